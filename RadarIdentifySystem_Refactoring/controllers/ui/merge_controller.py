@@ -0,0 +1,219 @@
+from typing import List, Optional, Tuple
+import numpy as np
+from PyQt6.QtCore import QObject
+from models.config.app_config import cfg
+from models.services.merge_service import MergeParams, MergeResult, MergeService
+from models.utils.log_manager import LoggerMixin
+from models.utils.update_throttle import UpdateThrottle
+from views.modules.scroll_module.merge_control_panel.merge_control_panel import MergeControlPanel
+from views.modules.scroll_module.view_panel.merge_view import MergeView
+
+
+class MergeController(QObject, LoggerMixin):
+    """合并控制器
+
+    负责协调合并控制面板、合并视图与合并服务：
+    - set_clusters 传入全部切片的簇参数并建立合并索引，add_clusters 在新切片到达时增量合并；
+    - 面板请求合并时按面板参数查询兼容簇对并求连通分量，结果交给合并视图显示；
+    - 在视图中勾选的合并组可以人工合并，并支持撤销 / 重做；
+    - 调整面板参数时实时预览合并效果，点击合并后应用；
+    - 全速处理时处理线程通过 post_clusters 提交各切片的簇，按 cfg.viewRefreshRate（次/秒）的频率
+      把期间到达的全部簇一次增量合并并刷新视图，而不是每个切片刷新一次。
+    """
+
+    # 合并视图中显示的合并组数量
+    MAX_DISPLAY_GROUPS = 4
+    # 计算组内平均相似度时最多抽取的簇对数
+    MAX_SCORED_PAIRS = 200_000
+
+    def __init__(
+        self, merge_view: MergeView, merge_control_panel: MergeControlPanel, parent: Optional[QObject] = None
+    ) -> None:
+        """初始化合并控制器
+
+        Args:
+            merge_view (MergeView): 合并视图
+            merge_control_panel (MergeControlPanel): 合并控制面板
+            parent (Optional[QObject]): 父对象，用于Qt对象树管理
+        """
+        super().__init__(parent=parent)
+
+        self._merge_view = merge_view
+        self._control_panel = merge_control_panel
+        # 合并服务的参数始终是最近一次应用（merge）的参数，预览只使用面板上尚未应用的参数
+        self._service = MergeService(MergeParams(**self._control_panel.get_control_settings()))
+        self._records: Optional[np.ndarray] = None
+        self._result: Optional[MergeResult] = None
+        # 视图当前显示的是否为尚未应用的预览结果
+        self._previewing = False
+        # 处理线程提交的簇，节流后在界面线程中一次合并
+        self._throttle = UpdateThrottle(cfg.get(cfg.viewRefreshRate), keep_all=True, parent=self)
+
+        self._throttle.flushed.connect(self._add_posted_clusters)
+        cfg.viewRefreshRate.valueChanged.connect(self._throttle.set_rate)
+        self._control_panel.controlChanged.connect(self._on_control_changed)
+        self._control_panel.mergeRequested.connect(self._on_merge_requested)
+        self._control_panel.mergeSelectedRequested.connect(self._on_merge_selected_requested)
+        self._control_panel.undoRequested.connect(self._on_undo_requested)
+        self._control_panel.redoRequested.connect(self._on_redo_requested)
+        self._merge_view.selectionChanged.connect(self._update_edit_state)
+        self._control_panel.set_control_enabled(False)
+        self.logger.debug("合并控制器初始化成功")
+
+    @property
+    def service(self) -> MergeService:
+        """合并服务"""
+        return self._service
+
+    @property
+    def result(self) -> Optional[MergeResult]:
+        """最近一次合并结果"""
+        return self._result
+
+    def set_clusters(self, records: np.ndarray, class_ids: Optional[np.ndarray] = None) -> None:
+        """设置待合并的簇
+
+        Args:
+            records: 全部切片的簇参数记录（CLUSTER_PARAMS_DTYPE）
+            class_ids: 各簇的识别类别
+        """
+        self._throttle.clear()
+        self._service.set_clusters(records, class_ids)
+        self._records = records
+        self._result = None
+        self._merge_view.clear_merge_data()
+        self._control_panel.set_control_enabled(records.size > 0)
+        self._control_panel.set_status(f"待合并簇数: {records.size}")
+        self._update_edit_state()
+
+    def add_clusters(self, records: np.ndarray, class_ids: Optional[np.ndarray] = None) -> MergeResult:
+        """追加新切片的簇并增量合并，已有的合并结果与人工合并保持不变
+
+        新簇按最近一次应用的合并参数合并，面板上正在预览、尚未应用的参数不生效。
+
+        Args:
+            records: 新切片的簇参数记录
+            class_ids: 新切片各簇的识别类别
+
+        Returns:
+            合并结果
+        """
+        self._service.add_clusters(records, class_ids)
+        self._records = self._service.records
+        self._control_panel.set_control_enabled(True)
+        return self._refresh()
+
+    def post_clusters(self, records: np.ndarray, class_ids: Optional[np.ndarray] = None) -> None:
+        """提交新切片的簇，可在处理线程中调用，不等待界面线程
+
+        Args:
+            records: 新切片的簇参数记录
+            class_ids: 新切片各簇的识别类别
+        """
+        self._throttle.post((records, class_ids))
+
+    def merge(self) -> Optional[MergeResult]:
+        """按面板参数执行合并并刷新视图
+
+        Returns:
+            合并结果，尚未设置簇时为 None
+        """
+        if self._records is None:
+            return None
+        self._service.merge(MergeParams(**self._control_panel.get_control_settings()))
+        return self._refresh()
+
+    def preview(self) -> Optional[MergeResult]:
+        """按面板参数预览合并效果，合并组保持不变
+
+        Returns:
+            预览的合并结果，尚未设置簇时为 None
+        """
+        if self._records is None:
+            return None
+        result = self._service.preview(MergeParams(**self._control_panel.get_control_settings()))
+        self._previewing = True
+        self._merge_view.update_merge_data(self._merge_data(self._records, result))
+        self._control_panel.set_status(f"预览：合并后组数 {result.n_groups}，点击“合并”应用")
+        self._update_edit_state()
+        return result
+
+    def _refresh(self) -> MergeResult:
+        """以合并服务的当前状态刷新视图与面板"""
+        self._previewing = False
+        self._result = self._service.result()
+        self._merge_view.update_merge_data(self._merge_data(self._records, self._result))
+        self._control_panel.set_status(f"合并后组数: {self._result.n_groups}")
+        self._update_edit_state()
+        return self._result
+
+    def _add_posted_clusters(self, posted: List[Tuple[np.ndarray, Optional[np.ndarray]]]) -> None:
+        """把两次刷新之间提交的全部簇一次增量合并"""
+        records = np.concatenate([r for r, _ in posted])
+        class_ids = [c for _, c in posted]
+        self.add_clusters(records, None if any(c is None for c in class_ids) else np.concatenate(class_ids))
+
+    def _update_edit_state(self) -> None:
+        """更新人工合并、撤销与重做按钮的可用状态"""
+        self._control_panel.set_edit_state(
+            self._result is not None and not self._previewing and len(self._merge_view.selected_groups()) >= 2,
+            self._service.can_undo,
+            self._service.can_redo,
+        )
+
+    def _on_control_changed(self) -> None:
+        """面板参数变化时实时预览"""
+        self.preview()
+
+    def _on_merge_requested(self) -> None:
+        """处理面板的合并请求"""
+        self.merge()
+
+    def _on_merge_selected_requested(self) -> None:
+        """人工合并视图中勾选的组"""
+        if self._result is None or self._previewing:
+            return
+        groups = self._merge_view.selected_groups()
+        # 每组取一个簇作为代表，并查集按代表合并整组
+        representatives = [int(self._result.members(group)[0]) for group in groups]
+        if len(representatives) >= 2 and self._service.merge_clusters(representatives):
+            self.logger.info(f"人工合并 {len(representatives)} 个组")
+            self._refresh()
+
+    def _on_undo_requested(self) -> None:
+        """撤销最近一次人工合并"""
+        if self._service.undo():
+            self._refresh()
+
+    def _on_redo_requested(self) -> None:
+        """重做最近一次撤销的人工合并"""
+        if self._service.redo():
+            self._refresh()
+
+    def _merge_data(self, records: np.ndarray, result: MergeResult) -> dict:
+        """整理合并视图所需的数据"""
+        sizes = result.group_sizes
+        largest = np.argsort(-sizes, kind="stable")[:self.MAX_DISPLAY_GROUPS]
+        pairs = result.pairs
+        if len(pairs) > self.MAX_SCORED_PAIRS:
+            pairs = pairs[np.linspace(0, len(pairs) - 1, self.MAX_SCORED_PAIRS).astype(np.intp)]
+        pair_groups = result.group_ids[pairs[:, 0]]
+        scores = self._service.similarity(pairs).score()
+        groups = []
+        for group in largest:
+            group_scores = scores[pair_groups == group]
+            members = records[result.members(int(group))]
+            groups.append({
+                "id": int(group),
+                "size": int(sizes[group]),
+                "slices": (int(members["slice_index"].min()), int(members["slice_index"].max())),
+                "cf_range": (float(np.nanmin(members["cf_min"])), float(np.nanmax(members["cf_max"]))),
+                "similarity": float(np.nanmean(group_scores)) if np.any(~np.isnan(group_scores)) else None,
+            })
+        return {
+            "n_clusters": int(records.size),
+            "n_groups": result.n_groups,
+            "n_pairs": int(len(result.pairs)),
+            "groups": groups,
+            "points": {"toa": records["toa_start"], "cf": records["cf_mean"], "group_ids": result.group_ids},
+        }
@@ -0,0 +1,372 @@
+from typing import Dict, List, Optional, Tuple
+from pathlib import Path
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+from views.interfaces.model_management_interface import ModelManagementInterface
+from models.config.app_config import cfg, MODELS_DIR, INFERENCE_CACHE_DIR, INFERENCE_THREADS_DEBOUNCE_MS
+from models.processors.inference_backends import (
+    BACKENDS,
+    FLOAT_VARIANT,
+    BackendUnavailableError,
+    InferenceBackend,
+    create_backend,
+)
+from models.processors.cascade_classifier import CascadeClassifier
+from models.processors.model_predictor import ModelPredictor
+from models.services.inference_cache import InferenceCache
+from models.services.inference_executor import InferenceExecutor
+from models.services.model_converter import ModelConverter
+from models.services.model_quantizer import SUPPORTED_VARIANTS, ModelQuantizer, QuantizationReport
+from models.services.model_registry import ModelRegistry
+from models.utils.log_manager import LoggerMixin
+
+
+class ModelConvertWorker(QThread):
+    """模型转换线程
+
+    转换需要导入 TensorFlow 并逐个导出模型，耗时较长，放在后台线程中执行。
+    """
+
+    succeeded = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, converter: ModelConverter, models_dir: str, backend: str, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._converter = converter
+        self._models_dir = models_dir
+        self._backend = backend
+
+    def run(self) -> None:
+        """执行转换"""
+        try:
+            converted: List[Path] = self._converter.convert_directory(self._models_dir, self._backend)
+        except (BackendUnavailableError, OSError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+        self.succeeded.emit([path.name for path in converted])
+
+
+class ModelQuantizeWorker(QThread):
+    """模型量化线程
+
+    量化与准确率评估需要逐个加载模型并推理整个留出集，放在后台线程中执行。
+    """
+
+    succeeded = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+    def __init__(self, quantizer: ModelQuantizer, models_dir: str, backend: str, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._quantizer = quantizer
+        self._models_dir = models_dir
+        self._backend = backend
+
+    def run(self) -> None:
+        """执行量化"""
+        try:
+            reports: List[QuantizationReport] = self._quantizer.quantize_directory(self._models_dir, self._backend)
+        except (BackendUnavailableError, OSError, ValueError) as e:
+            self.failed.emit(str(e))
+            return
+        self.succeeded.emit(reports)
+
+
+class ModelManagementController(QObject, LoggerMixin):
+    """模型管理界面控制器
+
+    负责协调模型管理界面与推理后端配置、模型转换服务、模型注册表之间的交互。
+    模型注册表与推理结果缓存由本控制器创建并持有，分析流程通过 create_predictor
+    获取已接入两者的模型预测器。
+    """
+
+    def __init__(self, model_management_interface: ModelManagementInterface, parent: Optional[QObject] = None) -> None:
+        """初始化模型管理控制器
+
+        Args:
+            model_management_interface: 模型管理界面实例
+            parent: 父对象，用于Qt对象树管理
+        """
+        super().__init__(parent=parent)
+
+        self._interface: ModelManagementInterface = model_management_interface
+        self._converter = ModelConverter()
+        self._convert_worker: Optional[ModelConvertWorker] = None
+        self._quantizer = ModelQuantizer(self._converter)
+        self._quantize_worker: Optional[ModelQuantizeWorker] = None
+        # 已加载的轻量分类器：模型名称 -> 分类器对象（加载失败时为 None）
+        self._fast_models: Dict[str, Optional[object]] = {}
+        # 推理后端实例使用的（算子内, 算子间）线程数，常驻模型都按此设置创建
+        self._threads = self._configured_threads()
+        self._threads_timer = QTimer(self)
+        self._threads_timer.setSingleShot(True)
+        self._threads_timer.setInterval(INFERENCE_THREADS_DEBOUNCE_MS)
+        self._threads_timer.timeout.connect(self._apply_threads)
+        self._registry = ModelRegistry(
+            MODELS_DIR,
+            backend=cfg.get(cfg.inferenceBackend),
+            max_resident=cfg.get(cfg.maxResidentModels),
+            memory_budget_mb=cfg.get(cfg.modelMemoryBudget),
+            backend_factory=self._create_backend,
+            variants=cfg.get(cfg.modelVariants),
+            warmup_batch_sizes=self._warmup_batch_sizes(),
+        )
+        self._cache = InferenceCache(INFERENCE_CACHE_DIR, max_disk_mb=cfg.get(cfg.inferenceCacheSize))
+
+        self.logger.debug("正在初始化模型管理控制器")
+        cfg.inferenceBackend.valueChanged.connect(self._on_backend_changed)
+        cfg.maxResidentModels.valueChanged.connect(self._on_limits_changed)
+        cfg.modelMemoryBudget.valueChanged.connect(self._on_limits_changed)
+        cfg.inferenceCacheSize.valueChanged.connect(self._on_cache_size_changed)
+        cfg.intraOpThreads.valueChanged.connect(self._on_threads_changed)
+        cfg.interOpThreads.valueChanged.connect(self._on_threads_changed)
+        cfg.inferenceBatchSize.valueChanged.connect(self._on_batch_size_changed)
+        self._interface.convertCard.clicked.connect(self._on_convert_clicked)
+        self._interface.modelDirCard.clicked.connect(self.refresh_models)
+        self._interface.quantizeCard.clicked.connect(self._on_quantize_clicked)
+        self._interface.variantCard.variantChanged.connect(self._on_variant_changed)
+        self._interface.cascadeThresholdCard.thresholdChanged.connect(self._on_threshold_changed)
+        cfg.cascadeDefaultThreshold.valueChanged.connect(lambda _value: self._update_thresholds())
+        self._interface.clearCacheCard.clicked.connect(self._on_clear_cache_clicked)
+        self.refresh_models()
+        self._update_cache_summary()
+        self.logger.info("模型管理控制器初始化成功，界面信号已连接")
+
+    @property
+    def registry(self) -> ModelRegistry:
+        """模型注册表"""
+        return self._registry
+
+    @property
+    def cache(self) -> Optional[InferenceCache]:
+        """推理结果缓存，未启用时为 None"""
+        return self._cache if cfg.get(cfg.inferenceCacheEnabled) else None
+
+    def create_predictor(self, batch_size: Optional[int] = None) -> ModelPredictor:
+        """创建从注册表获取模型、并使用推理结果缓存的模型预测器
+
+        Args:
+            batch_size: 每批推理的最大样本数，为 None 时使用 cfg.inferenceBatchSize
+
+        Returns:
+            模型预测器
+        """
+        return ModelPredictor(
+            batch_size if batch_size is not None else cfg.get(cfg.inferenceBatchSize),
+            model_provider=self._registry.get,
+            cache=self.cache,
+            version_provider=self._registry.version,
+        )
+
+    def create_executor(self, batch_size: Optional[int] = None) -> InferenceExecutor:
+        """创建在专用线程中运行 create_predictor 所得预测器的推理执行器
+
+        执行器由调用方持有，用完后需调用 shutdown。
+        """
+        return InferenceExecutor(self.create_predictor(batch_size))
+
+    def create_cascade(self, name: str) -> CascadeClassifier:
+        """创建模型对应的级联分类器（第一级）
+
+        轻量分类器在首次使用时加载；没有轻量分类器或加载失败时，返回的分类器把所有簇交给 CNN。
+
+        Args:
+            name: 模型名称
+
+        Returns:
+            按当前阈值配置的级联分类器
+        """
+        if name not in self._fast_models:
+            cascade = CascadeClassifier()
+            path = CascadeClassifier.model_path(MODELS_DIR, name)
+            if path.exists():
+                try:
+                    cascade.load(path)
+                except (ImportError, OSError, ValueError) as e:
+                    self.logger.warning(f"轻量分类器加载失败，全部簇将交给 CNN: {path.name}, {e}")
+            self._fast_models[name] = cascade.fast_model
+        return CascadeClassifier(self._fast_models[name], self._cascade_threshold(name) / 100)
+
+    def refresh_models(self) -> None:
+        """重新扫描模型目录并更新界面"""
+        names = self._registry.discover()
+        self._fast_models.clear()
+        self._interface.setModelSummary(len(names), self._registry.resident_names)
+        self._update_variants()
+        self._update_thresholds()
+
+    def _on_limits_changed(self, _value: int) -> None:
+        """常驻数量或内存预算变化"""
+        self._registry.set_limits(cfg.get(cfg.maxResidentModels), cfg.get(cfg.modelMemoryBudget))
+        self._interface.setModelSummary(len(self._registry.names), self._registry.resident_names)
+
+    @staticmethod
+    def _configured_threads() -> Tuple[int, int]:
+        """配置中的（算子内, 算子间）推理线程数"""
+        return cfg.get(cfg.intraOpThreads), cfg.get(cfg.interOpThreads)
+
+    def _create_backend(self, name: str) -> InferenceBackend:
+        """按已应用的推理线程设置创建推理后端"""
+        return create_backend(name, *self._threads)
+
+    @staticmethod
+    def _warmup_batch_sizes() -> List[int]:
+        """模型预热使用的批大小：整批，以及 flush 时常见的单样本尾批"""
+        return [cfg.get(cfg.inferenceBatchSize), 1]
+
+    def _on_batch_size_changed(self, _value: int) -> None:
+        """推理批大小变化，之后加载的模型按新批大小预热"""
+        self._registry.set_warmup_batch_sizes(self._warmup_batch_sizes())
+
+    def _on_threads_changed(self, _value: int) -> None:
+        """推理线程数变化，拖动滑块期间只重新计时，停止变化后再应用"""
+        self._threads_timer.start()
+
+    def _apply_threads(self) -> None:
+        """线程数与常驻模型创建时的设置不同时释放常驻模型，下次使用时按新设置重新加载"""
+        threads = self._configured_threads()
+        if threads == self._threads:
+            return
+        self._threads = threads
+        self.logger.info(f"推理线程数已变更: 算子内={threads[0]}, 算子间={threads[1]}")
+        self._registry.clear()
+        self._interface.setModelSummary(len(self._registry.names), self._registry.resident_names)
+
+    def _on_cache_size_changed(self, value: int) -> None:
+        """磁盘缓存上限变化"""
+        self._cache.set_limit(value)
+        self._update_cache_summary()
+
+    def _on_clear_cache_clicked(self) -> None:
+        """清空推理结果缓存"""
+        self._cache.clear()
+        self._update_cache_summary()
+        self._interface.showMessage(True, "缓存已清空", "下次识别将重新推理")
+
+    def _update_cache_summary(self) -> None:
+        """刷新界面上的推理缓存占用"""
+        self._interface.setCacheSummary(len(self._cache), self._cache.disk_bytes)
+
+    def _on_backend_changed(self, backend: str) -> None:
+        """推理后端变化时切换注册表的优先格式，并检查依赖是否可用
+
+        Args:
+            backend: 新的后端标识
+        """
+        self.logger.info(f"推理后端已切换为: {backend}")
+        self._registry.set_backend(backend)
+        self._interface.setModelSummary(len(self._registry.names), self._registry.resident_names)
+        self._update_variants()
+        if not BACKENDS[backend].is_available():
+            self._interface.showMessage(False, "后端不可用", f"未安装 {BACKENDS[backend].display_name} 运行库")
+
+    def _on_convert_clicked(self) -> None:
+        """启动后台模型转换"""
+        if self._convert_worker is not None and self._convert_worker.isRunning():
+            return
+        backend = cfg.get(cfg.inferenceBackend)
+        self._convert_worker = ModelConvertWorker(self._converter, MODELS_DIR, backend, self)
+        self._convert_worker.succeeded.connect(self._on_convert_succeeded)
+        self._convert_worker.failed.connect(self._on_convert_failed)
+        self._convert_worker.finished.connect(lambda: self._interface.setConverting(False))
+        self._interface.setConverting(True)
+        self.logger.info(f"开始转换模型: 目录={MODELS_DIR}, 后端={backend}")
+        self._convert_worker.start()
+
+    def _on_convert_succeeded(self, names: List[str]) -> None:
+        """转换完成，重新扫描以纳入新生成的模型文件"""
+        self.refresh_models()
+        if names:
+            self._interface.showMessage(True, "转换完成", "、".join(names))
+        else:
+            self._interface.showMessage(True, "无需转换", "所有模型均已是最新格式")
+
+    def _on_convert_failed(self, message: str) -> None:
+        """转换失败"""
+        self.logger.error(f"模型转换失败: {message}")
+        self._interface.showMessage(False, "转换失败", message)
+
+    def _update_variants(self) -> None:
+        """按当前后端刷新各模型可选的精度变体"""
+        backend = self._registry.backend
+        variants: Dict[str, List[str]] = {}
+        for name in self._registry.names:
+            available = self._registry.entry(name).available_variants(backend)
+            if available:
+                variants[name] = available
+        selected = {name: self._registry.variant(name) for name in variants}
+        self._interface.variantCard.setModels(variants, selected)
+
+    def _on_variant_changed(self, name: str, variant: str) -> None:
+        """模型精度变化，保存到配置并让注册表按新变体重新加载
+
+        Args:
+            name: 模型名称
+            variant: 精度变体
+        """
+        self._registry.set_variant(name, variant)
+        variants = dict(cfg.get(cfg.modelVariants))
+        if variant == FLOAT_VARIANT:
+            variants.pop(name, None)
+        else:
+            variants[name] = variant
+        cfg.set(cfg.modelVariants, variants)
+        self._interface.setModelSummary(len(self._registry.names), self._registry.resident_names)
+
+    def _on_quantize_clicked(self) -> None:
+        """启动后台模型量化"""
+        if self._quantize_worker is not None and self._quantize_worker.isRunning():
+            return
+        backend = cfg.get(cfg.inferenceBackend)
+        if backend not in SUPPORTED_VARIANTS:
+            self._interface.showMessage(False, "无法量化", f"{BACKENDS[backend].display_name} 后端不支持量化模型")
+            return
+        self._quantizer.max_accuracy_drop = cfg.get(cfg.quantizationMaxDrop) / 100
+        self._quantize_worker = ModelQuantizeWorker(self._quantizer, MODELS_DIR, backend, self)
+        self._quantize_worker.succeeded.connect(self._on_quantize_succeeded)
+        self._quantize_worker.failed.connect(self._on_quantize_failed)
+        self._quantize_worker.finished.connect(lambda: self._interface.setQuantizing(False))
+        self._interface.setQuantizing(True)
+        self.logger.info(f"开始量化模型: 目录={MODELS_DIR}, 后端={backend}")
+        self._quantize_worker.start()
+
+    def _on_quantize_succeeded(self, reports: List[QuantizationReport]) -> None:
+        """量化完成，重新扫描并汇报各变体的准确率检查结果"""
+        self.refresh_models()
+        if not reports:
+            self._interface.showMessage(False, "未生成量化模型", "没有找到带留出集的模型")
+            return
+        accepted = [f"{r.path.name}（{r.quantized_accuracy:.2%}）" for r in reports if r.accepted]
+        rejected = [f"{r.path.name}（-{r.accuracy_drop:.2%}）" for r in reports if not r.accepted]
+        if accepted:
+            self._interface.showMessage(True, "量化完成", "、".join(accepted))
+        if rejected:
+            self._interface.showMessage(False, "准确率损失过大，已丢弃", "、".join(rejected))
+
+    def _on_quantize_failed(self, message: str) -> None:
+        """量化失败"""
+        self.logger.error(f"模型量化失败: {message}")
+        self._interface.showMessage(False, "量化失败", message)
+
+    @staticmethod
+    def _cascade_threshold(name: str) -> int:
+        """模型的级联置信度阈值（百分比）"""
+        return cfg.get(cfg.cascadeThresholds).get(name, cfg.get(cfg.cascadeDefaultThreshold))
+
+    def _update_thresholds(self) -> None:
+        """刷新各模型的级联阈值，只有存在轻量分类器文件的模型可以设置"""
+        thresholds = {
+            name: self._cascade_threshold(name) if CascadeClassifier.model_path(MODELS_DIR, name).exists() else None
+            for name in self._registry.names
+        }
+        self._interface.cascadeThresholdCard.setModels(thresholds)
+
+    def _on_threshold_changed(self, name: str, threshold: int) -> None:
+        """模型的级联阈值变化，保存到配置
+
+        Args:
+            name: 模型名称
+            threshold: 置信度阈值（百分比）
+        """
+        thresholds = dict(cfg.get(cfg.cascadeThresholds))
+        thresholds[name] = threshold
+        cfg.set(cfg.cascadeThresholds, thresholds)
+        self.logger.info(f"级联阈值已更新: {name} -> {threshold}%")
@@ -1,10 +1,11 @@
+import sys
 from typing import Optional
-from PyQt6.QtCore import QObject
+from PyQt6.QtCore import QObject, QTimer
 from PyQt6.QtGui import QColor
 from qfluentwidgets import setTheme, setThemeColor
 from views.interfaces.settings_interface import SettingsInterface
 from models.utils.log_manager import LoggerMixin, get_log_manager
-from models.config.app_config import cfg
+from models.config.app_config import cfg, INFERENCE_THREADS_DEBOUNCE_MS
 from models.utils.signal_bus import mw_signalBus
 
 
@@ -34,6 +35,12 @@ class SettingsController(QObject, LoggerMixin):
         super().__init__(parent=parent)
             
         self._settings_interface: SettingsInterface = settings_interface
+        # 已应用的（算子内, 算子间）推理线程数；拖动滑块期间只重新计时，停止变化后再应用
+        self._inference_threads = (cfg.get(cfg.intraOpThreads), cfg.get(cfg.interOpThreads))
+        self._threads_timer = QTimer(self)
+        self._threads_timer.setSingleShot(True)
+        self._threads_timer.setInterval(INFERENCE_THREADS_DEBOUNCE_MS)
+        self._threads_timer.timeout.connect(self._apply_inference_threads)
         
         self.logger.debug("正在初始化设置控制器")
         self._setup_app_connections()
@@ -47,6 +54,7 @@ class SettingsController(QObject, LoggerMixin):
         - 连接 cfg.themeChanged -> _on_theme_changed（日志/业务扩展点）；
         - 连接 cfg.dpiScale.valueChanged -> _on_dpi_scale_changed（DPI变化处理）；
         - 连接 cfg.logLevel.valueChanged -> _on_log_level_changed（日志级别变化处理）；
+        - 连接 cfg.intraOpThreads / interOpThreads.valueChanged -> _on_inference_threads_changed（推理线程数变化，防抖后处理）；
         
         Returns:
             None
@@ -56,6 +64,8 @@ class SettingsController(QObject, LoggerMixin):
         cfg.themeChanged.connect(self._on_theme_changed)
         cfg.dpiScale.valueChanged.connect(self._on_dpi_scale_changed)
         cfg.logLevel.valueChanged.connect(self._on_log_level_changed)
+        cfg.intraOpThreads.valueChanged.connect(self._on_inference_threads_changed)
+        cfg.interOpThreads.valueChanged.connect(self._on_inference_threads_changed)
         self.logger.debug("全局主题、DPI和日志级别信号连接已建立")
 
     def _connect_interface_signals(self) -> None:
@@ -149,4 +159,33 @@ class SettingsController(QObject, LoggerMixin):
             self.logger.info(f"日志级别已动态更新为: {value}")
         except Exception as e:
             self.logger.error(f"更新日志级别失败: {e}")
-    
+
+    def _on_inference_threads_changed(self, value: int) -> None:
+        """推理线程数变化时的回调处理
+
+        拖动滑块时每一步都会触发，只重新计时，停止变化后由 _apply_inference_threads 处理。
+
+        Args:
+            value: 新的线程数
+
+        Returns:
+            None
+        """
+        self._threads_timer.start()
+
+    def _apply_inference_threads(self) -> None:
+        """推理线程数停止变化后的处理
+
+        ONNX Runtime / TFLite 模型在下次加载时应用新的线程数；TensorFlow 的线程池一经创建
+        无法修改，已导入 TensorFlow 时提示重启。线程数与上次应用的相同时不做任何处理。
+
+        Returns:
+            None
+        """
+        threads = (cfg.get(cfg.intraOpThreads), cfg.get(cfg.interOpThreads))
+        if threads == self._inference_threads:
+            return
+        self._inference_threads = threads
+        self.logger.info(f"推理线程数已变更: 算子内={threads[0]}, 算子间={threads[1]}")
+        if "tensorflow" in sys.modules:
+            self._settings_interface.showRestartTooltip("TensorFlow 的线程数将在重启后生效")
@@ -0,0 +1,186 @@
+from typing import Hashable, List, Optional, Sequence, Set
+from PyQt6.QtCore import QObject
+from models.config.app_config import cfg
+from models.services.render_service import RenderService, render_service
+from models.utils.log_manager import LoggerMixin
+from models.utils.plot_style import plot_style
+from models.utils.render_cache import RenderCache
+from models.utils.update_throttle import UpdateThrottle
+from views.modules.panel_module.slice_panel import SlicePanel
+from views.modules.scroll_module.view_panel.slice_view import SliceFrame, SliceView
+
+
+class SliceController(QObject, LoggerMixin):
+    """切片控制器
+
+    负责协调切片面板与切片视图：
+    - set_slices 传入全部切片数据，切片面板切换切片时在切片视图中显示；
+    - 显示某一切片后，由渲染服务在线程池中预渲染前后相邻的切片，切换到相邻切片时直接使用
+      已排序、抽稀并栅格化好的内容，界面线程只需绘制图像；不再相邻的切片的预渲染请求被取消；
+    - 未缓存的切片同样在线程池中整理，完成前保持显示上一切片；
+    - 切片显示内容保存在以 cfg.plotCacheSize（MB）为上限的 LRU 缓存中，来回切换时不重复计算；
+    - 全速处理时处理线程通过 post_slice 逐个提交切片，切片照常追加，但视图最多以
+      cfg.viewRefreshRate（次/秒）的频率跳转到最新的切片，中间的切片不绘制。
+    """
+
+    # 预渲染当前切片前后各多少个切片
+    PRERENDER_RADIUS = 1
+
+    def __init__(
+        self,
+        slice_panel: SlicePanel,
+        slice_view: SliceView,
+        service: Optional[RenderService] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """初始化切片控制器
+
+        Args:
+            slice_panel (SlicePanel): 切片面板
+            slice_view (SliceView): 切片视图
+            service (Optional[RenderService]): 渲染服务，缺省使用全局实例
+            parent (Optional[QObject]): 父对象，用于Qt对象树管理
+        """
+        super().__init__(parent=parent)
+
+        self._slice_panel = slice_panel
+        self._slice_view = slice_view
+        self._service = service if service is not None else render_service
+        self._slices: List[dict] = []
+        self._cache = RenderCache(cfg.get(cfg.plotCacheSize))
+        # 切片数据每次重新设置时递增，丢弃旧数据的预渲染结果
+        self._generation = 0
+        # 尚未完成的预渲染请求的目标
+        self._pending: Set[Hashable] = set()
+        # 当前切片序号与其尚未完成的渲染请求的目标
+        self._index = 0
+        self._shown_target: Optional[Hashable] = None
+        # 处理线程提交的切片，节流后在界面线程中整块追加
+        self._throttle = UpdateThrottle(cfg.get(cfg.viewRefreshRate), keep_all=True, parent=self)
+
+        self._slice_panel.sliceChanged.connect(self._show)
+        self._throttle.flushed.connect(self._append_slices)
+        self._service.rendered.connect(self._on_rendered)
+        self._service.failed.connect(self._on_failed)
+        cfg.plotCacheSize.valueChanged.connect(self._cache.set_limit)
+        cfg.viewRefreshRate.valueChanged.connect(self._throttle.set_rate)
+        self.logger.debug("切片控制器初始化成功")
+
+    @property
+    def cache(self) -> RenderCache:
+        """切片显示内容缓存"""
+        return self._cache
+
+    def set_slices(self, slices: Sequence[dict]) -> None:
+        """设置全部切片并显示第一个切片
+
+        Args:
+            slices: 各切片的数据字典，包含 pulses 与可选的 labels（见 SliceView.update_data）
+        """
+        self._throttle.clear()
+        self._cancel_pending(set())
+        self._generation += 1
+        self._slices = [{**data, "slice_index": i} for i, data in enumerate(slices)]
+        self._cache.clear()
+        self._slice_panel.set_slice_info({"index": 0, "count": len(self._slices)})
+        if self._slices:
+            self._show(0)
+        else:
+            self._slice_view.clear_data()
+
+    def post_slice(self, data: dict) -> None:
+        """追加一个处理完成的切片，可在处理线程中调用，不等待界面线程
+
+        Args:
+            data: 切片的数据字典（见 SliceView.update_data）
+        """
+        self._throttle.post(data)
+
+    def shutdown(self) -> None:
+        """丢弃尚未追加的切片并取消尚未完成的预渲染请求"""
+        self._throttle.clear()
+        self._cancel_pending(set())
+
+    def _show(self, index: int) -> None:
+        """显示切片并预渲染相邻切片
+
+        未缓存的切片同样交给渲染服务整理，完成前视图保持显示上一切片；
+        快速连续切换时只有最后一次切换的请求会被执行。
+        """
+        self._index = index
+        frame = self._cache.get(index)
+        if frame is None:
+            self.logger.debug(f"切片 {index} 未预渲染，提交渲染请求")
+            target = self._target(index)
+            # 正在预渲染的切片不重复提交，完成后直接显示
+            self._cancel_pending({target})
+            self._shown_target = target
+            if target not in self._pending:
+                self._pending.add(target)
+                self._service.submit(
+                    target, SliceView.build_frame, self._slices[index],
+                    self._slice_view.render_sizes(), self._slice_view.density_threshold(), plot_style(),
+                )
+            return
+        self._slice_view.show_frame(frame)
+        self._prerender(index)
+
+    def _append_slices(self, slices: List[dict]) -> None:
+        """追加处理线程提交的切片并显示其中最新的一个"""
+        start = len(self._slices)
+        self._slices += [{**data, "slice_index": start + i} for i, data in enumerate(slices)]
+        last = len(self._slices) - 1
+        shown = self._slice_panel.get_slice_info()["index"]
+        self._slice_panel.set_slice_info({"index": last, "count": len(self._slices)})
+        if shown == last:
+            self._show(last)
+
+    def _prerender(self, index: int) -> None:
+        """预渲染当前切片前后尚未缓存的切片，取消不再相邻的切片的请求"""
+        neighbors = []
+        for distance in range(1, self.PRERENDER_RADIUS + 1):
+            neighbors += [index + distance, index - distance]
+        targets = {
+            self._target(i) for i in neighbors if 0 <= i < len(self._slices) and i not in self._cache
+        }
+        self._shown_target = None
+        self._cancel_pending(targets)
+
+        sizes, threshold = self._slice_view.render_sizes(), self._slice_view.density_threshold()
+        style = plot_style()
+        for target in targets - self._pending:
+            data = self._slices[target[2]]
+            self._service.submit(target, SliceView.build_frame, data, sizes, threshold, style)
+        self._pending = targets
+
+    def _cancel_pending(self, keep: Set[Hashable]) -> None:
+        """取消 keep 之外的预渲染请求"""
+        if self._shown_target not in keep:
+            self._shown_target = None
+        for target in self._pending - keep:
+            self._service.cancel(target)
+        self._pending &= keep
+
+    def _target(self, index: int) -> tuple:
+        """切片预渲染请求的目标"""
+        return ("slice", self._generation, index)
+
+    def _on_rendered(self, target: Hashable, request_id: int, frame: SliceFrame) -> None:
+        """缓存预渲染结果，图像在界面线程中转换为 QPixmap"""
+        if target not in self._pending:
+            return
+        self._pending.discard(target)
+        frame.to_pixmaps()
+        self._cache.put(target[2], frame, frame.nbytes)
+        if target == self._shown_target:
+            self._slice_view.show_frame(frame)
+            self._prerender(self._index)
+
+    def _on_failed(self, target: Hashable, request_id: int, message: str) -> None:
+        """渲染失败的切片不再视为正在渲染，之后切换到该切片时重新提交；视图保持显示上一切片"""
+        if target not in self._pending:
+            return
+        self._pending.discard(target)
+        if target == self._shown_target:
+            self._shown_target = None
+            self.logger.warning(f"切片 {target[2]} 渲染失败，保持显示上一切片: {message}")
@@ -54,6 +54,27 @@ class Config(QConfig):
     sliceLength = RangeConfigItem("Slice", "sliceLength", 250, RangeValidator(10, 1000))
     timeFlipProc = OptionsConfigItem("Slice", "timeFlipProc", "reserve", OptionsValidator(["discard", "reserve"]))
     timeFlipReserve = OptionsConfigItem("Slice", "timeFlipReserve", "concatenation", OptionsValidator(["concatenation", "sequence", "none"]))
+
+    # 绘图设置
+    densityPlotThreshold = RangeConfigItem("Plot", "DensityThreshold", 200, RangeValidator(10, 5000))
+    plotCacheSize = RangeConfigItem("Plot", "CacheSize", 512, RangeValidator(64, 4096))
+    viewRefreshRate = RangeConfigItem("Plot", "RefreshRate", 10, RangeValidator(1, 30))
+
+    # 模型设置
+    inferenceBackend = OptionsConfigItem("Model", "InferenceBackend", "onnxruntime", OptionsValidator(["tensorflow", "onnxruntime", "tflite"]))
+    maxResidentModels = RangeConfigItem("Model", "MaxResidentModels", 2, RangeValidator(1, 8))
+    modelMemoryBudget = RangeConfigItem("Model", "MemoryBudget", 1024, RangeValidator(128, 8192))
+    inferenceCacheEnabled = ConfigItem("Model", "InferenceCacheEnabled", True, BoolValidator())
+    inferenceCacheSize = RangeConfigItem("Model", "InferenceCacheSize", 256, RangeValidator(16, 4096))
+    modelVariants = ConfigItem("Model", "Variants", {})
+    quantizationMaxDrop = RangeConfigItem("Model", "QuantizationMaxDrop", 1, RangeValidator(0, 10))
+    cascadeDefaultThreshold = RangeConfigItem("Model", "CascadeDefaultThreshold", 90, RangeValidator(50, 100))
+    cascadeThresholds = ConfigItem("Model", "CascadeThresholds", {})
+
+    # 推理设置
+    intraOpThreads = RangeConfigItem("Inference", "IntraOpThreads", 2, RangeValidator(0, 32))
+    interOpThreads = RangeConfigItem("Inference", "InterOpThreads", 1, RangeValidator(0, 8))
+    inferenceBatchSize = RangeConfigItem("Inference", "BatchSize", 256, RangeValidator(16, 1024))
         
     def __init__(self):
         """初始化应用程序配置"""
@@ -68,3 +89,9 @@ cfg.themeMode.value = Theme.AUTO
 # 获取项目根目录的绝对路径
 project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 qconfig.load(os.path.join(project_root, "app/config/config.json"), cfg)
+# 模型文件目录
+MODELS_DIR = os.path.join(project_root, "resources", "models")
+# 推理结果缓存目录
+INFERENCE_CACHE_DIR = os.path.join(project_root, "cache", "inference")
+# 拖动推理线程数滑块时，停止变化这么久（毫秒）之后才应用新设置
+INFERENCE_THREADS_DEBOUNCE_MS = 500
@@ -0,0 +1,151 @@
+# coding: utf-8
+"""
+分析结果模型
+
+以结构化数组累积整个分析过程的簇参数记录。每处理完一个切片即整块追加该切片的
+全部记录，内部缓冲按倍增策略扩容，追加的均摊开销与记录条数成正比；
+汇总统计与导出均为按列的向量化操作，十万量级的簇也无需逐条遍历。
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Union
+
+import numpy as np
+
+from models.data.cluster_params import CLUSTER_PARAMS_DTYPE, MAX_PRI_VALUES, PriType
+from models.utils.log_manager import LoggerMixin
+
+
+class AnalysisResult(LoggerMixin):
+    """分析结果
+
+    Attributes:
+        clusters: 已追加的全部簇参数记录（只读视图）
+    """
+
+    SUPPORTED_FORMATS = ("csv", "npy")
+
+    def __init__(self, initial_capacity: int = 1024) -> None:
+        """初始化分析结果
+
+        Args:
+            initial_capacity: 内部缓冲的初始容量（记录条数）
+        """
+        self._buffer = np.empty(max(int(initial_capacity), 1), dtype=CLUSTER_PARAMS_DTYPE)
+        self._size = 0
+
+    def __len__(self) -> int:
+        """已追加的记录条数"""
+        return self._size
+
+    @property
+    def clusters(self) -> np.ndarray:
+        """已追加的全部簇参数记录（只读视图）"""
+        view = self._buffer[:self._size]
+        view.flags.writeable = False
+        return view
+
+    def add_cluster_result(self, records: np.ndarray) -> None:
+        """整块追加一批簇参数记录
+
+        Args:
+            records: dtype 为 CLUSTER_PARAMS_DTYPE 的结构化数组（或单条记录）
+
+        Raises:
+            TypeError: 当记录的数据类型不匹配时
+        """
+        records = np.atleast_1d(records)
+        if records.dtype != CLUSTER_PARAMS_DTYPE:
+            raise TypeError(f"簇参数记录的数据类型不匹配: {records.dtype}")
+        count = records.size
+        if count == 0:
+            return
+        self._reserve(self._size + count)
+        self._buffer[self._size:self._size + count] = records
+        self._size += count
+
+    def clear(self) -> None:
+        """清空全部记录（保留已分配的缓冲）"""
+        self._size = 0
+
+    def get_summary(self) -> Dict[str, Any]:
+        """按列统计分析结果
+
+        Returns:
+            汇总字典，包括簇数量、切片数量、脉冲总数、各 PRI 类型的簇数量以及载频/脉宽范围
+        """
+        clusters = self._buffer[:self._size]
+        pri_type_counts = np.bincount(clusters["pri_type"].astype(np.intp), minlength=len(PriType))
+        summary: Dict[str, Any] = {
+            "cluster_count": self._size,
+            "slice_count": int(np.unique(clusters["slice_index"]).size),
+            "pulse_count": int(clusters["pulse_count"].sum(dtype=np.int64)),
+            "pri_type_counts": {pri_type.name: int(pri_type_counts[pri_type]) for pri_type in PriType},
+        }
+        if self._size:
+            summary.update({
+                "cf_range": (float(np.nanmin(clusters["cf_min"])), float(np.nanmax(clusters["cf_max"]))),
+                "pw_range": (float(np.nanmin(clusters["pw_mean"])), float(np.nanmax(clusters["pw_mean"]))),
+                "time_range": (
+                    float(np.nanmin(clusters["toa_start"])),
+                    float(np.nanmax(clusters["toa_start"] + clusters["time_span"])),
+                ),
+            })
+        return summary
+
+    def export_results(self, file_path: Union[str, Path], format: str = "csv") -> bool:
+        """导出全部簇参数记录
+
+        Args:
+            file_path: 导出文件路径
+            format: 导出格式，"csv" 为带表头的文本表格，"npy" 为保留数据类型的二进制数组
+
+        Returns:
+            是否导出成功
+        """
+        if format not in self.SUPPORTED_FORMATS:
+            self.logger.error(f"不支持的导出格式: {format}")
+            return False
+
+        path = Path(file_path)
+        clusters = self._buffer[:self._size]
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if format == "npy":
+                np.save(path, clusters)
+            else:
+                self._save_csv(path, clusters)
+        except OSError as e:
+            self.logger.error(f"导出分析结果失败: {path}, {e}")
+            return False
+
+        self.logger.info(f"分析结果已导出: {path}, 记录数={self._size}")
+        return True
+
+    def _reserve(self, capacity: int) -> None:
+        """按倍增策略扩容内部缓冲"""
+        if capacity <= self._buffer.size:
+            return
+        new_buffer = np.empty(max(capacity, 2 * self._buffer.size), dtype=CLUSTER_PARAMS_DTYPE)
+        new_buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = new_buffer
+
+    @staticmethod
+    def _save_csv(path: Path, clusters: np.ndarray) -> None:
+        """以列为单位写出 CSV，PRI 数组字段展开为 pri_0..pri_{n-1}"""
+        columns = []
+        header = []
+        formats = []
+        for name in CLUSTER_PARAMS_DTYPE.names:
+            values = clusters[name]
+            is_int = np.issubdtype(values.dtype, np.integer)
+            if values.ndim == 2:
+                columns.extend(values.T)
+                header.extend(f"pri_{i}" for i in range(MAX_PRI_VALUES))
+                formats.extend(["%.6f"] * MAX_PRI_VALUES)
+            else:
+                columns.append(values)
+                header.append(name)
+                formats.append("%d" if is_int else "%.6f")
+        table = np.column_stack(columns) if columns and clusters.size else np.empty((0, len(header)))
+        np.savetxt(path, table, fmt=formats, delimiter=",", header=",".join(header), comments="", encoding="utf-8")
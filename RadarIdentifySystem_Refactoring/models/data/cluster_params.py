@@ -0,0 +1,77 @@
+# coding: utf-8
+"""
+簇参数记录格式
+
+每个簇的提取参数以一条 NumPy 结构化记录表示，一个切片的全部簇构成一个结构化数组。
+相比逐簇字典，结构化数组可以整块追加、按列统计与导出，长时间全速运行时也不会产生
+大量小对象。
+"""
+
+from enum import IntEnum
+
+import numpy as np
+
+
+class PriType(IntEnum):
+    """PRI 类型
+
+    Attributes:
+        UNKNOWN: 脉冲数不足，无法判断
+        CONSTANT: 重频固定
+        JITTER: 重频抖动
+        STAGGER: 重频参差（DTOA 呈现多个离散取值）
+        MULTIPLE: 簇内存在多个互不相关的重频（交错信号未完全分选）
+    """
+
+    UNKNOWN = 0
+    CONSTANT = 1
+    JITTER = 2
+    STAGGER = 3
+    MULTIPLE = 4
+
+
+# 每条记录最多保存的 PRI 个数（与 PriAnalyzer 默认的 max_pri_count 一致）
+MAX_PRI_VALUES = 4
+
+# 簇参数记录的结构化数据类型
+#   slice_index: 所属切片序号；label: 切片内的簇标签；pulse_count: 脉冲数
+#   cf_mean / cf_min / cf_max: 载频均值与范围；pw_mean: 脉宽均值
+#   pa_mean / pa_std / pa_max: 幅度统计；doa_mean: 到达角均值
+#   toa_start: 首个脉冲的到达时间；time_span: 末个与首个脉冲的到达时间差
+#   pri_type: PRI 类型（PriType 取值）；pri_count: 有效 PRI 个数；pri_values: PRI 值，升序，NaN 填充
+CLUSTER_PARAMS_DTYPE = np.dtype([
+    ("slice_index", np.int32),
+    ("label", np.int32),
+    ("pulse_count", np.int32),
+    ("cf_mean", np.float64),
+    ("cf_min", np.float64),
+    ("cf_max", np.float64),
+    ("pw_mean", np.float64),
+    ("pa_mean", np.float64),
+    ("pa_std", np.float64),
+    ("pa_max", np.float64),
+    ("doa_mean", np.float64),
+    ("toa_start", np.float64),
+    ("time_span", np.float64),
+    ("pri_type", np.int8),
+    ("pri_count", np.int8),
+    ("pri_values", np.float64, (MAX_PRI_VALUES,)),
+])
+
+
+def empty_cluster_params(n_clusters: int = 0) -> np.ndarray:
+    """创建指定长度的簇参数数组
+
+    浮点字段初始化为 NaN，整数字段初始化为 0。
+
+    Args:
+        n_clusters: 记录条数
+
+    Returns:
+        dtype 为 CLUSTER_PARAMS_DTYPE 的结构化数组
+    """
+    records = np.zeros(n_clusters, dtype=CLUSTER_PARAMS_DTYPE)
+    for name in CLUSTER_PARAMS_DTYPE.names:
+        if np.issubdtype(CLUSTER_PARAMS_DTYPE[name].base, np.floating):
+            records[name] = np.nan
+    return records
@@ -0,0 +1,31 @@
+# coding: utf-8
+"""
+脉冲数据列定义
+
+导入后的脉冲数据统一整理为 (N, 5) 的二维数组，各列含义由 PulseColumn 约定，
+与参数配置界面中“维度索引”的 CF/PW/PA/DOA/TOA 顺序保持一致。
+"""
+
+from enum import IntEnum
+
+
+class PulseColumn(IntEnum):
+    """脉冲数据列索引
+
+    Attributes:
+        CF: 载频
+        PW: 脉宽
+        PA: 脉冲幅度
+        DOA: 到达角
+        TOA: 到达时间
+    """
+
+    CF = 0
+    PW = 1
+    PA = 2
+    DOA = 3
+    TOA = 4
+
+
+# 脉冲数据的列数
+PULSE_COLUMN_COUNT = len(PulseColumn)
@@ -0,0 +1,187 @@
+# coding: utf-8
+"""
+级联识别
+
+两级识别流程：先用基于簇参数（CF / PW / PRI）的轻量分类器（scikit-learn 模型）识别全部簇，
+置信度达到阈值的簇直接采用其结果，只有不确定的簇才送入 CNN 模型。
+实际数据中大部分簇来自少数常见辐射源，轻量分类器可以拦下其中绝大多数，CNN 调用次数随之大幅减少。
+
+轻量分类器与 CNN 模型放在同一目录，命名为 ``<模型名>.cascade.joblib``，其 classes_ 取值为
+CNN 的类别序号。scikit-learn / joblib 只在加载或训练轻量分类器时导入。
+"""
+
+import importlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from models.data.cluster_params import CLUSTER_PARAMS_DTYPE
+from models.utils.log_manager import LoggerMixin
+
+# 缺失参数（如未识别出 PRI）的填充值，参数本身均为正数
+MISSING_VALUE = -1.0
+
+
+def param_features(records: np.ndarray) -> np.ndarray:
+    """由簇参数记录构造轻量分类器的输入特征
+
+    特征依次为：载频均值、载频范围、脉宽均值、PRI 类型、有效 PRI 个数、各 PRI 值。
+    幅度与到达角取决于相对位置而非辐射源本身，不作为特征。
+
+    Args:
+        records: CLUSTER_PARAMS_DTYPE 结构化数组
+
+    Returns:
+        特征矩阵，形状为 (N, 5 + MAX_PRI_VALUES)
+    """
+    if records.dtype != CLUSTER_PARAMS_DTYPE:
+        raise TypeError(f"簇参数记录类型不匹配: {records.dtype}")
+    features = np.column_stack([
+        records["cf_mean"],
+        records["cf_max"] - records["cf_min"],
+        records["pw_mean"],
+        records["pri_type"].astype(np.float64),
+        records["pri_count"].astype(np.float64),
+        records["pri_values"].reshape(records.size, -1),
+    ])
+    features[np.isnan(features)] = MISSING_VALUE
+    return features
+
+
+@dataclass
+class CascadeDecision:
+    """轻量分类器的判定结果
+
+    Attributes:
+        class_ids: 各簇的类别序号（需要 CNN 的簇在合并前为 -1）
+        confidence: 各簇的置信度
+        needs_cnn: 需要送入 CNN 的簇
+    """
+
+    class_ids: np.ndarray
+    confidence: np.ndarray
+    needs_cnn: np.ndarray
+
+    @property
+    def cnn_indices(self) -> np.ndarray:
+        """需要送入 CNN 的簇序号"""
+        return np.flatnonzero(self.needs_cnn)
+
+    @property
+    def fast_ratio(self) -> float:
+        """由轻量分类器直接给出结果的簇比例"""
+        return 1.0 - float(self.needs_cnn.mean()) if self.needs_cnn.size else 1.0
+
+    def merge(self, cnn_probabilities: np.ndarray) -> None:
+        """把 CNN 对不确定簇的推理结果写回
+
+        Args:
+            cnn_probabilities: CNN 输出的类别概率，行与 cnn_indices 一一对应
+        """
+        indices = self.cnn_indices
+        if cnn_probabilities.shape[0] != indices.size:
+            raise ValueError(f"CNN 结果数量不匹配: {cnn_probabilities.shape[0]} vs {indices.size}")
+        if indices.size:
+            self.class_ids[indices] = cnn_probabilities.argmax(axis=1)
+            self.confidence[indices] = cnn_probabilities.max(axis=1)
+
+
+class CascadeClassifier(LoggerMixin):
+    """级联分类器的第一级
+
+    没有轻量分类器时所有簇都交给 CNN；阈值为 1.0 时同样全部交给 CNN。
+    """
+
+    def __init__(self, fast_model: Optional[Any] = None, threshold: float = 0.9) -> None:
+        """初始化级联分类器
+
+        Args:
+            fast_model: 提供 predict_proba 与 classes_ 的轻量分类器
+            threshold: 采用轻量分类器结果所需的最低置信度（0~1）
+        """
+        self.fast_model = fast_model
+        self.threshold = float(threshold)
+
+    @staticmethod
+    def model_path(models_dir: Union[str, Path], name: str) -> Path:
+        """模型目录下与 CNN 模型同名的轻量分类器路径
+
+        Args:
+            models_dir: 模型目录
+            name: 模型名称（ModelRegistry 中的名称）
+        """
+        return Path(models_dir) / f"{name}.cascade.joblib"
+
+    def load(self, path: Union[str, Path]) -> None:
+        """加载轻量分类器
+
+        Raises:
+            ImportError: 当未安装 joblib / scikit-learn 时
+            OSError: 当文件无法读取时
+        """
+        joblib = importlib.import_module("joblib")
+        self.fast_model = joblib.load(path)
+        self.logger.info(f"轻量分类器已加载: {Path(path).name}")
+
+    def fit(self, records: np.ndarray, class_ids: np.ndarray, path: Optional[Union[str, Path]] = None) -> None:
+        """以已识别的簇（通常是 CNN 的识别结果）训练轻量分类器
+
+        Args:
+            records: 簇参数记录
+            class_ids: 各簇的类别序号
+            path: 保存路径，为 None 时不保存
+
+        Raises:
+            ImportError: 当未安装 scikit-learn 时
+        """
+        ensemble = importlib.import_module("sklearn.ensemble")
+        model = ensemble.RandomForestClassifier(n_estimators=100, max_depth=12, min_samples_leaf=2, n_jobs=1)
+        model.fit(param_features(records), np.asarray(class_ids))
+        self.fast_model = model
+        if path is not None:
+            importlib.import_module("joblib").dump(model, path)
+        self.logger.info(f"轻量分类器训练完成: 样本数={records.size}, 类别数={len(model.classes_)}")
+
+    def decide(self, records: np.ndarray) -> CascadeDecision:
+        """用轻量分类器识别全部簇，低于阈值的簇标记为需要 CNN
+
+        Args:
+            records: 簇参数记录
+
+        Returns:
+            判定结果
+        """
+        count = records.size
+        if self.fast_model is None or self.threshold >= 1.0 or count == 0:
+            return CascadeDecision(
+                np.full(count, -1, dtype=np.int64), np.zeros(count), np.ones(count, dtype=bool)
+            )
+        probabilities = self.fast_model.predict_proba(param_features(records))
+        best = probabilities.argmax(axis=1)
+        confidence = probabilities[np.arange(count), best]
+        needs_cnn = confidence < self.threshold
+        class_ids = np.asarray(self.fast_model.classes_)[best].astype(np.int64)
+        class_ids[needs_cnn] = -1
+        return CascadeDecision(class_ids, confidence, needs_cnn)
+
+    def classify(
+        self, records: np.ndarray, features: np.ndarray, cnn_predict: Callable[[np.ndarray], np.ndarray]
+    ) -> CascadeDecision:
+        """完整的两级识别
+
+        Args:
+            records: 簇参数记录
+            features: CNN 的输入特征，第 0 维与 records 对应
+            cnn_predict: CNN 推理函数，如 ``lambda x: predictor.predict("pa", x)``
+
+        Returns:
+            合并了 CNN 结果的判定结果
+        """
+        decision = self.decide(records)
+        indices = decision.cnn_indices
+        if indices.size:
+            decision.merge(np.asarray(cnn_predict(features[indices])))
+        self.logger.debug(f"级联识别完成: 簇数={records.size}, 送入 CNN={indices.size}")
+        return decision
@@ -0,0 +1,214 @@
+# coding: utf-8
+"""
+模型输入特征构建器
+
+识别模型的输入是定长的 PA / DTOA 表示。本模块在一个切片内对所有簇一次性完成
+重采样或分箱，并直接写入预分配的张量，推理前无需为每个簇单独绘图或构建列表。
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from models.data.pulse_columns import PulseColumn
+from models.processors.params_extractor import DtoaFeatures
+from models.utils.log_manager import LoggerMixin
+from models.utils.segment_ops import ClusterSegments, segment_max, segment_min
+
+
+class FeatureBuilder(LoggerMixin):
+    """模型输入特征构建器
+
+    - 序列模式：将每个簇的 PA / DTOA 序列按脉冲序号线性插值为定长序列，输出 (K, L)；
+    - 图像模式：将每个簇的 PA-TOA 散点按簇内归一化后分箱为二值图像，输出 (K, H, W)。
+
+    所有输出均为 float32，并按簇做最小-最大归一化到 [0, 1]。
+    """
+
+    def __init__(
+        self,
+        sequence_length: int = 256,
+        image_shape: Tuple[int, int] = (64, 64),
+        dtype: np.dtype = np.float32,
+    ) -> None:
+        """初始化特征构建器
+
+        Args:
+            sequence_length: 序列模式的输出长度
+            image_shape: 图像模式的输出尺寸 (高, 宽)
+            dtype: 输出张量的数据类型
+
+        Raises:
+            ValueError: 当尺寸参数无效时
+        """
+        if sequence_length < 2:
+            raise ValueError(f"序列长度至少为2: {sequence_length}")
+        if len(image_shape) != 2 or min(image_shape) < 1:
+            raise ValueError(f"无效的图像尺寸: {image_shape}")
+        self.sequence_length = int(sequence_length)
+        self.image_shape = (int(image_shape[0]), int(image_shape[1]))
+        self.dtype = np.dtype(dtype)
+
+    def allocate_sequences(self, n_clusters: int) -> np.ndarray:
+        """预分配序列模式的输出张量
+
+        Args:
+            n_clusters: 容量（簇数量）
+
+        Returns:
+            形状为 (n_clusters, sequence_length) 的零张量
+        """
+        return np.zeros((n_clusters, self.sequence_length), dtype=self.dtype)
+
+    def allocate_images(self, n_clusters: int) -> np.ndarray:
+        """预分配图像模式的输出张量
+
+        Args:
+            n_clusters: 容量（簇数量）
+
+        Returns:
+            形状为 (n_clusters, H, W) 的零张量
+        """
+        return np.zeros((n_clusters, *self.image_shape), dtype=self.dtype)
+
+    def build_pa_sequences(
+        self,
+        pulses: np.ndarray,
+        segments: ClusterSegments,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """将所有簇的 PA 序列重采样为定长序列
+
+        Args:
+            pulses: 切片脉冲数据，形状为 (N, 5)
+            segments: 簇分段描述（簇内按 TOA 升序）
+            out: 预分配的输出张量，行数不少于簇数量；为 None 时内部分配
+
+        Returns:
+            out 的前 K 行视图，形状为 (K, sequence_length)
+        """
+        pa = segments.gather(pulses[:, PulseColumn.PA]).astype(np.float64, copy=False)
+        return self._resample(pa, segments.starts, segments.counts, out, "PA")
+
+    def build_dtoa_sequences(self, features: DtoaFeatures, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """将所有簇的 DTOA 序列重采样为定长序列
+
+        Args:
+            features: ParamsExtractor 输出的 DTOA 特征
+            out: 预分配的输出张量，行数不少于簇数量；为 None 时内部分配
+
+        Returns:
+            out 的前 K 行视图，形状为 (K, sequence_length)
+        """
+        return self._resample(features.dtoa, features.dtoa_starts, features.dtoa_counts, out, "DTOA")
+
+    def build_pa_images(
+        self,
+        pulses: np.ndarray,
+        segments: ClusterSegments,
+        out: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """将所有簇的 PA-TOA 散点分箱为定尺寸二值图像
+
+        横轴为簇内归一化的 TOA，纵轴为簇内归一化的 PA（图像第 0 行对应最大 PA）。
+
+        Args:
+            pulses: 切片脉冲数据，形状为 (N, 5)
+            segments: 簇分段描述
+            out: 预分配的输出张量，形状为 (>=K, H, W)；为 None 时内部分配
+
+        Returns:
+            out 的前 K 个图像视图，形状为 (K, H, W)
+        """
+        n_clusters = segments.n_clusters
+        height, width = self.image_shape
+        images = self._prepare_out(out, n_clusters, self.image_shape)
+        if segments.n_pulses == 0:
+            return images
+
+        seg_ids = segments.segment_ids
+        toa = segments.gather(pulses[:, PulseColumn.TOA]).astype(np.float64, copy=False)
+        pa = segments.gather(pulses[:, PulseColumn.PA]).astype(np.float64, copy=False)
+
+        x = np.minimum((self._normalize(toa, segments) * width).astype(np.intp), width - 1)
+        y = np.minimum((self._normalize(pa, segments) * height).astype(np.intp), height - 1)
+        flat = images.reshape(n_clusters, -1)
+        flat[seg_ids, (height - 1 - y) * width + x] = 1
+        self.logger.debug(f"PA图像构建完成: 簇数={n_clusters}, 尺寸={self.image_shape}")
+        return images
+
+    def _resample(
+        self,
+        values: np.ndarray,
+        starts: np.ndarray,
+        counts: np.ndarray,
+        out: Optional[np.ndarray],
+        name: str,
+    ) -> np.ndarray:
+        """按脉冲序号对各分段做线性插值重采样并归一化
+
+        Args:
+            values: 按分段排列的一维数组
+            starts: 各分段起始偏移
+            counts: 各分段长度
+            out: 预分配的输出张量
+            name: 特征名称（仅用于日志）
+
+        Returns:
+            形状为 (K, sequence_length) 的输出视图
+        """
+        n_clusters = counts.size
+        result = self._prepare_out(out, n_clusters, (self.sequence_length,))
+        nonempty = counts > 0
+        if not nonempty.any():
+            return result
+
+        seg_starts = starts[nonempty][:, None]
+        seg_last = (counts[nonempty] - 1)[:, None]
+        # 目标位置在每个分段内均匀分布于 [0, count-1]
+        position = np.linspace(0.0, 1.0, self.sequence_length)[None, :] * seg_last
+        lower = np.floor(position).astype(np.intp)
+        upper = np.minimum(lower + 1, seg_last)
+        weight = position - lower
+        sampled = values[seg_starts + lower] * (1.0 - weight) + values[seg_starts + upper] * weight
+
+        low = sampled.min(axis=1, keepdims=True)
+        span = sampled.max(axis=1, keepdims=True) - low
+        np.divide(sampled - low, span, out=sampled, where=span > 0)
+        sampled[np.broadcast_to(span <= 0, sampled.shape)] = 0.0
+
+        result[nonempty] = sampled
+        self.logger.debug(f"{name}序列重采样完成: 簇数={n_clusters}, 长度={self.sequence_length}")
+        return result
+
+    def _prepare_out(self, out: Optional[np.ndarray], n_clusters: int, item_shape: Tuple[int, ...]) -> np.ndarray:
+        """校验或分配输出张量，并清零前 n_clusters 项
+
+        Raises:
+            ValueError: 当预分配张量容量或形状不符合要求时
+        """
+        if out is None:
+            return np.zeros((n_clusters, *item_shape), dtype=self.dtype)
+        if out.shape[1:] != item_shape or out.shape[0] < n_clusters or not out.flags.c_contiguous:
+            raise ValueError(f"预分配张量形状不匹配: 需要 (>={n_clusters}, {item_shape}), 实际 {out.shape}")
+        view = out[:n_clusters]
+        view.fill(0)
+        return view
+
+    @staticmethod
+    def _normalize(values: np.ndarray, segments: ClusterSegments) -> np.ndarray:
+        """簇内最小-最大归一化
+
+        Args:
+            values: 按分段排列的一维数组
+            segments: 簇分段描述
+
+        Returns:
+            与 values 等长、按簇归一化到 [0, 1] 的数组（常数簇取 0.5）
+        """
+        seg_ids = segments.segment_ids
+        low = segment_min(values, segments)[seg_ids]
+        span = segment_max(values, segments)[seg_ids] - low
+        normalized = np.full(values.shape, 0.5)
+        np.divide(values - low, span, out=normalized, where=span > 0)
+        return normalized
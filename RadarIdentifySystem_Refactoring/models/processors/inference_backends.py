@@ -0,0 +1,370 @@
+# coding: utf-8
+"""
+推理后端
+
+为识别模型提供统一的推理接口，可在以下实现之间切换：
+
+- TensorFlow：直接加载随软件发布的 Keras 模型（.keras / .h5）；
+- ONNX Runtime（CPU）：加载转换后的 .onnx 模型，导入与常驻内存开销远小于 TensorFlow；
+- TFLite：加载转换后的 .tflite 模型，优先使用独立的 tflite_runtime 解释器。
+
+各后端的依赖库都只在 load 时导入，模块本身可以在界面线程中随时导入。
+推理线程数（算子内 / 算子间）在创建后端时指定，避免运行库默认占满所有核心、与聚类线程争抢 CPU。
+所有后端都实现 ``predict_on_batch``，可直接注册到 ModelPredictor。
+
+同一模型的量化变体与浮点模型放在同一目录，文件名在后缀前加精度标记，
+如 ``pa.int8.onnx``、``pa.fp16.tflite``。
+"""
+
+import importlib.util
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+from models.utils.log_manager import LoggerMixin
+
+
+class BackendUnavailableError(RuntimeError):
+    """推理后端依赖的库未安装"""
+
+
+class InferenceBackend(ABC, LoggerMixin):
+    """推理后端基类
+
+    Attributes:
+        name: 后端标识，与配置项 cfg.inferenceBackend 的取值一致
+        display_name: 界面显示名称
+        suffixes: 该后端可加载的模型文件后缀
+        modules: 判断后端是否可用时检查的模块（满足其一即可）
+    """
+
+    name = ""
+    display_name = ""
+    suffixes: Tuple[str, ...] = ()
+    modules: Tuple[str, ...] = ()
+
+    def __init__(self, intra_op_threads: int = 0, inter_op_threads: int = 0) -> None:
+        """初始化推理后端
+
+        Args:
+            intra_op_threads: 单个算子内部并行的线程数，0 表示使用运行库默认值
+            inter_op_threads: 算子之间并行的线程数，0 表示使用运行库默认值
+        """
+        self.model_path: Optional[Path] = None
+        self.version: Optional[str] = None
+        self.intra_op_threads = max(int(intra_op_threads), 0)
+        self.inter_op_threads = max(int(inter_op_threads), 0)
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """后端依赖是否已安装（只查找模块，不导入）"""
+        return any(importlib.util.find_spec(module) is not None for module in cls.modules)
+
+    @classmethod
+    def runtime_module(cls) -> Optional[str]:
+        """实际会被导入的运行库模块名，未安装时为 None"""
+        return next((module for module in cls.modules if importlib.util.find_spec(module) is not None), None)
+
+    @property
+    def is_loaded(self) -> bool:
+        """是否已加载模型"""
+        return self.model_path is not None
+
+    @property
+    @abstractmethod
+    def input_shape(self) -> Tuple[Optional[int], ...]:
+        """模型输入形状，第 0 维为批大小（可变时为 None）"""
+
+    def load(self, model_path: Union[str, Path]) -> None:
+        """加载模型文件
+
+        Args:
+            model_path: 模型文件路径
+
+        Raises:
+            BackendUnavailableError: 当后端依赖库未安装时
+            ValueError: 当模型文件格式与后端不匹配时
+            OSError: 当模型文件无法读取时
+        """
+        path = Path(model_path)
+        if path.suffix.lower() not in self.suffixes:
+            raise ValueError(f"{self.display_name} 不支持的模型格式: {path.name}")
+        if not path.exists():
+            raise FileNotFoundError(f"模型文件不存在: {path}")
+        self._load(path)
+        self.model_path = path
+        self.version = model_file_version(path)
+        self.logger.info(f"模型已加载: 后端={self.name}, 文件={path.name}")
+
+    def predict_on_batch(self, x: np.ndarray) -> np.ndarray:
+        """推理一批样本
+
+        Args:
+            x: 输入张量，第 0 维为样本
+
+        Returns:
+            输出张量，第 0 维与输入一致
+        """
+        if not self.is_loaded:
+            raise RuntimeError("推理后端尚未加载模型")
+        return self._predict(np.ascontiguousarray(x, dtype=np.float32))
+
+    def warmup(self, batch_sizes: Sequence[int]) -> float:
+        """按预期的批大小各推理一次全零输入
+
+        首次推理时运行库才会完成图追踪、内存分配与算子选择，耗时可达数秒；
+        加载后立即预热，这部分开销就不会落在第一批真实样本上。
+        除批大小外还有可变维度的模型无法构造输入，跳过预热。
+
+        Args:
+            batch_sizes: 预期的批大小
+
+        Returns:
+            预热耗时（秒）
+        """
+        shape = self.input_shape[1:]
+        if any(dim is None for dim in shape):
+            self.logger.warning(f"模型输入形状不固定，跳过预热: {self.model_path.name}, 形状={self.input_shape}")
+            return 0.0
+        start = time.perf_counter()
+        for batch_size in dict.fromkeys(int(size) for size in batch_sizes if size > 0):
+            self.predict_on_batch(np.zeros((batch_size, *shape), dtype=np.float32))
+        elapsed = time.perf_counter() - start
+        self.logger.debug(f"模型预热完成: {self.model_path.name}, 批大小={list(batch_sizes)}, 耗时={elapsed:.2f}s")
+        return elapsed
+
+    def release(self) -> None:
+        """释放模型占用的资源"""
+        self._release()
+        self.model_path = None
+        self.version = None
+
+    @abstractmethod
+    def _load(self, path: Path) -> None:
+        """由子类加载模型文件"""
+
+    @abstractmethod
+    def _predict(self, x: np.ndarray) -> np.ndarray:
+        """由子类推理一批 float32 样本"""
+
+    @abstractmethod
+    def _release(self) -> None:
+        """由子类释放运行库对象"""
+
+    @classmethod
+    def _import(cls, module: str):
+        """导入后端依赖库，未安装时抛出 BackendUnavailableError"""
+        try:
+            return importlib.import_module(module)
+        except ImportError as e:
+            raise BackendUnavailableError(f"{cls.display_name} 不可用: {e}") from e
+
+
+class TensorFlowBackend(InferenceBackend):
+    """TensorFlow / Keras 推理后端"""
+
+    name = "tensorflow"
+    display_name = "TensorFlow"
+    suffixes = (".keras", ".h5")
+    modules = ("tensorflow",)
+
+    def __init__(self, intra_op_threads: int = 0, inter_op_threads: int = 0) -> None:
+        super().__init__(intra_op_threads, inter_op_threads)
+        self._model = None
+        self._function = None
+
+    @property
+    def input_shape(self) -> Tuple[Optional[int], ...]:
+        return tuple(self._model.input_shape)
+
+    def _load(self, path: Path) -> None:
+        tf = self._import("tensorflow")
+        self._configure_threads(tf)
+        self._model = tf.keras.models.load_model(path, compile=False)
+        # 以批大小可变的输入签名追踪一次计算图，之后任何批大小都不再重新追踪
+        model = self._model
+        signature = tf.TensorSpec((None, *model.input_shape[1:]), tf.float32)
+        self._function = tf.function(lambda x: model(x, training=False)).get_concrete_function(signature)
+
+    def _configure_threads(self, tf) -> None:
+        """设置 TensorFlow 的全局线程数
+
+        TensorFlow 的线程池在首次执行运算时创建，之后无法再修改，只能在重启后生效。
+        """
+        threading = tf.config.threading
+        if (threading.get_intra_op_parallelism_threads(), threading.get_inter_op_parallelism_threads()) == (
+            self.intra_op_threads,
+            self.inter_op_threads,
+        ):
+            return
+        try:
+            threading.set_intra_op_parallelism_threads(self.intra_op_threads)
+            threading.set_inter_op_parallelism_threads(self.inter_op_threads)
+        except RuntimeError:
+            self.logger.warning("TensorFlow 已初始化，推理线程数设置将在重启后生效")
+
+    def _predict(self, x: np.ndarray) -> np.ndarray:
+        return self._function(x).numpy()
+
+    def _release(self) -> None:
+        self._model = None
+        self._function = None
+
+
+class OnnxRuntimeBackend(InferenceBackend):
+    """ONNX Runtime（CPU）推理后端"""
+
+    name = "onnxruntime"
+    display_name = "ONNX Runtime"
+    suffixes = (".onnx",)
+    modules = ("onnxruntime",)
+
+    def __init__(self, intra_op_threads: int = 0, inter_op_threads: int = 0) -> None:
+        super().__init__(intra_op_threads, inter_op_threads)
+        self._session = None
+        self._input_name = ""
+
+    @property
+    def input_shape(self) -> Tuple[Optional[int], ...]:
+        shape = self._session.get_inputs()[0].shape
+        return tuple(dim if isinstance(dim, int) else None for dim in shape)
+
+    def _load(self, path: Path) -> None:
+        ort = self._import("onnxruntime")
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_threads
+        options.inter_op_num_threads = self.inter_op_threads
+        if self.inter_op_threads > 1:
+            # 算子间线程只在并行执行模式下使用
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+        self._session = ort.InferenceSession(str(path), sess_options=options, providers=["CPUExecutionProvider"])
+        self._input_name = self._session.get_inputs()[0].name
+
+    def _predict(self, x: np.ndarray) -> np.ndarray:
+        return self._session.run(None, {self._input_name: x})[0]
+
+    def _release(self) -> None:
+        self._session = None
+
+
+class TFLiteBackend(InferenceBackend):
+    """TFLite 推理后端
+
+    优先使用独立安装的 tflite_runtime，未安装时退回 TensorFlow 自带的解释器。
+    解释器的输入形状是固定的，批大小变化时需要重新分配张量。
+    解释器只有算子内线程数一项设置，inter_op_threads 不起作用。
+    """
+
+    name = "tflite"
+    display_name = "TFLite"
+    suffixes = (".tflite",)
+    modules = ("tflite_runtime", "tensorflow")
+
+    def __init__(self, intra_op_threads: int = 0, inter_op_threads: int = 0) -> None:
+        super().__init__(intra_op_threads, inter_op_threads)
+        self._interpreter = None
+        self._input_index = 0
+        self._output_index = 0
+        self._batch_size = 0
+
+    @property
+    def input_shape(self) -> Tuple[Optional[int], ...]:
+        shape = self._interpreter.get_input_details()[0]["shape_signature"]
+        return tuple(int(dim) if dim >= 0 else None for dim in shape)
+
+    def _load(self, path: Path) -> None:
+        if importlib.util.find_spec("tflite_runtime") is not None:
+            interpreter_cls = self._import("tflite_runtime.interpreter").Interpreter
+        else:
+            interpreter_cls = self._import("tensorflow").lite.Interpreter
+        self._interpreter = interpreter_cls(model_path=str(path), num_threads=self.intra_op_threads or None)
+        self._input_index = self._interpreter.get_input_details()[0]["index"]
+        self._output_index = self._interpreter.get_output_details()[0]["index"]
+        self._batch_size = 0
+
+    def _predict(self, x: np.ndarray) -> np.ndarray:
+        if x.shape[0] != self._batch_size:
+            self._interpreter.resize_tensor_input(self._input_index, list(x.shape))
+            self._interpreter.allocate_tensors()
+            self._batch_size = x.shape[0]
+        self._interpreter.set_tensor(self._input_index, x)
+        self._interpreter.invoke()
+        return self._interpreter.get_tensor(self._output_index).copy()
+
+    def _release(self) -> None:
+        self._interpreter = None
+        self._batch_size = 0
+
+
+BACKENDS: Dict[str, Type[InferenceBackend]] = {
+    backend.name: backend for backend in (TensorFlowBackend, OnnxRuntimeBackend, TFLiteBackend)
+}
+
+
+FLOAT_VARIANT = "float32"
+# 量化变体 -> 文件名中的精度标记
+VARIANT_TAGS: Dict[str, str] = {"float16": "fp16", "int8": "int8"}
+
+
+def split_variant(model_path: Union[str, Path]) -> Tuple[Path, str]:
+    """从模型文件路径中分离精度标记
+
+    Args:
+        model_path: 模型文件路径
+
+    Returns:
+        (去掉后缀与精度标记的路径, 精度变体)，浮点模型的变体为 FLOAT_VARIANT
+    """
+    stem_path = Path(model_path).with_suffix("")
+    for variant, tag in VARIANT_TAGS.items():
+        if stem_path.suffix == f".{tag}":
+            return stem_path.with_suffix(""), variant
+    return stem_path, FLOAT_VARIANT
+
+
+def model_file_version(model_path: Union[str, Path]) -> str:
+    """由文件名、大小与修改时间组成的模型版本标识，模型文件被替换后随之改变
+
+    Raises:
+        OSError: 当模型文件无法访问时
+    """
+    path = Path(model_path)
+    stat = path.stat()
+    return f"{path.name}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def available_backends() -> List[str]:
+    """已安装依赖的后端标识列表"""
+    return [name for name, backend in BACKENDS.items() if backend.is_available()]
+
+
+def backend_for_file(model_path: Union[str, Path]) -> Type[InferenceBackend]:
+    """根据模型文件后缀确定后端
+
+    Raises:
+        ValueError: 当文件后缀不被任何后端支持时
+    """
+    suffix = Path(model_path).suffix.lower()
+    for backend in BACKENDS.values():
+        if suffix in backend.suffixes:
+            return backend
+    raise ValueError(f"不支持的模型格式: {model_path}")
+
+
+def create_backend(name: str, intra_op_threads: int = 0, inter_op_threads: int = 0) -> InferenceBackend:
+    """按标识创建推理后端实例
+
+    Args:
+        name: 后端标识
+        intra_op_threads: 算子内线程数，0 表示使用运行库默认值
+        inter_op_threads: 算子间线程数，0 表示使用运行库默认值
+
+    Raises:
+        KeyError: 当后端标识未知时
+    """
+    if name not in BACKENDS:
+        raise KeyError(f"未知的推理后端: {name}")
+    return BACKENDS[name](intra_op_threads, inter_op_threads)
@@ -0,0 +1,164 @@
+# coding: utf-8
+"""
+簇对相似度
+
+对候选簇对整批计算各项相似度（0~1，1 表示完全一致）：
+
+- 载频重叠：两簇载频区间的交集占较窄区间的比例（点区间落在另一区间内时为 1）；
+- 脉宽比：较小与较大脉宽均值之比；
+- PRI 匹配：1 减去最接近的一对 PRI 的相对差；
+- 到达角接近度：按圆周距离的高斯核，尺度为 doa_scale 度；
+- 类别一致：识别类别相同为 1，不同为 0。
+
+簇参数先整理为按列连续存放的参数表，簇对以两个下标数组索引参数表，所有计算都是按列的数组运算，
+不对单个簇对调用 Python 函数。参数缺失的项为 NaN，综合得分时不计入。
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import numpy as np
+
+from models.data.cluster_params import CLUSTER_PARAMS_DTYPE
+
+# 综合得分的默认权重
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "cf_overlap": 0.3,
+    "pw_ratio": 0.2,
+    "pri_match": 0.3,
+    "doa_proximity": 0.1,
+    "class_agreement": 0.1,
+}
+
+
+@dataclass
+class PairSimilarity:
+    """簇对的各项相似度，每项形状为 (P,)，参数缺失时为 NaN"""
+
+    cf_overlap: np.ndarray
+    pw_ratio: np.ndarray
+    pri_match: np.ndarray
+    doa_proximity: np.ndarray
+    class_agreement: np.ndarray
+
+    def score(self, weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """加权综合得分，只计入非缺失的项
+
+        Args:
+            weights: 各项的权重，为 None 时使用 DEFAULT_WEIGHTS
+
+        Returns:
+            综合得分（0~1），所有项都缺失时为 NaN
+        """
+        weights = DEFAULT_WEIGHTS if weights is None else weights
+        total = np.zeros(self.cf_overlap.shape[0])
+        weight_sum = np.zeros_like(total)
+        for name, weight in weights.items():
+            values = getattr(self, name)
+            valid = ~np.isnan(values)
+            total += np.where(valid, values, 0.0) * weight
+            weight_sum += valid * weight
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return total / weight_sum
+
+
+class SimilarityTable:
+    """簇参数表
+
+    保存相似度计算所需的各列（连续存放），可对任意多批簇对重复计算。
+    """
+
+    def __init__(self, records: np.ndarray, class_ids: Optional[np.ndarray] = None, doa_scale: float = 10.0) -> None:
+        """整理簇参数表
+
+        Args:
+            records: CLUSTER_PARAMS_DTYPE 结构化数组
+            class_ids: 各簇的识别类别，小于 0 表示未识别；为 None 时类别一致项为 NaN
+            doa_scale: 到达角接近度的尺度（度）
+
+        Raises:
+            TypeError: 当记录类型不匹配时
+            ValueError: 当类别数量与记录数量不一致时
+        """
+        if records.dtype != CLUSTER_PARAMS_DTYPE:
+            raise TypeError(f"簇参数记录类型不匹配: {records.dtype}")
+        if class_ids is not None and len(class_ids) != records.size:
+            raise ValueError(f"类别数量与簇数量不匹配: {len(class_ids)} vs {records.size}")
+        self.cf_min = np.ascontiguousarray(np.where(np.isnan(records["cf_min"]), records["cf_mean"], records["cf_min"]))
+        self.cf_max = np.ascontiguousarray(np.where(np.isnan(records["cf_max"]), records["cf_mean"], records["cf_max"]))
+        self.pw = np.ascontiguousarray(records["pw_mean"])
+        # PRI 按列存放，全为 NaN 的列（没有簇具有那么多个 PRI）不参与比较
+        self.pri_columns = [
+            np.ascontiguousarray(column) for column in records["pri_values"].T if not np.isnan(column).all()
+        ]
+        self.doa = np.ascontiguousarray(records["doa_mean"])
+        self.class_ids = None if class_ids is None else np.asarray(class_ids, dtype=np.int64)
+        self.doa_scale = float(doa_scale)
+
+    def compute(self, pairs: np.ndarray, chunk_size: int = 1 << 18) -> PairSimilarity:
+        """计算簇对的各项相似度
+
+        Args:
+            pairs: 簇对，形状为 (P, 2)
+            chunk_size: 每批计算的簇对数，限制中间数组的大小
+
+        Returns:
+            各项相似度
+        """
+        count = pairs.shape[0]
+        columns = {name: np.empty(count) for name in PairSimilarity.__dataclass_fields__}
+        for start in range(0, count, chunk_size):
+            stop = min(start + chunk_size, count)
+            left, right = pairs[start:stop, 0], pairs[start:stop, 1]
+            columns["cf_overlap"][start:stop] = self._cf_overlap(left, right)
+            columns["pw_ratio"][start:stop] = self._pw_ratio(left, right)
+            columns["pri_match"][start:stop] = self._pri_match(left, right)
+            columns["doa_proximity"][start:stop] = self._doa_proximity(left, right)
+            columns["class_agreement"][start:stop] = self._class_agreement(left, right)
+        return PairSimilarity(**columns)
+
+    def _cf_overlap(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """载频区间的交集占较窄区间的比例"""
+        low_a, high_a, low_b, high_b = self.cf_min[left], self.cf_max[left], self.cf_min[right], self.cf_max[right]
+        intersection = np.minimum(high_a, high_b) - np.maximum(low_a, low_b)
+        narrower = np.minimum(high_a - low_a, high_b - low_b)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            overlap = np.clip(intersection / narrower, 0.0, 1.0)
+        # 较窄的区间退化为点时，按是否落在另一区间内取 1 或 0
+        point = narrower == 0
+        overlap[point] = (intersection[point] >= 0).astype(np.float64)
+        return overlap
+
+    def _pw_ratio(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """较小与较大脉宽均值之比"""
+        pw_a, pw_b = self.pw[left], self.pw[right]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = np.minimum(pw_a, pw_b) / np.maximum(pw_a, pw_b)
+        ratio[(pw_a == 0) & (pw_b == 0)] = 1.0
+        return ratio
+
+    def _pri_match(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """1 减去最接近的一对 PRI 的相对差"""
+        closest = np.full(left.size, np.nan)
+        # 逐列组合比较，np.fmin 跳过 NaN，不需要 (P, 4, 4) 的中间数组
+        left_columns = [column[left] for column in self.pri_columns]
+        right_columns = [column[right] for column in self.pri_columns]
+        for pri_a in left_columns:
+            for pri_b in right_columns:
+                np.fmin(closest, np.abs(pri_a - pri_b) / np.fmax(pri_a, pri_b), out=closest)
+        return 1.0 - np.minimum(closest, 1.0)
+
+    def _doa_proximity(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """按圆周距离的高斯核"""
+        distance = np.abs(self.doa[left] - self.doa[right]) % 360.0
+        distance = np.minimum(distance, 360.0 - distance)
+        return np.exp(-0.5 * (distance / self.doa_scale) ** 2)
+
+    def _class_agreement(self, left: np.ndarray, right: np.ndarray) -> np.ndarray:
+        """识别类别相同为 1，不同为 0，未识别为 NaN"""
+        if self.class_ids is None:
+            return np.full(left.size, np.nan)
+        class_a, class_b = self.class_ids[left], self.class_ids[right]
+        agreement = (class_a == class_b).astype(np.float64)
+        agreement[(class_a < 0) | (class_b < 0)] = np.nan
+        return agreement
@@ -0,0 +1,327 @@
+# coding: utf-8
+"""
+模型预测器
+
+将多个簇（全速模式下跨越多个切片）的特征张量汇集成大批量后统一推理。
+逐簇调用 model.predict 时，TensorFlow 的调度开销远大于实际计算量；
+按批调用 predict_on_batch 可以把这部分开销均摊到整批样本上。
+
+TensorFlow 仅在首次加载模型文件时导入，不影响应用启动。
+
+配置了推理结果缓存时，每批样本先按特征哈希查询缓存，只把未命中的样本送入模型；
+整批命中时连模型都不会获取（也就不会触发模型加载）。
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from models.processors.inference_backends import model_file_version
+from models.utils.log_manager import LoggerMixin
+
+if TYPE_CHECKING:
+    from models.services.inference_cache import InferenceCache
+
+
+@dataclass
+class Predictions:
+    """一批样本的推理结果
+
+    Attributes:
+        slice_indices: 样本所属切片序号
+        labels: 样本对应的簇标签
+        probabilities: 各类别概率，形状为 (M, n_classes)
+    """
+
+    slice_indices: np.ndarray
+    labels: np.ndarray
+    probabilities: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.labels.size)
+
+    @property
+    def class_ids(self) -> np.ndarray:
+        """预测类别（概率最大的类别序号）"""
+        return self.probabilities.argmax(axis=1) if len(self) else np.empty(0, dtype=np.intp)
+
+    @property
+    def confidence(self) -> np.ndarray:
+        """预测类别对应的概率"""
+        return self.probabilities.max(axis=1) if len(self) else np.empty(0)
+
+    @classmethod
+    def concatenate(cls, parts: List["Predictions"]) -> "Predictions":
+        """拼接多批推理结果"""
+        return cls(
+            slice_indices=np.concatenate([p.slice_indices for p in parts]),
+            labels=np.concatenate([p.labels for p in parts]),
+            probabilities=np.concatenate([p.probabilities for p in parts]),
+        )
+
+
+class _PendingQueue:
+    """单个模型的待推理样本队列"""
+
+    def __init__(self) -> None:
+        self.features: List[np.ndarray] = []
+        self.slice_indices: List[np.ndarray] = []
+        self.labels: List[np.ndarray] = []
+        self.count = 0
+        self.results: List[Predictions] = []
+
+    def peek(self, count: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """查看队首 count 个样本（不出队），返回 (features, slice_indices, labels)
+
+        多次提交的数据先合并为一块，之后每批只取视图，避免重复拷贝剩余样本。
+        """
+        if len(self.features) > 1:
+            self.features = [np.concatenate(self.features)]
+            self.slice_indices = [np.concatenate(self.slice_indices)]
+            self.labels = [np.concatenate(self.labels)]
+        return tuple(part[0][:count] for part in (self.features, self.slice_indices, self.labels))
+
+    def discard(self, count: int) -> None:
+        """移除队首 count 个样本（须先经 peek 合并）"""
+        self.count -= count
+        if self.count:
+            self.features = [self.features[0][count:]]
+            self.slice_indices = [self.slice_indices[0][count:]]
+            self.labels = [self.labels[0][count:]]
+        else:
+            self.features, self.slice_indices, self.labels = [], [], []
+
+
+class ModelPredictor(LoggerMixin):
+    """模型预测器
+
+    每个已注册的模型对应一个待推理队列。调用 submit 提交一个切片的全部簇特征，
+    队列中的样本凑满 batch_size 后立即推理一批，剩余样本在 flush 时推理。
+
+    模型对象只需提供 ``predict_on_batch(x) -> np.ndarray`` 方法。
+    未通过 set_model 注册的模型名称交给 model_provider 解析（如 ModelRegistry.get），
+    预测器不持有这类模型的引用，模型的加载与淘汰由提供方负责。
+
+    只有版本已知的模型才使用缓存：set_model 传入的 version、模型对象的 version 属性，
+    或 version_provider（如 ModelRegistry.version）返回的版本。
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 256,
+        model_provider: Optional[Callable[[str], Any]] = None,
+        cache: Optional["InferenceCache"] = None,
+        version_provider: Optional[Callable[[str], Optional[str]]] = None,
+    ) -> None:
+        """初始化模型预测器
+
+        Args:
+            batch_size: 每次调用 predict_on_batch 的最大样本数
+            model_provider: 按名称获取模型对象的函数，每批推理前调用
+            cache: 推理结果缓存，为 None 时不缓存
+            version_provider: 按名称获取模型版本的函数（不应触发模型加载）
+        """
+        self._models: Dict[str, Any] = {}
+        self._versions: Dict[str, Optional[str]] = {}
+        self._queues: Dict[str, _PendingQueue] = {}
+        self._model_provider = model_provider
+        self._version_provider = version_provider
+        self.cache = cache
+        self.batch_size = batch_size
+
+    @property
+    def batch_size(self) -> int:
+        """每批的最大样本数"""
+        return self._batch_size
+
+    @batch_size.setter
+    def batch_size(self, value: int) -> None:
+        if int(value) < 1:
+            raise ValueError(f"批大小必须为正整数: {value}")
+        self._batch_size = int(value)
+
+    @property
+    def model_names(self) -> List[str]:
+        """已注册的模型名称"""
+        return list(self._models)
+
+    def set_model(self, name: str, model: Any, version: Optional[str] = None) -> None:
+        """注册已加载的模型对象
+
+        Args:
+            name: 模型名称，如 "pa"、"dtoa"
+            model: 提供 predict_on_batch 方法的模型对象
+            version: 模型版本，用作推理缓存键的一部分；为 None 时取模型对象的 version 属性
+        """
+        if not callable(getattr(model, "predict_on_batch", None)):
+            raise TypeError(f"模型对象缺少 predict_on_batch 方法: {type(model).__name__}")
+        self._models[name] = model
+        self._versions[name] = version if version is not None else getattr(model, "version", None)
+        self._queues.setdefault(name, _PendingQueue())
+        self.logger.info(f"模型已注册: {name}")
+
+    def load_model(self, name: str, model_path: str) -> bool:
+        """从文件加载 Keras 模型并注册
+
+        Args:
+            name: 模型名称
+            model_path: 模型文件路径（.keras / .h5）
+
+        Returns:
+            是否加载成功
+        """
+        try:
+            # 仅在需要时导入 TensorFlow，避免拖慢应用启动
+            from tensorflow import keras
+
+            model = keras.models.load_model(model_path, compile=False)
+            version = model_file_version(model_path)
+        except ImportError as e:
+            self.logger.error(f"无法导入TensorFlow: {e}")
+            return False
+        except (OSError, ValueError) as e:
+            self.logger.error(f"加载模型失败: {model_path}, {e}")
+            return False
+        self.set_model(name, model, version)
+        return True
+
+    def predict(self, name: str, features: np.ndarray) -> np.ndarray:
+        """立即推理一组样本，按 batch_size 分批调用 predict_on_batch
+
+        Args:
+            name: 模型名称
+            features: 特征张量，第 0 维为样本
+
+        Returns:
+            概率数组，形状为 (M, n_classes)
+        """
+        features = np.asarray(features)
+        count = features.shape[0]
+        if count == 0:
+            return np.empty((0, 0), dtype=np.float32)
+
+        output: Optional[np.ndarray] = None
+        for start in range(0, count, self._batch_size):
+            batch = self._predict_batch(name, features[start:start + self._batch_size])
+            if output is None:
+                output = np.empty((count, *batch.shape[1:]), dtype=batch.dtype)
+            output[start:start + batch.shape[0]] = batch
+        return output
+
+    def submit(self, name: str, features: np.ndarray, labels: np.ndarray, slice_index: int = 0) -> int:
+        """提交一个切片的簇特征，凑满整批后立即推理
+
+        Args:
+            name: 模型名称
+            features: 特征张量，第 0 维与 labels 对应
+            labels: 簇标签
+            slice_index: 切片序号
+
+        Returns:
+            本次调用中完成推理的批数
+        """
+        if name not in self._models and self._model_provider is None:
+            raise KeyError(f"模型未注册: {name}")
+        features = np.asarray(features)
+        labels = np.asarray(labels)
+        if features.shape[0] != labels.shape[0]:
+            raise ValueError(f"特征与标签数量不匹配: {features.shape[0]} vs {labels.shape[0]}")
+        if labels.size == 0:
+            return 0
+
+        queue = self._queues.setdefault(name, _PendingQueue())
+        # 调用方可能复用预分配张量，入队时必须复制
+        queue.features.append(features.copy())
+        queue.slice_indices.append(np.full(labels.size, slice_index, dtype=np.int32))
+        queue.labels.append(labels.astype(np.int32, copy=False))
+        queue.count += labels.size
+
+        batches = 0
+        while queue.count >= self._batch_size:
+            self._run_batch(name, queue, self._batch_size)
+            batches += 1
+        return batches
+
+    def flush(self, name: Optional[str] = None) -> Dict[str, Predictions]:
+        """推理所有剩余样本，并取出累计的推理结果
+
+        配置了推理缓存时，完成后把新增的缓存条目写入磁盘。
+
+        Args:
+            name: 模型名称，为 None 时处理全部模型
+
+        Returns:
+            模型名称到推理结果的映射（按提交顺序）
+        """
+        names = [name] if name is not None else list(self._queues)
+        results: Dict[str, Predictions] = {}
+        for key in names:
+            queue = self._queues[key]
+            while queue.count:
+                self._run_batch(key, queue, min(queue.count, self._batch_size))
+            if queue.results:
+                results[key] = Predictions.concatenate(queue.results)
+                queue.results = []
+        if self.cache is not None:
+            self.cache.save()
+        return results
+
+    def pending_count(self, name: str) -> int:
+        """队列中尚未推理的样本数"""
+        return self._queues[name].count if name in self._queues else 0
+
+    def _get_model(self, name: str) -> Any:
+        """获取已注册或由 model_provider 提供的模型
+
+        Raises:
+            KeyError: 当模型未注册且无法由 model_provider 提供时
+        """
+        if name in self._models:
+            return self._models[name]
+        if self._model_provider is None:
+            raise KeyError(f"模型未注册: {name}")
+        return self._model_provider(name)
+
+    def _model_version(self, name: str) -> Optional[str]:
+        """获取模型版本，未知时为 None"""
+        if name in self._models:
+            return self._versions.get(name)
+        if self._version_provider is None:
+            return None
+        return self._version_provider(name)
+
+    def _predict_batch(self, name: str, features: np.ndarray) -> np.ndarray:
+        """推理一批样本，命中缓存的样本不再送入模型"""
+        version = self._model_version(name) if self.cache is not None else None
+        if version is None:
+            return np.asarray(self._get_model(name).predict_on_batch(features))
+
+        model_key = f"{name}@{version}"
+        digests = self.cache.digest(features)
+        cached = self.cache.get_many(model_key, digests)
+        missing = [i for i, row in enumerate(cached) if row is None]
+        if not missing:
+            return np.stack(cached)
+
+        computed = np.asarray(self._get_model(name).predict_on_batch(features[missing]))
+        self.cache.put_many(model_key, [digests[i] for i in missing], computed)
+        if len(missing) == len(cached):
+            return computed
+        output = np.empty((len(cached), *computed.shape[1:]), dtype=computed.dtype)
+        output[missing] = computed
+        hits = [i for i, row in enumerate(cached) if row is not None]
+        output[hits] = np.stack([cached[i] for i in hits])
+        return output
+
+    def _run_batch(self, name: str, queue: _PendingQueue, count: int) -> None:
+        """推理队首 count 个样本，成功后才出队；推理失败时样本留在队列中，可再次 flush 重试"""
+        features, slice_indices, labels = queue.peek(count)
+        try:
+            probabilities = self._predict_batch(name, features)
+        except Exception as e:  # 模型加载与推理可能抛出任意异常
+            self.logger.error(f"批量推理失败，{queue.count} 个样本保留在队列中: 模型={name}, {e}")
+            raise
+        queue.discard(count)
+        queue.results.append(Predictions(slice_indices, labels, probabilities))
+        self.logger.debug(f"批量推理完成: 模型={name}, 样本数={count}")
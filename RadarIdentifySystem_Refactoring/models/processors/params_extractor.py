@@ -0,0 +1,353 @@
+# coding: utf-8
+"""
+参数提取器
+
+对一个切片内的全部聚类结果批量提取 DTOA 序列、PRI 直方图与 PRI 类型统计。
+所有簇共享同一次排序与分段归约，计算量随脉冲数线性增长，而与簇的数量无关。
+"""
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from models.data.cluster_params import MAX_PRI_VALUES, PriType, empty_cluster_params
+from models.data.pulse_columns import PulseColumn
+from models.utils.log_manager import LoggerMixin
+from models.utils.segment_ops import (
+    ClusterSegments,
+    build_segments,
+    inner_differences,
+    segment_max,
+    segment_mean,
+    segment_median,
+    segment_min,
+    segment_std,
+)
+
+if TYPE_CHECKING:
+    from models.processors.pri_analyzer import PriAnalysis
+
+
+@dataclass
+class DtoaFeatures:
+    """一个切片内全部簇的 DTOA 特征
+
+    DTOA 序列以“扁平数组 + 偏移”的形式存放：第 k 个簇的序列为
+    ``dtoa[dtoa_starts[k]:dtoa_starts[k] + dtoa_counts[k]]``。
+
+    Attributes:
+        labels: 簇标签，长度为 K
+        pulse_counts: 各簇脉冲数
+        dtoa: 所有簇的 DTOA 序列拼接结果（簇内按 TOA 升序）
+        dtoa_starts: 各簇 DTOA 序列在 dtoa 中的起始偏移
+        dtoa_counts: 各簇 DTOA 序列长度
+        pri_hist: PRI 直方图，形状为 (K, n_bins)
+        hist_edges: 直方图分箱边界，长度为 n_bins + 1
+        pri_mean: DTOA 均值
+        pri_std: DTOA 标准差
+        pri_min: DTOA 最小值
+        pri_max: DTOA 最大值
+        pri_median: DTOA 中位数
+        level_count: DTOA 显著取值档位数（参差信号有多个档位）
+        pri_type: PRI 类型（PriType 取值）
+    """
+
+    labels: np.ndarray
+    pulse_counts: np.ndarray
+    dtoa: np.ndarray
+    dtoa_starts: np.ndarray
+    dtoa_counts: np.ndarray
+    pri_hist: np.ndarray
+    hist_edges: np.ndarray
+    pri_mean: np.ndarray
+    pri_std: np.ndarray
+    pri_min: np.ndarray
+    pri_max: np.ndarray
+    pri_median: np.ndarray
+    level_count: np.ndarray
+    pri_type: np.ndarray
+
+    @property
+    def n_clusters(self) -> int:
+        """簇数量"""
+        return int(self.labels.size)
+
+    def dtoa_of(self, index: int) -> np.ndarray:
+        """获取第 index 个簇的 DTOA 序列
+
+        Args:
+            index: 簇序号（0..K-1），注意不是簇标签
+
+        Returns:
+            该簇的 DTOA 序列视图
+        """
+        start = self.dtoa_starts[index]
+        return self.dtoa[start:start + self.dtoa_counts[index]]
+
+
+class ParamsExtractor(LoggerMixin):
+    """参数提取器
+
+    以切片为单位批量提取各簇的 DTOA/PRI 特征。
+    TOA 与 PRI 相关参数的单位保持一致，由数据导入时的约定决定。
+    """
+
+    def __init__(
+        self,
+        pri_bin_width: float = 1.0,
+        pri_max: float = 2000.0,
+        min_pulses: int = 4,
+        jitter_threshold: float = 0.05,
+        level_ratio: float = 0.3,
+    ) -> None:
+        """初始化参数提取器
+
+        Args:
+            pri_bin_width: PRI 直方图分箱宽度
+            pri_max: PRI 直方图上限，超出范围的 DTOA 不计入直方图
+            min_pulses: 判定 PRI 类型所需的最少脉冲数
+            jitter_threshold: DTOA 变异系数不超过该值时判为重频固定
+            level_ratio: DTOA 档位的脉冲数不低于最大档位的该比例时视为显著档位
+
+        Raises:
+            ValueError: 当分箱参数无效时
+        """
+        if pri_bin_width <= 0 or pri_max <= pri_bin_width:
+            raise ValueError(f"无效的PRI直方图参数: bin_width={pri_bin_width}, pri_max={pri_max}")
+        self.pri_bin_width = float(pri_bin_width)
+        self.pri_max = float(pri_max)
+        self.min_pulses = int(min_pulses)
+        self.jitter_threshold = float(jitter_threshold)
+        self.level_ratio = float(level_ratio)
+
+    @property
+    def n_bins(self) -> int:
+        """PRI 直方图分箱数"""
+        return int(np.ceil(self.pri_max / self.pri_bin_width))
+
+    @property
+    def hist_edges(self) -> np.ndarray:
+        """PRI 直方图分箱边界"""
+        return np.arange(self.n_bins + 1, dtype=np.float64) * self.pri_bin_width
+
+    def build_segments(self, pulses: np.ndarray, labels: np.ndarray) -> ClusterSegments:
+        """根据切片数据与聚类标签构建簇分段
+
+        Args:
+            pulses: 切片脉冲数据，形状为 (N, 5)，列顺序见 PulseColumn
+            labels: 聚类标签，长度为 N，噪声为 -1
+
+        Returns:
+            ClusterSegments 分段描述
+        """
+        return build_segments(labels, pulses[:, PulseColumn.TOA])
+
+    def extract_dtoa_features(
+        self,
+        pulses: np.ndarray,
+        labels: np.ndarray,
+        segments: Optional[ClusterSegments] = None,
+    ) -> DtoaFeatures:
+        """批量提取切片内全部簇的 DTOA 特征
+
+        Args:
+            pulses: 切片脉冲数据，形状为 (N, 5)，列顺序见 PulseColumn
+            labels: 聚类标签，长度为 N，噪声为 -1
+            segments: 已构建好的簇分段，为 None 时内部构建
+
+        Returns:
+            DtoaFeatures 特征集合
+
+        Raises:
+            ValueError: 当输入形状不匹配时
+        """
+        pulses = np.asarray(pulses)
+        labels = np.asarray(labels)
+        if pulses.ndim != 2 or pulses.shape[0] != labels.shape[0]:
+            raise ValueError(f"脉冲数据与标签形状不匹配: {pulses.shape} vs {labels.shape}")
+
+        if segments is None:
+            segments = self.build_segments(pulses, labels)
+
+        toa_sorted = segments.gather(pulses[:, PulseColumn.TOA]).astype(np.float64, copy=False)
+        dtoa, dtoa_segments = inner_differences(toa_sorted, segments, lag=1)
+
+        pri_mean = segment_mean(dtoa, dtoa_segments)
+        pri_std = segment_std(dtoa, dtoa_segments, mean=pri_mean)
+        pri_hist = self._segment_histogram(dtoa, dtoa_segments)
+        level_count = self._count_levels(dtoa, dtoa_segments, pri_mean)
+
+        features = DtoaFeatures(
+            labels=segments.labels,
+            pulse_counts=segments.counts,
+            dtoa=dtoa,
+            dtoa_starts=dtoa_segments.starts,
+            dtoa_counts=dtoa_segments.counts,
+            pri_hist=pri_hist,
+            hist_edges=self.hist_edges,
+            pri_mean=pri_mean,
+            pri_std=pri_std,
+            pri_min=segment_min(dtoa, dtoa_segments),
+            pri_max=segment_max(dtoa, dtoa_segments),
+            pri_median=segment_median(dtoa, dtoa_segments),
+            level_count=level_count,
+            pri_type=self._classify(segments.counts, pri_mean, pri_std, level_count),
+        )
+        self.logger.debug(f"DTOA特征提取完成: 簇数={features.n_clusters}, 脉冲数={segments.n_pulses}")
+        return features
+
+    def extract_params(
+        self,
+        pulses: np.ndarray,
+        labels: np.ndarray,
+        slice_index: int = 0,
+        segments: Optional[ClusterSegments] = None,
+        pri_analysis: Optional["PriAnalysis"] = None,
+    ) -> np.ndarray:
+        """批量提取切片内全部簇的参数记录
+
+        Args:
+            pulses: 切片脉冲数据，形状为 (N, 5)，列顺序见 PulseColumn
+            labels: 聚类标签，长度为 N，噪声为 -1
+            slice_index: 切片序号，写入每条记录
+            segments: 已构建好的簇分段，为 None 时内部构建
+            pri_analysis: PriAnalyzer 的分析结果；为 None 时以 DTOA 中位数作为 PRI，
+                类型取自 DTOA 统计判定
+
+        Returns:
+            dtype 为 CLUSTER_PARAMS_DTYPE 的结构化数组，每个簇一条记录
+
+        Raises:
+            ValueError: 当输入形状不匹配，或 pri_analysis 与分段不一致时
+        """
+        pulses = np.asarray(pulses)
+        labels = np.asarray(labels)
+        if pulses.ndim != 2 or pulses.shape[0] != labels.shape[0]:
+            raise ValueError(f"脉冲数据与标签形状不匹配: {pulses.shape} vs {labels.shape}")
+        if segments is None:
+            segments = self.build_segments(pulses, labels)
+
+        records = empty_cluster_params(segments.n_clusters)
+        if segments.n_clusters == 0:
+            return records
+
+        def column(col: PulseColumn) -> np.ndarray:
+            return segments.gather(pulses[:, col]).astype(np.float64, copy=False)
+
+        cf, pa, toa = column(PulseColumn.CF), column(PulseColumn.PA), column(PulseColumn.TOA)
+        records["slice_index"] = slice_index
+        records["label"] = segments.labels
+        records["pulse_count"] = segments.counts
+        records["cf_mean"] = segment_mean(cf, segments)
+        records["cf_min"] = segment_min(cf, segments)
+        records["cf_max"] = segment_max(cf, segments)
+        records["pw_mean"] = segment_mean(column(PulseColumn.PW), segments)
+        records["pa_mean"] = pa_mean = segment_mean(pa, segments)
+        records["pa_std"] = segment_std(pa, segments, mean=pa_mean)
+        records["pa_max"] = segment_max(pa, segments)
+        records["doa_mean"] = segment_mean(column(PulseColumn.DOA), segments)
+        # 簇内 TOA 升序，首末元素即为起止时间
+        records["toa_start"] = toa[segments.starts]
+        records["time_span"] = toa[segments.ends - 1] - toa[segments.starts]
+
+        if pri_analysis is not None:
+            if not np.array_equal(pri_analysis.labels, segments.labels):
+                raise ValueError("PRI分析结果与簇分段不一致")
+            width = min(MAX_PRI_VALUES, pri_analysis.pri_values.shape[1])
+            records["pri_type"] = pri_analysis.pri_type
+            records["pri_count"] = np.minimum(pri_analysis.pri_count, width)
+            records["pri_values"][:, :width] = pri_analysis.pri_values[:, :width]
+        else:
+            dtoa, dtoa_segments = inner_differences(toa, segments, lag=1)
+            pri_mean = segment_mean(dtoa, dtoa_segments)
+            pri_std = segment_std(dtoa, dtoa_segments, mean=pri_mean)
+            level_count = self._count_levels(dtoa, dtoa_segments, pri_mean)
+            pri_type = self._classify(segments.counts, pri_mean, pri_std, level_count)
+            known = pri_type != PriType.UNKNOWN
+            records["pri_type"] = pri_type
+            records["pri_count"] = known
+            records["pri_values"][known, 0] = segment_median(dtoa, dtoa_segments)[known]
+
+        self.logger.debug(f"簇参数提取完成: 切片={slice_index}, 簇数={segments.n_clusters}")
+        return records
+
+    def _segment_histogram(self, dtoa: np.ndarray, segments: ClusterSegments) -> np.ndarray:
+        """一次 bincount 计算所有簇的 PRI 直方图
+
+        Args:
+            dtoa: 按分段排列的 DTOA
+            segments: DTOA 分段描述
+
+        Returns:
+            形状为 (K, n_bins) 的直方图
+        """
+        n_bins = self.n_bins
+        bins = np.floor(dtoa / self.pri_bin_width).astype(np.int64)
+        valid = (bins >= 0) & (bins < n_bins)
+        flat = segments.segment_ids[valid] * n_bins + bins[valid]
+        hist = np.bincount(flat, minlength=segments.n_clusters * n_bins)
+        return hist.reshape(segments.n_clusters, n_bins)
+
+    def _count_levels(self, dtoa: np.ndarray, segments: ClusterSegments, pri_mean: np.ndarray) -> np.ndarray:
+        """统计每个簇 DTOA 的显著取值档位数
+
+        在各分段内部对 DTOA 排序，相邻取值的间隔超过 ``jitter_threshold * 均值`` 时
+        视为进入新的档位；脉冲数过少的档位（如漏脉冲造成的倍数 DTOA）不计入。
+
+        Args:
+            dtoa: 按分段排列的 DTOA
+            segments: DTOA 分段描述
+            pri_mean: 各簇 DTOA 均值
+
+        Returns:
+            每个簇的显著档位数，空分段为 0
+        """
+        level_count = np.zeros(segments.n_clusters, dtype=np.int64)
+        if dtoa.size == 0:
+            return level_count
+
+        seg_ids = segments.segment_ids
+        ranked = dtoa[np.lexsort((dtoa, seg_ids))]
+        tolerance = self.jitter_threshold * pri_mean[seg_ids]
+
+        # 新档位起点：分段起点，或与前一个取值的间隔超过容差
+        new_level = np.ones(ranked.size, dtype=bool)
+        new_level[1:] = (seg_ids[1:] != seg_ids[:-1]) | (np.diff(ranked) > tolerance[1:])
+        level_starts = np.flatnonzero(new_level)
+        level_sizes = np.diff(np.append(level_starts, ranked.size))
+        level_segment = seg_ids[level_starts]
+
+        # 同一分段的档位是连续的，可以再做一次分段最大值
+        seg_first_level = np.flatnonzero(np.r_[True, level_segment[1:] != level_segment[:-1]])
+        largest = np.maximum.reduceat(level_sizes, seg_first_level)
+        largest = np.repeat(largest, np.diff(np.append(seg_first_level, level_sizes.size)))
+        significant = level_sizes >= self.level_ratio * largest
+        level_count += np.bincount(level_segment, weights=significant, minlength=segments.n_clusters).astype(np.int64)
+        return level_count
+
+    def _classify(
+        self,
+        pulse_counts: np.ndarray,
+        pri_mean: np.ndarray,
+        pri_std: np.ndarray,
+        level_count: np.ndarray,
+    ) -> np.ndarray:
+        """根据统计量判定 PRI 类型
+
+        Args:
+            pulse_counts: 各簇脉冲数
+            pri_mean: DTOA 均值
+            pri_std: DTOA 标准差
+            level_count: DTOA 显著档位数
+
+        Returns:
+            PriType 取值数组
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            cv = pri_std / pri_mean
+        pri_type = np.full(pulse_counts.shape, PriType.JITTER, dtype=np.int8)
+        pri_type[cv <= self.jitter_threshold] = PriType.CONSTANT
+        pri_type[(level_count >= 2) & (cv > self.jitter_threshold)] = PriType.STAGGER
+        pri_type[(pulse_counts < self.min_pulses) | ~np.isfinite(cv)] = PriType.UNKNOWN
+        return pri_type
@@ -0,0 +1,513 @@
+# coding: utf-8
+"""
+PRI 分析器
+
+面向分选的 PRI 搜索引擎，为每个簇提取重频值、抖动量与参差模式，
+在不调用神经网络的情况下快速给出 PRI 参数：
+
+- 序列差值直方图（SDIF）：对 1..C 阶 TOA 差值分别做直方图，每块簇共用一次 bincount，
+  用于识别固定/抖动重频以及参差重频的帧周期；
+- 差值谱：将簇内 TOA 量化为脉冲序列后用 FFT 求自相关，复杂度 O(M log M)，
+  再做次谐波抑制，用于 SDIF 无法判定的多重频簇。
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from models.data.cluster_params import PriType
+from models.data.pulse_columns import PulseColumn
+from models.utils.log_manager import LoggerMixin
+from models.utils.segment_ops import ClusterSegments, build_segments, inner_differences
+
+
+@dataclass
+class PriAnalysis:
+    """一个切片内全部簇的 PRI 分析结果
+
+    不定长的结果（多个 PRI 值、参差模式）以 NaN 填充为定宽二维数组。
+
+    Attributes:
+        labels: 簇标签，长度为 K
+        pri_type: PRI 类型（PriType 取值）
+        pri_values: 检测到的 PRI 值，形状为 (K, max_pri_count)，升序，NaN 填充
+        pri_count: 每个簇检测到的 PRI 个数
+        jitter: 抖动量（DTOA 相对标准差），参差与多重频簇为 NaN
+        frame_period: 参差帧周期，非参差簇为 NaN
+        stagger_pattern: 参差子周期序列，形状为 (K, max_stagger_levels)，NaN 填充
+        stagger_levels: 参差级数，非参差簇为 0
+    """
+
+    labels: np.ndarray
+    pri_type: np.ndarray
+    pri_values: np.ndarray
+    pri_count: np.ndarray
+    jitter: np.ndarray
+    frame_period: np.ndarray
+    stagger_pattern: np.ndarray
+    stagger_levels: np.ndarray
+
+    @property
+    def n_clusters(self) -> int:
+        """簇数量"""
+        return int(self.labels.size)
+
+    def pris_of(self, index: int) -> np.ndarray:
+        """获取第 index 个簇检测到的 PRI 值"""
+        return self.pri_values[index, :self.pri_count[index]]
+
+    def pattern_of(self, index: int) -> np.ndarray:
+        """获取第 index 个簇的参差子周期序列"""
+        return self.stagger_pattern[index, :self.stagger_levels[index]]
+
+
+class PriAnalyzer(LoggerMixin):
+    """PRI 分析器
+
+    TOA 与所有 PRI 相关参数的单位保持一致。
+    """
+
+    # 每次同时建立 SDIF 直方图的最多簇数
+    SDIF_CHUNK = 64
+    # 估计一阶 DTOA 主体范围时每个时间窗的 DTOA 数
+    DTOA_WINDOW = 32
+
+    def __init__(
+        self,
+        pri_min: float = 2.0,
+        pri_max: float = 2000.0,
+        bin_width: float = 1.0,
+        max_order: int = 6,
+        threshold_ratio: float = 0.15,
+        smooth_bins: int = 3,
+        jitter_threshold: float = 0.05,
+        harmonic_tolerance: float = 0.03,
+        spectrum_ratio: float = 0.3,
+        coverage_ratio: float = 0.6,
+        jitter_band: float = 0.1,
+        dtoa_quantile: float = 0.9,
+        max_pri_count: int = 4,
+        max_fft_bins: int = 1 << 20,
+        min_pulses: int = 4,
+    ) -> None:
+        """初始化 PRI 分析器
+
+        Args:
+            pri_min: 搜索的最小 PRI
+            pri_max: 搜索的最大 PRI（参差帧周期也须在此范围内）
+            bin_width: 直方图与差值谱的量化分辨率
+            max_order: SDIF 的最高差值阶数，同时是可识别的最大参差级数
+            threshold_ratio: SDIF 门限系数，c 阶门限为 ratio * (E - c)，E 为簇脉冲数
+            smooth_bins: 寻峰前对直方图做滑动求和的窗口宽度（分箱数，取奇数）
+            jitter_threshold: 抖动量不超过该值时判为重频固定
+            harmonic_tolerance: 判定谐波关系时允许的相对误差
+            spectrum_ratio: 差值谱门限，相对于谱峰最大值的比例
+            coverage_ratio: SDIF 单峰可解释的 DTOA 比例不低于该值时才判为单一重频
+            jitter_band: 差值谱中相对间隔不超过该值的相邻峰合并为同一（抖动）重频
+            dtoa_quantile: 估计一阶 DTOA 主体范围上限时使用的分位数（排除漏脉冲造成的大间隔）
+            max_pri_count: 每个簇最多输出的 PRI 个数
+            max_fft_bins: 差值谱量化后的最大序列长度，超出部分的脉冲不参与计算
+            min_pulses: 参与分析所需的最少脉冲数
+
+        Raises:
+            ValueError: 当 PRI 范围或分辨率无效时
+        """
+        if bin_width <= 0 or not 0 <= pri_min < pri_max:
+            raise ValueError(f"无效的PRI搜索范围: [{pri_min}, {pri_max}], bin_width={bin_width}")
+        self.pri_min = float(pri_min)
+        self.pri_max = float(pri_max)
+        self.bin_width = float(bin_width)
+        self.max_order = max(int(max_order), 1)
+        self.threshold_ratio = float(threshold_ratio)
+        self.smooth_bins = max(int(smooth_bins), 1) | 1
+        self.jitter_threshold = float(jitter_threshold)
+        self.harmonic_tolerance = float(harmonic_tolerance)
+        self.spectrum_ratio = float(spectrum_ratio)
+        self.coverage_ratio = float(coverage_ratio)
+        self.jitter_band = float(jitter_band)
+        self.dtoa_quantile = float(dtoa_quantile)
+        self.max_pri_count = max(int(max_pri_count), 1)
+        self.max_fft_bins = int(max_fft_bins)
+        self.min_pulses = max(int(min_pulses), 3)
+
+    @property
+    def n_bins(self) -> int:
+        """直方图分箱数"""
+        return int(np.ceil(self.pri_max / self.bin_width))
+
+    def analyze(
+        self,
+        pulses: np.ndarray,
+        labels: np.ndarray,
+        segments: Optional[ClusterSegments] = None,
+    ) -> PriAnalysis:
+        """分析切片内所有簇的 PRI
+
+        Args:
+            pulses: 切片脉冲数据，形状为 (N, 5)
+            labels: 聚类标签，长度为 N，噪声为 -1
+            segments: 已构建好的簇分段，为 None 时内部构建
+
+        Returns:
+            PriAnalysis 分析结果
+        """
+        pulses = np.asarray(pulses)
+        if segments is None:
+            segments = build_segments(labels, pulses[:, PulseColumn.TOA])
+        toa = segments.gather(pulses[:, PulseColumn.TOA]).astype(np.float64, copy=False)
+
+        n_clusters = segments.n_clusters
+        result = PriAnalysis(
+            labels=segments.labels,
+            pri_type=np.full(n_clusters, PriType.UNKNOWN, dtype=np.int8),
+            pri_values=np.full((n_clusters, self.max_pri_count), np.nan),
+            pri_count=np.zeros(n_clusters, dtype=np.int64),
+            jitter=np.full(n_clusters, np.nan),
+            frame_period=np.full(n_clusters, np.nan),
+            stagger_pattern=np.full((n_clusters, self.max_order), np.nan),
+            stagger_levels=np.zeros(n_clusters, dtype=np.int64),
+        )
+        if n_clusters == 0:
+            return result
+
+        dtoa, dtoa_segments = inner_differences(toa, segments, lag=1)
+        order_bins = self._order_bins(toa, segments)
+
+        # 只为脉冲数足够的簇建直方图，并按块建立，峰值内存与簇数无关
+        eligible = np.flatnonzero(segments.counts >= self.min_pulses)
+        for chunk_start in range(0, eligible.size, self.SDIF_CHUNK):
+            clusters = eligible[chunk_start:chunk_start + self.SDIF_CHUNK]
+            histograms = self._histograms(order_bins, clusters)
+            for row, k in enumerate(clusters):
+                self._resolve_cluster(
+                    k, histograms[:, row], segments.counts[k], dtoa_segments, dtoa, toa, segments, result
+                )
+
+        self._fill_jitter(dtoa, dtoa_segments, result)
+        self.logger.debug(
+            f"PRI分析完成: 簇数={n_clusters}, 参差={int((result.pri_type == PriType.STAGGER).sum())}, "
+            f"多重频={int((result.pri_type == PriType.MULTIPLE).sum())}"
+        )
+        return result
+
+    def sdif(self, toa: np.ndarray, segments: ClusterSegments, clusters: Optional[np.ndarray] = None) -> np.ndarray:
+        """计算簇的 1..C 阶序列差值直方图
+
+        Args:
+            toa: 按分段排列（簇内升序）的 TOA
+            segments: 簇分段描述
+            clusters: 需要计算的簇序号（升序），为 None 时计算全部簇
+
+        Returns:
+            形状为 (C, len(clusters), n_bins) 的直方图
+        """
+        if clusters is None:
+            clusters = np.arange(segments.n_clusters)
+        return self._histograms(self._order_bins(toa, segments), np.asarray(clusters, dtype=np.intp))
+
+    def _order_bins(self, toa: np.ndarray, segments: ClusterSegments) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """各阶 TOA 差值落入的分箱
+
+        Returns:
+            每阶一项 (簇序号, 分箱)，按簇序号升序，只含搜索范围内的差值
+        """
+        n_bins = self.n_bins
+        order_bins = []
+        for order in range(1, self.max_order + 1):
+            diffs, diff_segments = inner_differences(toa, segments, lag=order)
+            bins = np.rint(diffs / self.bin_width).astype(np.int64)
+            valid = (bins >= 0) & (bins < n_bins)
+            order_bins.append((diff_segments.segment_ids[valid], bins[valid]))
+        return order_bins
+
+    def _histograms(self, order_bins: List[Tuple[np.ndarray, np.ndarray]], clusters: np.ndarray) -> np.ndarray:
+        """由各阶差值分箱建立指定簇（升序）的直方图，形状为 (C, len(clusters), n_bins)"""
+        n_bins = self.n_bins
+        histograms = np.zeros((self.max_order, clusters.size, n_bins), dtype=np.int64)
+        if clusters.size == 0:
+            return histograms
+        # 簇序号到直方图行号的映射，不需要的簇映射为 -1
+        rows = np.full(int(clusters[-1]) + 1 - int(clusters[0]), -1, dtype=np.int64)
+        rows[clusters - clusters[0]] = np.arange(clusters.size)
+        for order, (ids, bins) in enumerate(order_bins):
+            # 差值按簇序号排列，块内各簇的差值位于连续区间
+            low, high = np.searchsorted(ids, [clusters[0], clusters[-1] + 1])
+            row = rows[ids[low:high] - clusters[0]]
+            keep = row >= 0
+            flat = row[keep] * n_bins + bins[low:high][keep]
+            histograms[order] = np.bincount(flat, minlength=clusters.size * n_bins).reshape(-1, n_bins)
+        return histograms
+
+    def pri_spectrum(self, toa: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """用 FFT 计算单个簇的全阶差值谱
+
+        将 TOA 量化为脉冲序列 x[m]，其自相关 r[l] 即为差值落在第 l 个分箱的脉冲对数。
+
+        Args:
+            toa: 单个簇的升序 TOA
+
+        Returns:
+            (lags, spectrum): 各分箱对应的差值，以及各差值上的脉冲对数
+        """
+        n_lags = self.n_bins
+        bins = np.floor((toa - toa[0]) / self.bin_width).astype(np.int64)
+        bins = bins[bins < self.max_fft_bins]
+        train = np.bincount(bins).astype(np.float64)
+
+        size = 1 << int(np.ceil(np.log2(train.size + n_lags)))
+        spectrum = np.fft.rfft(train, size)
+        autocorr = np.fft.irfft(spectrum * np.conj(spectrum), size)[:n_lags]
+        lags = np.arange(n_lags) * self.bin_width
+        return lags, np.rint(autocorr)
+
+    def _resolve_cluster(
+        self,
+        k: int,
+        histograms: np.ndarray,
+        n_pulses: int,
+        dtoa_segments: ClusterSegments,
+        dtoa: np.ndarray,
+        toa: np.ndarray,
+        segments: ClusterSegments,
+        result: PriAnalysis,
+    ) -> None:
+        """根据单个簇的 SDIF 判定 PRI 类型并写入结果
+
+        Args:
+            k: 簇序号
+            histograms: 该簇 1..C 阶直方图，形状为 (C, n_bins)
+            n_pulses: 该簇脉冲数
+            dtoa_segments: 一阶差值分段描述
+            dtoa: 一阶差值
+            toa: 按分段排列的 TOA
+            segments: 簇分段描述
+            result: 待写入的分析结果
+        """
+        start = dtoa_segments.starts[k]
+        sequence = dtoa[start:start + dtoa_segments.counts[k]]
+        level_peaks, _ = self._significant_peaks(histograms[0], threshold=self.threshold_ratio * (n_pulses - 1))
+
+        if level_peaks.size >= 2:
+            for order in range(level_peaks.size, min(self.max_order, n_pulses - 1) + 1):
+                frame, _ = self._significant_peaks(
+                    histograms[order - 1], threshold=self.threshold_ratio * (n_pulses - order)
+                )
+                if frame.size != 1:
+                    continue
+                pattern = self._stagger_pattern(sequence, level_peaks, order)
+                if pattern is not None and abs(pattern.sum() - frame[0]) <= self.harmonic_tolerance * frame[0]:
+                    self._set_pris(result, k, level_peaks)
+                    result.pri_type[k] = PriType.STAGGER
+                    result.frame_period[k] = frame[0]
+                    result.stagger_levels[k] = order
+                    result.stagger_pattern[k, :order] = pattern
+                    return
+
+        # 绝大多数 DTOA 是最小档位的整数倍（其余档位来自漏脉冲）时，判为单一重频
+        if level_peaks.size and self._coverage(sequence, level_peaks[0]) >= self.coverage_ratio:
+            self._set_pris(result, k, level_peaks[:1])
+            result.pri_type[k] = PriType.CONSTANT
+            return
+
+        # SDIF 无法判定：回退到差值谱 + 次谐波抑制
+        start = segments.starts[k]
+        lags, spectrum = self.pri_spectrum(toa[start:start + n_pulses])
+        peaks, strengths = self._significant_peaks(spectrum, ratio=self.spectrum_ratio, centers=lags)
+        upper = self._dtoa_upper(sequence) * (1 + self.harmonic_tolerance)
+        pris = self._suppress_harmonics(*self._merge_jitter_band(peaks, strengths, upper))
+        if pris.size:
+            self._set_pris(result, k, pris)
+            result.pri_type[k] = PriType.JITTER if pris.size == 1 else PriType.MULTIPLE
+
+    def _search_range(self) -> slice:
+        """PRI 搜索范围对应的分箱切片"""
+        return slice(max(int(self.pri_min // self.bin_width), 1), self.n_bins)
+
+    def _significant_peaks(
+        self,
+        hist: np.ndarray,
+        threshold: Optional[float] = None,
+        ratio: Optional[float] = None,
+        centers: Optional[np.ndarray] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """在直方图中寻找超过门限的峰，返回质心精化后的峰值位置
+
+        Args:
+            hist: 一维直方图
+            threshold: 绝对门限（作用于滑动求和后的直方图）
+            ratio: 相对门限，相对于搜索范围内滑动求和后的最大值；与 threshold 二选一
+            centers: 各分箱对应的取值，为 None 时按 bin_width 计算
+
+        Returns:
+            (positions, strengths): 升序的峰值位置及对应的滑动求和计数
+        """
+        if centers is None:
+            centers = np.arange(hist.size) * self.bin_width
+        half = self.smooth_bins // 2
+        cumsum = np.cumsum(np.pad(hist.astype(np.float64), (half + 1, half)))
+        smoothed = cumsum[self.smooth_bins:] - cumsum[:-self.smooth_bins]
+        smoothed[:self._search_range().start] = 0
+        if threshold is None:
+            threshold = (ratio or 0.0) * smoothed.max(initial=0)
+
+        padded = np.pad(smoothed, 1)
+        center = padded[1:-1]
+        peaks = np.flatnonzero((center > padded[:-2]) & (center >= padded[2:]) & (center >= max(threshold, 1)))
+        if peaks.size == 0:
+            return np.empty(0), np.empty(0)
+
+        # 以窗口内的计数为权重求质心
+        offsets = np.arange(-half - 1, half + 2)
+        window = np.clip(peaks[:, None] + offsets[None, :], 0, hist.size - 1)
+        weights = hist[window].astype(np.float64)
+        positions = (weights * centers[window]).sum(axis=1) / weights.sum(axis=1)
+        return positions, smoothed[peaks]
+
+    def _coverage(self, sequence: np.ndarray, pri: float) -> float:
+        """计算 DTOA 序列中可由 pri 整数倍解释的比例
+
+        Args:
+            sequence: 单个簇的一阶 DTOA 序列
+            pri: 候选 PRI
+
+        Returns:
+            覆盖比例，范围 [0, 1]
+        """
+        if sequence.size == 0 or pri <= 0:
+            return 0.0
+        ratio = sequence / pri
+        multiple = np.rint(ratio)
+        tolerance = max(self.harmonic_tolerance, (self.smooth_bins // 2 + 1) * self.bin_width / pri)
+        return float(np.mean((multiple >= 1) & (np.abs(ratio - multiple) <= tolerance * multiple)))
+
+    def _dtoa_upper(self, sequence: np.ndarray) -> float:
+        """估计一阶 DTOA 主体范围的上限
+
+        交错信号中任一脉冲列都保证一阶 DTOA 不超过其 PRI，主体范围内的谱峰只能来自同一抖动重频。
+        但各脉冲列覆盖的时间段不同时，只有一列脉冲的时间段内 DTOA 等于该列的 PRI，
+        整段序列的分位数会被抬高到把不同重频并为一组。因此按时间分窗各取分位数，
+        以最小值作为上限，即各脉冲列同时存在的时间段内的上限；单一重频各窗的分位数相近。
+
+        Args:
+            sequence: 单个簇按时间排列的一阶 DTOA 序列
+
+        Returns:
+            一阶 DTOA 主体范围的上限
+        """
+        n_windows = max(sequence.size // self.DTOA_WINDOW, 1)
+        windows = np.array_split(sequence, n_windows)
+        return float(min(np.quantile(window, self.dtoa_quantile) for window in windows))
+
+    def _merge_jitter_band(
+        self, peaks: np.ndarray, strengths: np.ndarray, upper: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """合并落在同一抖动带内的相邻谱峰
+
+        抖动重频的差值谱呈宽而起伏的峰，相对间隔不超过 jitter_band 的相邻峰、
+        以及同时不超过 upper 的相邻峰视为同一重频，以强度加权求中心，
+        并以组内相对半宽作为后续谐波判定的容差。
+
+        Args:
+            peaks: 升序的谱峰位置
+            strengths: 对应的谱峰强度
+            upper: 一阶 DTOA 主体范围的上限
+
+        Returns:
+            (centers, tolerances): 合并后的重频中心及其相对容差
+        """
+        if peaks.size == 0:
+            return peaks, peaks
+        same_band = (peaks[1:] / peaks[:-1] - 1 <= self.jitter_band) | (peaks[1:] <= upper)
+        new_group = np.r_[True, ~same_band]
+        group_ids = np.cumsum(new_group) - 1
+        weight = np.bincount(group_ids, weights=strengths)
+        centers = np.bincount(group_ids, weights=strengths * peaks) / weight
+        low = peaks[new_group]
+        high = peaks[np.r_[new_group[1:], True]]
+        tolerances = np.maximum(self.harmonic_tolerance, 0.5 * (high - low) / centers)
+        return centers, tolerances
+
+    def _suppress_harmonics(self, peaks: np.ndarray, tolerances: np.ndarray) -> np.ndarray:
+        """去除是更小 PRI 整数倍（谐波）的峰
+
+        Args:
+            peaks: 升序的候选 PRI
+            tolerances: 各候选 PRI 的相对容差
+
+        Returns:
+            保留的基本 PRI
+        """
+        accepted: List[float] = []
+        accepted_tolerance: List[float] = []
+        for value, tolerance in zip(peaks, tolerances):
+            if accepted:
+                ratios = value / np.asarray(accepted)
+                multiple = np.rint(ratios)
+                allowed = np.maximum(np.asarray(accepted_tolerance), tolerance)
+                if np.any((multiple >= 2) & (np.abs(ratios - multiple) <= allowed * multiple)):
+                    continue
+            accepted.append(float(value))
+            accepted_tolerance.append(float(tolerance))
+        return np.asarray(accepted)
+
+    def _stagger_pattern(self, sequence: np.ndarray, levels: np.ndarray, order: int) -> Optional[np.ndarray]:
+        """从一阶 DTOA 序列中提取参差子周期序列
+
+        取第一段连续 order 个均能匹配到某个档位的 DTOA，替换为档位值后
+        旋转为从最小值开始的规范形式。
+
+        Args:
+            sequence: 单个簇的一阶 DTOA 序列
+            levels: 参差档位
+            order: 参差级数
+
+        Returns:
+            长度为 order 的子周期序列；找不到时返回 None
+        """
+        nearest = np.abs(sequence[:, None] - levels[None, :]).argmin(axis=1)
+        matched = np.abs(sequence - levels[nearest]) <= self.harmonic_tolerance * levels[nearest]
+        run = np.convolve(matched.astype(np.int64), np.ones(order, dtype=np.int64), mode="valid")
+        hits = np.flatnonzero(run == order)
+        if hits.size == 0:
+            return None
+        pattern = levels[nearest[hits[0]:hits[0] + order]]
+        return np.roll(pattern, -int(pattern.argmin()))
+
+    def _set_pris(self, result: PriAnalysis, k: int, pris: np.ndarray) -> None:
+        """写入第 k 个簇的 PRI 值（超出上限的部分丢弃）"""
+        count = min(pris.size, self.max_pri_count)
+        result.pri_values[k, :count] = pris[:count]
+        result.pri_count[k] = count
+
+    def _fill_jitter(self, dtoa: np.ndarray, dtoa_segments: ClusterSegments, result: PriAnalysis) -> None:
+        """批量计算单一重频簇的抖动量，并据此区分固定与抖动重频
+
+        只统计落在 [0.5, 1.5] 倍 PRI 内的 DTOA，以排除漏脉冲造成的倍数间隔；
+        PRI 值同时更新为这些 DTOA 的均值。
+
+        Args:
+            dtoa: 一阶差值
+            dtoa_segments: 一阶差值分段描述
+            result: 待写入的分析结果
+        """
+        single = (result.pri_count == 1) & (result.pri_type != PriType.STAGGER)
+        if dtoa.size == 0 or not single.any():
+            return
+        seg_ids = dtoa_segments.segment_ids
+        pri = result.pri_values[seg_ids, 0]
+        mask = single[seg_ids] & (np.abs(dtoa - pri) <= 0.5 * pri)
+
+        counts = np.bincount(seg_ids, weights=mask, minlength=result.n_clusters)
+        sums = np.bincount(seg_ids, weights=np.where(mask, dtoa, 0.0), minlength=result.n_clusters)
+        squares = np.bincount(seg_ids, weights=np.where(mask, dtoa * dtoa, 0.0), minlength=result.n_clusters)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = sums / counts
+            std = np.sqrt(np.maximum(squares / counts - mean * mean, 0.0))
+            jitter = std / mean
+
+        valid = single & (counts >= 2)
+        result.jitter[valid] = jitter[valid]
+        result.pri_values[valid, 0] = mean[valid]
+        result.pri_type[valid & (jitter <= self.jitter_threshold)] = PriType.CONSTANT
+        result.pri_type[valid & (jitter > self.jitter_threshold)] = PriType.JITTER
@@ -0,0 +1,273 @@
+# coding: utf-8
+"""
+推理结果缓存服务
+
+以“模型名称 + 模型版本 + 单个样本特征张量的哈希”为键缓存模型输出的类别概率。
+只调整合并参数后重新识别、或重新打开同一份数据时，特征张量不变，可以直接复用推理结果。
+
+缓存在内存中按最近使用顺序保留，调用 save 时把新增条目写入磁盘：
+每个模型版本一个子目录，每次保存写一个 .npz 分段文件；磁盘总量超过上限时删除最久未使用的分段。
+某个模型的磁盘分段只在第一次查询该模型时读入内存。
+"""
+
+import hashlib
+import os
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from models.utils.log_manager import LoggerMixin
+
+DIGEST_SIZE = 16
+
+
+class InferenceCache(LoggerMixin):
+    """推理结果缓存
+
+    线程安全：推理线程写入的同时，界面线程可以清空缓存或调整上限。
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Union[str, Path]] = None,
+        max_disk_mb: float = 256.0,
+        max_entries: int = 500_000,
+        max_segments: int = 8,
+    ) -> None:
+        """初始化推理结果缓存
+
+        Args:
+            cache_dir: 磁盘缓存目录，为 None 时只缓存在内存中
+            max_disk_mb: 磁盘缓存总量上限（MB）
+            max_entries: 内存中最多保留的样本条目数
+            max_segments: 单个模型的分段文件数超过该值时，保存时合并为一个文件
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._max_disk_bytes = float(max_disk_mb) * 1024 * 1024
+        self._max_entries = max(int(max_entries), 1)
+        self._max_segments = max(int(max_segments), 1)
+        # (模型键, 样本摘要) -> 概率行，按最近使用顺序排列
+        self._entries: "OrderedDict[Tuple[str, bytes], np.ndarray]" = OrderedDict()
+        # 尚未写入磁盘的条目：模型键 -> 样本摘要列表
+        self._dirty: Dict[str, List[bytes]] = {}
+        self._loaded_models: set = set()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def disk_bytes(self) -> int:
+        """磁盘缓存当前占用（字节）"""
+        return sum(size for _, _, size in self._segment_files())
+
+    @staticmethod
+    def digest(features: np.ndarray) -> List[bytes]:
+        """计算每个样本特征张量的摘要
+
+        摘要同时覆盖数据类型与单个样本的形状，形状不同但字节相同的张量不会冲突。
+
+        Args:
+            features: 特征张量，第 0 维为样本
+
+        Returns:
+            与样本一一对应的摘要
+        """
+        features = np.ascontiguousarray(features)
+        header = hashlib.blake2b(f"{features.dtype.str}{features.shape[1:]}".encode(), digest_size=DIGEST_SIZE)
+        digests = []
+        for row in features.reshape(features.shape[0], -1):
+            hasher = header.copy()
+            hasher.update(row)
+            digests.append(hasher.digest())
+        return digests
+
+    def get_many(self, model_key: str, digests: Sequence[bytes]) -> List[Optional[np.ndarray]]:
+        """批量查询缓存
+
+        Args:
+            model_key: 模型键（名称与版本）
+            digests: 样本摘要
+
+        Returns:
+            与 digests 一一对应的概率行，未命中时为 None
+        """
+        with self._lock:
+            self._load_model(model_key)
+            rows: List[Optional[np.ndarray]] = []
+            for digest in digests:
+                row = self._entries.get((model_key, digest))
+                if row is not None:
+                    self._entries.move_to_end((model_key, digest))
+                rows.append(row)
+            hits = sum(row is not None for row in rows)
+            self.hits += hits
+            self.misses += len(rows) - hits
+            return rows
+
+    def put_many(self, model_key: str, digests: Sequence[bytes], probabilities: np.ndarray) -> None:
+        """批量写入缓存
+
+        Args:
+            model_key: 模型键（名称与版本）
+            digests: 样本摘要
+            probabilities: 概率数组，第 0 维与 digests 对应
+        """
+        probabilities = np.asarray(probabilities)
+        if probabilities.shape[0] != len(digests):
+            raise ValueError(f"摘要与结果数量不匹配: {len(digests)} vs {probabilities.shape[0]}")
+        with self._lock:
+            self._load_model(model_key)
+            dirty = self._dirty.setdefault(model_key, [])
+            for digest, row in zip(digests, probabilities):
+                key = (model_key, digest)
+                if key not in self._entries:
+                    dirty.append(digest)
+                # 复制为独立数组，不持有整批结果的引用
+                self._entries[key] = row.copy()
+                self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def save(self) -> int:
+        """把新增条目写入磁盘，并按上限清理旧分段
+
+        Returns:
+            写入磁盘的条目数
+        """
+        if self.cache_dir is None:
+            return 0
+        written = 0
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            for model_key, digests in dirty.items():
+                model_dir = self._model_dir(model_key)
+                segments = sorted(model_dir.glob("*.npz")) if model_dir.is_dir() else []
+                if len(segments) >= self._max_segments:
+                    # 分段过多时把旧分段与该模型在内存中的条目合并写为一个文件，
+                    # 已因内存条目上限被淘汰、只保存在磁盘上的条目同样写入
+                    merged: Dict[bytes, np.ndarray] = {}
+                    for segment in segments:
+                        merged.update(self._read_segment(segment))
+                    merged.update((digest, row) for (owner, digest), row in self._entries.items() if owner == model_key)
+                    digests, rows = list(merged), list(merged.values())
+                else:
+                    segments = []
+                    digests = [digest for digest in digests if (model_key, digest) in self._entries]
+                    rows = [self._entries[(model_key, digest)] for digest in digests]
+                if not digests:
+                    continue
+                try:
+                    self._write_segment(model_dir, digests, rows)
+                except OSError as e:
+                    self.logger.warning(f"推理缓存写入失败: {model_dir}, {e}")
+                    continue
+                for segment in segments:
+                    segment.unlink(missing_ok=True)
+                written += len(digests)
+        self._enforce_limit()
+        if written:
+            self.logger.debug(f"推理缓存已保存: 条目数={written}")
+        return written
+
+    def set_limit(self, max_disk_mb: float) -> None:
+        """调整磁盘缓存上限，超出部分立即清理"""
+        self._max_disk_bytes = float(max_disk_mb) * 1024 * 1024
+        self._enforce_limit()
+
+    def clear(self) -> None:
+        """清空内存与磁盘缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._dirty.clear()
+            self._loaded_models.clear()
+            self.hits = self.misses = 0
+            for path, _, _ in self._segment_files():
+                path.unlink(missing_ok=True)
+        self.logger.info("推理缓存已清空")
+
+    def _model_dir(self, model_key: str) -> Path:
+        """模型键对应的磁盘子目录"""
+        return self.cache_dir / hashlib.blake2b(model_key.encode(), digest_size=8).hexdigest()
+
+    def _load_model(self, model_key: str) -> None:
+        """首次访问某个模型时读入其磁盘分段"""
+        if model_key in self._loaded_models:
+            return
+        self._loaded_models.add(model_key)
+        if self.cache_dir is None:
+            return
+        model_dir = self._model_dir(model_key)
+        if not model_dir.is_dir():
+            return
+        count = 0
+        for segment in sorted(model_dir.glob("*.npz")):
+            stored = self._read_segment(segment)
+            for digest, row in stored.items():
+                self._entries.setdefault((model_key, digest), row)
+            count += len(stored)
+            if stored:
+                # 更新访问时间，清理时优先保留最近使用的模型
+                os.utime(segment)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self.logger.debug(f"推理缓存已载入: 分段目录={model_dir.name}, 条目数={count}")
+
+    def _read_segment(self, segment: Path) -> Dict[bytes, np.ndarray]:
+        """读取一个分段文件，返回样本摘要到概率行的映射；分段损坏时删除并返回空映射"""
+        try:
+            with np.load(segment) as data:
+                digests, probabilities = data["digests"], data["probabilities"]
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            self.logger.warning(f"推理缓存分段损坏，已删除: {segment.name}, {e}")
+            segment.unlink(missing_ok=True)
+            return {}
+        return {digest.tobytes(): row for digest, row in zip(digests, probabilities)}
+
+    def _write_segment(self, model_dir: Path, digests: List[bytes], rows: List[np.ndarray]) -> None:
+        """写入一个分段文件（先写临时文件再替换，避免留下不完整的分段）"""
+        model_dir.mkdir(parents=True, exist_ok=True)
+        target = model_dir / f"{time.time_ns()}.npz"
+        temp = target.with_suffix(".tmp")
+        with open(temp, "wb") as f:
+            np.savez(
+                f,
+                digests=np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(len(digests), DIGEST_SIZE),
+                probabilities=np.stack(rows),
+            )
+        os.replace(temp, target)
+
+    def _segment_files(self) -> List[Tuple[Path, float, int]]:
+        """全部分段文件，返回 (路径, 修改时间, 大小)，按修改时间从旧到新排列"""
+        if self.cache_dir is None or not self.cache_dir.is_dir():
+            return []
+        files = []
+        for path in self.cache_dir.glob("*/*.npz"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((path, stat.st_mtime, stat.st_size))
+        return sorted(files, key=lambda item: item[1])
+
+    def _enforce_limit(self) -> None:
+        """删除最久未使用的分段，直到磁盘占用不超过上限"""
+        files = self._segment_files()
+        total = sum(size for _, _, size in files)
+        removed = 0
+        for path, _, size in files:
+            if total <= self._max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        if removed:
+            self.logger.info(f"推理缓存超出上限，已删除 {removed} 个旧分段")
@@ -0,0 +1,88 @@
+# coding: utf-8
+"""
+推理执行器服务
+
+所有模型调用都在一个专用线程中串行执行：聚类线程只负责提交特征并立即返回，
+不会在推理期间阻塞，也不会与推理运行库的线程池争抢同一批核心。
+推理运行库自身使用的线程数由推理后端的算子内 / 算子间线程设置决定。
+
+ModelPredictor 不是线程安全的，执行器保证它只在专用线程中被访问。
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Optional
+
+import numpy as np
+
+from models.processors.model_predictor import ModelPredictor, Predictions
+from models.utils.log_manager import LoggerMixin
+
+
+class InferenceExecutor(LoggerMixin):
+    """推理执行器
+
+    方法均返回 concurrent.futures.Future，调用方可以 add_done_callback 或在需要时 result()。
+    同一执行器上的调用按提交顺序执行。
+    """
+
+    def __init__(self, predictor: ModelPredictor) -> None:
+        """初始化推理执行器
+
+        Args:
+            predictor: 在专用线程中使用的模型预测器
+        """
+        self._predictor = predictor
+        self._executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="inference"
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """执行器是否仍可接受任务"""
+        return self._executor is not None
+
+    def submit(self, name: str, features: np.ndarray, labels: np.ndarray, slice_index: int = 0) -> "Future[int]":
+        """提交一个切片的簇特征（见 ModelPredictor.submit）
+
+        特征在调用线程中复制后入队，调用方可以立即复用自己的缓冲区。
+        """
+        features = np.array(features, copy=True)
+        labels = np.array(labels, copy=True)
+        return self._run(self._predictor.submit, name, features, labels, slice_index)
+
+    def flush(self, name: Optional[str] = None) -> "Future[Dict[str, Predictions]]":
+        """推理剩余样本并取出累计结果（见 ModelPredictor.flush）"""
+        return self._run(self._predictor.flush, name)
+
+    def predict(self, name: str, features: np.ndarray) -> "Future[np.ndarray]":
+        """立即推理一组样本（见 ModelPredictor.predict）"""
+        return self._run(self._predictor.predict, name, np.array(features, copy=True))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """停止执行器，未开始的任务被取消
+
+        Args:
+            wait: 是否等待正在执行的任务完成
+        """
+        if self._executor is None:
+            return
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+        self._executor = None
+        self.logger.debug("推理执行器已停止")
+
+    def _run(self, function, *args) -> Future:
+        """在推理线程中执行
+
+        Raises:
+            RuntimeError: 当执行器已停止时
+        """
+        if self._executor is None:
+            raise RuntimeError("推理执行器已停止")
+        future = self._executor.submit(function, *args)
+        future.add_done_callback(self._log_failure)
+        return future
+
+    def _log_failure(self, future: Future) -> None:
+        """记录推理线程中的异常（异常仍由 Future.result 抛给调用方）"""
+        if not future.cancelled() and future.exception() is not None:
+            self.logger.error(f"推理任务失败: {future.exception()}")
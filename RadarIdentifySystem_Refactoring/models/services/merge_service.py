@@ -0,0 +1,649 @@
+# coding: utf-8
+"""
+跨切片合并服务
+
+把各切片中识别出的簇按参数相似性关联为同一辐射源。两两比较全部簇的代价随簇数平方增长，
+一小时的数据可达数千个簇；这里先建立索引，只比较参数可能兼容的候选对：
+
+- 载频区间索引：簇按 cf_min 排序，每个簇只与 cf_min 落在 [自身 cf_min, 自身 cf_max + 容差]
+  内的后续簇构成候选（区间扫描，searchsorted 定位边界），保证两簇的载频区间（含容差）有交集；
+- 脉宽 / PRI 区间过滤：候选对在载频窗口内按脉宽差与 PRI 相对差整批向量化过滤。
+
+兼容的簇对构成图的边，连通分量即合并后的组。合并组保存在可回滚的并查集中，
+新切片到达时只合并涉及新簇的候选对，人工合并可以撤销 / 重做而无需整批重算；
+调整容差时的实时预览只重新判定跨过新旧阈值的簇对（MergePreview）。
+"""
+
+from dataclasses import dataclass, replace
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from models.data.cluster_params import CLUSTER_PARAMS_DTYPE
+from models.processors.merge_similarity import PairSimilarity, SimilarityTable
+from models.utils.disjoint_set import DisjointSet
+from models.utils.log_manager import LoggerMixin
+
+
+@dataclass
+class MergeParams:
+    """合并参数
+
+    Attributes:
+        cf_tolerance: 载频容差（与载频同单位），两簇载频区间外扩该值后有交集才可合并
+        pw_tolerance: 脉宽均值之差的上限（与脉宽同单位）
+        pri_tolerance: PRI 相对差的上限；两簇都有 PRI 时，至少一对 PRI 值满足才可合并
+        require_same_class: 是否要求识别类别一致
+        cross_slice_only: 是否只合并不同切片中的簇
+    """
+
+    cf_tolerance: float = 5.0
+    pw_tolerance: float = 0.5
+    pri_tolerance: float = 0.02
+    require_same_class: bool = True
+    cross_slice_only: bool = True
+
+
+@dataclass
+class MergeResult:
+    """合并结果
+
+    Attributes:
+        group_ids: 各簇所属组的序号（0..n_groups-1，按组内首个簇的位置编号）
+        pairs: 兼容的簇对，形状为 (P, 2)，每行 i < j
+    """
+
+    group_ids: np.ndarray
+    pairs: np.ndarray
+
+    @property
+    def n_groups(self) -> int:
+        """合并后的组数"""
+        return int(self.group_ids.max()) + 1 if self.group_ids.size else 0
+
+    @property
+    def group_sizes(self) -> np.ndarray:
+        """各组包含的簇数"""
+        return np.bincount(self.group_ids, minlength=self.n_groups)
+
+    def members(self, group: int) -> np.ndarray:
+        """组内簇的序号"""
+        return np.flatnonzero(self.group_ids == group)
+
+
+class ClusterIndex:
+    """簇参数索引
+
+    索引只依赖簇参数本身，构建一次后可以反复以不同的合并参数查询候选对。
+    """
+
+    def __init__(self, records: np.ndarray, class_ids: Optional[np.ndarray] = None) -> None:
+        """建立索引
+
+        Args:
+            records: CLUSTER_PARAMS_DTYPE 结构化数组
+            class_ids: 各簇的识别类别，为 None 时不参与比较
+
+        Raises:
+            TypeError: 当记录类型不匹配时
+            ValueError: 当类别数量与记录数量不一致时
+        """
+        if records.dtype != CLUSTER_PARAMS_DTYPE:
+            raise TypeError(f"簇参数记录类型不匹配: {records.dtype}")
+        if class_ids is not None and len(class_ids) != records.size:
+            raise ValueError(f"类别数量与簇数量不匹配: {len(class_ids)} vs {records.size}")
+
+        cf_min = np.where(np.isnan(records["cf_min"]), records["cf_mean"], records["cf_min"])
+        cf_max = np.where(np.isnan(records["cf_max"]), records["cf_mean"], records["cf_max"])
+        # 载频缺失的簇无法比较，不进入索引
+        valid = np.flatnonzero(~(np.isnan(cf_min) | np.isnan(cf_max)))
+        self.order = valid[np.argsort(cf_min[valid], kind="stable")]
+        self.cf_min = cf_min[self.order]
+        self.cf_max = cf_max[self.order]
+        self.pw = records["pw_mean"][self.order]
+        # PRI 按列存放，全为 NaN 的列不参与比较
+        self.pri_columns = [
+            column[self.order] for column in records["pri_values"].T if not np.isnan(column).all()
+        ]
+        self.slice_index = records["slice_index"][self.order]
+        self.class_ids = None if class_ids is None else np.asarray(class_ids)[self.order]
+        self.size = records.size
+
+    def candidate_distances(self, params: MergeParams, chunk_size: int = 4096) -> "PairDistances":
+        """查询兼容的簇对及其在各维度上的距离
+
+        Args:
+            params: 合并参数
+            chunk_size: 每次展开候选对的簇数，限制中间数组的峰值内存
+
+        Returns:
+            兼容簇对的距离表
+        """
+        n = self.order.size
+        # 载频区间扫描：排序位置 k 的簇与 (k, upper[k]) 内的簇构成候选
+        upper = np.searchsorted(self.cf_min, self.cf_max + params.cf_tolerance, side="right")
+        parts = []
+        for start in range(0, n, chunk_size):
+            rows = np.arange(start, min(start + chunk_size, n))
+            left, right = self._expand(rows, rows + 1, np.maximum(upper[rows], rows + 1))
+            parts.append(self._measure(left, right, params))
+        return self._collect(parts)
+
+    def candidate_pairs(self, params: MergeParams, chunk_size: int = 4096) -> np.ndarray:
+        """查询兼容的簇对
+
+        Returns:
+            簇对（原始序号），形状为 (P, 2)，每行 i < j
+        """
+        return self.candidate_distances(params, chunk_size).pairs
+
+    def pairs_with(self, indices: np.ndarray, params: MergeParams, chunk_size: int = 4096) -> np.ndarray:
+        """查询涉及指定簇的兼容簇对（用于新切片到达时的增量合并）
+
+        Args:
+            indices: 簇的原始序号
+            params: 合并参数
+            chunk_size: 每次展开候选对的簇数
+
+        Returns:
+            簇对（原始序号），形状为 (P, 2)，每行 i < j；两端都在 indices 中的簇对只出现一次
+        """
+        position = np.full(self.size, -1, dtype=np.intp)
+        position[self.order] = np.arange(self.order.size)
+        rows_all = position[np.asarray(indices, dtype=np.intp)]
+        rows_all = rows_all[rows_all >= 0]
+        if rows_all.size == 0:
+            return np.empty((0, 2), dtype=np.intp)
+        is_query = np.zeros(self.order.size, dtype=bool)
+        is_query[rows_all] = True
+        # cf_min 有序而 cf_max 无序：以最大区间宽度放宽下界，区间是否相交由载频间隙精确判断
+        width = float((self.cf_max - self.cf_min).max())
+        tolerance = params.cf_tolerance
+        parts = []
+        for start in range(0, rows_all.size, chunk_size):
+            rows = rows_all[start:start + chunk_size]
+            lower = np.searchsorted(self.cf_min, self.cf_min[rows] - tolerance - width, side="left")
+            upper = np.searchsorted(self.cf_min, self.cf_max[rows] + tolerance, side="right")
+            left, right = self._expand(rows, lower, upper)
+            keep = (right != left) & (~is_query[right] | (right > left))
+            parts.append(self._measure(left[keep], right[keep], params))
+        return self._collect(parts).pairs
+
+    def _collect(self, parts: List[Tuple[np.ndarray, ...]]) -> "PairDistances":
+        """合并各批结果，并把排序位置表示的簇对转换为原始序号"""
+        if not parts:
+            empty = np.empty(0)
+            return PairDistances(np.empty((0, 2), dtype=np.intp), empty, empty, empty)
+        left, right, cf_gap, pw_diff, pri_diff = (np.concatenate(columns) for columns in zip(*parts))
+        pairs = self.order[np.column_stack([left, right])]
+        pairs.sort(axis=1)
+        return PairDistances(pairs, cf_gap, pw_diff, pri_diff)
+
+    @staticmethod
+    def _expand(rows: np.ndarray, lower: np.ndarray, upper: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """展开候选对：rows[k] 与排序位置 [lower[k], upper[k]) 内的各簇"""
+        counts = np.maximum(upper - lower, 0)
+        total = int(counts.sum())
+        left = np.repeat(rows, counts)
+        # 每个簇的候选从 lower 开始连续编号
+        offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        right = np.repeat(lower, counts) + offsets
+        return left, right
+
+    def _measure(self, left: np.ndarray, right: np.ndarray, params: MergeParams) -> Tuple[np.ndarray, ...]:
+        """计算候选对的各维度距离，保留切片、类别约束与各项容差都满足的簇对
+
+        Returns:
+            (left, right, cf_gap, pw_diff, pri_diff)，簇以排序位置表示
+        """
+        keep = np.ones(left.size, dtype=bool)
+        if params.cross_slice_only:
+            keep &= self.slice_index[left] != self.slice_index[right]
+        if params.require_same_class and self.class_ids is not None:
+            keep &= self.class_ids[left] == self.class_ids[right]
+        left, right = left[keep], right[keep]
+
+        cf_gap = np.maximum(
+            np.maximum(self.cf_min[left], self.cf_min[right]) - np.minimum(self.cf_max[left], self.cf_max[right]), 0.0
+        )
+        # 脉宽缺失时不作约束
+        pw_diff = np.nan_to_num(np.abs(self.pw[left] - self.pw[right]), nan=0.0)
+        keep = (cf_gap <= params.cf_tolerance) & (pw_diff <= params.pw_tolerance)
+        left, right, cf_gap, pw_diff = left[keep], right[keep], cf_gap[keep], pw_diff[keep]
+
+        # 取最接近的一对 PRI 的相对差（两簇的 PRI 个数可以不同），逐列组合比较，np.fmin 跳过 NaN；
+        # 任一簇没有 PRI 时不作约束
+        pri_diff = np.full(left.size, np.nan)
+        right_columns = [column[right] for column in self.pri_columns]
+        for column in self.pri_columns:
+            pri_a = column[left]
+            for pri_b in right_columns:
+                np.fmin(pri_diff, np.abs(pri_a - pri_b) / np.fmax(pri_a, pri_b), out=pri_diff)
+        pri_diff[np.isnan(pri_diff)] = 0.0
+        keep = pri_diff <= params.pri_tolerance
+        return left[keep], right[keep], cf_gap[keep], pw_diff[keep], pri_diff[keep]
+
+
+@dataclass
+class PairDistances:
+    """候选簇对及其在各维度上的距离
+
+    一对簇在合并参数下兼容，当且仅当各维度的距离都不超过对应容差。
+
+    Attributes:
+        pairs: 簇对（原始序号），形状为 (P, 2)，每行 i < j
+        cf_gap: 载频区间的间隙（区间相交时为 0）
+        pw_diff: 脉宽均值之差的绝对值（任一簇缺失时为 0）
+        pri_diff: 最接近的一对 PRI 的相对差（任一簇没有 PRI 时为 0）
+    """
+
+    pairs: np.ndarray
+    cf_gap: np.ndarray
+    pw_diff: np.ndarray
+    pri_diff: np.ndarray
+
+    def compatible(self, params: MergeParams) -> np.ndarray:
+        """在（不宽于查询时的）合并参数下兼容的簇对掩码"""
+        return (
+            (self.cf_gap <= params.cf_tolerance)
+            & (self.pw_diff <= params.pw_tolerance)
+            & (self.pri_diff <= params.pri_tolerance)
+        )
+
+
+def connected_components(n: int, pairs: np.ndarray) -> np.ndarray:
+    """求无向图的连通分量
+
+    以挂接与指针跳跃交替迭代，迭代次数约为 O(log n)，每次迭代都是整批数组操作。
+
+    Args:
+        n: 节点数
+        pairs: 边，形状为 (P, 2)
+
+    Returns:
+        各节点所属分量的序号（0..C-1，按分量内最小节点的顺序编号）
+    """
+    parent = np.arange(n)
+    if pairs.size:
+        a, b = pairs[:, 0], pairs[:, 1]
+        while True:
+            root_a, root_b = parent[a], parent[b]
+            active = root_a != root_b
+            if not active.any():
+                break
+            low = np.minimum(root_a[active], root_b[active])
+            high = np.maximum(root_a[active], root_b[active])
+            # 把较大的根挂到较小的根下，重复的根取最小值
+            np.minimum.at(parent, high, low)
+            while True:
+                grand = parent[parent]
+                if np.array_equal(grand, parent):
+                    break
+                parent = grand
+    _, group_ids = np.unique(parent, return_inverse=True)
+    return group_ids
+
+
+# 可实时预览的容差及其在 PairDistances 中对应的距离
+PREVIEW_DIMENSIONS = {"cf_tolerance": "cf_gap", "pw_tolerance": "pw_diff", "pri_tolerance": "pri_diff"}
+
+
+class MergePreview:
+    """合并参数的实时预览
+
+    以宽于当前参数（headroom 倍）的容差预先查询一次候选簇对及其各维度距离。调整某一项容差时，
+    把在其余容差下兼容的簇对按该维度的距离排序，在可回滚的并查集上依次合并：
+    放宽容差只合并新跨过阈值的簇对，收紧容差回滚到对应的合并记录位置，
+    每次调整的代价只与新旧阈值之间的簇对数量有关。容差超出预查询范围或约束条件变化时重新查询。
+    """
+
+    def __init__(
+        self,
+        index: ClusterIndex,
+        params: MergeParams,
+        manual_pairs: Optional[np.ndarray] = None,
+        headroom: float = 2.0,
+    ) -> None:
+        """建立预览
+
+        Args:
+            index: 簇参数索引
+            params: 初始合并参数
+            manual_pairs: 人工合并的簇对，预览中始终合并
+            headroom: 预查询容差相对当前容差的倍数
+        """
+        self._index = index
+        self._manual = manual_pairs if manual_pairs is not None else np.empty((0, 2), dtype=np.intp)
+        self._headroom = float(headroom)
+        self._build(params)
+
+    @property
+    def params(self) -> MergeParams:
+        """当前预览的合并参数"""
+        return self._params
+
+    def update(self, params: MergeParams) -> MergeResult:
+        """按新的合并参数更新预览
+
+        Args:
+            params: 合并参数
+
+        Returns:
+            预览的合并结果
+        """
+        changed = [field for field in PREVIEW_DIMENSIONS if getattr(params, field) != getattr(self._params, field)]
+        if (
+            params.require_same_class != self._params.require_same_class
+            or params.cross_slice_only != self._params.cross_slice_only
+            or any(getattr(params, field) > getattr(self._ceiling, field) for field in changed)
+            or len(changed) > 1
+        ):
+            self._build(params)
+        elif changed:
+            if changed[0] != self._dimension:
+                self._start(changed[0])
+            self._move(int(np.searchsorted(self._sorted_distances, getattr(params, changed[0]), side="right")))
+            self._params = replace(params)
+        return self.result()
+
+    def result(self) -> MergeResult:
+        """当前预览的合并结果"""
+        if self._dimension is None:
+            pairs = self._table.pairs[self._table.compatible(self._params)]
+        else:
+            pairs = self._sorted_pairs[:self._position]
+        return MergeResult(self._groups.labels(), pairs)
+
+    def _build(self, params: MergeParams) -> None:
+        """以放宽的容差重新查询候选簇对，并整批求合并组"""
+        self._params = replace(params)
+        self._ceiling = replace(params, **{
+            field: getattr(params, field) * self._headroom for field in PREVIEW_DIMENSIONS
+        })
+        self._table = self._index.candidate_distances(self._ceiling)
+        pairs = self._table.pairs[self._table.compatible(params)]
+        self._groups = DisjointSet.from_labels(
+            connected_components(self._index.size, np.concatenate([pairs, self._manual]))
+        )
+        self._dimension: Optional[str] = None
+
+    def _start(self, dimension: str) -> None:
+        """开始调整某一项容差：按该维度的距离排列其余容差下兼容的簇对"""
+        table = self._table
+        mask = np.ones(table.pairs.shape[0], dtype=bool)
+        for field, column in PREVIEW_DIMENSIONS.items():
+            if field != dimension:
+                mask &= getattr(table, column) <= getattr(self._params, field)
+        distances = getattr(table, PREVIEW_DIMENSIONS[dimension])[mask]
+        order = np.argsort(distances, kind="stable")
+        self._dimension = dimension
+        self._sorted_pairs = table.pairs[mask][order]
+        self._sorted_distances = distances[order]
+        self._rebase(int(np.searchsorted(self._sorted_distances, getattr(self._params, dimension), side="right")))
+
+    def _rebase(self, position: int) -> None:
+        """以排序后的前 position 个簇对整批重建并查集"""
+        pairs = np.concatenate([self._sorted_pairs[:position], self._manual])
+        self._groups = DisjointSet.from_labels(connected_components(self._index.size, pairs))
+        self._base = position
+        self._position = position
+        # _checkpoints[i] 为合并第 base + i 个簇对之前的合并记录位置
+        self._checkpoints: List[int] = []
+
+    def _move(self, position: int) -> None:
+        """把合并状态移动到排序后的前 position 个簇对"""
+        if position < self._base:
+            self._rebase(position)
+        elif position < self._position:
+            self._groups.rollback(self._checkpoints[position - self._base])
+            del self._checkpoints[position - self._base:]
+        else:
+            for a, b in self._sorted_pairs[self._position:position].tolist():
+                self._checkpoints.append(self._groups.checkpoint())
+                self._groups.union(a, b)
+        self._position = position
+
+
+@dataclass
+class _MergeAction:
+    """一次合并操作
+
+    Attributes:
+        pairs: 合并的簇对
+        manual: 是否为人工合并（只有人工合并可以撤销 / 重做）
+        checkpoint: 执行前并查集的合并记录位置
+    """
+
+    pairs: np.ndarray
+    manual: bool
+    checkpoint: int
+
+
+class MergeService(LoggerMixin):
+    """跨切片合并服务
+
+    合并组以可回滚的并查集表示：
+    - merge 按合并参数整批重算（连通分量），随后重放尚未撤销的人工合并；
+    - add_clusters 在新切片到达时只查询涉及新簇的候选对并增量合并；
+    - merge_clusters 为人工合并，可以 undo / redo，撤销代价与其后的合并次数成正比，不需要整批重算。
+    """
+
+    def __init__(self, params: Optional[MergeParams] = None) -> None:
+        """初始化合并服务
+
+        Args:
+            params: 合并参数，为 None 时使用默认值
+        """
+        self.params = params if params is not None else MergeParams()
+        self._records: Optional[np.ndarray] = None
+        self._class_ids: Optional[np.ndarray] = None
+        self._index: Optional[ClusterIndex] = None
+        self._groups = DisjointSet()
+        self._pairs = np.empty((0, 2), dtype=np.intp)
+        # 已执行的合并操作（按执行顺序）与已撤销、可重做的人工合并
+        self._actions: List[_MergeAction] = []
+        self._redo: List[_MergeAction] = []
+        self._preview: Optional[MergePreview] = None
+        self._similarity: Optional[SimilarityTable] = None
+
+    @property
+    def index(self) -> Optional[ClusterIndex]:
+        """当前簇集合的索引"""
+        return self._index
+
+    @property
+    def records(self) -> Optional[np.ndarray]:
+        """当前的全部簇参数记录"""
+        return self._records
+
+    @property
+    def can_undo(self) -> bool:
+        """是否有可撤销的人工合并"""
+        return any(action.manual for action in self._actions)
+
+    @property
+    def can_redo(self) -> bool:
+        """是否有可重做的人工合并"""
+        return bool(self._redo)
+
+    def set_clusters(self, records: np.ndarray, class_ids: Optional[np.ndarray] = None) -> None:
+        """设置待合并的簇并建立索引，清空合并组与人工合并记录
+
+        Args:
+            records: 全部切片的簇参数记录
+            class_ids: 各簇的识别类别
+        """
+        self._index = ClusterIndex(records, class_ids)
+        self._records = records
+        self._class_ids = None if class_ids is None else np.asarray(class_ids)
+        self._groups = DisjointSet(records.size)
+        self._pairs = np.empty((0, 2), dtype=np.intp)
+        self._actions.clear()
+        self._redo.clear()
+        self._preview = None
+        self._similarity = None
+        self.logger.debug(f"合并索引已建立: 簇数={records.size}")
+
+    def merge(self, params: Optional[MergeParams] = None) -> MergeResult:
+        """按合并参数整批合并当前簇集合，并重放尚未撤销的人工合并
+
+        Args:
+            params: 合并参数，为 None 时使用 self.params
+
+        Returns:
+            合并结果
+
+        Raises:
+            RuntimeError: 当尚未调用 set_clusters 时
+        """
+        if self._index is None:
+            raise RuntimeError("尚未设置待合并的簇")
+        if params is not None:
+            self.params = params
+        self._pairs = self._index.candidate_pairs(self.params)
+        self._groups = DisjointSet.from_labels(connected_components(self._index.size, self._pairs))
+        manual = [action for action in self._actions if action.manual]
+        self._actions.clear()
+        for action in manual:
+            self._apply(action.pairs, manual=True)
+        result = self.result()
+        self.logger.info(f"合并完成: 簇数={self._index.size}, 兼容簇对={len(self._pairs)}, 合并后组数={result.n_groups}")
+        return result
+
+    def add_clusters(self, records: np.ndarray, class_ids: Optional[np.ndarray] = None) -> MergeResult:
+        """追加新切片的簇，只查询涉及新簇的候选对并增量合并
+
+        Args:
+            records: 新增的簇参数记录
+            class_ids: 新增簇的识别类别，须与已有簇一致地提供或省略
+
+        Returns:
+            合并结果
+
+        Raises:
+            ValueError: 当类别的提供方式与已有簇不一致时
+        """
+        if self._records is None:
+            self.set_clusters(records, class_ids)
+            return self.merge()
+        if (class_ids is None) != (self._class_ids is None):
+            raise ValueError("新增簇与已有簇的类别须同时提供或同时省略")
+        start = self._records.size
+        all_records = np.concatenate([self._records, records])
+        all_class_ids = None if class_ids is None else np.concatenate([self._class_ids, np.asarray(class_ids)])
+        self._index = ClusterIndex(all_records, all_class_ids)
+        self._records, self._class_ids = all_records, all_class_ids
+        self._groups.extend(records.size)
+        self._preview = None
+        self._similarity = None
+
+        pairs = self._index.pairs_with(np.arange(start, all_records.size), self.params)
+        self._pairs = np.concatenate([self._pairs, pairs])
+        self._apply(pairs, manual=False)
+        self.logger.debug(f"增量合并: 新增簇数={records.size}, 新增兼容簇对={len(pairs)}, 组数={self._groups.n_sets}")
+        return self.result()
+
+    def merge_clusters(self, indices: np.ndarray) -> bool:
+        """人工合并：把指定簇所在的组合并为一组
+
+        Args:
+            indices: 簇序号（至少两个）
+
+        Returns:
+            是否发生了合并（指定簇已在同一组时为 False）
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        roots = {self._groups.find(int(index)) for index in indices}
+        if len(roots) < 2:
+            return False
+        pairs = np.column_stack([np.full(indices.size - 1, indices[0]), indices[1:]])
+        self._apply(pairs, manual=True)
+        self._redo.clear()
+        return True
+
+    def undo(self) -> bool:
+        """撤销最近一次人工合并
+
+        在它之后执行的增量合并先回滚，撤销后再重新应用。
+
+        Returns:
+            是否撤销了人工合并
+        """
+        positions = [i for i, action in enumerate(self._actions) if action.manual]
+        if not positions:
+            return False
+        target = self._actions[positions[-1]]
+        later = self._actions[positions[-1] + 1:]
+        self._groups.rollback(target.checkpoint)
+        del self._actions[positions[-1]:]
+        self._preview = None
+        for action in later:
+            self._apply(action.pairs, manual=False)
+        self._redo.append(target)
+        return True
+
+    def redo(self) -> bool:
+        """重做最近一次撤销的人工合并
+
+        Returns:
+            是否重做了人工合并
+        """
+        if not self._redo:
+            return False
+        self._apply(self._redo.pop().pairs, manual=True)
+        return True
+
+    def preview(self, params: MergeParams) -> MergeResult:
+        """预览合并参数的效果，不改变当前的合并组
+
+        连续调整同一项容差时只重新判定跨过新旧阈值的簇对（见 MergePreview）。
+
+        Args:
+            params: 合并参数
+
+        Returns:
+            预览的合并结果（包含尚未撤销的人工合并）
+
+        Raises:
+            RuntimeError: 当尚未调用 set_clusters 时
+        """
+        if self._index is None:
+            raise RuntimeError("尚未设置待合并的簇")
+        if self._preview is None:
+            manual = [action.pairs for action in self._actions if action.manual]
+            self._preview = MergePreview(
+                self._index, params, np.concatenate(manual) if manual else None
+            )
+            return self._preview.result()
+        return self._preview.update(params)
+
+    def result(self) -> MergeResult:
+        """当前的合并结果"""
+        return MergeResult(self._groups.labels(), self._pairs)
+
+    def similarity(self, pairs: Optional[np.ndarray] = None) -> PairSimilarity:
+        """整批计算簇对的各项相似度（见 SimilarityTable）
+
+        Args:
+            pairs: 簇对，为 None 时取当前的兼容簇对
+
+        Returns:
+            各项相似度
+
+        Raises:
+            RuntimeError: 当尚未调用 set_clusters 时
+        """
+        if self._records is None:
+            raise RuntimeError("尚未设置待合并的簇")
+        if self._similarity is None:
+            self._similarity = SimilarityTable(self._records, self._class_ids)
+        return self._similarity.compute(self._pairs if pairs is None else pairs)
+
+    def _apply(self, pairs: np.ndarray, manual: bool) -> None:
+        """在并查集上执行一次合并操作并记录"""
+        if manual:
+            self._preview = None
+        checkpoint = self._groups.checkpoint()
+        for a, b in pairs.tolist():
+            self._groups.union(a, b)
+        self._actions.append(_MergeAction(pairs, manual, checkpoint))
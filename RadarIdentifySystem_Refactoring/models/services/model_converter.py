@@ -0,0 +1,127 @@
+# coding: utf-8
+"""
+模型转换服务
+
+将随软件发布的 Keras 模型转换为 ONNX / TFLite 格式，供轻量推理后端加载。
+转换本身依赖 TensorFlow（ONNX 还需要 tf2onnx），只需在有完整环境的机器上执行一次，
+转换结果与原模型放在同一目录、同名不同后缀。
+"""
+
+import importlib
+from pathlib import Path
+from typing import List, Union
+
+from models.processors.inference_backends import (
+    BACKENDS,
+    BackendUnavailableError,
+    OnnxRuntimeBackend,
+    TensorFlowBackend,
+    TFLiteBackend,
+)
+from models.utils.log_manager import LoggerMixin
+
+
+class ModelConverter(LoggerMixin):
+    """Keras 模型转换器"""
+
+    def __init__(self, opset: int = 13) -> None:
+        """初始化模型转换器
+
+        Args:
+            opset: 导出 ONNX 时使用的算子集版本
+        """
+        self.opset = int(opset)
+
+    @staticmethod
+    def converted_path(keras_path: Union[str, Path], backend: str) -> Path:
+        """获取 Keras 模型转换为指定后端格式后的文件路径
+
+        Args:
+            keras_path: Keras 模型路径
+            backend: 目标后端标识
+
+        Returns:
+            转换结果路径；目标为 TensorFlow 时即原路径
+        """
+        keras_path = Path(keras_path)
+        if backend == TensorFlowBackend.name:
+            return keras_path
+        return keras_path.with_suffix(BACKENDS[backend].suffixes[0])
+
+    def needs_conversion(self, keras_path: Union[str, Path], backend: str) -> bool:
+        """转换结果不存在或早于原模型时需要（重新）转换"""
+        keras_path = Path(keras_path)
+        target = self.converted_path(keras_path, backend)
+        if target == keras_path:
+            return False
+        return not target.exists() or target.stat().st_mtime < keras_path.stat().st_mtime
+
+    def convert(self, keras_path: Union[str, Path], backend: str) -> Path:
+        """将单个 Keras 模型转换为指定后端的格式
+
+        Args:
+            keras_path: Keras 模型路径
+            backend: 目标后端标识
+
+        Returns:
+            转换结果路径
+
+        Raises:
+            BackendUnavailableError: 当缺少转换所需的库时
+            KeyError: 当后端标识未知时
+        """
+        if backend not in BACKENDS:
+            raise KeyError(f"未知的推理后端: {backend}")
+        keras_path = Path(keras_path)
+        target = self.converted_path(keras_path, backend)
+        if target == keras_path:
+            return target
+
+        tf = self._import("tensorflow")
+        model = tf.keras.models.load_model(keras_path, compile=False)
+        if backend == OnnxRuntimeBackend.name:
+            self._to_onnx(tf, model, target)
+        elif backend == TFLiteBackend.name:
+            target.write_bytes(tf.lite.TFLiteConverter.from_keras_model(model).convert())
+        self.logger.info(f"模型转换完成: {keras_path.name} -> {target.name}")
+        return target
+
+    def convert_directory(self, models_dir: Union[str, Path], backend: str) -> List[Path]:
+        """转换目录下所有需要转换的 Keras 模型
+
+        Args:
+            models_dir: 模型目录（递归查找）
+            backend: 目标后端标识
+
+        Returns:
+            本次生成的文件列表
+        """
+        converted = []
+        for keras_path in self.find_keras_models(models_dir):
+            if self.needs_conversion(keras_path, backend):
+                converted.append(self.convert(keras_path, backend))
+        return converted
+
+    @staticmethod
+    def find_keras_models(models_dir: Union[str, Path]) -> List[Path]:
+        """递归查找目录下的 Keras 模型文件"""
+        models_dir = Path(models_dir)
+        if not models_dir.is_dir():
+            return []
+        return sorted(
+            path for path in models_dir.rglob("*") if path.suffix.lower() in TensorFlowBackend.suffixes
+        )
+
+    def _to_onnx(self, tf, model, target: Path) -> None:
+        """通过 tf2onnx 导出 ONNX，批大小维度保持可变"""
+        tf2onnx_convert = self._import("tf2onnx.convert")
+        signature = (tf.TensorSpec((None, *model.input_shape[1:]), tf.float32, name="input"),)
+        tf2onnx_convert.from_keras(model, input_signature=signature, opset=self.opset, output_path=str(target))
+
+    @staticmethod
+    def _import(module: str):
+        """导入转换依赖库，未安装时抛出 BackendUnavailableError"""
+        try:
+            return importlib.import_module(module)
+        except ImportError as e:
+            raise BackendUnavailableError(f"模型转换需要 {module}: {e}") from e
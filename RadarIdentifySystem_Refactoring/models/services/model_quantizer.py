@@ -0,0 +1,326 @@
+# coding: utf-8
+"""
+模型量化服务
+
+对识别模型做训练后量化，生成 int8 / float16 变体以提高 CPU 推理吞吐量：
+
+- ONNX Runtime：int8 静态量化（QDQ 格式），以留出集的一部分样本做激活值校准；
+- TFLite：float16 权重量化，或以代表性数据集做 int8 量化（输入输出保持 float32）。
+
+每个量化变体生成后都会在留出集上与同一后端的浮点模型比较分类准确率，
+准确率下降超过上限的变体直接删除，不会被模型注册表发现。
+
+留出集与 Keras 模型放在同一目录，命名为 ``<模型名>.holdout.npz``，包含：
+
+- ``x``：输入样本，第 0 维为样本；
+- ``y``：类别序号（一维）或 one-hot 标签（二维）；
+- ``x_calibration``（可选）：校准样本，缺省时取 x 的前 calibration_samples 个样本校准、其余样本评估。
+"""
+
+import importlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from models.processors.inference_backends import (
+    VARIANT_TAGS,
+    BackendUnavailableError,
+    InferenceBackend,
+    OnnxRuntimeBackend,
+    TFLiteBackend,
+    create_backend,
+)
+from models.services.model_converter import ModelConverter
+from models.utils.log_manager import LoggerMixin
+
+# 各后端支持生成的量化变体
+SUPPORTED_VARIANTS: Dict[str, Tuple[str, ...]] = {
+    OnnxRuntimeBackend.name: ("int8",),
+    TFLiteBackend.name: ("float16", "int8"),
+}
+
+
+@dataclass
+class HoldoutSet:
+    """留出集
+
+    Attributes:
+        x_calibration: 校准样本
+        x: 评估样本
+        y: 评估样本的类别序号
+    """
+
+    x_calibration: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+
+
+@dataclass
+class QuantizationReport:
+    """单个量化变体的生成结果
+
+    Attributes:
+        model_path: 原 Keras 模型路径
+        backend: 后端标识
+        variant: 精度变体
+        path: 量化模型路径（未通过准确率检查时文件已被删除）
+        float_accuracy: 浮点模型在留出集上的准确率
+        quantized_accuracy: 量化模型在留出集上的准确率
+        accepted: 是否通过准确率检查
+    """
+
+    model_path: Path
+    backend: str
+    variant: str
+    path: Path
+    float_accuracy: float
+    quantized_accuracy: float
+    accepted: bool
+
+    @property
+    def accuracy_drop(self) -> float:
+        """准确率下降量"""
+        return self.float_accuracy - self.quantized_accuracy
+
+
+class ModelQuantizer(LoggerMixin):
+    """模型量化器"""
+
+    def __init__(
+        self,
+        converter: Optional[ModelConverter] = None,
+        max_accuracy_drop: float = 0.01,
+        calibration_samples: int = 256,
+        batch_size: int = 256,
+        backend_factory: Callable[[str], InferenceBackend] = create_backend,
+    ) -> None:
+        """初始化模型量化器
+
+        Args:
+            converter: 生成浮点参照模型所用的转换器
+            max_accuracy_drop: 允许的准确率下降上限（0~1）
+            calibration_samples: 留出集未提供校准样本时，从中划出的校准样本数
+            batch_size: 评估时每批推理的样本数
+            backend_factory: 按后端标识创建推理后端实例的工厂函数
+        """
+        self.converter = converter if converter is not None else ModelConverter()
+        self.max_accuracy_drop = float(max_accuracy_drop)
+        self.calibration_samples = int(calibration_samples)
+        self.batch_size = int(batch_size)
+        self._backend_factory = backend_factory
+
+    @staticmethod
+    def quantized_path(float_path: Union[str, Path], variant: str) -> Path:
+        """浮点模型对应的量化变体路径，如 pa.onnx -> pa.int8.onnx"""
+        float_path = Path(float_path)
+        return float_path.with_name(f"{float_path.stem}.{VARIANT_TAGS[variant]}{float_path.suffix}")
+
+    @staticmethod
+    def holdout_path(keras_path: Union[str, Path]) -> Path:
+        """Keras 模型对应的留出集路径"""
+        keras_path = Path(keras_path)
+        return keras_path.with_name(f"{keras_path.stem}.holdout.npz")
+
+    def load_holdout(self, path: Union[str, Path]) -> HoldoutSet:
+        """读取留出集
+
+        Raises:
+            OSError: 当文件无法读取时
+            ValueError: 当缺少必需的数组或样本数不足时
+        """
+        with np.load(path) as data:
+            if "x" not in data or "y" not in data:
+                raise ValueError(f"留出集缺少 x 或 y: {path}")
+            x = data["x"].astype(np.float32, copy=False)
+            y = data["y"]
+            x_calibration = data["x_calibration"].astype(np.float32, copy=False) if "x_calibration" in data else None
+        if y.ndim == 2:
+            y = y.argmax(axis=1)
+        if x.shape[0] != y.shape[0]:
+            raise ValueError(f"留出集样本与标签数量不匹配: {x.shape[0]} vs {y.shape[0]}")
+        if x_calibration is None:
+            if x.shape[0] <= self.calibration_samples:
+                raise ValueError(f"留出集样本不足以划分校准集: {path}")
+            x_calibration, x, y = x[:self.calibration_samples], x[self.calibration_samples:], y[self.calibration_samples:]
+        if x.shape[0] == 0:
+            raise ValueError(f"留出集没有评估样本: {path}")
+        return HoldoutSet(x_calibration, x, y.astype(np.intp, copy=False))
+
+    def evaluate(self, backend: str, model_path: Union[str, Path], x: np.ndarray, y: np.ndarray) -> float:
+        """计算模型在样本上的分类准确率
+
+        Args:
+            backend: 后端标识
+            model_path: 模型文件路径
+            x: 输入样本
+            y: 类别序号
+
+        Returns:
+            准确率（0~1）
+        """
+        model = self._backend_factory(backend)
+        model.load(model_path)
+        try:
+            correct = 0
+            for start in range(0, x.shape[0], self.batch_size):
+                output = model.predict_on_batch(x[start:start + self.batch_size])
+                correct += int(np.count_nonzero(output.argmax(axis=1) == y[start:start + self.batch_size]))
+        finally:
+            model.release()
+        return correct / x.shape[0]
+
+    def quantize(
+        self, keras_path: Union[str, Path], backend: str, variant: str, holdout: Optional[HoldoutSet] = None
+    ) -> QuantizationReport:
+        """生成单个量化变体并做准确率检查
+
+        Args:
+            keras_path: Keras 模型路径
+            backend: 目标后端标识
+            variant: 精度变体
+            holdout: 留出集，为 None 时读取模型旁的 .holdout.npz
+
+        Returns:
+            量化结果
+
+        Raises:
+            ValueError: 当后端不支持该变体或留出集无效时
+            FileNotFoundError: 当留出集不存在时
+            BackendUnavailableError: 当缺少量化所需的库时
+        """
+        if variant not in SUPPORTED_VARIANTS.get(backend, ()):
+            raise ValueError(f"{backend} 不支持生成 {variant} 变体")
+        keras_path = Path(keras_path)
+        if holdout is None:
+            holdout_path = self.holdout_path(keras_path)
+            if not holdout_path.exists():
+                raise FileNotFoundError(f"缺少留出集，无法检查量化精度: {holdout_path.name}")
+            holdout = self.load_holdout(holdout_path)
+
+        float_path = self.converter.converted_path(keras_path, backend)
+        if self.converter.needs_conversion(keras_path, backend):
+            self.converter.convert(keras_path, backend)
+        target = self.quantized_path(float_path, variant)
+        # 在模型目录之外的临时目录中量化与评估，量化或评估出错时模型目录中不会留下未经检查的变体；
+        # 通过准确率检查后先复制为后端不会加载的 .part 文件，再替换目标文件
+        with tempfile.TemporaryDirectory(prefix="quantize_") as temp_dir:
+            temp = Path(temp_dir) / target.name
+            if backend == OnnxRuntimeBackend.name:
+                self._quantize_onnx(float_path, temp, holdout.x_calibration)
+            else:
+                self._quantize_tflite(keras_path, temp, variant, holdout.x_calibration)
+
+            float_accuracy = self.evaluate(backend, float_path, holdout.x, holdout.y)
+            quantized_accuracy = self.evaluate(backend, temp, holdout.x, holdout.y)
+            report = QuantizationReport(
+                keras_path,
+                backend,
+                variant,
+                target,
+                float_accuracy,
+                quantized_accuracy,
+                accepted=float_accuracy - quantized_accuracy <= self.max_accuracy_drop,
+            )
+            if report.accepted:
+                part = target.with_suffix(target.suffix + ".part")
+                try:
+                    shutil.copyfile(temp, part)
+                    os.replace(part, target)
+                finally:
+                    part.unlink(missing_ok=True)
+
+        if report.accepted:
+            self.logger.info(
+                f"量化模型已生成: {target.name}, 准确率 {float_accuracy:.4f} -> {quantized_accuracy:.4f}"
+            )
+        else:
+            # 旧的变体对应的浮点模型可能已更新，一并删除
+            target.unlink(missing_ok=True)
+            self.logger.warning(
+                f"量化模型准确率下降 {report.accuracy_drop:.4f} 超过上限 {self.max_accuracy_drop:.4f}，已丢弃: {target.name}"
+            )
+        return report
+
+    def quantize_directory(
+        self, models_dir: Union[str, Path], backend: str, variants: Optional[Sequence[str]] = None
+    ) -> List[QuantizationReport]:
+        """为目录下所有带留出集的 Keras 模型生成量化变体
+
+        Args:
+            models_dir: 模型目录（递归查找）
+            backend: 目标后端标识
+            variants: 要生成的变体，为 None 时生成该后端支持的全部变体
+
+        Returns:
+            各变体的量化结果（没有留出集或量化出错的模型跳过，错误记录到日志）
+
+        Raises:
+            ValueError: 当后端不支持所列变体时
+            BackendUnavailableError: 当缺少量化所需的库时（对所有模型都会失败，不再继续）
+        """
+        variants = SUPPORTED_VARIANTS.get(backend, ()) if variants is None else variants
+        unsupported = [variant for variant in variants if variant not in SUPPORTED_VARIANTS.get(backend, ())]
+        if unsupported:
+            raise ValueError(f"{backend} 不支持生成 {', '.join(unsupported)} 变体")
+        reports = []
+        for keras_path in self.converter.find_keras_models(models_dir):
+            holdout_path = self.holdout_path(keras_path)
+            if not holdout_path.exists():
+                self.logger.warning(f"模型 {keras_path.name} 没有留出集，跳过量化")
+                continue
+            try:
+                holdout = self.load_holdout(holdout_path)
+                for variant in variants:
+                    reports.append(self.quantize(keras_path, backend, variant, holdout))
+            except BackendUnavailableError:
+                raise
+            except Exception as e:  # 转换与量化库可能抛出任意异常，单个模型出错不影响其余模型
+                self.logger.error(f"模型 {keras_path.name} 量化失败，跳过: {e}")
+        return reports
+
+    def _quantize_onnx(self, float_path: Path, target: Path, x_calibration: np.ndarray) -> None:
+        """ONNX Runtime int8 静态量化（QDQ 格式）"""
+        onnx = self._import("onnx")
+        quantization = self._import("onnxruntime.quantization")
+        input_name = onnx.load(str(float_path)).graph.input[0].name
+        batches = iter([x_calibration[start:start + 1] for start in range(x_calibration.shape[0])])
+
+        class _CalibrationReader(quantization.CalibrationDataReader):
+            def get_next(self):
+                batch = next(batches, None)
+                return None if batch is None else {input_name: batch}
+
+        quantization.quantize_static(
+            str(float_path),
+            str(target),
+            _CalibrationReader(),
+            quant_format=quantization.QuantFormat.QDQ,
+            activation_type=quantization.QuantType.QUInt8,
+            weight_type=quantization.QuantType.QInt8,
+            per_channel=True,
+        )
+
+    def _quantize_tflite(self, keras_path: Path, target: Path, variant: str, x_calibration: np.ndarray) -> None:
+        """TFLite float16 / int8 训练后量化，输入输出保持 float32"""
+        tf = self._import("tensorflow")
+        model = tf.keras.models.load_model(keras_path, compile=False)
+        converter = tf.lite.TFLiteConverter.from_keras_model(model)
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        if variant == "float16":
+            converter.target_spec.supported_types = [tf.float16]
+        else:
+            converter.representative_dataset = lambda: ([x_calibration[i:i + 1]] for i in range(x_calibration.shape[0]))
+        target.write_bytes(converter.convert())
+
+    @staticmethod
+    def _import(module: str):
+        """导入量化依赖库，未安装时抛出 BackendUnavailableError"""
+        try:
+            return importlib.import_module(module)
+        except ImportError as e:
+            raise BackendUnavailableError(f"模型量化需要 {module}: {e}") from e
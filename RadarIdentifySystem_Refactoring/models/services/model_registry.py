@@ -0,0 +1,354 @@
+# coding: utf-8
+"""
+模型注册表服务
+
+扫描模型目录发现所有模型文件，但只在首次使用时加载。已加载的模型按最近使用顺序
+常驻内存：常驻数量超过上限或估计内存超过预算时，淘汰最久未使用的模型。
+同一模型的不同格式（.keras / .onnx / .tflite）按文件名（不含后缀）归为一个条目，
+加载时按当前推理后端选择对应格式。量化变体（如 pa.int8.onnx）归入同一条目，
+每个模型可以单独选择使用的精度，所选变体缺少当前后端的格式时退回浮点模型。
+
+模型加载后立即按预期的批大小预热，首批真实样本不会再承担图追踪与内存分配的开销。
+"""
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from models.processors.inference_backends import (
+    BACKENDS,
+    FLOAT_VARIANT,
+    VARIANT_TAGS,
+    InferenceBackend,
+    TensorFlowBackend,
+    backend_for_file,
+    create_backend,
+    model_file_version,
+    split_variant,
+)
+from models.utils.log_manager import LoggerMixin
+
+
+@dataclass
+class ModelEntry:
+    """模型条目
+
+    Attributes:
+        name: 模型名称（相对模型目录的路径，不含后缀，使用 / 分隔）
+        files: 后端标识到浮点模型文件的映射
+        variants: 量化变体到（后端标识 -> 模型文件）映射的映射
+    """
+
+    name: str
+    files: Dict[str, Path] = field(default_factory=dict)
+    variants: Dict[str, Dict[str, Path]] = field(default_factory=dict)
+
+    def available_variants(self, backend: str) -> List[str]:
+        """指定后端可以加载的精度变体，浮点模型排在最前"""
+        variants = [FLOAT_VARIANT] if backend in self.files else []
+        return variants + [variant for variant in VARIANT_TAGS if backend in self.variants.get(variant, {})]
+
+
+class ModelRegistry(LoggerMixin):
+    """模型注册表
+
+    线程安全：推理线程与界面线程可以同时调用 get。模型在锁外加载与预热，
+    加载期间其他方法不会被阻塞；同一模型同时被多个线程请求时只加载一次。
+
+    内存占用以模型文件大小估计（权重在内存中的大小与文件大小相当）。
+    """
+
+    def __init__(
+        self,
+        models_dir: Union[str, Path],
+        backend: str = TensorFlowBackend.name,
+        max_resident: int = 2,
+        memory_budget_mb: float = 1024.0,
+        backend_factory: Callable[[str], InferenceBackend] = create_backend,
+        variants: Optional[Dict[str, str]] = None,
+        warmup_batch_sizes: Sequence[int] = (),
+    ) -> None:
+        """初始化模型注册表
+
+        Args:
+            models_dir: 模型目录
+            backend: 优先使用的推理后端标识
+            max_resident: 最多常驻的模型数量
+            memory_budget_mb: 常驻模型的估计内存上限（MB）
+            backend_factory: 按后端标识创建推理后端实例的工厂函数
+            variants: 模型名称到所选精度变体的映射，未列出的模型使用浮点模型
+            warmup_batch_sizes: 加载后预热使用的批大小，为空时不预热
+        """
+        self.models_dir = Path(models_dir)
+        self._backend = backend
+        self._max_resident = max(int(max_resident), 1)
+        self._memory_budget = float(memory_budget_mb) * 1024 * 1024
+        self._backend_factory = backend_factory
+        self._entries: Dict[str, ModelEntry] = {}
+        self._variants: Dict[str, str] = dict(variants or {})
+        self._warmup_batch_sizes: List[int] = list(warmup_batch_sizes)
+        # 常驻模型：名称 -> (推理后端实例, 估计内存)，按最近使用顺序排列
+        self._resident: "OrderedDict[str, tuple]" = OrderedDict()
+        # 正在加载的模型：名称 -> 加载结果，被释放或清空时移除，加载完成后不再常驻
+        self._loading: Dict[str, Future] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def backend(self) -> str:
+        """优先使用的推理后端标识"""
+        return self._backend
+
+    @property
+    def names(self) -> List[str]:
+        """已发现的模型名称"""
+        with self._lock:
+            return sorted(self._entries)
+
+    @property
+    def resident_names(self) -> List[str]:
+        """常驻模型名称，按最近使用顺序（最后一个为最近使用）"""
+        with self._lock:
+            return list(self._resident)
+
+    @property
+    def resident_bytes(self) -> int:
+        """常驻模型的估计内存总量（字节）"""
+        with self._lock:
+            return sum(size for _, size in self._resident.values())
+
+    def entry(self, name: str) -> ModelEntry:
+        """获取模型条目
+
+        Raises:
+            KeyError: 当模型不存在时
+        """
+        with self._lock:
+            if name not in self._entries:
+                raise KeyError(f"模型不存在: {name}")
+            return self._entries[name]
+
+    def discover(self) -> List[str]:
+        """扫描模型目录，更新模型条目（不加载任何模型）
+
+        已不存在的模型若仍常驻，会被释放。
+
+        Returns:
+            已发现的模型名称
+        """
+        entries: Dict[str, ModelEntry] = {}
+        if self.models_dir.is_dir():
+            for path in sorted(self.models_dir.rglob("*")):
+                try:
+                    backend = backend_for_file(path)
+                except ValueError:
+                    continue
+                stem_path, variant = split_variant(path.relative_to(self.models_dir))
+                entry = entries.setdefault(stem_path.as_posix(), ModelEntry(stem_path.as_posix()))
+                if variant == FLOAT_VARIANT:
+                    entry.files[backend.name] = path
+                else:
+                    entry.variants.setdefault(variant, {})[backend.name] = path
+
+        with self._lock:
+            self._entries = entries
+            for name in [name for name in self._resident if name not in entries]:
+                self._evict(name)
+            for name in [name for name in self._loading if name not in entries]:
+                del self._loading[name]
+        self.logger.info(f"模型目录扫描完成: {self.models_dir}, 模型数={len(entries)}")
+        return self.names
+
+    def get(self, name: str) -> InferenceBackend:
+        """获取已加载的模型，首次使用时加载
+
+        Args:
+            name: 模型名称
+
+        Returns:
+            已加载模型的推理后端实例
+
+        Raises:
+            KeyError: 当模型不存在时
+            BackendUnavailableError / OSError / ValueError: 当模型加载失败时
+        """
+        with self._lock:
+            if name in self._resident:
+                self._resident.move_to_end(name)
+                return self._resident[name][0]
+            future = self._loading.get(name)
+            loading_elsewhere = future is not None
+            if not loading_elsewhere:
+                backend_name, path = self._select_file(self.entry(name))
+                size = path.stat().st_size
+                # 先腾出空间再加载，避免峰值内存超出预算
+                self._shrink(self._max_resident - 1, self._memory_budget - size)
+                future = self._loading[name] = Future()
+                warmup_batch_sizes = list(self._warmup_batch_sizes)
+        if loading_elsewhere:
+            # 其他线程正在加载同一模型，等待其结果
+            return future.result()
+
+        try:
+            model = self._backend_factory(backend_name)
+            model.load(path)
+            if warmup_batch_sizes:
+                self._warmup(name, model, warmup_batch_sizes)
+        except BaseException as e:
+            with self._lock:
+                if self._loading.get(name) is future:
+                    del self._loading[name]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            # 加载期间模型被释放或注册表被清空时，结果只交给本次调用者与等待中的调用者，不再常驻
+            if self._loading.get(name) is future:
+                del self._loading[name]
+                # 加载期间其他模型可能已常驻，再次腾出空间
+                self._shrink(self._max_resident - 1, self._memory_budget - size)
+                self._resident[name] = (model, size)
+        future.set_result(model)
+        self.logger.info(f"模型已加载: {name}, 后端={backend_name}, 估计内存={size / 1024 / 1024:.1f}MB")
+        return model
+
+    def version(self, name: str) -> str:
+        """获取模型的版本标识，不加载模型
+
+        常驻模型返回其已加载文件的版本，否则返回按当前后端将要加载的文件的版本。
+
+        Raises:
+            KeyError: 当模型不存在时
+            ValueError: 当没有任何可加载的格式时
+        """
+        with self._lock:
+            if name in self._resident:
+                return self._resident[name][0].version
+            _, path = self._select_file(self.entry(name))
+            return model_file_version(path)
+
+    def is_resident(self, name: str) -> bool:
+        """模型是否常驻内存"""
+        with self._lock:
+            return name in self._resident
+
+    def set_backend(self, backend: str) -> None:
+        """切换优先使用的推理后端，释放全部常驻模型
+
+        Raises:
+            KeyError: 当后端标识未知时
+        """
+        if backend not in BACKENDS:
+            raise KeyError(f"未知的推理后端: {backend}")
+        with self._lock:
+            if backend == self._backend:
+                return
+            self._backend = backend
+            self.clear()
+
+    def variant(self, name: str) -> str:
+        """模型所选的精度变体"""
+        with self._lock:
+            return self._variants.get(name, FLOAT_VARIANT)
+
+    def set_variant(self, name: str, variant: str) -> None:
+        """选择模型使用的精度变体，已常驻的该模型会被释放，下次使用时按新变体加载
+
+        Args:
+            name: 模型名称
+            variant: 精度变体（FLOAT_VARIANT 或 VARIANT_TAGS 中的键）
+
+        Raises:
+            KeyError: 当精度变体未知时
+        """
+        if variant != FLOAT_VARIANT and variant not in VARIANT_TAGS:
+            raise KeyError(f"未知的精度变体: {variant}")
+        with self._lock:
+            if self.variant(name) == variant:
+                return
+            if variant == FLOAT_VARIANT:
+                self._variants.pop(name, None)
+            else:
+                self._variants[name] = variant
+            self.release(name)
+        self.logger.info(f"模型精度已切换: {name} -> {variant}")
+
+    def set_warmup_batch_sizes(self, batch_sizes: Sequence[int]) -> None:
+        """设置加载后预热使用的批大小（对之后加载的模型生效）"""
+        with self._lock:
+            self._warmup_batch_sizes = list(batch_sizes)
+
+    def set_limits(self, max_resident: Optional[int] = None, memory_budget_mb: Optional[float] = None) -> None:
+        """调整常驻上限，超出部分立即淘汰
+
+        Args:
+            max_resident: 最多常驻的模型数量
+            memory_budget_mb: 常驻模型的估计内存上限（MB）
+        """
+        with self._lock:
+            if max_resident is not None:
+                self._max_resident = max(int(max_resident), 1)
+            if memory_budget_mb is not None:
+                self._memory_budget = float(memory_budget_mb) * 1024 * 1024
+            self._shrink(self._max_resident, self._memory_budget)
+
+    def release(self, name: str) -> None:
+        """释放指定的常驻模型，正在加载的该模型加载完成后不再常驻"""
+        with self._lock:
+            self._loading.pop(name, None)
+            if name in self._resident:
+                self._evict(name)
+
+    def clear(self) -> None:
+        """释放全部常驻模型，正在加载的模型加载完成后不再常驻"""
+        with self._lock:
+            self._loading.clear()
+            for name in list(self._resident):
+                self._evict(name)
+
+    def _select_file(self, entry: ModelEntry) -> tuple:
+        """按优先后端与所选精度变体选择模型文件
+
+        所选量化变体缺少当前后端的格式时使用浮点模型；浮点模型也缺少当前后端的格式时
+        退回其他可用后端。
+
+        Raises:
+            ValueError: 当没有任何可加载的格式时
+        """
+        variant = self._variants.get(entry.name, FLOAT_VARIANT)
+        if self._backend in entry.variants.get(variant, {}):
+            return self._backend, entry.variants[variant][self._backend]
+        if variant != FLOAT_VARIANT:
+            self.logger.warning(f"模型 {entry.name} 缺少 {self._backend} 的 {variant} 变体，改用浮点模型")
+        if self._backend in entry.files:
+            return self._backend, entry.files[self._backend]
+        for backend_name, path in entry.files.items():
+            if BACKENDS[backend_name].is_available():
+                self.logger.warning(f"模型 {entry.name} 缺少 {self._backend} 格式，改用 {backend_name}")
+                return backend_name, path
+        raise ValueError(f"模型 {entry.name} 没有可用后端能够加载的格式")
+
+    def _warmup(self, name: str, model: InferenceBackend, batch_sizes: Sequence[int]) -> None:
+        """预热刚加载的模型，预热失败不影响加载结果"""
+        try:
+            elapsed = model.warmup(batch_sizes)
+        except Exception as e:  # 运行库可能抛出任意异常
+            self.logger.warning(f"模型预热失败: {name}, {e}")
+            return
+        self.logger.info(f"模型已预热: {name}, 耗时={elapsed:.2f}s")
+
+    def _shrink(self, max_count: int, max_bytes: float) -> None:
+        """按最久未使用顺序淘汰，直到常驻数量与内存均不超过上限"""
+        while self._resident and (len(self._resident) > max_count or self.resident_bytes > max_bytes):
+            self._evict(next(iter(self._resident)))
+
+    def _evict(self, name: str) -> None:
+        """移除常驻模型
+
+        只丢弃注册表持有的引用而不调用 release：其他线程可能刚通过 get 取得该模型
+        正在推理，模型在最后一个引用消失后自然回收。
+        """
+        del self._resident[name]
+        self.logger.info(f"模型已移出常驻: {name}")
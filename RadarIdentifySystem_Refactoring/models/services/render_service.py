@@ -0,0 +1,172 @@
+# coding: utf-8
+"""
+绘图渲染服务
+
+把排序、抽稀与栅格化等绘图计算放到线程池中执行，界面线程只负责提交请求与绘制结果图像，
+重绘大量数据时滚动与交互不会卡顿。
+
+每个请求属于一个目标（例如一个绘图控件），同一目标只保留最新的请求：
+提交新请求时，尚在排队的旧请求直接从线程池中取消，已在执行的旧请求结果被丢弃。
+结果通过 rendered 信号在界面线程中发送，最新请求失败时发送 failed 信号。
+
+QImage 可以在工作线程中创建，QPixmap 只能在界面线程中使用，因此渲染函数应返回 QImage。
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool, pyqtSignal
+
+from models.utils.log_manager import LoggerMixin
+from models.utils.plot_decimation import DecimatedSeries
+from models.utils.plot_style import PlotStyle
+
+
+class _RenderJob(QRunnable):
+    """线程池中执行的渲染任务"""
+
+    def __init__(self, service: "RenderService", target: Hashable, request_id: int, function: Callable, args: tuple):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.target = target
+        self.request_id = request_id
+        self._service = service
+        self._function = function
+        self._args = args
+
+    def run(self) -> None:
+        """执行渲染函数，开始前已过期的请求直接跳过"""
+        if not self._service.is_current(self.target, self.request_id):
+            return
+        try:
+            result = self._function(*self._args)
+        except Exception as e:  # 渲染函数可能抛出任意异常，不能让异常逃出工作线程
+            self._service._failed.emit(self.target, self.request_id, f"{type(e).__name__}: {e}")
+            return
+        self._service._finished.emit(self.target, self.request_id, result)
+
+
+class RenderService(QObject, LoggerMixin):
+    """绘图渲染服务
+
+    Signals:
+        rendered(object, int, object): 目标的最新请求完成，参数为目标、请求号与渲染结果
+        failed(object, int, str): 目标的最新请求失败，参数为目标、请求号与错误信息
+    """
+
+    rendered = pyqtSignal(object, int, object)
+    failed = pyqtSignal(object, int, str)
+
+    # 工作线程发出，经队列连接转到界面线程后再过滤过期结果
+    _finished = pyqtSignal(object, int, object)
+    _failed = pyqtSignal(object, int, str)
+
+    def __init__(self, max_threads: Optional[int] = None, parent: Optional[QObject] = None) -> None:
+        """初始化渲染服务
+
+        Args:
+            max_threads: 线程池的最大线程数，缺省为 CPU 核数减一（至少一个）
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_threads or max(QThread.idealThreadCount() - 1, 1))
+        self._lock = threading.Lock()
+        self._next_id = 0
+        # 各目标最新的请求号与对应任务（已完成的目标被移除）
+        self._latest: Dict[Hashable, Tuple[int, _RenderJob]] = {}
+        self._finished.connect(self._on_finished)
+        self._failed.connect(self._on_failed)
+
+    def submit(self, target: Hashable, function: Callable[..., Any], *args: Any) -> int:
+        """提交渲染请求，同一目标排队中的旧请求被取消
+
+        Args:
+            target: 请求所属的目标
+            function: 在工作线程中执行的渲染函数，不得访问任何控件
+            *args: 渲染函数的参数
+
+        Returns:
+            请求号
+        """
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            job = _RenderJob(self, target, request_id, function, args)
+            previous = self._latest.get(target)
+            self._latest[target] = (request_id, job)
+        if previous is not None:
+            self._pool.tryTake(previous[1])
+        self._pool.start(job)
+        return request_id
+
+    def render_plot(
+        self,
+        target: Hashable,
+        series: DecimatedSeries,
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float],
+        width: int,
+        height: int,
+        point_size: int = 2,
+        density_threshold: Optional[int] = None,
+        style: Optional[PlotStyle] = None,
+    ) -> int:
+        """提交散点图栅格化请求，结果为 (QImage, 是否为密度图)（见 DecimatedSeries.render）
+
+        style 须在界面线程中取得（plot_style()）后传入。
+
+        Returns:
+            请求号
+        """
+        return self.submit(
+            target, series.render, x_range, y_range, width, height, point_size, density_threshold, style
+        )
+
+    def cancel(self, target: Hashable) -> None:
+        """取消目标的请求：排队中的不再执行，执行中的结果被丢弃"""
+        with self._lock:
+            previous = self._latest.pop(target, None)
+        if previous is not None:
+            self._pool.tryTake(previous[1])
+
+    def is_current(self, target: Hashable, request_id: int) -> bool:
+        """请求是否仍是目标的最新请求"""
+        with self._lock:
+            latest = self._latest.get(target)
+        return latest is not None and latest[0] == request_id
+
+    def is_pending(self, target: Hashable) -> bool:
+        """目标是否有尚未完成的请求"""
+        with self._lock:
+            return target in self._latest
+
+    def shutdown(self) -> None:
+        """取消所有排队中的请求并等待执行中的请求结束"""
+        with self._lock:
+            self._latest.clear()
+        self._pool.clear()
+        self._pool.waitForDone()
+
+    def _on_finished(self, target: Hashable, request_id: int, result: Any) -> None:
+        """在界面线程中转发最新请求的结果"""
+        with self._lock:
+            latest = self._latest.get(target)
+            if latest is None or latest[0] != request_id:
+                return
+            del self._latest[target]
+        self.rendered.emit(target, request_id, result)
+
+    def _on_failed(self, target: Hashable, request_id: int, message: str) -> None:
+        """记录渲染失败，目标不再视为有待完成的请求，最新请求的失败经 failed 信号转发"""
+        self.logger.error(f"渲染失败: {target}, {message}")
+        with self._lock:
+            latest = self._latest.get(target)
+            if latest is None or latest[0] != request_id:
+                return
+            del self._latest[target]
+        self.failed.emit(target, request_id, message)
+
+
+# 全局渲染服务实例
+render_service = RenderService()
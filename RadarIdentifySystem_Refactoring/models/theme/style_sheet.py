@@ -10,6 +10,7 @@ class StyleSheet(StyleSheetBase, Enum):
     MAIN_INTERFACE = "main_interface"
     SETTING_INTERFACE = "setting_interface"
     PARAMS_CONFIG_INTERFACE = "params_config_interface"
+    MODEL_MANAGEMENT_INTERFACE = "model_management_interface"
 
     def path(self, theme=Theme.AUTO):
         theme = qconfig.theme if theme == Theme.AUTO else theme
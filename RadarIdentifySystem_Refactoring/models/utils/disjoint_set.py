@@ -0,0 +1,101 @@
+# coding: utf-8
+"""
+可回滚的并查集
+
+按集合大小合并而不做路径压缩，单次查找为 O(log n)；每次合并只修改被挂接的根，
+记录下来即可按相反顺序撤销，撤销代价与被撤销的合并次数成正比，与元素总数无关。
+"""
+
+from typing import List
+
+import numpy as np
+
+
+class DisjointSet:
+    """可回滚的并查集
+
+    checkpoint() 返回当前的合并记录位置，rollback(checkpoint) 撤销此后的全部合并。
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        """创建 size 个单元素集合"""
+        self._parent = np.arange(size)
+        self._size = np.ones(size, dtype=np.int64)
+        # 每次有效合并被挂接的根，按合并顺序排列
+        self._history: List[int] = []
+        self.n_sets = size
+
+    @classmethod
+    def from_labels(cls, labels: np.ndarray) -> "DisjointSet":
+        """由分组标签整批构造，每组以组内第一个元素为根
+
+        Args:
+            labels: 各元素的分组标签
+        """
+        labels = np.asarray(labels)
+        result = cls(labels.size)
+        _, first, inverse, counts = np.unique(labels, return_index=True, return_inverse=True, return_counts=True)
+        result._parent = first[inverse]
+        result._size[first] = counts
+        result.n_sets = first.size
+        return result
+
+    def __len__(self) -> int:
+        return self._parent.size
+
+    def extend(self, count: int) -> None:
+        """追加 count 个单元素集合"""
+        start = self._parent.size
+        self._parent = np.concatenate([self._parent, np.arange(start, start + count)])
+        self._size = np.concatenate([self._size, np.ones(count, dtype=np.int64)])
+        self.n_sets += count
+
+    def find(self, item: int) -> int:
+        """元素所在集合的根"""
+        parent = self._parent
+        while parent[item] != item:
+            item = parent[item]
+        return int(item)
+
+    def union(self, a: int, b: int) -> bool:
+        """合并两个元素所在的集合
+
+        Returns:
+            是否发生了合并（两者已在同一集合时为 False）
+        """
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a == root_b:
+            return False
+        if self._size[root_a] < self._size[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        self._size[root_a] += self._size[root_b]
+        self._history.append(root_b)
+        self.n_sets -= 1
+        return True
+
+    def checkpoint(self) -> int:
+        """当前的合并记录位置"""
+        return len(self._history)
+
+    def rollback(self, checkpoint: int) -> None:
+        """撤销 checkpoint 之后的全部合并"""
+        while len(self._history) > checkpoint:
+            child = self._history.pop()
+            root = self._parent[child]
+            self._size[root] -= self._size[child]
+            self._parent[child] = child
+            self.n_sets += 1
+
+    def labels(self) -> np.ndarray:
+        """各元素所属集合的序号（0..n_sets-1，按集合内首个元素的位置编号）"""
+        roots = self._parent.copy()
+        while True:
+            grand = roots[roots]
+            if np.array_equal(grand, roots):
+                break
+            roots = grand
+        _, first, inverse = np.unique(roots, return_index=True, return_inverse=True)
+        rank = np.empty(first.size, dtype=np.intp)
+        rank[np.argsort(first, kind="stable")] = np.arange(first.size)
+        return rank[inverse]
@@ -0,0 +1,62 @@
+# coding: utf-8
+"""
+重量级模块后台预加载
+
+TensorFlow、ONNX Runtime 等库仅导入就需要数秒。启动路径上的代码只在使用时才导入这些库，
+窗口显示后再由本线程在后台提前导入，首次推理时即可直接使用，而界面始终保持可交互。
+"""
+
+import importlib
+import importlib.util
+import time
+from typing import Dict, List, Optional, Sequence
+
+from PyQt6.QtCore import QObject, QThread, pyqtSignal
+
+from models.utils.log_manager import LoggerMixin
+
+
+class ModulePreloader(QThread, LoggerMixin):
+    """模块预加载线程
+
+    未安装的模块直接跳过，不视为错误。
+
+    Signals:
+        moduleLoaded(str, float): 单个模块导入完成，参数为模块名与耗时（秒）
+        preloadFinished(dict): 全部完成，参数为模块名到是否导入成功的映射
+    """
+
+    moduleLoaded = pyqtSignal(str, float)
+    preloadFinished = pyqtSignal(dict)
+
+    def __init__(self, modules: Sequence[str], parent: Optional[QObject] = None) -> None:
+        """初始化预加载线程
+
+        Args:
+            modules: 按顺序导入的模块名
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._modules: List[str] = list(dict.fromkeys(modules))
+
+    def run(self) -> None:
+        """依次导入模块"""
+        results: Dict[str, bool] = {}
+        for module in self._modules:
+            if self.isInterruptionRequested():
+                break
+            if importlib.util.find_spec(module.split(".")[0]) is None:
+                results[module] = False
+                continue
+            start = time.perf_counter()
+            try:
+                importlib.import_module(module)
+            except Exception as e:  # 第三方库导入可能抛出任意异常
+                self.logger.warning(f"预加载模块失败: {module}, {e}")
+                results[module] = False
+                continue
+            elapsed = time.perf_counter() - start
+            results[module] = True
+            self.logger.debug(f"预加载模块完成: {module}, 耗时={elapsed:.2f}s")
+            self.moduleLoaded.emit(module, elapsed)
+        self.preloadFinished.emit(results)
@@ -0,0 +1,249 @@
+# coding: utf-8
+"""
+散点图抽稀
+
+数据按横坐标排序后，预先建立逐级的最小/最大值金字塔：第 0 级把每 BASE_BLOCK 个相邻点分为一块，
+记录块内纵坐标最小与最大的点，之后每一级把相邻两块合并。对可见的横轴范围抽稀时，
+按可见点数选择块数不超过像素列数的一级，直接取出范围内各块的极值点；
+范围两端不完整的块按线段树分解为更细各级的整块，因此每列最多约两个点，且不丢失可见范围内的尖峰。
+
+建金字塔的开销与点数成正比，只在设置数据时进行一次；之后缩放、平移时的抽稀只与像素列数有关，
+与数据量无关。
+
+序列可以保存每个点的标签（簇标签或识别类别）而不是颜色，栅格化时只为抽稀后的点按配色（PlotStyle）取色，
+切换主题不需要重建序列。
+
+序列建立后只读（密度图行偏移的缓存除外，重复计算也无害），可以在工作线程中建立、栅格化后交给界面线程。
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+from PyQt6.QtGui import QImage
+
+from models.utils.plot_raster import PlotSpec, data_range, density_row_offsets, rasterize_density, rasterize_scatter
+from models.utils.plot_style import PlotStyle, plot_style
+
+# 第 0 级的块大小
+BASE_BLOCK = 16
+
+
+class DecimatedSeries:
+    """可按可见范围抽稀的散点序列
+
+    Attributes:
+        x: 横坐标（升序）
+        y: 纵坐标
+        colors: 每个点的颜色（ARGB32），可为 None
+        labels: 每个点的标签，栅格化时按配色取色，可为 None
+        label_kind: 标签的种类，"cluster" 为簇标签，"class" 为识别类别
+        x_range: 全部数据的横轴显示范围
+        y_range: 全部数据的纵轴显示范围
+    """
+
+    def __init__(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        colors: Optional[np.ndarray] = None,
+        labels: Optional[np.ndarray] = None,
+        label_kind: str = "cluster",
+    ) -> None:
+        """建立抽稀金字塔
+
+        Args:
+            x: 横坐标，未排序时按横坐标稳定排序
+            y: 纵坐标
+            colors: 每个点的颜色（ARGB32），优先于 labels
+            labels: 每个点的标签（簇标签或识别类别）
+            label_kind: 标签的种类，"cluster" 或 "class"
+
+        Raises:
+            ValueError: 当各数组长度不一致时
+        """
+        x, y = np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64)
+        if y.shape != x.shape or any(a is not None and len(a) != x.size for a in (colors, labels)):
+            raise ValueError(f"散点数组长度不一致: x={x.size}, y={y.size}")
+        labels = None if labels is None else np.asarray(labels)
+        if x.size > 1 and not np.all(x[1:] >= x[:-1]):
+            order = np.argsort(x, kind="stable")
+            x, y = x[order], y[order]
+            colors = None if colors is None else np.asarray(colors)[order]
+            labels = None if labels is None else labels[order]
+        self.x = x
+        self.y = y
+        self.colors = colors
+        self.labels = labels
+        self.label_kind = label_kind
+        self.x_range = data_range(x)
+        self.y_range = data_range(y)
+        self._min_levels, self._max_levels = self._build_levels()
+        self._row_offsets: Optional[Tuple[tuple, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return self.x.size
+
+    @property
+    def nbytes(self) -> int:
+        """序列占用的内存（字节）"""
+        levels = sum(level.nbytes for level in self._min_levels + self._max_levels)
+        colors = sum(0 if a is None else a.nbytes for a in (self.colors, self.labels))
+        return self.x.nbytes + self.y.nbytes + colors + levels
+
+    def render(
+        self,
+        x_range: Tuple[float, float],
+        y_range: Tuple[float, float],
+        width: int,
+        height: int,
+        point_size: int = 2,
+        density_threshold: Optional[int] = None,
+        style: Optional[PlotStyle] = None,
+    ) -> Tuple[QImage, bool]:
+        """栅格化可见范围
+
+        Args:
+            x_range: 可见的横轴范围
+            y_range: 纵轴范围
+            width: 图像宽度（像素）
+            height: 图像高度（像素）
+            point_size: 标记边长（像素）
+            density_threshold: 可见点数达到该值时绘制密度图，None 表示始终绘制散点
+            style: 配色与标记，缺省为当前主题的配色（在工作线程中调用时须传入）
+
+        Returns:
+            (图像, 是否为密度图)
+        """
+        visible = self.visible(x_range)
+        if density_threshold is not None and visible.stop - visible.start >= density_threshold:
+            image = rasterize_density(
+                self.x[visible],
+                self.y[visible],
+                x_range,
+                y_range,
+                width,
+                height,
+                row_offsets=self._density_row_offsets(y_range, width, height)[visible],
+            )
+            return image, True
+        style = style if style is not None else plot_style()
+        x, y, colors = self.window(x_range, width, style)
+        spec = PlotSpec(
+            x, y, colors=colors, color=style.default_color, x_range=x_range, y_range=y_range,
+            point_size=point_size, sprite=style.sprite(point_size),
+        )
+        return rasterize_scatter(spec, width, height), False
+
+    def _density_row_offsets(self, y_range: Tuple[float, float], width: int, height: int) -> np.ndarray:
+        """全部点在密度图计数数组中的行偏移，纵轴范围与图像尺寸不变时复用（缩放、平移只改变横轴）"""
+        key = (y_range, width, height)
+        cached = self._row_offsets
+        if cached is None or cached[0] != key:
+            cached = self._row_offsets = (key, density_row_offsets(self.y, y_range, width, height))
+        return cached[1]
+
+    def window(
+        self, x_range: Tuple[float, float], bins: int, style: Optional[PlotStyle] = None
+    ) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """取可见范围内抽稀后的点
+
+        Args:
+            x_range: 可见的横轴范围
+            bins: 像素列数
+            style: 按标签取色使用的配色，缺省为当前主题的配色
+
+        Returns:
+            (横坐标, 纵坐标, 颜色)；可见点不超过 2 × bins 时原样返回
+        """
+        indices = self.window_indices(x_range, bins)
+        if self.colors is not None:
+            colors = self.colors[indices]
+        elif self.labels is not None:
+            colors = (style if style is not None else plot_style()).colors(self.labels[indices], self.label_kind)
+        else:
+            colors = None
+        return self.x[indices], self.y[indices], colors
+
+    def visible(self, x_range: Tuple[float, float]) -> slice:
+        """可见范围内全部点的下标区间（横坐标已排序，区间是连续的）"""
+        start = int(np.searchsorted(self.x, x_range[0], side="left"))
+        stop = int(np.searchsorted(self.x, x_range[1], side="right"))
+        return slice(start, stop)
+
+    def window_indices(self, x_range: Tuple[float, float], bins: int) -> np.ndarray:
+        """可见范围内抽稀后的点的下标"""
+        visible = self.visible(x_range)
+        start, stop = visible.start, visible.stop
+        bins = max(int(bins), 1)
+        count = stop - start
+        if count <= 2 * bins or not self._min_levels:
+            return np.arange(start, stop)
+
+        # 块大小取不小于 count / bins 的最小一级
+        level = min(max(int(np.ceil(np.log2(count / (bins * BASE_BLOCK)))), 0), len(self._min_levels) - 1)
+        block = BASE_BLOCK << level
+        first, last = -(-start // block), stop // block
+        if last <= first:
+            return self._cover(start, stop)
+        return np.concatenate((
+            self._cover(start, first * block),
+            self._min_levels[level][first:last],
+            self._max_levels[level][first:last],
+            self._cover(last * block, stop),
+        ))
+
+    def _cover(self, start: int, stop: int) -> np.ndarray:
+        """[start, stop) 内的极值点：两端不足一块的取原始点，中间按线段树分解为各级的整块"""
+        first, last = -(-start // BASE_BLOCK), stop // BASE_BLOCK
+        if last <= first:
+            return np.arange(start, stop)
+        parts = [np.arange(start, first * BASE_BLOCK), np.arange(last * BASE_BLOCK, stop)]
+        level = 0
+        while first < last:
+            if first % 2:
+                parts.append(self._min_levels[level][first:first + 1])
+                parts.append(self._max_levels[level][first:first + 1])
+                first += 1
+            if last % 2:
+                last -= 1
+                parts.append(self._min_levels[level][last:last + 1])
+                parts.append(self._max_levels[level][last:last + 1])
+            first, last, level = first // 2, last // 2, level + 1
+        return np.concatenate(parts)
+
+    def _build_levels(self) -> Tuple[list, list]:
+        """逐级建立块内最小与最大纵坐标的点的下标"""
+        count = self.y.size
+        if count < 2 * BASE_BLOCK:
+            return [], []
+        index_type = np.int32 if count < np.iinfo(np.int32).max else np.int64
+
+        # 第 0 级：补齐到整块，NaN 与补齐位置不会被选为极值
+        blocks = -(-count // BASE_BLOCK)
+        padded = np.full(blocks * BASE_BLOCK, np.nan)
+        padded[:count] = self.y
+        nan = np.isnan(padded)
+        offsets = np.arange(blocks, dtype=index_type) * BASE_BLOCK
+        low_values = np.where(nan, np.inf, padded).reshape(blocks, BASE_BLOCK)
+        high_values = np.where(nan, -np.inf, padded).reshape(blocks, BASE_BLOCK)
+        low = offsets + low_values.argmin(axis=1).astype(index_type)
+        high = offsets + high_values.argmax(axis=1).astype(index_type)
+        # 全为 NaN 的块选中块首（块首总是有效点）
+        low_values = low_values.min(axis=1)
+        high_values = high_values.max(axis=1)
+
+        min_levels, max_levels = [low], [high]
+        while low.size > 1:
+            if low.size % 2:
+                low, high = np.append(low, low[-1]), np.append(high, high[-1])
+                low_values, high_values = np.append(low_values, np.inf), np.append(high_values, -np.inf)
+            take_right = low_values[1::2] < low_values[0::2]
+            low = np.where(take_right, low[1::2], low[0::2])
+            low_values = np.where(take_right, low_values[1::2], low_values[0::2])
+            take_right = high_values[1::2] > high_values[0::2]
+            high = np.where(take_right, high[1::2], high[0::2])
+            high_values = np.where(take_right, high_values[1::2], high_values[0::2])
+            min_levels.append(low)
+            max_levels.append(high)
+        return min_levels, max_levels
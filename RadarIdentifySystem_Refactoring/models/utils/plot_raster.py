@@ -0,0 +1,345 @@
+# coding: utf-8
+"""
+散点图栅格化
+
+把散点直接写入 NumPy 像素缓冲区再包装为 QImage：坐标变换、越界裁剪与着色都是整批数组运算，
+每个标记点只是一次像素赋值，百万量级的脉冲也只需几十毫秒，不经过 matplotlib 的图形创建，
+也不为每个点调用 QPainter。
+
+簇标签、类别等整数键经预先生成的颜色查找表（ColorTable）一次 np.take 映射为颜色；
+标记的形状预先栅格化为各像素偏移与覆盖度（MarkerSprite），按偏移整批写入。
+
+点数很多时可以改为密度图：按像素对点计数（np.bincount），计数取对数后经颜色查找表映射为图像，
+开销只有一次计数，与标记大小无关，并能显示标记相互覆盖时看不出的分布结构。
+
+QImage 可以在任意线程中创建，栅格化可以放在工作线程中执行。
+"""
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+import numpy as np
+from PyQt6.QtGui import QImage
+
+# 默认的标记颜色（ARGB32）
+DEFAULT_COLOR = 0xFF1F77B4
+# 簇标签的配色（ARGB32），噪声点（标签为负）使用 NOISE_COLOR
+LABEL_PALETTE = np.array([
+    0xFF1F77B4, 0xFFFF7F0E, 0xFF2CA02C, 0xFFD62728, 0xFF9467BD,
+    0xFF8C564B, 0xFFE377C2, 0xFF7F7F7F, 0xFFBCBD22, 0xFF17BECF,
+], dtype=np.uint32)
+NOISE_COLOR = 0xFFB0B0B0
+# 颜色查找表的最大长度，超出时改为按调色板取模
+MAX_TABLE_SIZE = 1 << 20
+
+
+def _build_colormap(anchors: np.ndarray, size: int = 256) -> np.ndarray:
+    """按锚点颜色线性插值出 ARGB32 颜色查找表"""
+    positions = np.linspace(0.0, 1.0, len(anchors))
+    steps = np.linspace(0.0, 1.0, size)
+    channels = [np.rint(np.interp(steps, positions, anchors[:, i])).astype(np.uint32) for i in range(3)]
+    return np.uint32(0xFF000000) | (channels[0] << 16) | (channels[1] << 8) | channels[2]
+
+
+# 密度图的颜色查找表（viridis 的锚点），下标 0 对应最低的非零密度
+DENSITY_COLORMAP = _build_colormap(np.array([
+    (68, 1, 84), (59, 82, 139), (33, 145, 140), (94, 201, 98), (253, 231, 37),
+], dtype=np.float64))
+
+
+class ColorTable:
+    """整数键的颜色查找表
+
+    键 k ≥ 0 的颜色为 palette[k % len(palette)]，负键（噪声、未知类别）为 missing。
+    查找表按需加倍扩展到覆盖最大的键，映射只需一次 np.take（负键经 mode="clip" 落到表首）。
+    扩展时整体替换查找表，可以在多个线程中同时使用。
+    """
+
+    def __init__(self, palette: np.ndarray, missing: int, size: int = 1024) -> None:
+        """建立查找表
+
+        Args:
+            palette: 调色板（ARGB32）
+            missing: 负键的颜色（ARGB32）
+            size: 初始覆盖的键数
+        """
+        self.palette = np.asarray(palette, dtype=np.uint32)
+        self.missing = np.uint32(missing)
+        self._table = self._build(size)
+
+    def _build(self, size: int) -> np.ndarray:
+        """生成覆盖键 0..size-1 的查找表，下标 0 为负键"""
+        table = np.empty(size + 1, dtype=np.uint32)
+        table[0] = self.missing
+        table[1:] = np.resize(self.palette, size)
+        return table
+
+    def __call__(self, keys: np.ndarray) -> np.ndarray:
+        """按键取每个点的颜色
+
+        Args:
+            keys: 整数键
+
+        Returns:
+            每个点的颜色（ARGB32）
+        """
+        keys = np.asarray(keys).astype(np.intp, copy=False)
+        if keys.size == 0:
+            return np.empty(0, dtype=np.uint32)
+        table = self._table
+        top = int(keys.max())
+        if top >= table.size - 1:
+            if top >= MAX_TABLE_SIZE:
+                colors = np.take(self.palette, keys % self.palette.size)
+                colors[keys < 0] = self.missing
+                return colors
+            table = self._table = self._build(1 << top.bit_length())
+        return np.take(table, keys + 1, mode="clip")
+
+
+@dataclass(frozen=True)
+class MarkerSprite:
+    """预先栅格化的标记形状
+
+    Attributes:
+        rows: 各像素相对标记中心的行偏移
+        columns: 各像素相对标记中心的列偏移
+        coverage: 各像素被标记覆盖的比例（0–255），按从小到大排列，覆盖完整的像素最后写入
+    """
+
+    rows: np.ndarray
+    columns: np.ndarray
+    coverage: np.ndarray
+
+
+def marker_sprite(point_size: int, round_marker: bool = True) -> MarkerSprite:
+    """栅格化边长为 point_size 的标记
+
+    边长不超过 2 的标记总是方块；圆形标记按 4×4 超采样计算各像素的覆盖比例，
+    覆盖不足四分之一的像素不绘制，接近完整（不低于八分之七）的按完整覆盖绘制。
+
+    Args:
+        point_size: 标记边长（像素）
+        round_marker: 是否为圆形
+
+    Returns:
+        标记形状
+    """
+    size = max(int(point_size), 1)
+    first = -(size - 1) // 2
+    offsets = np.arange(first, first + size)
+    rows, columns = (a.ravel() for a in np.meshgrid(offsets, offsets, indexing="ij"))
+    if size <= 2 or not round_marker:
+        coverage = np.full(rows.size, 255)
+    else:
+        # 标记中心相对像素 (0, 0) 的位置与各像素内 4×4 个采样点
+        center = first + (size - 1) / 2
+        samples = (np.arange(4) + 0.5) / 4 - 0.5
+        dy = rows[:, None, None] + samples[None, :, None] - center
+        dx = columns[:, None, None] + samples[None, None, :] - center
+        inside = (dy ** 2 + dx ** 2) <= (size / 2) ** 2
+        coverage = np.rint(inside.mean(axis=(1, 2)) * 255).astype(np.int64)
+        coverage[coverage >= 224] = 255
+    keep = coverage >= 64
+    order = np.argsort(coverage[keep], kind="stable")
+    return MarkerSprite(rows[keep][order], columns[keep][order], coverage[keep][order].astype(np.uint32))
+
+
+@dataclass
+class PlotSpec:
+    """散点图描述
+
+    Attributes:
+        x: 横坐标
+        y: 纵坐标
+        colors: 每个点的颜色（ARGB32，uint32），为 None 时统一使用 color
+        color: 统一的标记颜色（ARGB32）
+        x_range: 横轴范围，为 None 时取数据范围
+        y_range: 纵轴范围，为 None 时取数据范围
+        point_size: 标记边长（像素）
+        background: 背景颜色（ARGB32），默认透明
+        sprite: 标记形状，为 None 时为 point_size 边长的方块
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    colors: Optional[np.ndarray] = None
+    color: int = DEFAULT_COLOR
+    x_range: Optional[Tuple[float, float]] = None
+    y_range: Optional[Tuple[float, float]] = None
+    point_size: int = 2
+    background: int = 0x00000000
+    sprite: Optional[MarkerSprite] = None
+
+    def ranges(self) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """实际使用的横轴与纵轴范围"""
+        x_range = self.x_range if self.x_range is not None else data_range(self.x)
+        y_range = self.y_range if self.y_range is not None else data_range(self.y)
+        return x_range, y_range
+
+
+def label_colors(labels: np.ndarray) -> np.ndarray:
+    """按簇标签取每个点的颜色
+
+    Args:
+        labels: 簇标签，负值为噪声
+
+    Returns:
+        每个点的颜色（ARGB32）
+    """
+    return _LABEL_TABLE(labels)
+
+
+# 默认配色的簇标签颜色表
+_LABEL_TABLE = ColorTable(LABEL_PALETTE, NOISE_COLOR)
+
+
+def data_range(values: np.ndarray, padding: float = 0.02) -> Tuple[float, float]:
+    """数据的显示范围，两端各留 padding 比例的空白
+
+    Args:
+        values: 数据
+        padding: 空白比例
+
+    Returns:
+        (下限, 上限)；没有有效数据时为 (0, 1)，所有值相同时上下各扩 0.5
+    """
+    finite = values[np.isfinite(values)]
+    if finite.size == 0:
+        return 0.0, 1.0
+    low, high = float(finite.min()), float(finite.max())
+    if high == low:
+        return low - 0.5, high + 0.5
+    margin = (high - low) * padding
+    return low - margin, high + margin
+
+
+def to_pixels(
+    x: np.ndarray, y: np.ndarray, x_range: Tuple[float, float], y_range: Tuple[float, float], width: int, height: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """把数据坐标变换为像素坐标
+
+    Returns:
+        (列, 行, 有效掩码)；纵轴向上，越界与非有限值的点无效
+    """
+    x_scale = (width - 1) / (x_range[1] - x_range[0])
+    y_scale = (height - 1) / (y_range[1] - y_range[0])
+    with np.errstate(invalid="ignore"):
+        columns = np.rint((x - x_range[0]) * x_scale)
+        rows = np.rint((y_range[1] - y) * y_scale)
+        valid = (columns >= 0) & (columns < width) & (rows >= 0) & (rows < height)
+        columns[~valid] = 0
+        rows[~valid] = 0
+    return columns.astype(np.intp), rows.astype(np.intp), valid
+
+
+def rasterize_scatter(spec: PlotSpec, width: int, height: int) -> QImage:
+    """把散点图栅格化为 QImage
+
+    Args:
+        spec: 散点图描述
+        width: 图像宽度（像素）
+        height: 图像高度（像素）
+
+    Returns:
+        ARGB32 预乘格式的图像（颜色的 alpha 为 255 或 0 时与非预乘格式一致）
+    """
+    width, height = max(int(width), 1), max(int(height), 1)
+    buffer = np.full((height, width), spec.background, dtype=np.uint32)
+    x_range, y_range = spec.ranges()
+    columns, rows, valid = to_pixels(spec.x, spec.y, x_range, y_range, width, height)
+    columns, rows = columns[valid], rows[valid]
+    colors = np.uint32(spec.color) if spec.colors is None else spec.colors[valid]
+
+    # 按标记形状的各像素偏移整批写入；覆盖不完整的边缘像素写入按覆盖比例缩放的预乘颜色，
+    # 先于覆盖完整的像素写入，相邻标记的边缘不会盖住中心
+    sprite = spec.sprite if spec.sprite is not None else marker_sprite(spec.point_size, round_marker=False)
+    scaled = {255: colors}
+    for dy, dx, coverage in zip(sprite.rows, sprite.columns, sprite.coverage):
+        coverage = int(coverage)
+        if coverage not in scaled:
+            scaled[coverage] = _scale_argb(colors, coverage)
+        buffer[np.clip(rows + dy, 0, height - 1), np.clip(columns + dx, 0, width - 1)] = scaled[coverage]
+    return buffer_to_image(buffer)
+
+
+def _scale_argb(colors: np.ndarray, coverage: int) -> np.ndarray:
+    """按覆盖比例（0–255）缩放 ARGB32 颜色的四个通道，得到预乘格式的半透明颜色"""
+    colors = np.asarray(colors, dtype=np.uint32)
+    # 交替的两个通道各占 16 位，一次乘法同时缩放两个通道
+    even = ((colors & np.uint32(0x00FF00FF)) * np.uint32(coverage) >> np.uint32(8)) & np.uint32(0x00FF00FF)
+    odd = ((colors >> np.uint32(8) & np.uint32(0x00FF00FF)) * np.uint32(coverage) >> np.uint32(8)) & np.uint32(0x00FF00FF)
+    return even | (odd << np.uint32(8))
+
+
+def rasterize_density(
+    x: np.ndarray,
+    y: np.ndarray,
+    x_range: Tuple[float, float],
+    y_range: Tuple[float, float],
+    width: int,
+    height: int,
+    colormap: np.ndarray = DENSITY_COLORMAP,
+    row_offsets: Optional[np.ndarray] = None,
+) -> QImage:
+    """把散点按像素计数并栅格化为密度图
+
+    Args:
+        x: 横坐标
+        y: 纵坐标
+        x_range: 横轴范围
+        y_range: 纵轴范围
+        width: 图像宽度（像素）
+        height: 图像高度（像素）
+        colormap: 颜色查找表（ARGB32）
+        row_offsets: density_row_offsets(y, y_range, width, height) 的结果；
+            只平移、缩放横轴时纵坐标的分箱不变，可以复用
+
+    Returns:
+        ARGB32 预乘格式的图像；没有点的像素透明，其余按对数计数取色
+    """
+    width, height = max(int(width), 1), max(int(height), 1)
+    # 越界与 NaN 的点（fmin/fmax 把 NaN 当作缺失）落到四周各扩一格的边框，计数后丢弃边框，
+    # 不需要单独的有效掩码与筛选
+    if row_offsets is None:
+        row_offsets = density_row_offsets(y, y_range, width, height)
+    flat = _clamped_bins(x, x_range[0], (width - 1) / (x_range[1] - x_range[0]), width)
+    flat += row_offsets
+    counts = np.bincount(flat, minlength=(width + 2) * (height + 2)).reshape(height + 2, width + 2)
+    counts = counts[1:-1, 1:-1].ravel()
+    # 对数压缩计数的动态范围，单个点也落在查找表的最低一档
+    levels = np.log1p(counts)
+    peak = levels.max()
+    scale = (colormap.size - 1) / peak if peak > 0 else 0.0
+    buffer = np.take(colormap, (levels * scale).astype(np.intp))
+    buffer[counts == 0] = 0
+    return buffer_to_image(buffer.reshape(height, width))
+
+
+def density_row_offsets(y: np.ndarray, y_range: Tuple[float, float], width: int, height: int) -> np.ndarray:
+    """密度图中各点所在行在计数数组中的偏移（计数数组四周各扩一格边框，越界与 NaN 的点落在边框行）"""
+    width, height = max(int(width), 1), max(int(height), 1)
+    rows = _clamped_bins(y, y_range[1], -(height - 1) / (y_range[1] - y_range[0]), height)
+    rows *= width + 2
+    return rows
+
+
+def _clamped_bins(values: np.ndarray, offset: float, scale: float, size: int) -> np.ndarray:
+    """(values - offset) * scale 四舍五入后加 1，越界与 NaN 归入 0 或 size + 1
+
+    差值按 float64 计算后存为 float32，之后的运算都在 float32 上原地进行，结果为 int32，内存带宽减半。
+    """
+    positions = np.empty(values.shape, dtype=np.float32)
+    np.subtract(values, offset, out=positions, casting="same_kind")
+    positions *= np.float32(scale)
+    positions += np.float32(1.5)
+    np.fmax(positions, np.float32(0.5), out=positions)
+    np.fmin(positions, np.float32(size + 1.5), out=positions)
+    return positions.astype(np.int32)
+
+
+def buffer_to_image(buffer: np.ndarray) -> QImage:
+    """把 (H, W) 的 ARGB32 像素缓冲区复制为 QImage"""
+    height, width = buffer.shape
+    buffer = np.ascontiguousarray(buffer, dtype=np.uint32)
+    return QImage(buffer.data, width, height, width * 4, QImage.Format.Format_ARGB32_Premultiplied).copy()
@@ -0,0 +1,99 @@
+# coding: utf-8
+"""
+绘图配色与标记
+
+按当前主题（qconfig.theme，浅色 / 深色）预先生成散点图使用的颜色查找表与标记形状：
+簇标签与识别类别经 ColorTable 一次 np.take 映射为颜色，标记形状按边长缓存。
+
+散点序列只保存标签，不保存颜色，栅格化时才按当前主题的配色取色；
+切换主题时只重新生成一次配色，各图按新配色重新栅格化即可，不必重建散点序列。
+
+PlotStyle 生成后只读（颜色表的扩展与标记缓存除外，重复生成也无害），可以交给工作线程使用。
+"""
+
+from typing import Dict, Optional
+
+import numpy as np
+from qfluentwidgets import Theme, qconfig
+
+from models.utils.plot_raster import DEFAULT_COLOR, LABEL_PALETTE, NOISE_COLOR, ColorTable, MarkerSprite, marker_sprite
+
+# 深色主题下的簇标签配色（提高亮度以便在深色背景上区分）
+DARK_LABEL_PALETTE = np.array([
+    0xFF4FA3E0, 0xFFFFA24D, 0xFF5CCB5C, 0xFFF0605D, 0xFFB594D6,
+    0xFFC48E7F, 0xFFF59BD6, 0xFFB8B8B8, 0xFFDADB4A, 0xFF4FD8E8,
+], dtype=np.uint32)
+DARK_NOISE_COLOR = 0xFF6E6E6E
+DARK_DEFAULT_COLOR = 0xFF4FA3E0
+
+# 识别类别的配色，未知类别（负值）使用 UNKNOWN_CLASS_COLOR
+CLASS_PALETTE = np.array([
+    0xFFE41A1C, 0xFF377EB8, 0xFF4DAF4A, 0xFF984EA3, 0xFFFF7F00, 0xFFA65628, 0xFFF781BF, 0xFF999999,
+], dtype=np.uint32)
+DARK_CLASS_PALETTE = np.array([
+    0xFFFF5A5C, 0xFF6AA8E0, 0xFF7ED67B, 0xFFC68BD1, 0xFFFFA040, 0xFFD9895C, 0xFFFFA8D8, 0xFFC0C0C0,
+], dtype=np.uint32)
+UNKNOWN_CLASS_COLOR = 0xFF808080
+
+
+class PlotStyle:
+    """某一主题下的散点图配色与标记
+
+    Attributes:
+        theme: 主题（Theme.LIGHT 或 Theme.DARK）
+        default_color: 没有标签的散点的颜色（ARGB32）
+        labels: 簇标签的颜色表（负值为噪声）
+        classes: 识别类别的颜色表（负值为未知类别）
+    """
+
+    def __init__(self, theme: Theme) -> None:
+        """生成配色
+
+        Args:
+            theme: 主题
+        """
+        self.theme = theme
+        dark = theme == Theme.DARK
+        self.default_color = DARK_DEFAULT_COLOR if dark else DEFAULT_COLOR
+        self.labels = ColorTable(DARK_LABEL_PALETTE if dark else LABEL_PALETTE, DARK_NOISE_COLOR if dark else NOISE_COLOR)
+        self.classes = ColorTable(DARK_CLASS_PALETTE if dark else CLASS_PALETTE, UNKNOWN_CLASS_COLOR)
+        self._sprites: Dict[int, MarkerSprite] = {}
+
+    def colors(self, keys: np.ndarray, kind: str = "cluster") -> np.ndarray:
+        """按标签取每个点的颜色
+
+        Args:
+            keys: 簇标签或识别类别
+            kind: "cluster" 为簇标签，"class" 为识别类别
+
+        Returns:
+            每个点的颜色（ARGB32）
+        """
+        return (self.classes if kind == "class" else self.labels)(keys)
+
+    def sprite(self, point_size: int) -> MarkerSprite:
+        """边长为 point_size 的标记形状"""
+        sprite = self._sprites.get(point_size)
+        if sprite is None:
+            sprite = self._sprites[point_size] = marker_sprite(point_size)
+        return sprite
+
+
+# 当前主题的配色，主题变化后首次使用时重新生成
+_current_style: Optional[PlotStyle] = None
+
+
+def plot_style(theme: Optional[Theme] = None) -> PlotStyle:
+    """取主题的配色（须在界面线程中调用，工作线程使用调用方传入的配色）
+
+    Args:
+        theme: 主题，缺省为当前主题（qconfig.theme）
+
+    Returns:
+        配色；与上次取用的主题相同时为同一对象
+    """
+    global _current_style
+    theme = theme if theme is not None else qconfig.theme
+    if _current_style is None or _current_style.theme != theme:
+        _current_style = PlotStyle(theme)
+    return _current_style
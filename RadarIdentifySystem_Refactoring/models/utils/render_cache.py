@@ -0,0 +1,97 @@
+# coding: utf-8
+"""
+绘图结果缓存
+
+按最近使用顺序淘汰、以字节数为上限的缓存，用于保存预先栅格化的切片面板图像及其散点序列，
+在切片之间来回切换时直接取用，不必在界面线程中重新排序、抽稀与栅格化。
+
+缓存只在界面线程中访问，不加锁。
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from models.utils.log_manager import LoggerMixin
+
+
+class RenderCache(LoggerMixin):
+    """最近最少使用（LRU）缓存，总字节数不超过上限"""
+
+    def __init__(self, max_mb: float = 256.0) -> None:
+        """初始化缓存
+
+        Args:
+            max_mb: 缓存占用的内存上限（MB）
+        """
+        self._max_bytes = float(max_mb) * 1024 * 1024
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def total_bytes(self) -> int:
+        """缓存条目的总字节数"""
+        return self._total_bytes
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """取出条目并标记为最近使用
+
+        Args:
+            key: 条目键
+
+        Returns:
+            条目值，不存在时为 None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: Hashable, value: Any, nbytes: int) -> None:
+        """加入或替换条目，超出上限时淘汰最久未使用的条目
+
+        单个条目超过上限时不缓存。
+
+        Args:
+            key: 条目键
+            value: 条目值
+            nbytes: 条目占用的字节数
+        """
+        self.discard(key)
+        if nbytes > self._max_bytes:
+            self.logger.debug(f"条目超出缓存上限，不缓存: {key}, {nbytes / 1024 / 1024:.1f}MB")
+            return
+        self._entries[key] = (value, int(nbytes))
+        self._total_bytes += int(nbytes)
+        self._shrink()
+
+    def discard(self, key: Hashable) -> None:
+        """移除条目（不存在时忽略）"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._total_bytes -= entry[1]
+
+    def clear(self) -> None:
+        """清空缓存"""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def set_limit(self, max_mb: float) -> None:
+        """修改内存上限并立即按新上限淘汰
+
+        Args:
+            max_mb: 缓存占用的内存上限（MB）
+        """
+        self._max_bytes = float(max_mb) * 1024 * 1024
+        self._shrink()
+
+    def _shrink(self) -> None:
+        """按最久未使用顺序淘汰，直到总字节数不超过上限"""
+        while self._entries and self._total_bytes > self._max_bytes:
+            self.discard(next(iter(self._entries)))
@@ -0,0 +1,228 @@
+# coding: utf-8
+"""
+分段（按簇）归约工具
+
+将一个切片内所有脉冲按 (簇标签, TOA) 排序后，每个簇在排序结果中占据一段连续区间。
+在这种布局下，逐簇统计量可以用 np.ufunc.reduceat 一次性求出，
+计算量只与脉冲数相关，而与簇的数量无关。
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ClusterSegments:
+    """簇分段描述
+
+    Attributes:
+        order: 将原始脉冲排列为 (标签, TOA) 有序的索引数组，长度为有效脉冲数
+        labels: 各簇的标签（升序），长度为 K
+        starts: 各簇在排序结果中的起始偏移，长度为 K
+        counts: 各簇的脉冲数，长度为 K
+    """
+
+    order: np.ndarray
+    labels: np.ndarray
+    starts: np.ndarray
+    counts: np.ndarray
+    _segment_ids: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+
+    @property
+    def n_clusters(self) -> int:
+        """簇数量"""
+        return int(self.labels.size)
+
+    @property
+    def n_pulses(self) -> int:
+        """参与分段的脉冲总数"""
+        return int(self.order.size)
+
+    @property
+    def ends(self) -> np.ndarray:
+        """各簇在排序结果中的结束偏移（不含）"""
+        return self.starts + self.counts
+
+    @property
+    def segment_ids(self) -> np.ndarray:
+        """排序结果中每个脉冲所属的簇序号（0..K-1）"""
+        if self._segment_ids is None:
+            ids = np.repeat(np.arange(self.n_clusters, dtype=np.intp), self.counts)
+            object.__setattr__(self, "_segment_ids", ids)
+        return self._segment_ids
+
+    def gather(self, values: np.ndarray) -> np.ndarray:
+        """按分段顺序重排原始脉冲的某一列
+
+        Args:
+            values: 与原始脉冲一一对应的一维数组
+
+        Returns:
+            按 (标签, TOA) 排序后的数组
+        """
+        return np.asarray(values)[self.order]
+
+
+def build_segments(labels: np.ndarray, toa: np.ndarray, noise_label: Optional[int] = -1) -> ClusterSegments:
+    """根据聚类标签与到达时间构建簇分段
+
+    Args:
+        labels: 每个脉冲的簇标签，长度为 N
+        toa: 每个脉冲的到达时间，长度为 N
+        noise_label: 噪声标签，对应脉冲不参与分段；为 None 时保留所有脉冲
+
+    Returns:
+        ClusterSegments 分段描述
+
+    Raises:
+        ValueError: 当 labels 与 toa 长度不一致时
+    """
+    labels = np.asarray(labels)
+    toa = np.asarray(toa)
+    if labels.shape != toa.shape or labels.ndim != 1:
+        raise ValueError(f"labels 与 toa 必须是等长的一维数组: {labels.shape} vs {toa.shape}")
+
+    if noise_label is not None:
+        valid = np.flatnonzero(labels != noise_label)
+    else:
+        valid = np.arange(labels.size)
+
+    # 先按 TOA、再按标签稳定排序，得到 (标签, TOA) 的字典序
+    local = np.lexsort((toa[valid], labels[valid]))
+    order = valid[local]
+
+    sorted_labels = labels[order]
+    if sorted_labels.size == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return ClusterSegments(order=order, labels=sorted_labels, starts=empty, counts=empty)
+
+    boundaries = np.flatnonzero(sorted_labels[1:] != sorted_labels[:-1]) + 1
+    starts = np.concatenate(([0], boundaries)).astype(np.intp)
+    counts = np.diff(np.append(starts, sorted_labels.size)).astype(np.intp)
+    return ClusterSegments(order=order, labels=sorted_labels[starts], starts=starts, counts=counts)
+
+
+def _reduceat(ufunc: np.ufunc, values: np.ndarray, segments: ClusterSegments, empty_value: float) -> np.ndarray:
+    """对非空分段执行 ufunc.reduceat，空分段填充 empty_value
+
+    reduceat 在起止偏移相同时会返回该位置的元素而非单位元，因此需要跳过空分段。
+    """
+    out = np.full(segments.n_clusters, empty_value, dtype=np.float64)
+    nonempty = segments.counts > 0
+    if values.size and nonempty.any():
+        out[nonempty] = ufunc.reduceat(values, segments.starts[nonempty])
+    return out
+
+
+def segment_sum(values: np.ndarray, segments: ClusterSegments) -> np.ndarray:
+    """分段求和
+
+    Args:
+        values: 已按分段顺序排列的数组
+        segments: 簇分段描述
+
+    Returns:
+        每个簇的求和结果，长度为 K；空分段为 0
+    """
+    return _reduceat(np.add, values, segments, 0.0)
+
+
+def segment_mean(values: np.ndarray, segments: ClusterSegments) -> np.ndarray:
+    """分段均值
+
+    Args:
+        values: 已按分段顺序排列的数组
+        segments: 簇分段描述
+
+    Returns:
+        每个簇的均值，长度为 K；空分段为 NaN
+    """
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return segment_sum(values.astype(np.float64, copy=False), segments) / segments.counts
+
+
+def segment_std(values: np.ndarray, segments: ClusterSegments, mean: Optional[np.ndarray] = None) -> np.ndarray:
+    """分段总体标准差
+
+    Args:
+        values: 已按分段顺序排列的数组
+        segments: 簇分段描述
+        mean: 已计算好的分段均值，为 None 时内部计算
+
+    Returns:
+        每个簇的标准差，长度为 K；空分段为 NaN
+    """
+    values = values.astype(np.float64, copy=False)
+    if mean is None:
+        mean = segment_mean(values, segments)
+    centered = values - np.repeat(mean, segments.counts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.sqrt(segment_sum(centered * centered, segments) / segments.counts)
+
+
+def segment_min(values: np.ndarray, segments: ClusterSegments) -> np.ndarray:
+    """分段最小值，空分段为 NaN"""
+    return _reduceat(np.minimum, values, segments, np.nan)
+
+
+def segment_max(values: np.ndarray, segments: ClusterSegments) -> np.ndarray:
+    """分段最大值，空分段为 NaN"""
+    return _reduceat(np.maximum, values, segments, np.nan)
+
+
+def segment_median(values: np.ndarray, segments: ClusterSegments) -> np.ndarray:
+    """分段中位数
+
+    在每个分段内部对数值排序（一次 lexsort 完成全部分段），再取中间位置。
+
+    Args:
+        values: 已按分段顺序排列的数组
+        segments: 簇分段描述
+
+    Returns:
+        每个簇的中位数，长度为 K；空分段为 NaN
+    """
+    out = np.full(segments.n_clusters, np.nan, dtype=np.float64)
+    nonempty = segments.counts > 0
+    if not nonempty.any():
+        return out
+    ranked = values[np.lexsort((values, segments.segment_ids))].astype(np.float64, copy=False)
+    starts = segments.starts[nonempty]
+    counts = segments.counts[nonempty]
+    out[nonempty] = 0.5 * (ranked[starts + (counts - 1) // 2] + ranked[starts + counts // 2])
+    return out
+
+
+def inner_differences(values: np.ndarray, segments: ClusterSegments, lag: int = 1) -> Tuple[np.ndarray, ClusterSegments]:
+    """计算分段内部的 lag 阶差分
+
+    对排序后的数组做一次整体差分，再剔除跨越簇边界的位置。
+
+    Args:
+        values: 已按分段顺序排列的数组
+        segments: 簇分段描述
+        lag: 差分阶数（相隔的元素个数）
+
+    Returns:
+        (diffs, diff_segments): 差分值以及由差分值构成的新分段描述。
+        diff_segments.labels 与原分段一致，脉冲数不足 lag+1 的簇对应计数为 0。
+    """
+    counts = np.maximum(segments.counts - lag, 0)
+    if values.size <= lag:
+        diffs = np.empty(0, dtype=np.float64)
+    else:
+        diffs = values[lag:] - values[:-lag]
+        position = np.arange(diffs.size)
+        # 差分位置 p 合法 <=> p 与 p+lag 落在同一簇内
+        seg_of = segments.segment_ids
+        diffs = diffs[seg_of[position] == seg_of[position + lag]]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.intp) if counts.size else counts
+    diff_segments = ClusterSegments(
+        order=np.arange(diffs.size),
+        labels=segments.labels,
+        starts=starts,
+        counts=counts,
+    )
+    return diffs, diff_segments
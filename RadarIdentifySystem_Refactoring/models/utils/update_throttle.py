@@ -0,0 +1,108 @@
+# coding: utf-8
+"""
+界面更新节流
+
+全速处理时每个切片都会产生结果，若每个结果都触发一次重绘，处理速度就被绘图速度限制。
+处理线程把结果交给节流器后立即返回，节流器在界面线程中以不超过设定频率的速度发出更新：
+默认只保留两次更新之间最新的结果，中间的结果不再绘制；也可以保留全部结果，一次更新中整块处理。
+
+post 可以在任意线程中调用，只在锁内保存结果，每个更新周期最多向界面线程投递一次事件，
+不会等待界面线程。
+"""
+
+import threading
+import time
+from typing import Any, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from models.utils.log_manager import LoggerMixin
+
+
+class UpdateThrottle(QObject, LoggerMixin):
+    """界面更新节流器
+
+    Signals:
+        flushed(object): 在界面线程中发出的更新；只保留最新结果时参数为最新的结果，
+            保留全部结果时参数为两次更新之间提交的全部结果（按提交顺序的列表）
+    """
+
+    flushed = pyqtSignal(object)
+
+    # 由提交线程发出，经队列连接在界面线程中启动定时器
+    _scheduled = pyqtSignal()
+
+    def __init__(self, rate: float = 10.0, keep_all: bool = False, parent: Optional[QObject] = None) -> None:
+        """初始化节流器
+
+        Args:
+            rate: 每秒最多更新次数
+            keep_all: 是否保留两次更新之间的全部结果，否则只保留最新的结果
+            parent: 父对象，节流器须在界面线程中创建
+        """
+        super().__init__(parent)
+        self._keep_all = keep_all
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._pending: List[Any] = []
+        self._waiting = False
+        self._last_flush = 0.0
+        self._dropped = 0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self.flush)
+        self._scheduled.connect(self._schedule)
+
+    @property
+    def dropped(self) -> int:
+        """只保留最新结果时被跳过的结果数"""
+        with self._lock:
+            return self._dropped
+
+    def set_rate(self, rate: float) -> None:
+        """修改每秒最多更新次数
+
+        Args:
+            rate: 每秒最多更新次数
+        """
+        self._interval = 1.0 / rate
+
+    def post(self, value: Any) -> None:
+        """提交结果，可在任意线程中调用，不会阻塞
+
+        Args:
+            value: 结果
+        """
+        with self._lock:
+            if self._keep_all:
+                self._pending.append(value)
+            else:
+                self._dropped += len(self._pending)
+                self._pending = [value]
+            schedule = not self._waiting
+            self._waiting = True
+        if schedule:
+            self._scheduled.emit()
+
+    def flush(self) -> None:
+        """立即发出尚未发出的更新（须在界面线程中调用），例如处理结束时显示最后的结果"""
+        self._timer.stop()
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._waiting = False
+            self._last_flush = time.monotonic()
+        if pending:
+            self.flushed.emit(pending if self._keep_all else pending[-1])
+
+    def clear(self) -> None:
+        """丢弃尚未发出的结果"""
+        self._timer.stop()
+        with self._lock:
+            self._pending = []
+            self._waiting = False
+
+    def _schedule(self) -> None:
+        """距上次更新满一个周期时发出更新"""
+        wait = self._last_flush + self._interval - time.monotonic()
+        self._timer.start(max(int(wait * 1000), 0))
@@ -0,0 +1,58 @@
+import sys
+import os
+import unittest
+
+import numpy as np
+from PyQt6.QtWidgets import QApplication
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+from controllers.ui.merge_controller import MergeController
+from models.data.cluster_params import empty_cluster_params
+from views.modules.scroll_module.merge_control_panel.merge_control_panel import MergeControlPanel
+from views.modules.scroll_module.view_panel.merge_view import MergeView
+
+
+class TestMergeController(unittest.TestCase):
+    """合并控制器测试类
+
+    测试增量合并只使用已应用的合并参数。
+    """
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """创建应用实例"""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self) -> None:
+        """创建控制器与两个载频相差 8 的簇"""
+        self.panel = MergeControlPanel()
+        self.controller = MergeController(MergeView(), self.panel)
+        self.records = empty_cluster_params(2)
+        self.records["slice_index"] = [0, 1]
+        self.records["cf_min"] = self.records["cf_mean"] = self.records["cf_max"] = [1000.0, 1008.0]
+
+    def test_add_clusters_ignores_previewed_params(self) -> None:
+        """测试预览中尚未应用的参数不用于新到达的簇
+
+        Returns:
+            None
+        """
+        applied = self.controller.service.params
+        self.controller.set_clusters(self.records[:1])
+        # 放宽载频容差后只预览、不应用
+        self.panel.cf_tolerance_spin.setValue(applied.cf_tolerance * 4)
+        self.assertGreater(self.controller.preview().n_groups, 0)
+
+        result = self.controller.add_clusters(self.records[1:])
+        self.assertEqual(self.controller.service.params, applied)
+        self.assertEqual(result.n_groups, 2)
+
+        self.controller.merge()
+        self.assertEqual(self.controller.service.params.cf_tolerance, applied.cf_tolerance * 4)
+        self.assertEqual(self.controller.result.n_groups, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import os
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from PyQt6.QtCore import QObject
+from PyQt6.QtWidgets import QApplication
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
@@ -164,6 +165,39 @@ class TestSettingsController(unittest.TestCase):
         # 断言不会尝试连接
         interface.themeColorCard.colorChanged.connect.assert_not_called()
 
+    @patch('controllers.ui.settings_controller.cfg')
+    def test_inference_threads_debounced(self, mock_app_cfg: Mock) -> None:
+        """测试推理线程数变化防抖
+
+        验证拖动滑块期间不提示重启，停止变化后只在线程数确实改变时提示一次。
+
+        Args:
+            mock_app_cfg: 模拟的应用配置对象
+        Returns:
+            None
+        """
+        # 定时器需要应用实例；保存在类上，避免测试结束后被销毁影响其他测试
+        type(self).app = QApplication.instance() or QApplication([])
+        intra, inter = MagicMock(), MagicMock()
+        mock_app_cfg.intraOpThreads = intra
+        mock_app_cfg.interOpThreads = inter
+        threads = {intra: 2, inter: 1}
+        mock_app_cfg.get.side_effect = lambda item: threads.get(item)
+        interface = MagicMock()
+        self.controller = SettingsController(interface)
+
+        with patch.dict(sys.modules, {"tensorflow": MagicMock()}):
+            for value in (3, 4, 5):
+                threads[intra] = value
+                self.controller._on_inference_threads_changed(value)
+            self.assertTrue(self.controller._threads_timer.isActive())
+            interface.showRestartTooltip.assert_not_called()
+
+            self.controller._threads_timer.stop()
+            self.controller._apply_inference_threads()
+            self.controller._apply_inference_threads()
+            interface.showRestartTooltip.assert_called_once()
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+启动导入测试
+验证构造主窗口时不会导入 TensorFlow / Keras / SciPy / scikit-learn 等重量级库
+"""
+
+import sys
+import os
+import subprocess
+import textwrap
+import unittest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../.."))
+
+HEAVY_MODULES = ("tensorflow", "keras", "scipy", "sklearn", "onnxruntime")
+
+
+class TestStartupImports(unittest.TestCase):
+    """启动路径导入检查"""
+
+    def test_main_window_avoids_heavy_modules(self) -> None:
+        """在独立进程中构造主窗口，检查 sys.modules"""
+        script = textwrap.dedent(
+            f"""
+            import sys
+            from PyQt6.QtWidgets import QApplication
+            app = QApplication(sys.argv)
+            from views.main_window import MainWindow
+            window = MainWindow()
+            loaded = [name for name in {HEAVY_MODULES!r} if name in sys.modules]
+            window.close()
+            print("LOADED:" + ",".join(loaded))
+            """
+        )
+        env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+        config_path = os.path.join(PROJECT_ROOT, "app", "config", "config.json")
+        with open(config_path, "rb") as f:
+            config = f.read()
+        try:
+            result = subprocess.run(
+                [sys.executable, "-c", script], cwd=PROJECT_ROOT, env=env, capture_output=True, text=True, timeout=120
+            )
+        finally:
+            # 主窗口会写回配置文件，测试结束后恢复
+            with open(config_path, "wb") as f:
+                f.write(config)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        loaded = [line for line in result.stdout.splitlines() if line.startswith("LOADED:")]
+        self.assertListEqual(loaded, ["LOADED:"], f"启动时导入了重量级模块: {loaded}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+分析结果模型测试
+验证簇参数记录的批量提取、整块追加、汇总与导出
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.data.analysis_result import AnalysisResult
+from models.data.cluster_params import CLUSTER_PARAMS_DTYPE, PriType
+from models.data.pulse_columns import PulseColumn
+from models.processors.params_extractor import ParamsExtractor
+from models.processors.pri_analyzer import PriAnalyzer
+
+
+def _make_slice(rng: np.random.Generator):
+    """构造两部固定重频信号与噪声组成的切片
+
+    Returns:
+        (pulses, labels)
+    """
+    toa = np.r_[np.arange(40) * 100.0, 3 + np.arange(30) * 250.0, rng.uniform(0, 4000, 10)]
+    labels = np.r_[np.full(40, 0), np.full(30, 5), np.full(10, -1)]
+    pulses = rng.uniform(0, 1, (toa.size, 5))
+    pulses[:, PulseColumn.CF] = np.r_[rng.uniform(2900, 2910, 40), rng.uniform(9400, 9405, 30), rng.uniform(0, 1, 10)]
+    pulses[:, PulseColumn.TOA] = toa
+    perm = rng.permutation(toa.size)
+    return pulses[perm], labels[perm]
+
+
+class TestAnalysisResult(unittest.TestCase):
+    """AnalysisResult 单元测试"""
+
+    def setUp(self) -> None:
+        """构造测试数据"""
+        self.rng = np.random.default_rng(0)
+        self.pulses, self.labels = _make_slice(self.rng)
+        self.extractor = ParamsExtractor()
+
+    def test_extract_params(self) -> None:
+        """参数记录应与逐簇计算一致"""
+        records = self.extractor.extract_params(self.pulses, self.labels, slice_index=3)
+        self.assertEqual(records.dtype, CLUSTER_PARAMS_DTYPE)
+        self.assertListEqual(records["label"].tolist(), [0, 5])
+        self.assertTrue(np.all(records["slice_index"] == 3))
+
+        for record in records:
+            mask = self.labels == record["label"]
+            cluster = self.pulses[mask]
+            toa = np.sort(cluster[:, PulseColumn.TOA])
+            self.assertEqual(record["pulse_count"], mask.sum())
+            np.testing.assert_allclose(record["cf_mean"], cluster[:, PulseColumn.CF].mean())
+            np.testing.assert_allclose(record["cf_max"], cluster[:, PulseColumn.CF].max())
+            np.testing.assert_allclose(record["pa_std"], cluster[:, PulseColumn.PA].std())
+            np.testing.assert_allclose(record["time_span"], toa[-1] - toa[0])
+            self.assertEqual(record["pri_type"], PriType.CONSTANT)
+            np.testing.assert_allclose(record["pri_values"][0], np.median(np.diff(toa)))
+
+    def test_extract_params_with_pri_analysis(self) -> None:
+        """传入 PriAnalysis 时使用其 PRI 结果"""
+        analysis = PriAnalyzer().analyze(self.pulses, self.labels)
+        records = self.extractor.extract_params(self.pulses, self.labels, pri_analysis=analysis)
+        np.testing.assert_array_equal(records["pri_count"], analysis.pri_count)
+        np.testing.assert_allclose(records["pri_values"][:, 0], [100.0, 250.0], rtol=1e-6)
+
+    def test_bulk_append_and_summary(self) -> None:
+        """整块追加跨越扩容边界后，汇总结果应正确"""
+        result = AnalysisResult(initial_capacity=3)
+        for slice_index in range(5):
+            result.add_cluster_result(self.extractor.extract_params(self.pulses, self.labels, slice_index))
+        result.add_cluster_result(np.zeros(0, dtype=CLUSTER_PARAMS_DTYPE))
+
+        self.assertEqual(len(result), 10)
+        self.assertListEqual(result.clusters["slice_index"].tolist(), np.repeat(np.arange(5), 2).tolist())
+        summary = result.get_summary()
+        self.assertEqual(summary["cluster_count"], 10)
+        self.assertEqual(summary["slice_count"], 5)
+        self.assertEqual(summary["pulse_count"], 5 * 70)
+        self.assertEqual(summary["pri_type_counts"]["CONSTANT"], 10)
+        self.assertLess(summary["cf_range"][0], 2910)
+        self.assertGreater(summary["cf_range"][1], 9400)
+
+        with self.assertRaises(TypeError):
+            result.add_cluster_result(np.zeros(2))
+
+    def test_export(self) -> None:
+        """CSV 与 NPY 导出可以读回"""
+        result = AnalysisResult()
+        result.add_cluster_result(self.extractor.extract_params(self.pulses, self.labels))
+        with tempfile.TemporaryDirectory() as tmp:
+            npy_path = os.path.join(tmp, "result.npy")
+            csv_path = os.path.join(tmp, "result.csv")
+            self.assertTrue(result.export_results(npy_path, format="npy"))
+            self.assertTrue(result.export_results(csv_path, format="csv"))
+            self.assertFalse(result.export_results(csv_path, format="xlsx"))
+
+            self.assertEqual(np.load(npy_path).tobytes(), result.clusters.tobytes())
+            table = np.genfromtxt(csv_path, delimiter=",", names=True)
+            np.testing.assert_array_equal(table["label"], [0, 5])
+            np.testing.assert_allclose(table["pri_0"], result.clusters["pri_values"][:, 0], rtol=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+级联识别测试
+验证参数特征构造、按置信度分流，以及 CNN 结果的合并
+"""
+
+import sys
+import os
+import importlib.util
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.data.cluster_params import empty_cluster_params
+from models.processors.cascade_classifier import MISSING_VALUE, CascadeClassifier, param_features
+
+
+class _CfModel:
+    """按载频判别的轻量分类器：载频 < 5000 为类别 3，否则为类别 7；置信度取自 pw_mean"""
+
+    classes_ = np.array([3, 7])
+
+    def predict_proba(self, features: np.ndarray) -> np.ndarray:
+        high = features[:, 0] >= 5000
+        confidence = features[:, 2]
+        return np.column_stack([np.where(high, 1 - confidence, confidence), np.where(high, confidence, 1 - confidence)])
+
+
+class TestCascadeClassifier(unittest.TestCase):
+    """CascadeClassifier 单元测试"""
+
+    def setUp(self) -> None:
+        self.records = empty_cluster_params(4)
+        self.records["cf_mean"] = [3000, 9000, 3000, 9000]
+        self.records["cf_min"] = self.records["cf_mean"] - 5
+        self.records["cf_max"] = self.records["cf_mean"] + 5
+        self.records["pw_mean"] = [0.95, 0.99, 0.6, 0.7]
+        self.records["pri_count"] = [1, 1, 0, 2]
+        self.records["pri_values"][:, 0] = 100.0
+        self.features = np.arange(8, dtype=np.float32).reshape(4, 2)
+
+    def test_param_features(self) -> None:
+        """特征列与缺失值填充"""
+        features = param_features(self.records)
+        self.assertEqual(features.shape, (4, 9))
+        np.testing.assert_array_equal(features[:, 1], 10.0)
+        self.assertTrue(np.all(features[:, 6:] == MISSING_VALUE))
+        with self.assertRaises(TypeError):
+            param_features(np.zeros(3))
+
+    def test_confident_clusters_skip_cnn(self) -> None:
+        """只有置信度低于阈值的簇送入 CNN，结果按原顺序合并"""
+        calls = []
+
+        def cnn_predict(x: np.ndarray) -> np.ndarray:
+            calls.append(x.copy())
+            return np.tile(np.eye(5, dtype=np.float32)[1], (x.shape[0], 1))
+
+        decision = CascadeClassifier(_CfModel(), threshold=0.9).classify(self.records, self.features, cnn_predict)
+        self.assertEqual(len(calls), 1)
+        np.testing.assert_array_equal(calls[0], self.features[2:])
+        np.testing.assert_array_equal(decision.class_ids, [3, 7, 1, 1])
+        np.testing.assert_allclose(decision.confidence, [0.95, 0.99, 1.0, 1.0])
+        self.assertAlmostEqual(decision.fast_ratio, 0.5)
+
+    def test_without_fast_model(self) -> None:
+        """没有轻量分类器或阈值为 100% 时全部交给 CNN"""
+        self.assertTrue(CascadeClassifier().decide(self.records).needs_cnn.all())
+        self.assertTrue(CascadeClassifier(_CfModel(), threshold=1.0).decide(self.records).needs_cnn.all())
+
+    @unittest.skipUnless(importlib.util.find_spec("sklearn"), "未安装 scikit-learn")
+    def test_fit(self) -> None:
+        """以识别结果训练轻量分类器"""
+        records = np.concatenate([self.records] * 10)
+        cascade = CascadeClassifier(threshold=0.5)
+        cascade.fit(records, np.where(records["cf_mean"] > 5000, 7, 3))
+        np.testing.assert_array_equal(cascade.decide(self.records).class_ids, [3, 7, 3, 7])
+
+
+if __name__ == "__main__":
+    unittest.main()
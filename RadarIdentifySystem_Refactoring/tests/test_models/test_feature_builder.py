@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+特征构建器测试
+验证批量重采样/分箱结果与逐簇计算一致，且直接写入预分配张量
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.data.pulse_columns import PulseColumn
+from models.processors.feature_builder import FeatureBuilder
+from models.processors.params_extractor import ParamsExtractor
+
+
+class TestFeatureBuilder(unittest.TestCase):
+    """FeatureBuilder 单元测试"""
+
+    def setUp(self) -> None:
+        """构造包含不同长度簇（含单脉冲簇）的切片"""
+        rng = np.random.default_rng(42)
+        sizes = {0: 300, 4: 17, 5: 1, 8: 64}
+        labels = np.concatenate([np.full(n, label) for label, n in sizes.items()] + [np.full(10, -1)])
+        self.pulses = rng.uniform(0, 100, (labels.size, 5))
+        perm = rng.permutation(labels.size)
+        self.pulses, self.labels = self.pulses[perm], labels[perm]
+        self.extractor = ParamsExtractor()
+        self.segments = self.extractor.build_segments(self.pulses, self.labels)
+        self.builder = FeatureBuilder(sequence_length=32, image_shape=(8, 16))
+
+    def _reference_sequence(self, values: np.ndarray) -> np.ndarray:
+        """逐簇参考实现：按序号线性插值后归一化"""
+        if values.size == 1:
+            return np.zeros(self.builder.sequence_length)
+        grid = np.linspace(0, values.size - 1, self.builder.sequence_length)
+        sampled = np.interp(grid, np.arange(values.size), values)
+        return (sampled - sampled.min()) / (sampled.max() - sampled.min())
+
+    def test_pa_sequences_match_reference(self) -> None:
+        """PA 序列重采样应与 np.interp 逐簇结果一致"""
+        out = self.builder.allocate_sequences(10)
+        result = self.builder.build_pa_sequences(self.pulses, self.segments, out=out)
+        self.assertEqual(result.shape, (4, 32))
+        self.assertTrue(np.shares_memory(result, out))
+        self.assertEqual(result.dtype, np.float32)
+
+        for k, label in enumerate(self.segments.labels):
+            mask = self.labels == label
+            order = np.argsort(self.pulses[mask, PulseColumn.TOA])
+            expected = self._reference_sequence(self.pulses[mask, PulseColumn.PA][order])
+            np.testing.assert_allclose(result[k], expected, atol=1e-6)
+
+    def test_dtoa_sequences(self) -> None:
+        """DTOA 序列重采样，空 DTOA 的簇输出全零"""
+        features = self.extractor.extract_dtoa_features(self.pulses, self.labels, self.segments)
+        result = self.builder.build_dtoa_sequences(features)
+        for k in range(features.n_clusters):
+            dtoa = features.dtoa_of(k)
+            if dtoa.size == 0:
+                self.assertFalse(result[k].any())
+            else:
+                np.testing.assert_allclose(result[k], self._reference_sequence(dtoa), atol=1e-6)
+
+    def test_pa_images(self) -> None:
+        """每个脉冲恰好落在一个像素上，且像素数不超过脉冲数"""
+        images = self.builder.build_pa_images(self.pulses, self.segments)
+        self.assertEqual(images.shape, (4, 8, 16))
+        self.assertTrue(np.isin(images, (0, 1)).all())
+        for k, count in enumerate(self.segments.counts):
+            self.assertGreaterEqual(images[k].sum(), 1)
+            self.assertLessEqual(images[k].sum(), count)
+
+    def test_out_shape_validation(self) -> None:
+        """预分配张量容量不足时抛出 ValueError"""
+        with self.assertRaises(ValueError):
+            self.builder.build_pa_sequences(self.pulses, self.segments, out=self.builder.allocate_sequences(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+推理后端与模型转换测试
+验证后端注册表、模型格式匹配以及转换路径规则
+"""
+
+import sys
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.processors.inference_backends import (
+    BACKENDS,
+    InferenceBackend,
+    OnnxRuntimeBackend,
+    TensorFlowBackend,
+    TFLiteBackend,
+    available_backends,
+    backend_for_file,
+    create_backend,
+)
+from models.services.model_converter import ModelConverter
+
+
+class TestInferenceBackends(unittest.TestCase):
+    """推理后端单元测试"""
+
+    def test_registry(self) -> None:
+        """注册表包含三种后端，且可用列表是其子集"""
+        self.assertListEqual(list(BACKENDS), ["tensorflow", "onnxruntime", "tflite"])
+        self.assertTrue(set(available_backends()) <= set(BACKENDS))
+        self.assertIsInstance(create_backend("tflite"), TFLiteBackend)
+        with self.assertRaises(KeyError):
+            create_backend("torch")
+
+    def test_abstract_backend(self) -> None:
+        """未实现全部抽象方法的后端不能实例化"""
+
+        class _Partial(InferenceBackend):
+            def _load(self, path: Path) -> None:
+                pass
+
+        with self.assertRaises(TypeError):
+            InferenceBackend()
+        with self.assertRaises(TypeError):
+            _Partial()
+
+    def test_backend_for_file(self) -> None:
+        """按后缀匹配后端"""
+        self.assertIs(backend_for_file("pa_model.h5"), TensorFlowBackend)
+        self.assertIs(backend_for_file("pa_model.KERAS"), TensorFlowBackend)
+        self.assertIs(backend_for_file("dtoa_model.onnx"), OnnxRuntimeBackend)
+        self.assertIs(backend_for_file("dtoa_model.tflite"), TFLiteBackend)
+        with self.assertRaises(ValueError):
+            backend_for_file("model.pt")
+
+    def test_invalid_load_and_predict(self) -> None:
+        """格式不匹配、文件缺失或未加载时报错"""
+        backend = create_backend("onnxruntime")
+        with self.assertRaises(ValueError):
+            backend.load("model.h5")
+        with self.assertRaises(FileNotFoundError):
+            backend.load("missing_model.onnx")
+        with self.assertRaises(RuntimeError):
+            backend.predict_on_batch(np.zeros((1, 4)))
+
+
+class TestModelConverter(unittest.TestCase):
+    """模型转换器单元测试"""
+
+    def test_paths_and_staleness(self) -> None:
+        """转换结果与原模型同名，过期或缺失时需要重新转换"""
+        converter = ModelConverter()
+        with tempfile.TemporaryDirectory() as tmp:
+            keras_path = Path(tmp, "sub", "pa_model.keras")
+            keras_path.parent.mkdir()
+            keras_path.write_bytes(b"")
+            Path(tmp, "notes.txt").write_text("")
+
+            self.assertListEqual(converter.find_keras_models(tmp), [keras_path])
+            self.assertEqual(converter.converted_path(keras_path, "onnxruntime"), keras_path.with_suffix(".onnx"))
+            self.assertEqual(converter.converted_path(keras_path, "tensorflow"), keras_path)
+            self.assertFalse(converter.needs_conversion(keras_path, "tensorflow"))
+            self.assertTrue(converter.needs_conversion(keras_path, "tflite"))
+
+            tflite_path = keras_path.with_suffix(".tflite")
+            tflite_path.write_bytes(b"")
+            os.utime(tflite_path, (time.time() + 10, time.time() + 10))
+            self.assertFalse(converter.needs_conversion(keras_path, "tflite"))
+            self.assertListEqual(converter.convert_directory(tmp, "tflite"), [])
+            self.assertListEqual(converter.find_keras_models(Path(tmp, "missing")), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+推理结果缓存测试
+验证按特征哈希命中、磁盘持久化与容量上限，以及 ModelPredictor 跳过已缓存样本的推理
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.processors.model_predictor import ModelPredictor
+from models.services.inference_cache import InferenceCache
+
+
+class _CountingModel:
+    """记录推理样本数的模型：输出为 [行和, 行最大值]"""
+
+    version = "v1"
+
+    def __init__(self) -> None:
+        self.samples = 0
+
+    def predict_on_batch(self, x: np.ndarray) -> np.ndarray:
+        self.samples += x.shape[0]
+        return np.stack([x.sum(axis=1), x.max(axis=1)], axis=1)
+
+
+class TestInferenceCache(unittest.TestCase):
+    """InferenceCache 单元测试"""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self._tmp.name)
+        rng = np.random.default_rng(7)
+        self.features = rng.random((10, 4)).astype(np.float32)
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_digest_depends_on_content_and_shape(self) -> None:
+        """摘要只由样本内容、数据类型与形状决定"""
+        digests = InferenceCache.digest(self.features)
+        self.assertEqual(len(set(digests)), 10)
+        self.assertListEqual(InferenceCache.digest(self.features[3:5].copy()), digests[3:5])
+        self.assertNotEqual(InferenceCache.digest(self.features.reshape(10, 2, 2))[0], digests[0])
+
+    def test_persist_and_reload(self) -> None:
+        """保存后新实例可以从磁盘命中，其他模型版本不命中"""
+        cache = InferenceCache(self.cache_dir)
+        digests = cache.digest(self.features)
+        cache.put_many("pa@v1", digests[:6], self.features[:6, :2])
+        self.assertEqual(cache.save(), 6)
+
+        reloaded = InferenceCache(self.cache_dir)
+        rows = reloaded.get_many("pa@v1", digests)
+        self.assertEqual(sum(row is not None for row in rows), 6)
+        np.testing.assert_array_equal(rows[2], self.features[2, :2])
+        self.assertTrue(all(row is None for row in reloaded.get_many("pa@v2", digests)))
+
+    def test_compaction_keeps_evicted_entries(self) -> None:
+        """合并分段时保留已被内存上限淘汰、只保存在磁盘上的条目"""
+        cache = InferenceCache(self.cache_dir, max_entries=3, max_segments=2)
+        digests = cache.digest(self.features)
+        for start in range(0, 6, 2):
+            cache.put_many("pa@v1", digests[start:start + 2], self.features[start:start + 2, :2])
+            cache.save()
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(len(list(self.cache_dir.glob("*/*.npz"))), 1)
+
+        rows = InferenceCache(self.cache_dir).get_many("pa@v1", digests[:6])
+        self.assertTrue(all(row is not None for row in rows))
+        np.testing.assert_array_equal(rows[0], self.features[0, :2])
+
+    def test_disk_limit(self) -> None:
+        """磁盘占用超出上限时删除最旧的分段"""
+        cache = InferenceCache(self.cache_dir, max_disk_mb=1)
+        block = np.zeros((20_000, 4), dtype=np.float32)
+        for index in range(3):
+            features = block + index
+            features[:, 0] = np.arange(features.shape[0])
+            cache.put_many(f"m{index}@v1", cache.digest(features), features)
+            cache.save()
+        self.assertLessEqual(cache.disk_bytes, 1024 * 1024)
+        self.assertEqual(len(list(self.cache_dir.glob("*/*.npz"))), 1)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.disk_bytes, 0)
+
+    def test_predictor_skips_cached_samples(self) -> None:
+        """预测器只推理未命中的样本，结果与直接推理一致"""
+        model = _CountingModel()
+        predictor = ModelPredictor(batch_size=4, cache=InferenceCache(self.cache_dir))
+        predictor.set_model("pa", model)
+        predictor.submit("pa", self.features[:6], np.arange(6))
+        first = predictor.flush()["pa"]
+        self.assertEqual(model.samples, 6)
+
+        predictor = ModelPredictor(batch_size=4, cache=InferenceCache(self.cache_dir))
+        predictor.set_model("pa", model)
+        predictor.submit("pa", self.features, np.arange(10), slice_index=1)
+        second = predictor.flush()["pa"]
+        self.assertEqual(model.samples, 10)
+        np.testing.assert_allclose(second.probabilities[:6], first.probabilities)
+        np.testing.assert_allclose(second.probabilities, _CountingModel().predict_on_batch(self.features))
+
+    def test_unversioned_model_not_cached(self) -> None:
+        """版本未知的模型不使用缓存"""
+        model = _CountingModel()
+        model.version = None
+        cache = InferenceCache()
+        predictor = ModelPredictor(batch_size=4, cache=cache)
+        predictor.set_model("pa", model)
+        predictor.predict("pa", self.features)
+        predictor.predict("pa", self.features)
+        self.assertEqual(model.samples, 20)
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+推理执行器测试
+验证模型调用在专用线程中按提交顺序执行，以及推理线程数传递到后端
+"""
+
+import sys
+import os
+import threading
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.processors.inference_backends import create_backend
+from models.processors.model_predictor import ModelPredictor
+from models.services.inference_executor import InferenceExecutor
+
+
+class _ThreadRecordingModel:
+    """记录调用线程的模型：输出为输入按行求和"""
+
+    def __init__(self) -> None:
+        self.threads = set()
+
+    def predict_on_batch(self, x: np.ndarray) -> np.ndarray:
+        self.threads.add(threading.current_thread().name)
+        return x.sum(axis=1, keepdims=True)
+
+
+class TestInferenceExecutor(unittest.TestCase):
+    """InferenceExecutor 单元测试"""
+
+    def setUp(self) -> None:
+        self.model = _ThreadRecordingModel()
+        predictor = ModelPredictor(batch_size=4)
+        predictor.set_model("pa", self.model)
+        self.executor = InferenceExecutor(predictor)
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+
+    def test_runs_on_dedicated_thread_in_order(self) -> None:
+        """提交后立即返回，结果按提交顺序汇总，模型只在推理线程中调用"""
+        buffer = np.ones((3, 2), dtype=np.float32)
+        for slice_index in range(3):
+            buffer[:] = slice_index
+            self.executor.submit("pa", buffer, np.arange(3), slice_index)
+        predictions = self.executor.flush().result(timeout=10)["pa"]
+        np.testing.assert_array_equal(predictions.slice_indices, np.repeat(np.arange(3), 3))
+        np.testing.assert_allclose(predictions.probabilities[:, 0], np.repeat([0.0, 2.0, 4.0], 3))
+        self.assertEqual(len(self.model.threads), 1)
+        self.assertTrue(next(iter(self.model.threads)).startswith("inference"))
+
+    def test_errors_and_shutdown(self) -> None:
+        """推理线程中的异常通过 Future 抛出，停止后拒绝新任务"""
+        future = self.executor.predict("missing", np.ones((2, 2)))
+        with self.assertRaises(KeyError):
+            future.result(timeout=10)
+        self.executor.shutdown()
+        self.assertFalse(self.executor.is_running)
+        with self.assertRaises(RuntimeError):
+            self.executor.flush()
+
+    def test_backend_thread_settings(self) -> None:
+        """创建后端时指定的线程数被保存，负数按 0（运行库默认）处理"""
+        backend = create_backend("onnxruntime", intra_op_threads=2, inter_op_threads=-1)
+        self.assertEqual((backend.intra_op_threads, backend.inter_op_threads), (2, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+跨切片合并服务测试
+验证索引查询的候选对与两两比较的结果一致、连通分量的计算，
+并查集上的增量合并与人工合并的撤销 / 重做，以及调整容差时的增量预览
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.data.cluster_params import empty_cluster_params
+from models.services.merge_service import MergeParams, MergeService, connected_components
+from models.utils.disjoint_set import DisjointSet
+
+
+def _random_records(count: int, seed: int) -> np.ndarray:
+    """生成若干辐射源在不同切片中的簇"""
+    rng = np.random.default_rng(seed)
+    records = empty_cluster_params(count)
+    emitter_cf = rng.uniform(1000, 2000, 40)
+    emitter_pw = rng.uniform(1, 20, 40)
+    emitter_pri = rng.uniform(100, 1000, 40)
+    emitter = rng.integers(0, 40, count)
+    records["slice_index"] = rng.integers(0, 30, count)
+    records["cf_mean"] = emitter_cf[emitter] + rng.normal(0, 1, count)
+    records["cf_min"] = records["cf_mean"] - rng.uniform(0, 3, count)
+    records["cf_max"] = records["cf_mean"] + rng.uniform(0, 3, count)
+    records["pw_mean"] = emitter_pw[emitter] + rng.normal(0, 0.2, count)
+    records["pri_values"][:, 0] = emitter_pri[emitter] * (1 + rng.normal(0, 0.005, count))
+    records["pri_values"][rng.random(count) < 0.2, 0] = np.nan
+    return records
+
+
+def _brute_force_pairs(records: np.ndarray, class_ids: np.ndarray, params: MergeParams) -> set:
+    """两两比较得到的兼容簇对"""
+    pairs = set()
+    for i in range(records.size):
+        for j in range(i + 1, records.size):
+            a, b = records[i], records[j]
+            if a["cf_max"] + params.cf_tolerance < b["cf_min"] or b["cf_max"] + params.cf_tolerance < a["cf_min"]:
+                continue
+            if abs(a["pw_mean"] - b["pw_mean"]) > params.pw_tolerance:
+                continue
+            if params.cross_slice_only and a["slice_index"] == b["slice_index"]:
+                continue
+            if params.require_same_class and class_ids[i] != class_ids[j]:
+                continue
+            pri_a, pri_b = a["pri_values"][~np.isnan(a["pri_values"])], b["pri_values"][~np.isnan(b["pri_values"])]
+            if pri_a.size and pri_b.size:
+                diff = np.abs(pri_a[:, None] - pri_b[None, :]) / np.maximum(pri_a[:, None], pri_b[None, :])
+                if not (diff <= params.pri_tolerance).any():
+                    continue
+            pairs.add((i, j))
+    return pairs
+
+
+class TestMergeService(unittest.TestCase):
+    """MergeService 单元测试"""
+
+    def test_candidate_pairs_match_brute_force(self) -> None:
+        records = _random_records(400, seed=1)
+        class_ids = np.random.default_rng(2).integers(0, 3, records.size)
+        service = MergeService()
+        service.set_clusters(records, class_ids)
+
+        for params in (MergeParams(), MergeParams(cf_tolerance=0.0, require_same_class=False, cross_slice_only=False)):
+            result = service.merge(params)
+            self.assertEqual(set(map(tuple, result.pairs.tolist())), _brute_force_pairs(records, class_ids, params))
+
+    def test_small_chunks_give_same_pairs(self) -> None:
+        records = _random_records(300, seed=3)
+        service = MergeService()
+        service.set_clusters(records)
+        expected = service.index.candidate_pairs(MergeParams())
+        pairs = service.index.candidate_pairs(MergeParams(), chunk_size=7)
+        np.testing.assert_array_equal(np.unique(pairs, axis=0), np.unique(expected, axis=0))
+
+    def test_groups_are_connected_components(self) -> None:
+        records = empty_cluster_params(5)
+        records["slice_index"] = [0, 1, 2, 0, 1]
+        records["cf_mean"] = [1000, 1003, 1006, 3000, 1000]
+        records["cf_min"] = records["cf_mean"]
+        records["cf_max"] = records["cf_mean"]
+        records["pw_mean"] = [5, 5, 5, 5, 9]
+        service = MergeService(MergeParams(cf_tolerance=4.0, require_same_class=False))
+        service.set_clusters(records)
+
+        result = service.merge()
+        # 0-1、1-2 兼容，0 与 2 经由 1 连通；3 载频不同，4 脉宽不同
+        np.testing.assert_array_equal(result.group_ids, [0, 0, 0, 1, 2])
+        self.assertEqual(result.n_groups, 3)
+        np.testing.assert_array_equal(result.members(0), [0, 1, 2])
+
+    def test_missing_cf_is_not_merged(self) -> None:
+        records = empty_cluster_params(3)
+        records["slice_index"] = [0, 1, 2]
+        records["cf_mean"] = [1000, np.nan, 1000]
+        records["pw_mean"] = 5
+        service = MergeService()
+        service.set_clusters(records)
+
+        result = service.merge()
+        self.assertEqual(result.group_ids[0], result.group_ids[2])
+        self.assertNotEqual(result.group_ids[0], result.group_ids[1])
+
+    def test_merge_requires_clusters(self) -> None:
+        with self.assertRaises(RuntimeError):
+            MergeService().merge()
+
+    def test_connected_components_long_chain(self) -> None:
+        count = 1000
+        order = np.random.default_rng(4).permutation(count)
+        pairs = np.column_stack([order[:-1], order[1:]])
+        np.testing.assert_array_equal(connected_components(count, pairs), np.zeros(count))
+        np.testing.assert_array_equal(connected_components(3, np.empty((0, 2), dtype=np.intp)), [0, 1, 2])
+
+    def test_incremental_merge_matches_full_merge(self) -> None:
+        records = _random_records(400, seed=5)
+        class_ids = np.random.default_rng(6).integers(0, 3, records.size)
+        full = MergeService()
+        full.set_clusters(records, class_ids)
+        expected = full.merge()
+
+        service = MergeService()
+        for start in range(0, records.size, 100):
+            result = service.add_clusters(records[start:start + 100], class_ids[start:start + 100])
+        np.testing.assert_array_equal(result.group_ids, expected.group_ids)
+        self.assertEqual(
+            set(map(tuple, result.pairs.tolist())), set(map(tuple, expected.pairs.tolist()))
+        )
+
+    def test_manual_merge_undo_redo(self) -> None:
+        records = empty_cluster_params(4)
+        records["slice_index"] = [0, 1, 2, 3]
+        records["cf_mean"] = [1000, 1001, 2000, 3000]
+        records["pw_mean"] = 5
+        service = MergeService()
+        service.set_clusters(records)
+        before = service.merge().group_ids.copy()
+        self.assertFalse(service.can_undo)
+
+        self.assertTrue(service.merge_clusters([0, 2]))
+        self.assertFalse(service.merge_clusters([1, 2]))
+        merged = service.result().group_ids
+        self.assertEqual(merged[0], merged[2])
+
+        # 人工合并之后到达的新簇在撤销后仍然保留其自动合并
+        extra = empty_cluster_params(1)
+        extra["slice_index"] = 4
+        extra["cf_mean"] = 3000
+        extra["pw_mean"] = 5
+        service.add_clusters(extra)
+        self.assertTrue(service.undo())
+        groups = service.result().group_ids
+        np.testing.assert_array_equal(groups[:4], before)
+        self.assertEqual(groups[3], groups[4])
+        self.assertFalse(service.undo())
+
+        self.assertTrue(service.redo())
+        groups = service.result().group_ids
+        self.assertEqual(groups[0], groups[2])
+        self.assertFalse(service.can_redo)
+
+        # 整批重算后人工合并仍然有效
+        groups = service.merge(MergeParams(cf_tolerance=0.5)).group_ids
+        self.assertEqual(groups[0], groups[2])
+        self.assertNotEqual(groups[0], groups[1])
+
+    def test_preview_matches_full_merge(self) -> None:
+        records = _random_records(400, seed=7)
+        class_ids = np.random.default_rng(8).integers(0, 3, records.size)
+        service = MergeService()
+        service.set_clusters(records, class_ids)
+        reference = MergeService()
+        reference.set_clusters(records, class_ids)
+
+        # 连续调整同一项容差（放宽、收紧、越过初始值），再切换到另一项容差，最后超出预查询范围
+        steps = [
+            MergeParams(cf_tolerance=5.0), MergeParams(cf_tolerance=7.0), MergeParams(cf_tolerance=3.0),
+            MergeParams(cf_tolerance=1.0), MergeParams(cf_tolerance=6.0), MergeParams(cf_tolerance=6.0, pw_tolerance=0.2),
+            MergeParams(cf_tolerance=6.0, pw_tolerance=0.8), MergeParams(cf_tolerance=6.0, pw_tolerance=3.0),
+            MergeParams(cf_tolerance=6.0, pw_tolerance=3.0, cross_slice_only=False),
+        ]
+        for params in steps:
+            preview = service.preview(params)
+            expected = reference.merge(params)
+            np.testing.assert_array_equal(preview.group_ids, expected.group_ids)
+            self.assertEqual(set(map(tuple, preview.pairs.tolist())), set(map(tuple, expected.pairs.tolist())))
+        # 预览不改变当前的合并组
+        self.assertEqual(service.result().n_groups, records.size)
+
+    def test_preview_keeps_manual_merges(self) -> None:
+        records = empty_cluster_params(3)
+        records["slice_index"] = [0, 1, 2]
+        records["cf_mean"] = [1000, 1001, 3000]
+        records["pw_mean"] = 5
+        service = MergeService()
+        service.set_clusters(records)
+        service.merge()
+        service.merge_clusters([0, 2])
+
+        groups = service.preview(MergeParams(cf_tolerance=0.1)).group_ids
+        self.assertEqual(groups[0], groups[2])
+        self.assertNotEqual(groups[0], groups[1])
+
+
+class TestDisjointSet(unittest.TestCase):
+    """DisjointSet 单元测试"""
+
+    def test_union_and_rollback(self) -> None:
+        groups = DisjointSet(6)
+        groups.union(0, 1)
+        checkpoint = groups.checkpoint()
+        groups.union(2, 3)
+        groups.union(1, 3)
+        self.assertFalse(groups.union(0, 2))
+        self.assertEqual(groups.n_sets, 3)
+        np.testing.assert_array_equal(groups.labels(), [0, 0, 0, 0, 1, 2])
+
+        groups.rollback(checkpoint)
+        self.assertEqual(groups.n_sets, 5)
+        np.testing.assert_array_equal(groups.labels(), [0, 0, 1, 2, 3, 4])
+
+    def test_from_labels_and_extend(self) -> None:
+        groups = DisjointSet.from_labels(np.array([5, 2, 5, 2, 7]))
+        self.assertEqual(groups.n_sets, 3)
+        np.testing.assert_array_equal(groups.labels(), [0, 1, 0, 1, 2])
+        groups.extend(2)
+        groups.union(5, 4)
+        np.testing.assert_array_equal(groups.labels(), [0, 1, 0, 1, 2, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+簇对相似度测试
+验证整批计算的各项相似度与逐对定义一致，以及缺失参数与综合得分的处理
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.data.cluster_params import empty_cluster_params
+from models.processors.merge_similarity import PairSimilarity, SimilarityTable
+
+
+class TestSimilarityTable(unittest.TestCase):
+    """SimilarityTable 单元测试"""
+
+    def setUp(self) -> None:
+        self.records = empty_cluster_params(5)
+        self.records["cf_min"] = [1000, 1005, 1020, 1002, np.nan]
+        self.records["cf_max"] = [1010, 1015, 1030, 1002, np.nan]
+        self.records["pw_mean"] = [5, 4, 5, 10, np.nan]
+        self.records["doa_mean"] = [355, 5, 180, 355, 10]
+        self.records["pri_values"][0, :2] = [100, 200]
+        self.records["pri_values"][1, 0] = 199
+        self.records["pri_values"][2, 0] = 150
+        self.class_ids = np.array([1, 1, 2, -1, 1])
+
+    def test_components(self) -> None:
+        table = SimilarityTable(self.records, self.class_ids, doa_scale=10.0)
+        pairs = np.array([[0, 1], [0, 2], [0, 3], [1, 3], [0, 4]])
+        similarity = table.compute(pairs)
+
+        # 载频：[1000,1010] 与 [1005,1015] 交集 5，占较窄区间 10 的一半；点 1002 落在 [1000,1010] 内
+        np.testing.assert_allclose(similarity.cf_overlap[:4], [0.5, 0.0, 1.0, 0.0])
+        self.assertTrue(np.isnan(similarity.cf_overlap[4]))
+        np.testing.assert_allclose(similarity.pw_ratio[:4], [0.8, 1.0, 0.5, 0.4])
+        # PRI：200 与 199 最接近；第 3、4 个簇没有 PRI
+        np.testing.assert_allclose(similarity.pri_match[:2], [1 - 1 / 200, 1 - 50 / 200])
+        self.assertTrue(np.isnan(similarity.pri_match[2:]).all())
+        # 到达角按圆周距离：355 与 5 相差 10 度
+        np.testing.assert_allclose(similarity.doa_proximity[:3], [np.exp(-0.5), np.exp(-0.5 * 17.5 ** 2), 1.0])
+        np.testing.assert_array_equal(similarity.class_agreement[[0, 1, 4]], [1.0, 0.0, 1.0])
+        self.assertTrue(np.isnan(similarity.class_agreement[2:4]).all())
+
+    def test_chunks_match_single_batch(self) -> None:
+        rng = np.random.default_rng(0)
+        records = empty_cluster_params(200)
+        records["cf_min"] = rng.uniform(1000, 1100, 200)
+        records["cf_max"] = records["cf_min"] + rng.uniform(0, 5, 200)
+        records["pw_mean"] = rng.uniform(1, 10, 200)
+        records["doa_mean"] = rng.uniform(0, 360, 200)
+        records["pri_values"][:, :2] = rng.uniform(100, 1000, (200, 2))
+        table = SimilarityTable(records, rng.integers(0, 3, 200))
+        pairs = rng.integers(0, 200, (5000, 2))
+
+        expected = table.compute(pairs)
+        chunked = table.compute(pairs, chunk_size=333)
+        for name in PairSimilarity.__dataclass_fields__:
+            np.testing.assert_array_equal(getattr(chunked, name), getattr(expected, name))
+
+    def test_score_skips_missing_components(self) -> None:
+        similarity = PairSimilarity(
+            cf_overlap=np.array([1.0, 0.0, np.nan]),
+            pw_ratio=np.array([0.5, np.nan, np.nan]),
+            pri_match=np.array([np.nan, np.nan, np.nan]),
+            doa_proximity=np.array([np.nan, np.nan, np.nan]),
+            class_agreement=np.array([np.nan, np.nan, np.nan]),
+        )
+        score = similarity.score({"cf_overlap": 3.0, "pw_ratio": 1.0})
+        np.testing.assert_allclose(score[:2], [3.5 / 4, 0.0])
+        self.assertTrue(np.isnan(score[2]))
+
+    def test_without_class_ids(self) -> None:
+        similarity = SimilarityTable(self.records).compute(np.array([[0, 1]]))
+        self.assertTrue(np.isnan(similarity.class_agreement).all())
+        self.assertGreater(similarity.score()[0], 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模型预测器测试
+验证跨切片的批量汇集、分批推理与结果顺序
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.processors.model_predictor import ModelPredictor
+
+
+class _LinearModel:
+    """以线性打分 + softmax 代替神经网络，记录每次调用的批大小"""
+
+    def __init__(self, n_features: int, n_classes: int) -> None:
+        self.weights = np.random.default_rng(1).normal(size=(n_features, n_classes))
+        self.batch_sizes = []
+
+    def predict_on_batch(self, x: np.ndarray) -> np.ndarray:
+        self.batch_sizes.append(x.shape[0])
+        logits = x.reshape(x.shape[0], -1) @ self.weights
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+
+
+class TestModelPredictor(unittest.TestCase):
+    """ModelPredictor 单元测试"""
+
+    def setUp(self) -> None:
+        """注册测试模型"""
+        self.model = _LinearModel(16, 5)
+        self.predictor = ModelPredictor(batch_size=32)
+        self.predictor.set_model("pa", self.model)
+        self.rng = np.random.default_rng(0)
+
+    def test_predict_chunks_by_batch_size(self) -> None:
+        """predict 按 batch_size 分批并保持样本顺序"""
+        features = self.rng.normal(size=(100, 16)).astype(np.float32)
+        probabilities = self.predictor.predict("pa", features)
+        self.assertListEqual(self.model.batch_sizes, [32, 32, 32, 4])
+        np.testing.assert_allclose(probabilities, _LinearModel(16, 5).predict_on_batch(features), rtol=1e-6)
+
+    def test_submit_across_slices(self) -> None:
+        """跨切片提交的样本应凑满整批推理，flush 后按提交顺序返回"""
+        buffer = np.empty((20, 16), dtype=np.float32)
+        expected_labels = []
+        expected_slices = []
+        expected_features = []
+        for slice_index in range(7):
+            count = int(self.rng.integers(0, 20))
+            # 复用同一个预分配张量，模拟 FeatureBuilder 的 out= 用法
+            buffer[:count] = self.rng.normal(size=(count, 16))
+            labels = np.arange(count)
+            self.predictor.submit("pa", buffer[:count], labels, slice_index)
+            expected_features.append(buffer[:count].copy())
+            expected_labels.extend(labels.tolist())
+            expected_slices.extend([slice_index] * count)
+
+        total = len(expected_labels)
+        self.assertTrue(all(size == 32 for size in self.model.batch_sizes))
+        self.assertEqual(self.predictor.pending_count("pa"), total % 32)
+
+        predictions = self.predictor.flush()["pa"]
+        self.assertEqual(len(predictions), total)
+        self.assertEqual(self.predictor.pending_count("pa"), 0)
+        self.assertListEqual(predictions.labels.tolist(), expected_labels)
+        self.assertListEqual(predictions.slice_indices.tolist(), expected_slices)
+        reference = _LinearModel(16, 5).predict_on_batch(np.concatenate(expected_features))
+        np.testing.assert_allclose(predictions.probabilities, reference, rtol=1e-5)
+        np.testing.assert_array_equal(predictions.class_ids, reference.argmax(axis=1))
+        self.assertDictEqual(self.predictor.flush(), {})
+
+    def test_failed_batch_kept_for_retry(self) -> None:
+        """推理失败时样本留在队列中，再次 flush 时重新推理，结果不缺失"""
+        features = self.rng.normal(size=(40, 16)).astype(np.float32)
+        predict_on_batch = self.model.predict_on_batch
+
+        def _fail(x: np.ndarray) -> np.ndarray:
+            raise RuntimeError("推理失败")
+
+        self.model.predict_on_batch = _fail
+        with self.assertRaises(RuntimeError):
+            self.predictor.submit("pa", features, np.arange(40))
+        self.assertEqual(self.predictor.pending_count("pa"), 40)
+
+        self.model.predict_on_batch = predict_on_batch
+        predictions = self.predictor.flush()["pa"]
+        self.assertListEqual(predictions.labels.tolist(), list(range(40)))
+        np.testing.assert_allclose(predictions.probabilities, _LinearModel(16, 5).predict_on_batch(features), rtol=1e-5)
+
+    def test_invalid_usage(self) -> None:
+        """未注册模型、非法批大小与形状不匹配时抛出异常"""
+        with self.assertRaises(KeyError):
+            self.predictor.predict("dtoa", np.zeros((1, 16)))
+        with self.assertRaises(ValueError):
+            self.predictor.batch_size = 0
+        with self.assertRaises(ValueError):
+            self.predictor.submit("pa", np.zeros((3, 16)), np.arange(2))
+        with self.assertRaises(TypeError):
+            self.predictor.set_model("bad", object())
+
+
+if __name__ == "__main__":
+    unittest.main()
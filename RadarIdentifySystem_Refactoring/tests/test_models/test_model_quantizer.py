@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模型量化测试
+验证量化变体的命名、留出集读取、准确率检查，以及模型注册表按模型选择精度变体
+"""
+
+import sys
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.processors.inference_backends import OnnxRuntimeBackend, split_variant
+from models.services.model_quantizer import ModelQuantizer
+from models.services.model_registry import ModelRegistry
+
+
+class _FileBackend(OnnxRuntimeBackend):
+    """不依赖 onnxruntime 的测试后端：模型文件内容为每个样本的预测类别"""
+
+    def _load(self, path: Path) -> None:
+        self._classes = np.frombuffer(path.read_bytes(), dtype=np.uint8)
+        self._offset = 0
+
+    def _predict(self, x: np.ndarray) -> np.ndarray:
+        classes = self._classes[self._offset:self._offset + x.shape[0]]
+        self._offset += x.shape[0]
+        return np.eye(3, dtype=np.float32)[classes]
+
+    def _release(self) -> None:
+        pass
+
+
+class _FakeQuantizer(ModelQuantizer):
+    """量化结果为预先设定的预测类别"""
+
+    quantized_classes = b""
+
+    def _quantize_onnx(self, float_path: Path, target: Path, x_calibration: np.ndarray) -> None:
+        target.write_bytes(self.quantized_classes)
+
+
+class TestModelQuantizer(unittest.TestCase):
+    """ModelQuantizer 单元测试"""
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        (self.root / "pa.keras").write_bytes(b"")
+        self.y = np.array([0, 1, 2, 0, 1, 2, 0, 1, 2, 0], dtype=np.uint8)
+        # 浮点模型 10 个评估样本全部正确
+        (self.root / "pa.onnx").write_bytes(self.y.tobytes())
+        np.savez(self.root / "pa.holdout.npz", x=np.zeros((14, 4), dtype=np.float32), y=np.concatenate([[0] * 4, self.y]))
+        self.quantizer = _FakeQuantizer(
+            max_accuracy_drop=0.1, calibration_samples=4, batch_size=4, backend_factory=lambda _: _FileBackend()
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_variant_naming(self) -> None:
+        """量化变体路径与精度标记互逆"""
+        path = ModelQuantizer.quantized_path(self.root / "pa.onnx", "int8")
+        self.assertEqual(path.name, "pa.int8.onnx")
+        self.assertEqual(split_variant(path), (self.root / "pa", "int8"))
+        self.assertEqual(split_variant(self.root / "pa.v2.onnx"), (self.root / "pa.v2", "float32"))
+
+    def test_holdout_split(self) -> None:
+        """未提供校准样本时从留出集前部划出"""
+        holdout = self.quantizer.load_holdout(self.root / "pa.holdout.npz")
+        self.assertEqual(holdout.x_calibration.shape[0], 4)
+        np.testing.assert_array_equal(holdout.y, self.y)
+
+    def test_accuracy_gate(self) -> None:
+        """准确率下降不超过上限时保留，否则删除量化文件"""
+        wrong_one = self.y.copy()
+        wrong_one[0] = 1
+        _FakeQuantizer.quantized_classes = wrong_one.tobytes()
+        report = self.quantizer.quantize(self.root / "pa.keras", "onnxruntime", "int8")
+        self.assertTrue(report.accepted)
+        self.assertAlmostEqual(report.accuracy_drop, 0.1)
+        self.assertTrue(report.path.exists())
+
+        wrong_two = wrong_one.copy()
+        wrong_two[1] = 0
+        _FakeQuantizer.quantized_classes = wrong_two.tobytes()
+        report = self.quantizer.quantize(self.root / "pa.keras", "onnxruntime", "int8")
+        self.assertFalse(report.accepted)
+        self.assertFalse(report.path.exists())
+
+        with self.assertRaises(ValueError):
+            self.quantizer.quantize(self.root / "pa.keras", "onnxruntime", "float16")
+
+    def test_evaluation_error_leaves_no_file(self) -> None:
+        """评估出错时不留下量化文件，目录量化跳过出错的模型继续处理其余模型"""
+        _FakeQuantizer.quantized_classes = self.y.tobytes()
+        (self.root / "sub").mkdir()
+        for name in ("pa.keras", "pa.onnx", "pa.holdout.npz"):
+            (self.root / "sub" / name).write_bytes((self.root / name).read_bytes())
+        # 浮点模型输出的样本数不足，评估时形状不匹配
+        (self.root / "pa.onnx").write_bytes(self.y[:2].tobytes())
+        with self.assertRaises(ValueError):
+            self.quantizer.quantize(self.root / "pa.keras", "onnxruntime", "int8")
+        self.assertListEqual(sorted(path.name for path in self.root.glob("*.onnx")), ["pa.onnx"])
+
+        reports = self.quantizer.quantize_directory(self.root, "onnxruntime")
+        self.assertListEqual([report.path.name for report in reports], ["pa.int8.onnx"])
+        self.assertEqual(reports[0].path.parent.name, "sub")
+        self.assertTrue(reports[0].accepted)
+        self.assertFalse((self.root / "pa.int8.onnx").exists())
+
+    def test_unchecked_variant_not_discoverable(self) -> None:
+        """准确率检查完成前，模型目录中没有可被注册表发现的量化文件"""
+        _FakeQuantizer.quantized_classes = self.y.tobytes()
+        registry = ModelRegistry(self.root, backend="onnxruntime", backend_factory=lambda _: _FileBackend())
+        evaluate = self.quantizer.evaluate
+        discovered = []
+
+        def _evaluate(*args):
+            discovered.append(registry.discover())
+            return evaluate(*args)
+
+        self.quantizer.evaluate = _evaluate
+        report = self.quantizer.quantize(self.root / "pa.keras", "onnxruntime", "int8")
+        self.assertTrue(report.accepted)
+        self.assertListEqual(discovered, [["pa"], ["pa"]])
+        self.assertListEqual(registry.discover(), ["pa"])
+        self.assertListEqual(registry.entry("pa").available_variants("onnxruntime"), ["float32", "int8"])
+        self.assertListEqual(sorted(path.name for path in self.root.iterdir() if path.suffix == ".part"), [])
+
+    def test_registry_variant_selection(self) -> None:
+        """注册表把量化变体归入同一模型，按所选精度加载，缺少时退回浮点"""
+        _FakeQuantizer.quantized_classes = self.y.tobytes()
+        self.quantizer.quantize(self.root / "pa.keras", "onnxruntime", "int8")
+        registry = ModelRegistry(
+            self.root, backend="onnxruntime", backend_factory=lambda _: _FileBackend(), variants={"pa": "int8"}
+        )
+        self.assertListEqual(registry.discover(), ["pa"])
+        self.assertListEqual(registry.entry("pa").available_variants("onnxruntime"), ["float32", "int8"])
+        self.assertEqual(registry.get("pa").model_path.name, "pa.int8.onnx")
+
+        registry.set_variant("pa", "float32")
+        self.assertFalse(registry.is_resident("pa"))
+        self.assertEqual(registry.get("pa").model_path.name, "pa.onnx")
+        with self.assertRaises(KeyError):
+            registry.set_variant("pa", "int4")
+
+
+if __name__ == "__main__":
+    unittest.main()
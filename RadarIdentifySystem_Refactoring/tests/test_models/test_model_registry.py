@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模型注册表测试
+验证模型发现、首次使用时加载、锁外加载以及按数量/内存的 LRU 淘汰
+"""
+
+import sys
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.processors.inference_backends import OnnxRuntimeBackend
+from models.processors.model_predictor import ModelPredictor
+from models.services.model_registry import ModelRegistry
+
+
+class _EchoBackend(OnnxRuntimeBackend):
+    """不依赖 onnxruntime 的测试后端：记录加载次数，推理结果为输入按行求和"""
+
+    loads = []
+    batches = []
+
+    @property
+    def input_shape(self):
+        return (None, 3)
+
+    def _load(self, path: Path) -> None:
+        _EchoBackend.loads.append(path.stem)
+
+    def _predict(self, x: np.ndarray) -> np.ndarray:
+        _EchoBackend.batches.append(x.shape)
+        return x.sum(axis=1, keepdims=True)
+
+    def _release(self) -> None:
+        pass
+
+
+class _SlowBackend(_EchoBackend):
+    """加载时阻塞，直到测试放行"""
+
+    started = threading.Event()
+    release = threading.Event()
+
+    def _load(self, path: Path) -> None:
+        _SlowBackend.started.set()
+        _SlowBackend.release.wait(5)
+        super()._load(path)
+
+
+class TestModelRegistry(unittest.TestCase):
+    """ModelRegistry 单元测试"""
+
+    def setUp(self) -> None:
+        """创建包含三个模型（每个 1MB）的临时目录"""
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        (root / "pa").mkdir()
+        for relative in ("pa/pa_v1.onnx", "pa/pa_v1.keras", "pa/pa_v2.onnx", "dtoa.onnx"):
+            (root / relative).write_bytes(b"\0" * (1024 * 1024))
+        (root / "readme.txt").write_text("")
+        _EchoBackend.loads = []
+        _EchoBackend.batches = []
+        self.registry = ModelRegistry(
+            root, backend="onnxruntime", max_resident=2, memory_budget_mb=10, backend_factory=lambda _: _EchoBackend()
+        )
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_discover_without_loading(self) -> None:
+        """扫描只登记模型，不加载"""
+        self.assertListEqual(self.registry.discover(), ["dtoa", "pa/pa_v1", "pa/pa_v2"])
+        self.assertSetEqual(set(self.registry.entry("pa/pa_v1").files), {"onnxruntime", "tensorflow"})
+        self.assertListEqual(_EchoBackend.loads, [])
+        with self.assertRaises(KeyError):
+            self.registry.get("missing")
+
+    def test_lru_by_count(self) -> None:
+        """超过常驻数量时淘汰最久未使用的模型，命中时不重复加载"""
+        self.registry.discover()
+        self.registry.get("dtoa")
+        self.registry.get("pa/pa_v1")
+        self.registry.get("dtoa")
+        self.registry.get("pa/pa_v2")
+        self.assertListEqual(self.registry.resident_names, ["dtoa", "pa/pa_v2"])
+        self.assertListEqual(_EchoBackend.loads, ["dtoa", "pa_v1", "pa_v2"])
+
+    def test_memory_budget(self) -> None:
+        """内存预算收紧后立即淘汰"""
+        self.registry.discover()
+        self.registry.set_limits(max_resident=3)
+        for name in ("dtoa", "pa/pa_v1", "pa/pa_v2"):
+            self.registry.get(name)
+        self.assertEqual(self.registry.resident_bytes, 3 * 1024 * 1024)
+        self.registry.set_limits(memory_budget_mb=2)
+        self.assertListEqual(self.registry.resident_names, ["pa/pa_v1", "pa/pa_v2"])
+
+    def test_predictor_uses_registry(self) -> None:
+        """ModelPredictor 通过注册表按需获取模型"""
+        self.registry.discover()
+        predictor = ModelPredictor(batch_size=4, model_provider=self.registry.get)
+        predictor.submit("dtoa", np.ones((6, 3), dtype=np.float32), np.arange(6))
+        predictions = predictor.flush()["dtoa"]
+        np.testing.assert_allclose(predictions.probabilities[:, 0], 3.0)
+        self.assertTrue(self.registry.is_resident("dtoa"))
+
+    def test_warmup_on_load(self) -> None:
+        """加载后按预期批大小预热一次，命中常驻模型时不再预热"""
+        self.registry.discover()
+        self.registry.set_warmup_batch_sizes([4, 1, 4])
+        self.registry.get("dtoa")
+        self.registry.get("dtoa")
+        self.assertListEqual(_EchoBackend.batches, [(4, 3), (1, 3)])
+
+    def test_load_outside_lock(self) -> None:
+        """加载期间其他方法立即返回，同一模型的并发请求只加载一次"""
+        _SlowBackend.started = threading.Event()
+        _SlowBackend.release = threading.Event()
+        registry = ModelRegistry(
+            self.registry.models_dir, backend="onnxruntime", backend_factory=lambda _: _SlowBackend()
+        )
+        registry.discover()
+        models = []
+        threads = [threading.Thread(target=lambda: models.append(registry.get("dtoa"))) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        self.assertTrue(_SlowBackend.started.wait(5))
+
+        start = time.perf_counter()
+        self.assertListEqual(registry.resident_names, [])
+        self.assertListEqual(registry.names, ["dtoa", "pa/pa_v1", "pa/pa_v2"])
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+        _SlowBackend.release.set()
+        for thread in threads:
+            thread.join(5)
+        self.assertEqual(len(models), 2)
+        self.assertIs(models[0], models[1])
+        self.assertListEqual(_EchoBackend.loads, ["dtoa"])
+        self.assertListEqual(registry.resident_names, ["dtoa"])
+
+    def test_release_while_loading(self) -> None:
+        """加载期间释放的模型加载完成后不再常驻"""
+        _SlowBackend.started = threading.Event()
+        _SlowBackend.release = threading.Event()
+        registry = ModelRegistry(
+            self.registry.models_dir, backend="onnxruntime", backend_factory=lambda _: _SlowBackend()
+        )
+        registry.discover()
+        thread = threading.Thread(target=registry.get, args=("dtoa",))
+        thread.start()
+        self.assertTrue(_SlowBackend.started.wait(5))
+        registry.clear()
+        _SlowBackend.release.set()
+        thread.join(5)
+        self.assertListEqual(registry.resident_names, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
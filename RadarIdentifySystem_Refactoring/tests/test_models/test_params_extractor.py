@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+参数提取器测试
+验证批量DTOA/PRI特征提取与逐簇计算结果一致
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.data.pulse_columns import PulseColumn
+from models.processors.params_extractor import ParamsExtractor, PriType
+
+
+def _make_slice(rng: np.random.Generator):
+    """构造包含固定、抖动、参差三类重频及噪声的切片数据
+
+    Returns:
+        (pulses, labels): 打乱顺序后的脉冲数据与标签
+    """
+    toa_constant = 5.0 + np.arange(60) * 100.0
+    toa_jitter = np.cumsum(150.0 * (1 + rng.uniform(-0.2, 0.2, 50)))
+    toa_stagger = np.cumsum(np.tile([200.0, 320.0, 450.0], 20))
+    toa_short = np.array([10.0, 40.0])
+    toa_noise = rng.uniform(0, 6000, 15)
+
+    toa = np.concatenate([toa_constant, toa_jitter, toa_stagger, toa_short, toa_noise])
+    labels = np.concatenate([
+        np.full(60, 3), np.full(50, 7), np.full(60, 1), np.full(2, 9), np.full(15, -1)
+    ])
+    pulses = rng.uniform(0, 1, (toa.size, 5))
+    pulses[:, PulseColumn.TOA] = toa
+
+    perm = rng.permutation(toa.size)
+    return pulses[perm], labels[perm]
+
+
+class TestParamsExtractor(unittest.TestCase):
+    """ParamsExtractor 单元测试"""
+
+    def setUp(self) -> None:
+        """构造测试数据"""
+        self.rng = np.random.default_rng(0)
+        self.pulses, self.labels = _make_slice(self.rng)
+        self.extractor = ParamsExtractor(pri_bin_width=2.0, pri_max=1000.0)
+
+    def test_matches_per_cluster_reference(self) -> None:
+        """批量结果应与逐簇循环计算一致"""
+        features = self.extractor.extract_dtoa_features(self.pulses, self.labels)
+        self.assertListEqual(features.labels.tolist(), [1, 3, 7, 9])
+
+        for k, label in enumerate(features.labels):
+            toa = np.sort(self.pulses[self.labels == label, PulseColumn.TOA])
+            dtoa = np.diff(toa)
+            np.testing.assert_allclose(features.dtoa_of(k), dtoa)
+            self.assertEqual(features.pulse_counts[k], toa.size)
+            np.testing.assert_allclose(features.pri_mean[k], dtoa.mean())
+            np.testing.assert_allclose(features.pri_std[k], dtoa.std())
+            np.testing.assert_allclose(features.pri_median[k], np.median(dtoa))
+            np.testing.assert_allclose(features.pri_min[k], dtoa.min())
+            np.testing.assert_allclose(features.pri_max[k], dtoa.max())
+
+            expected_hist, _ = np.histogram(dtoa, bins=features.hist_edges)
+            np.testing.assert_array_equal(features.pri_hist[k], expected_hist)
+
+    def test_pri_type_classification(self) -> None:
+        """固定、抖动、参差与脉冲不足四类应被正确区分"""
+        features = self.extractor.extract_dtoa_features(self.pulses, self.labels)
+        pri_type = dict(zip(features.labels.tolist(), features.pri_type.tolist()))
+        self.assertEqual(pri_type[3], PriType.CONSTANT)
+        self.assertEqual(pri_type[7], PriType.JITTER)
+        self.assertEqual(pri_type[1], PriType.STAGGER)
+        self.assertEqual(pri_type[9], PriType.UNKNOWN)
+
+    def test_empty_slice(self) -> None:
+        """全部为噪声时返回空结果"""
+        features = self.extractor.extract_dtoa_features(self.pulses, np.full(self.labels.size, -1))
+        self.assertEqual(features.n_clusters, 0)
+        self.assertEqual(features.pri_hist.shape, (0, self.extractor.n_bins))
+
+    def test_shape_mismatch(self) -> None:
+        """输入形状不匹配时抛出 ValueError"""
+        with self.assertRaises(ValueError):
+            self.extractor.extract_dtoa_features(self.pulses, self.labels[:-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+散点图抽稀测试
+验证可见范围抽稀后的点数上限、极值点保留、排序与 NaN 的处理以及按标签取色
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from qfluentwidgets import Theme
+
+from models.utils.plot_decimation import BASE_BLOCK, DecimatedSeries
+from models.utils.plot_style import PlotStyle
+
+
+class TestDecimatedSeries(unittest.TestCase):
+    """散点序列抽稀测试"""
+
+    def setUp(self):
+        rng = np.random.default_rng(7)
+        self.count = 200_003
+        self.x = np.sort(rng.random(self.count)) * 1000.0
+        self.y = rng.normal(size=self.count)
+        self.series = DecimatedSeries(self.x, self.y)
+
+    def test_few_points_returned_unchanged(self):
+        """可见点不超过 2 × bins 时返回全部可见点"""
+        x, y, colors = self.series.window((self.x[100], self.x[199]), 50)
+        np.testing.assert_array_equal(x, self.x[100:200])
+        np.testing.assert_array_equal(y, self.y[100:200])
+        self.assertIsNone(colors)
+
+    def test_window_bounded_and_keeps_extremes(self):
+        """抽稀后的点都在可见范围内，点数约为两倍像素列数，且保留范围内的极值"""
+        rng = np.random.default_rng(11)
+        bins = 300
+        overhead = 4 * int(np.log2(self.count)) + 2 * BASE_BLOCK
+        for _ in range(50):
+            low, high = np.sort(rng.random(2) * 1000.0)
+            start, stop = np.searchsorted(self.x, low, "left"), np.searchsorted(self.x, high, "right")
+            indices = self.series.window_indices((low, high), bins)
+            self.assertTrue(np.all((indices >= start) & (indices < stop)))
+            self.assertLessEqual(indices.size, 2 * bins + overhead)
+            if stop > start:
+                self.assertEqual(self.y[indices].min(), self.y[start:stop].min())
+                self.assertEqual(self.y[indices].max(), self.y[start:stop].max())
+
+    def test_cover_is_exact(self):
+        """任意下标区间的分解与原始区间的最小、最大值一致"""
+        rng = np.random.default_rng(3)
+        for _ in range(200):
+            start, stop = np.sort(rng.integers(0, self.count, 2))
+            stop += 1
+            indices = self.series._cover(int(start), int(stop))
+            self.assertEqual(self.y[indices].min(), self.y[start:stop].min())
+            self.assertEqual(self.y[indices].max(), self.y[start:stop].max())
+
+    def test_unsorted_input_and_nan(self):
+        """未排序的输入按横坐标排序并保持颜色对应，NaN 不被选为极值"""
+        rng = np.random.default_rng(5)
+        x = rng.random(10_000)
+        y = x * 2.0
+        y[::7] = np.nan
+        colors = np.arange(x.size, dtype=np.uint32)
+        series = DecimatedSeries(x, y, colors)
+        self.assertTrue(np.all(np.diff(series.x) >= 0))
+        np.testing.assert_array_equal(series.x, x[series.colors])
+        wx, wy, _ = series.window(series.x_range, 40)
+        self.assertLessEqual(wx.size, 80 + 4 * 14 + 2 * BASE_BLOCK)
+        self.assertEqual(np.nanmin(wy), np.nanmin(y))
+        self.assertEqual(np.nanmax(wy), np.nanmax(y))
+
+    def test_labels_colored_by_style(self):
+        """标签随横坐标排序，抽稀后的点按传入的配色取色"""
+        x = np.array([3.0, 1.0, 2.0, 0.0])
+        labels = np.array([2, 0, 1, -1])
+        series = DecimatedSeries(x, x, labels=labels)
+        np.testing.assert_array_equal(series.labels, [-1, 0, 1, 2])
+        for theme in (Theme.LIGHT, Theme.DARK):
+            style = PlotStyle(theme)
+            _, _, colors = series.window(series.x_range, 10, style)
+            np.testing.assert_array_equal(colors, style.labels(np.array([-1, 0, 1, 2])))
+
+    def test_mismatched_lengths(self):
+        """长度不一致时抛出 ValueError"""
+        with self.assertRaises(ValueError):
+            DecimatedSeries(np.zeros(3), np.zeros(4))
+        with self.assertRaises(ValueError):
+            DecimatedSeries(np.zeros(3), np.zeros(3), labels=np.zeros(2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+散点图栅格化测试
+验证坐标到像素的变换、越界裁剪、标记大小与着色、颜色查找表与标记形状，以及密度图的计数与取色
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.utils.plot_raster import (
+    DEFAULT_COLOR,
+    DENSITY_COLORMAP,
+    LABEL_PALETTE,
+    NOISE_COLOR,
+    ColorTable,
+    PlotSpec,
+    data_range,
+    density_row_offsets,
+    label_colors,
+    marker_sprite,
+    rasterize_density,
+    rasterize_scatter,
+    to_pixels,
+)
+
+
+def image_pixels(image) -> np.ndarray:
+    """把 QImage 读回 (H, W) 的 uint32 数组"""
+    pointer = image.constBits()
+    pointer.setsize(image.sizeInBytes())
+    return np.frombuffer(pointer, dtype=np.uint32).reshape(image.height(), image.width()).copy()
+
+
+class TestPlotRaster(unittest.TestCase):
+    """散点图栅格化测试"""
+
+    def test_to_pixels_corners_and_clipping(self):
+        """范围的四角落在图像四角，越界与 NaN 的点无效"""
+        x = np.array([0.0, 10.0, 0.0, 10.0, 11.0, np.nan])
+        y = np.array([0.0, 0.0, 5.0, 5.0, 1.0, 1.0])
+        columns, rows, valid = to_pixels(x, y, (0.0, 10.0), (0.0, 5.0), 11, 6)
+        np.testing.assert_array_equal(valid, [True, True, True, True, False, False])
+        np.testing.assert_array_equal(columns[:4], [0, 10, 0, 10])
+        # 纵轴向上：y 最小值在最后一行
+        np.testing.assert_array_equal(rows[:4], [5, 5, 0, 0])
+
+    def test_rasterize_single_points(self):
+        """point_size 为 1 时每个点恰好写一个像素"""
+        spec = PlotSpec(np.array([0.0, 4.0]), np.array([0.0, 2.0]), x_range=(0.0, 4.0), y_range=(0.0, 2.0), point_size=1)
+        pixels = image_pixels(rasterize_scatter(spec, 5, 3))
+        self.assertEqual(pixels[2, 0], DEFAULT_COLOR)
+        self.assertEqual(pixels[0, 4], DEFAULT_COLOR)
+        self.assertEqual(np.count_nonzero(pixels), 2)
+
+    def test_rasterize_marker_size_and_colors(self):
+        """标记为 point_size 边长的方块，使用逐点颜色并在边缘裁剪"""
+        colors = np.array([0xFFFF0000, 0xFF00FF00], dtype=np.uint32)
+        spec = PlotSpec(
+            np.array([5.0, 0.0]), np.array([5.0, 0.0]), colors=colors, x_range=(0.0, 10.0), y_range=(0.0, 10.0), point_size=3
+        )
+        pixels = image_pixels(rasterize_scatter(spec, 11, 11))
+        np.testing.assert_array_equal(pixels[4:7, 4:7], np.full((3, 3), 0xFFFF0000, dtype=np.uint32))
+        # 左下角的标记只剩图像内的 2×2
+        self.assertEqual(np.count_nonzero(pixels == 0xFF00FF00), 4)
+        self.assertEqual(np.count_nonzero(pixels), 13)
+
+    def test_density_matches_histogram(self):
+        """密度图的非空像素与逐像素计数一致，越界与 NaN 的点不计入，计数越多取色越靠后"""
+        rng = np.random.default_rng(1)
+        x = rng.normal(5.0, 2.0, 50_000)
+        y = rng.normal(5.0, 1.0, 50_000)
+        y[::100] = np.nan
+        width, height = 40, 30
+        pixels = image_pixels(rasterize_density(x, y, (0.0, 10.0), (0.0, 10.0), width, height))
+
+        columns, rows, valid = to_pixels(x, y, (0.0, 10.0), (0.0, 10.0), width, height)
+        counts = np.zeros((height, width), dtype=np.int64)
+        np.add.at(counts, (rows[valid], columns[valid]), 1)
+        np.testing.assert_array_equal(pixels != 0, counts > 0)
+
+        lut_index = {int(color): i for i, color in enumerate(DENSITY_COLORMAP)}
+        levels = np.array([lut_index[int(p)] for p in pixels[counts > 0]])
+        order = np.argsort(counts[counts > 0], kind="stable")
+        self.assertTrue(np.all(np.diff(levels[order]) >= 0))
+        self.assertEqual(levels.max(), DENSITY_COLORMAP.size - 1)
+
+    def test_density_row_offsets_reuse(self):
+        """复用预先计算的行偏移与直接计算的结果相同"""
+        rng = np.random.default_rng(2)
+        x, y = rng.random(1000), rng.random(1000)
+        offsets = density_row_offsets(y, (0.0, 1.0), 20, 10)
+        direct = image_pixels(rasterize_density(x[100:500], y[100:500], (0.0, 1.0), (0.0, 1.0), 20, 10))
+        reused = image_pixels(
+            rasterize_density(x[100:500], y[100:500], (0.0, 1.0), (0.0, 1.0), 20, 10, row_offsets=offsets[100:500])
+        )
+        np.testing.assert_array_equal(direct, reused)
+
+    def test_label_colors(self):
+        """标签按调色板循环取色，噪声为灰色"""
+        colors = label_colors(np.array([0, 1, LABEL_PALETTE.size, -1]))
+        np.testing.assert_array_equal(colors, [LABEL_PALETTE[0], LABEL_PALETTE[1], LABEL_PALETTE[0], NOISE_COLOR])
+
+    def test_color_table(self):
+        """颜色表按需扩展，负键为 missing，超大的键按调色板取模"""
+        table = ColorTable(LABEL_PALETTE, NOISE_COLOR, size=4)
+        keys = np.array([3, 4, 25, -1, -7, 2_000_003])
+        expected = [LABEL_PALETTE[3], LABEL_PALETTE[4], LABEL_PALETTE[5], NOISE_COLOR, NOISE_COLOR, LABEL_PALETTE[3]]
+        np.testing.assert_array_equal(table(keys), expected)
+        self.assertEqual(table(np.array([], dtype=int)).size, 0)
+
+    def test_marker_sprite(self):
+        """小标记为完整覆盖的方块，圆形标记的角上为部分覆盖且先于中心写入"""
+        square = marker_sprite(2)
+        self.assertEqual(len(square.rows), 4)
+        self.assertTrue(np.all(square.coverage == 255))
+
+        disc = marker_sprite(3)
+        self.assertEqual(len(disc.rows), 9)
+        corners = (np.abs(disc.rows) == 1) & (np.abs(disc.columns) == 1)
+        self.assertTrue(np.all(disc.coverage[corners] < 255))
+        self.assertTrue(np.all(disc.coverage[~corners] == 255))
+        self.assertTrue(np.all(np.diff(disc.coverage.astype(int)) >= 0))
+
+    def test_sprite_rasterized_with_coverage(self):
+        """部分覆盖的像素写入按覆盖比例缩放的预乘颜色"""
+        color = np.array([0xFF8040C0], dtype=np.uint32)
+        spec = PlotSpec(
+            np.array([5.0]), np.array([5.0]), colors=color, x_range=(0.0, 10.0), y_range=(0.0, 10.0),
+            point_size=3, sprite=marker_sprite(3),
+        )
+        pixels = image_pixels(rasterize_scatter(spec, 11, 11))
+        self.assertEqual(pixels[5, 5], 0xFF8040C0)
+        self.assertEqual(pixels[4, 5], 0xFF8040C0)
+        corner = int(marker_sprite(3).coverage[0])
+        self.assertEqual(pixels[4, 4] >> 24, 0xFF * corner >> 8)
+
+    def test_data_range(self):
+        """数据范围带留白，忽略非有限值，退化情况有合理的缺省值"""
+        self.assertEqual(data_range(np.array([0.0, 10.0, np.nan])), (-0.2, 10.2))
+        self.assertEqual(data_range(np.array([3.0, 3.0])), (2.5, 3.5))
+        self.assertEqual(data_range(np.array([np.nan])), (0.0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+绘图配色测试
+验证各主题的配色、标记缓存，以及主题不变时复用同一配色
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+from qfluentwidgets import Theme
+
+from models.utils.plot_raster import LABEL_PALETTE, NOISE_COLOR
+from models.utils.plot_style import DARK_LABEL_PALETTE, DARK_NOISE_COLOR, UNKNOWN_CLASS_COLOR, plot_style
+
+
+class TestPlotStyle(unittest.TestCase):
+    """绘图配色测试"""
+
+    def test_theme_palettes(self):
+        """浅色与深色主题使用各自的簇标签配色"""
+        labels = np.array([0, 1, -1])
+        light, dark = plot_style(Theme.LIGHT), plot_style(Theme.DARK)
+        np.testing.assert_array_equal(light.colors(labels), [LABEL_PALETTE[0], LABEL_PALETTE[1], NOISE_COLOR])
+        np.testing.assert_array_equal(dark.colors(labels), [DARK_LABEL_PALETTE[0], DARK_LABEL_PALETTE[1], DARK_NOISE_COLOR])
+        self.assertNotEqual(light.default_color, dark.default_color)
+
+    def test_class_colors(self):
+        """识别类别使用单独的配色，未知类别为灰色"""
+        style = plot_style(Theme.LIGHT)
+        colors = style.colors(np.array([0, -1]), kind="class")
+        self.assertEqual(colors[1], UNKNOWN_CLASS_COLOR)
+        self.assertNotEqual(colors[0], style.colors(np.array([0]))[0])
+
+    def test_cached_until_theme_changes(self):
+        """主题不变时返回同一配色与同一标记，主题变化后重新生成一次"""
+        style = plot_style(Theme.LIGHT)
+        self.assertIs(plot_style(Theme.LIGHT), style)
+        self.assertIs(style.sprite(3), style.sprite(3))
+        dark = plot_style(Theme.DARK)
+        self.assertIsNot(dark, style)
+        self.assertIs(plot_style(Theme.DARK), dark)
+
+
+if __name__ == "__main__":
+    unittest.main()
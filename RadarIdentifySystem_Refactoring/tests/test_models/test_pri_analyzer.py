@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+PRI 分析器测试
+验证固定、抖动、参差与交错重频（含覆盖时间段不同的交错信号）的识别结果
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+import numpy as np
+
+from models.data.cluster_params import PriType
+from models.data.pulse_columns import PulseColumn
+from models.processors.pri_analyzer import PriAnalyzer
+from models.utils.segment_ops import build_segments
+
+
+def _make_slice(rng: np.random.Generator):
+    """构造包含多种重频类型的切片数据
+
+    Returns:
+        (pulses, labels): 打乱顺序后的脉冲数据与标签
+    """
+    interleaved = np.sort(np.r_[np.arange(0, 30000, 173.0), 7 + np.arange(0, 30000, 411.0)])
+    missing = np.arange(0, 12000, 120.0)
+    trains = {
+        0: 3 + np.arange(100) * 100.0 + rng.normal(0, 0.2, 100),
+        1: np.cumsum(150.0 * (1 + rng.uniform(-0.2, 0.2, 80))),
+        2: np.cumsum(np.tile([200.0, 320.0, 450.0], 30)),
+        3: np.cumsum(np.tile([200.0, 200.0, 300.0], 30)),
+        4: interleaved,
+        5: missing[rng.uniform(size=missing.size) > 0.15],
+        6: np.array([10.0, 40.0, 90.0]),
+    }
+    toa = np.concatenate(list(trains.values()))
+    labels = np.concatenate([np.full(train.size, label) for label, train in trains.items()])
+    pulses = rng.uniform(0, 1, (toa.size, 5))
+    pulses[:, PulseColumn.TOA] = toa
+
+    perm = rng.permutation(toa.size)
+    return pulses[perm], labels[perm]
+
+
+class TestPriAnalyzer(unittest.TestCase):
+    """PriAnalyzer 单元测试"""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """构造测试数据并完成一次分析"""
+        cls.pulses, cls.labels = _make_slice(np.random.default_rng(0))
+        cls.result = PriAnalyzer().analyze(cls.pulses, cls.labels)
+        cls.index = {int(label): k for k, label in enumerate(cls.result.labels)}
+
+    def _type_of(self, label: int) -> PriType:
+        return PriType(self.result.pri_type[self.index[label]])
+
+    def _pris_of(self, label: int) -> np.ndarray:
+        return self.result.pris_of(self.index[label])
+
+    def test_constant(self) -> None:
+        """固定重频（含漏脉冲）应输出单一 PRI 且抖动量很小"""
+        for label, pri in ((0, 100.0), (5, 120.0)):
+            self.assertEqual(self._type_of(label), PriType.CONSTANT)
+            np.testing.assert_allclose(self._pris_of(label), [pri], rtol=1e-3)
+            self.assertLess(self.result.jitter[self.index[label]], 0.01)
+
+    def test_jitter(self) -> None:
+        """±20% 抖动应识别为单一抖动重频"""
+        self.assertEqual(self._type_of(1), PriType.JITTER)
+        np.testing.assert_allclose(self._pris_of(1), [150.0], rtol=0.05)
+        self.assertGreater(self.result.jitter[self.index[1]], 0.05)
+
+    def test_stagger(self) -> None:
+        """参差重频应给出档位、帧周期与子周期序列"""
+        k = self.index[2]
+        self.assertEqual(self._type_of(2), PriType.STAGGER)
+        np.testing.assert_allclose(self._pris_of(2), [200.0, 320.0, 450.0], atol=1.0)
+        np.testing.assert_allclose(self.result.frame_period[k], 970.0, atol=1.0)
+        np.testing.assert_allclose(self.result.pattern_of(k), [200.0, 320.0, 450.0], atol=1.0)
+
+        k = self.index[3]
+        self.assertEqual(self._type_of(3), PriType.STAGGER)
+        np.testing.assert_allclose(self.result.frame_period[k], 700.0, atol=1.0)
+        np.testing.assert_allclose(self.result.pattern_of(k), [200.0, 300.0, 200.0], atol=1.0)
+
+    def test_interleaved(self) -> None:
+        """交错的两部固定重频信号应分别给出两个 PRI"""
+        self.assertEqual(self._type_of(4), PriType.MULTIPLE)
+        np.testing.assert_allclose(self._pris_of(4), [173.0, 411.0], atol=1.0)
+
+    def test_interleaved_unequal_span(self) -> None:
+        """脉冲数相同、覆盖时间段不同的两列交错信号不应合并为一个抖动重频"""
+        for n_pulses, pris in ((150, (97.0, 131.0)), (60, (173.0, 411.0)), (100, (100.0, 230.0))):
+            toa = np.sort(np.r_[np.arange(n_pulses) * pris[0], 7 + np.arange(n_pulses) * pris[1]])
+            pulses = np.zeros((toa.size, 5))
+            pulses[:, PulseColumn.TOA] = toa
+            result = PriAnalyzer().analyze(pulses, np.zeros(toa.size, dtype=np.int64))
+            self.assertEqual(PriType(result.pri_type[0]), PriType.MULTIPLE, pris)
+            np.testing.assert_allclose(result.pris_of(0), pris, atol=1.0)
+
+    def test_too_few_pulses(self) -> None:
+        """脉冲数不足的簇保持 UNKNOWN"""
+        self.assertEqual(self._type_of(6), PriType.UNKNOWN)
+        self.assertEqual(self.result.pri_count[self.index[6]], 0)
+
+    def test_chunked_sdif(self) -> None:
+        """分块建立直方图与一次建立全部簇的结果一致，子集直方图与全部簇的对应行一致"""
+        analyzer = PriAnalyzer()
+        analyzer.SDIF_CHUNK = 2
+        chunked = analyzer.analyze(self.pulses, self.labels)
+        np.testing.assert_array_equal(chunked.pri_type, self.result.pri_type)
+        np.testing.assert_array_equal(chunked.pri_values, self.result.pri_values)
+        np.testing.assert_array_equal(chunked.stagger_pattern, self.result.stagger_pattern)
+
+        segments = build_segments(self.labels, self.pulses[:, PulseColumn.TOA])
+        toa = segments.gather(self.pulses[:, PulseColumn.TOA])
+        full = analyzer.sdif(toa, segments)
+        subset = analyzer.sdif(toa, segments, np.array([1, 4, 5]))
+        self.assertEqual(full.shape, (analyzer.max_order, segments.n_clusters, analyzer.n_bins))
+        np.testing.assert_array_equal(subset, full[:, [1, 4, 5]])
+
+    def test_empty_slice(self) -> None:
+        """全部为噪声时返回空结果"""
+        result = PriAnalyzer().analyze(self.pulses, np.full(self.labels.size, -1))
+        self.assertEqual(result.n_clusters, 0)
+        self.assertEqual(result.pri_values.shape[0], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+绘图结果缓存测试
+验证按字节数上限的最近最少使用淘汰
+"""
+
+import sys
+import os
+import unittest
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+from models.utils.render_cache import RenderCache
+
+MB = 1024 * 1024
+
+
+class TestRenderCache(unittest.TestCase):
+    """绘图结果缓存测试"""
+
+    def test_evicts_least_recently_used(self):
+        """超出上限时淘汰最久未使用的条目，get 会刷新使用顺序"""
+        cache = RenderCache(max_mb=3)
+        cache.put(0, "a", MB)
+        cache.put(1, "b", MB)
+        cache.put(2, "c", MB)
+        self.assertEqual(cache.get(0), "a")
+        cache.put(3, "d", MB)
+        self.assertNotIn(1, cache)
+        self.assertEqual([key for key in (0, 2, 3) if key in cache], [0, 2, 3])
+        self.assertEqual(cache.total_bytes, 3 * MB)
+
+    def test_replace_and_discard(self):
+        """替换条目时更新字节数，discard 与 clear 释放字节数"""
+        cache = RenderCache(max_mb=10)
+        cache.put("x", 1, 2 * MB)
+        cache.put("x", 2, 3 * MB)
+        self.assertEqual(cache.get("x"), 2)
+        self.assertEqual(cache.total_bytes, 3 * MB)
+        cache.discard("x")
+        cache.discard("missing")
+        self.assertEqual(cache.total_bytes, 0)
+        cache.put("y", 1, MB)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get("y"))
+
+    def test_oversized_entry_and_new_limit(self):
+        """超过上限的单个条目不缓存，降低上限时立即淘汰"""
+        cache = RenderCache(max_mb=2)
+        cache.put("big", 0, 3 * MB)
+        self.assertNotIn("big", cache)
+        cache.put(0, 0, MB)
+        cache.put(1, 1, MB)
+        cache.set_limit(1)
+        self.assertNotIn(0, cache)
+        self.assertIn(1, cache)
+        self.assertEqual(cache.total_bytes, MB)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+绘图渲染服务测试
+验证结果经 rendered 信号送达、失败经 failed 信号送达，同一目标只保留最新请求，取消的请求不再送达
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+
+from PyQt6.QtWidgets import QApplication
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+from models.services.render_service import RenderService
+
+
+class TestRenderService(unittest.TestCase):
+    """绘图渲染服务测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def setUp(self):
+        self.service = RenderService(max_threads=1)
+        self.results = []
+        self.service.rendered.connect(lambda target, request_id, result: self.results.append((target, result)))
+
+    def tearDown(self):
+        self.service.shutdown()
+
+    def wait(self, *targets):
+        """处理事件直到各目标没有待完成的请求"""
+        deadline = time.monotonic() + 5
+        while any(self.service.is_pending(t) for t in targets) and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.005)
+        self.app.processEvents()
+
+    def test_result_delivered(self):
+        """结果在界面线程中经 rendered 信号送达"""
+        self.service.submit("a", lambda x: x * 2, 21)
+        self.wait("a")
+        self.assertEqual(self.results, [("a", 42)])
+
+    def test_only_latest_request_delivered(self):
+        """同一目标连续提交时只送达最新请求的结果"""
+        release = threading.Event()
+        self.service.submit("block", release.wait)
+        for value in range(5):
+            self.service.submit("a", lambda x: x, value)
+        release.set()
+        self.wait("block", "a")
+        self.assertEqual([r for r in self.results if r[0] == "a"], [("a", 4)])
+
+    def test_cancel(self):
+        """取消的请求不再送达，其它目标不受影响"""
+        release = threading.Event()
+        self.service.submit("block", release.wait)
+        self.service.submit("a", lambda: "a")
+        self.service.submit("b", lambda: "b")
+        self.service.cancel("a")
+        self.assertFalse(self.service.is_pending("a"))
+        release.set()
+        self.wait("block", "b")
+        self.assertEqual([r for r in self.results if r[0] != "block"], [("b", "b")])
+
+    def test_failure_clears_pending(self):
+        """渲染失败时不送达结果而发出 failed 信号，目标不再有待完成的请求"""
+        failures = []
+        self.service.failed.connect(lambda target, request_id, message: failures.append((target, request_id, message)))
+        request_id = self.service.submit("a", lambda: 1 / 0)
+        self.wait("a")
+        self.assertFalse(self.service.is_pending("a"))
+        self.assertEqual(self.results, [])
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0][:2], ("a", request_id))
+        self.assertIn("ZeroDivisionError", failures[0][2])
+
+
+if __name__ == "__main__":
+    unittest.main()
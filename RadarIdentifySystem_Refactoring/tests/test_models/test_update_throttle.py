@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+界面更新节流测试
+验证更新频率受限、只保留最新结果或保留全部结果，以及处理线程提交时不阻塞
+"""
+
+import sys
+import os
+import threading
+import time
+import unittest
+
+from PyQt6.QtWidgets import QApplication
+
+# 添加项目根目录到Python路径
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../.."))
+
+from models.utils.update_throttle import UpdateThrottle
+
+
+class TestUpdateThrottle(unittest.TestCase):
+    """界面更新节流测试"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication.instance() or QApplication([])
+
+    def run_events(self, seconds):
+        """处理一段时间的事件"""
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.002)
+
+    def post_from_thread(self, throttle, count, delay=0.0):
+        """在工作线程中连续提交 0..count-1，返回线程"""
+        def work():
+            for i in range(count):
+                throttle.post(i)
+                if delay:
+                    time.sleep(delay)
+        thread = threading.Thread(target=work)
+        thread.start()
+        return thread
+
+    def test_latest_only(self):
+        """只保留最新结果：最后一次更新为最后提交的结果，中间结果被跳过"""
+        throttle = UpdateThrottle(rate=20)
+        updates = []
+        throttle.flushed.connect(updates.append)
+        thread = self.post_from_thread(throttle, 1000)
+        thread.join()
+        self.run_events(0.2)
+        self.assertEqual(updates[-1], 999)
+        self.assertEqual(len(updates) + throttle.dropped, 1000)
+        self.assertLess(len(updates), 10)
+
+    def test_keep_all(self):
+        """保留全部结果：各次更新按顺序拼起来为全部提交的结果"""
+        throttle = UpdateThrottle(rate=20, keep_all=True)
+        updates = []
+        throttle.flushed.connect(updates.append)
+        thread = self.post_from_thread(throttle, 200, delay=0.001)
+        while thread.is_alive():
+            self.run_events(0.01)
+        self.run_events(0.2)
+        self.assertEqual([v for batch in updates for v in batch], list(range(200)))
+        self.assertGreater(len(updates), 1)
+
+    def test_rate_limited(self):
+        """持续提交时更新间隔不小于设定周期"""
+        throttle = UpdateThrottle(rate=20)
+        times = []
+        throttle.flushed.connect(lambda value: times.append(time.monotonic()))
+        thread = self.post_from_thread(throttle, 300, delay=0.001)
+        while thread.is_alive():
+            self.run_events(0.01)
+        self.run_events(0.1)
+        gaps = [b - a for a, b in zip(times, times[1:])]
+        self.assertGreater(len(gaps), 2)
+        self.assertGreaterEqual(min(gaps), 0.04)
+
+    def test_post_does_not_block(self):
+        """界面线程不处理事件时提交也立即返回"""
+        throttle = UpdateThrottle(rate=10)
+        thread = self.post_from_thread(throttle, 10000)
+        thread.join(timeout=2)
+        self.assertFalse(thread.is_alive())
+        throttle.clear()
+
+    def test_flush_and_clear(self):
+        """flush 立即发出尚未发出的结果，clear 丢弃"""
+        throttle = UpdateThrottle(rate=1)
+        updates = []
+        throttle.flushed.connect(updates.append)
+        throttle.post("a")
+        throttle.flush()
+        self.assertEqual(updates, ["a"])
+        throttle.post("b")
+        throttle.clear()
+        self.run_events(0.05)
+        throttle.flush()
+        self.assertEqual(updates, ["a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
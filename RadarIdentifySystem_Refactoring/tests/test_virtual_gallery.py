@@ -0,0 +1,41 @@
+# coding:utf-8
+"""
+测试VirtualGallery虚拟化卡片画廊的控件复用
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import unittest
+from PyQt6.QtWidgets import QApplication, QWidget
+
+from views.base.virtual_gallery import VirtualGallery
+
+
+class TestVirtualGallery(unittest.TestCase):
+    """测试VirtualGallery在各种宽度与间距下的控件复用"""
+
+    @classmethod
+    def setUpClass(cls):
+        """设置测试类"""
+        cls.app = QApplication.instance() or QApplication([])
+
+    def test_visible_cards_never_share_widget(self):
+        """任意宽度、间距与滚动位置下，可见卡片数不超过控件数，且每张可见卡片绑定在各自的控件上"""
+        for spacing in (0, 3, 5):
+            gallery = VirtualGallery(QWidget, lambda card, index: None, visibleCards=5, spacing=spacing)
+            for width in range(40, 140, 7):
+                gallery.viewport.resize(width, 50)
+                gallery.setCount(50)
+                for offset in range(0, gallery.scrollBar.maximum() + 1, 3):
+                    gallery.scrollBar.setValue(offset)
+                    visible = gallery.visibleRange()
+                    self.assertLessEqual(len(visible), len(gallery.cards()), (spacing, width, offset))
+                    for index in visible:
+                        self.assertEqual(gallery._bound[index % len(gallery.cards())], index)
+            gallery.deleteLater()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,13 +1,17 @@
 from .icon_option_widget import OptionsWithIcon
+from .plot_widget import PlotWidget
 from .range_slider import RangeSlider
 from .step_slider import StepSlider
 from .subtitle_widget import SubTitle
+from .virtual_gallery import VirtualGallery
 
 
 
 __all__ = [
     'OptionsWithIcon',
+    'PlotWidget',
     'RangeSlider',
     'StepSlider',
     'SubTitle',
+    'VirtualGallery',
 ]
\ No newline at end of file
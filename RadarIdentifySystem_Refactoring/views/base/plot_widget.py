@@ -0,0 +1,431 @@
+# coding:utf-8
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+from PyQt6.QtCore import Qt, QPointF, QRect, QRectF, QSize, pyqtSignal
+from PyQt6.QtGui import QColor, QImage, QMouseEvent, QPainter, QPaintEvent, QPixmap, QResizeEvent, QWheelEvent
+from PyQt6.QtWidgets import QWidget
+
+from qfluentwidgets import isDarkTheme, qconfig
+
+from models.services.render_service import RenderService, render_service
+from models.utils.plot_decimation import DecimatedSeries
+from models.utils.plot_style import plot_style
+
+
+def niceTicks(low: float, high: float, count: int = 4) -> List[float]:
+    """
+    计算坐标轴刻度
+
+    刻度间隔取 1、2、5 乘以 10 的整数次幂中最接近 (high - low) / count 的值。
+
+    Args:
+        low (float): 轴下限
+        high (float): 轴上限
+        count (int): 期望的刻度数
+
+    Returns:
+        List[float]: 落在 [low, high] 内的刻度值
+    """
+    span = high - low
+    if not math.isfinite(span) or span <= 0:
+        return []
+    raw = span / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = min((m * magnitude for m in (1, 2, 5, 10)), key=lambda s: abs(s - raw))
+    first = math.ceil(low / step) * step
+    return [first + i * step for i in range(int((high - first) / step) + 1)]
+
+
+class PlotWidget(QWidget):
+    """
+    散点图组件
+
+    数据点由 NumPy 数组直接栅格化为图像（见 models.utils.plot_raster），
+    绘制时只有坐标轴、刻度与标题通过 QPainter 绘制，数据区域是一次图像绘制。
+    图像在数据、坐标范围或尺寸变化后的首次绘制时重新生成。
+
+    数据保存为 DecimatedSeries，每次栅格化只取可见横轴范围内按像素列抽稀后的点；
+    滚轮以光标为中心缩放横轴，左键拖动平移，双击恢复完整范围。
+    设置了密度阈值时，可见点数达到阈值改为绘制按像素计数的密度图。
+
+    栅格化默认交给渲染服务（models.services.render_service）在线程池中执行，界面线程只绘制图像；
+    新图像到达前，上一幅图像按新旧横轴范围的对应关系平移、缩放后绘制，缩放与平移时立即有反馈。
+
+    按标签着色的序列在栅格化时按当前主题的配色（models.utils.plot_style）取色，
+    切换主题后各图只需重新栅格化。
+    """
+
+    MARGINS = (48, 22, 10, 22)  # 左、上、右、下
+    ZOOM_STEP = 0.8  # 滚轮每格的缩放比例
+
+    # 用户缩放或平移后的横轴范围
+    xRangeChanged = pyqtSignal(float, float)
+
+    def __init__(self, title: str = "", parent: Optional[QWidget] = None):
+        """
+        初始化散点图组件
+
+        Args:
+            title (str): 标题
+            parent (QWidget, optional): 父组件. Defaults to None.
+        """
+        super().__init__(parent)
+        self._title = title
+        self._series: Optional[DecimatedSeries] = None
+        self._x_range: Optional[Tuple[float, float]] = None
+        self._y_range: Optional[Tuple[float, float]] = None
+        self._point_size = 2
+        self._density_threshold: Optional[int] = None
+        self._density = False
+        self._pixmap: Optional[QPixmap] = None
+        self._pixmap_range: Optional[Tuple[float, float]] = None
+        # 上一幅图像及其横轴范围，新图像到达前代替绘制
+        self._stale: Optional[Tuple[QPixmap, Tuple[float, float]]] = None
+        self._render_service: Optional[RenderService] = None
+        self._request: Optional[int] = None
+        self.setRenderService(render_service)
+        self._drag_start: Optional[Tuple[float, Tuple[float, float]]] = None
+        self.setMinimumSize(160, 140)
+        qconfig.themeChanged.connect(self._invalidate)
+
+    def title(self) -> str:
+        """标题"""
+        return self._title
+
+    def setTitle(self, title: str) -> None:
+        """设置标题"""
+        self._title = title
+        self.update()
+
+    def series(self) -> Optional[DecimatedSeries]:
+        """当前的散点序列"""
+        return self._series
+
+    def setData(
+        self,
+        x: np.ndarray,
+        y: np.ndarray,
+        colors: Optional[np.ndarray] = None,
+        x_range: Optional[Tuple[float, float]] = None,
+        y_range: Optional[Tuple[float, float]] = None,
+        point_size: int = 2,
+        labels: Optional[np.ndarray] = None,
+    ) -> None:
+        """
+        设置散点数据
+
+        Args:
+            x (np.ndarray): 横坐标
+            y (np.ndarray): 纵坐标
+            colors (np.ndarray, optional): 每个点的颜色（ARGB32）
+            x_range (Tuple[float, float], optional): 横轴范围，缺省时取数据范围
+            y_range (Tuple[float, float], optional): 纵轴范围，缺省时取数据范围
+            point_size (int): 标记边长（像素）
+            labels (np.ndarray, optional): 每个点的簇标签，按当前主题的配色着色
+        """
+        self.setSeries(DecimatedSeries(x, y, colors, labels), x_range, y_range, point_size)
+
+    def setSeries(
+        self,
+        series: DecimatedSeries,
+        x_range: Optional[Tuple[float, float]] = None,
+        y_range: Optional[Tuple[float, float]] = None,
+        point_size: int = 2,
+    ) -> None:
+        """
+        设置已建立抽稀金字塔的散点序列，多个图共用同一横坐标时可避免重复排序
+
+        Args:
+            series (DecimatedSeries): 散点序列
+            x_range (Tuple[float, float], optional): 横轴范围，缺省时取数据范围
+            y_range (Tuple[float, float], optional): 纵轴范围，缺省时取数据范围
+            point_size (int): 标记边长（像素）
+        """
+        self._series = series
+        # 新数据不沿用旧图像
+        self._pixmap = self._stale = None
+        self._x_range = x_range if x_range is not None else series.x_range
+        self._y_range = y_range if y_range is not None else series.y_range
+        self._point_size = point_size
+        self._invalidate()
+
+    def clear(self) -> None:
+        """清除数据"""
+        self._series = None
+        self._pixmap = self._stale = None
+        self._x_range = self._y_range = None
+        if self._render_service is not None:
+            self._render_service.cancel(id(self))
+        self._invalidate()
+
+    def renderService(self) -> Optional[RenderService]:
+        """栅格化使用的渲染服务，None 表示在界面线程中栅格化"""
+        return self._render_service
+
+    def setRenderService(self, service: Optional[RenderService]) -> None:
+        """
+        设置栅格化使用的渲染服务
+
+        Args:
+            service (RenderService, optional): 渲染服务，None 表示在界面线程中同步栅格化
+        """
+        if self._render_service is not None:
+            self._render_service.cancel(id(self))
+            self._render_service.rendered.disconnect(self._onRendered)
+        self._render_service = service
+        self._request = None
+        if service is not None:
+            service.rendered.connect(self._onRendered)
+
+    def densityThreshold(self) -> Optional[int]:
+        """切换为密度图的可见点数阈值，None 表示始终绘制散点"""
+        return self._density_threshold
+
+    def setDensityThreshold(self, threshold: Optional[int]) -> None:
+        """
+        设置切换为密度图的可见点数阈值
+
+        Args:
+            threshold (int, optional): 点数阈值，None 表示始终绘制散点
+        """
+        if threshold != self._density_threshold:
+            self._density_threshold = threshold
+            self._invalidate()
+
+    def isDensity(self) -> bool:
+        """最近一次绘制是否为密度图"""
+        return self._density
+
+    def xRange(self) -> Optional[Tuple[float, float]]:
+        """当前的横轴范围"""
+        return self._x_range
+
+    def setXRange(self, low: float, high: float) -> None:
+        """
+        设置横轴范围（不发送 xRangeChanged），超出数据范围的部分被截去
+
+        Args:
+            low (float): 下限
+            high (float): 上限
+        """
+        if self._series is None:
+            return
+        x_range = self._clampXRange(low, high)
+        if x_range != self._x_range:
+            self._x_range = x_range
+            self._invalidate()
+
+    def resetXRange(self) -> None:
+        """恢复完整的横轴范围"""
+        if self._series is not None:
+            self._changeXRange(*self._series.x_range)
+
+    def plotRect(self) -> QRect:
+        """数据区域（逻辑坐标）"""
+        left, top, right, bottom = self.MARGINS
+        return self.rect().adjusted(left, top, -right, -bottom)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """尺寸变化后重新栅格化"""
+        super().resizeEvent(event)
+        self._invalidate()
+
+    def paintEvent(self, event: QPaintEvent) -> None:
+        """绘制坐标轴与数据图像"""
+        painter = QPainter(self)
+        foreground = QColor(255, 255, 255, 200) if isDarkTheme() else QColor(0, 0, 0, 200)
+        grid = QColor(foreground)
+        grid.setAlpha(40)
+        rect = self.plotRect()
+
+        if self._series is not None and rect.width() > 1 and rect.height() > 1:
+            if self._pixmap is None:
+                self._render()
+            self._drawTicks(painter, rect, foreground, grid)
+            if self._pixmap is not None:
+                painter.drawPixmap(rect.topLeft(), self._pixmap)
+            elif self._stale is not None:
+                self._drawStale(painter, rect)
+
+        painter.setPen(foreground)
+        title = f"{self._title}（密度）" if self._density and self._series is not None else self._title
+        painter.drawText(QRect(0, 0, self.width(), self.MARGINS[1]), Qt.AlignmentFlag.AlignCenter, title)
+        painter.setPen(grid)
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRect(rect)
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """以光标为中心缩放横轴"""
+        if self._series is None:
+            return super().wheelEvent(event)
+        factor = self.ZOOM_STEP ** (event.angleDelta().y() / 120)
+        center = self._dataX(event.position())
+        low, high = self._x_range
+        self._changeXRange(center - (center - low) * factor, center + (high - center) * factor)
+        event.accept()
+
+    def mousePressEvent(self, event: QMouseEvent) -> None:
+        """左键开始平移"""
+        if self._series is not None and event.button() == Qt.MouseButton.LeftButton:
+            self._drag_start = (event.position().x(), self._x_range)
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event: QMouseEvent) -> None:
+        """拖动时按像素位移平移横轴"""
+        if self._drag_start is None:
+            return super().mouseMoveEvent(event)
+        start_x, (low, high) = self._drag_start
+        shift = (start_x - event.position().x()) / max(self.plotRect().width(), 1) * (high - low)
+        self._changeXRange(low + shift, high + shift)
+        event.accept()
+
+    def mouseReleaseEvent(self, event: QMouseEvent) -> None:
+        """结束平移"""
+        self._drag_start = None
+        super().mouseReleaseEvent(event)
+
+    def mouseDoubleClickEvent(self, event: QMouseEvent) -> None:
+        """双击恢复完整范围"""
+        self.resetXRange()
+        super().mouseDoubleClickEvent(event)
+
+    def renderSize(self) -> QSize:
+        """数据区域图像的尺寸（设备像素）"""
+        rect, ratio = self.plotRect(), self.devicePixelRatioF()
+        return QSize(round(rect.width() * ratio), round(rect.height() * ratio))
+
+    def setRendered(self, pixmap: QPixmap, density: bool) -> bool:
+        """
+        使用预先栅格化的数据区域图像（须按当前序列、坐标范围与密度阈值生成）
+
+        Args:
+            pixmap (QPixmap): 数据区域图像
+            density (bool): 图像是否为密度图
+
+        Returns:
+            bool: 图像尺寸与当前数据区域一致而被采用时为 True
+        """
+        if self._series is None or pixmap.size() != self.renderSize():
+            return False
+        if self._render_service is not None:
+            self._render_service.cancel(id(self))
+        self._request = None
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self._pixmap = pixmap
+        self._pixmap_range = self._x_range
+        self._density = density
+        self.update()
+        return True
+
+    def _render(self) -> None:
+        """按设备像素栅格化可见范围：点数达到密度阈值时绘制密度图，否则抽稀后绘制散点
+
+        有渲染服务时只提交请求（同一状态只提交一次），结果由 _onRendered 接收。
+        """
+        size = self.renderSize()
+        args = (
+            self._x_range, self._y_range, size.width(), size.height(),
+            self._point_size, self._density_threshold, plot_style(),
+        )
+        if self._render_service is None:
+            image, density = self._series.render(*args)
+            self._setImage(image, density)
+        elif self._request is None:
+            self._request = self._render_service.render_plot(id(self), self._series, *args)
+
+    def _onRendered(self, target: int, request_id: int, result: Tuple[QImage, bool]) -> None:
+        """接收渲染服务的结果，只采用本控件最新请求且尺寸仍一致的图像"""
+        if target != id(self) or request_id != self._request:
+            return
+        self._request = None
+        image, density = result
+        if image.size() != self.renderSize():
+            # 请求期间尺寸已变化，按新尺寸重新请求
+            self.update()
+            return
+        self._setImage(image, density)
+        self.update()
+
+    def _setImage(self, image: QImage, density: bool) -> None:
+        """把栅格化结果转换为当前图像"""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self._pixmap = pixmap
+        self._pixmap_range = self._x_range
+        self._density = density
+
+    def _drawStale(self, painter: QPainter, rect: QRect) -> None:
+        """按新旧横轴范围的对应关系绘制上一幅图像"""
+        pixmap, (old_low, old_high) = self._stale
+        low, high = self._x_range
+        scale = rect.width() / (high - low)
+        target = QRectF(
+            rect.left() + (old_low - low) * scale, rect.top(), (old_high - old_low) * scale, rect.height()
+        )
+        painter.save()
+        painter.setClipRect(rect)
+        painter.drawPixmap(target, pixmap, QRectF(pixmap.rect()))
+        painter.restore()
+
+    def _dataX(self, position: QPointF) -> float:
+        """控件坐标对应的横轴数据值"""
+        rect = self.plotRect()
+        low, high = self._x_range
+        return low + (position.x() - rect.left()) / max(rect.width(), 1) * (high - low)
+
+    def _clampXRange(self, low: float, high: float) -> Tuple[float, float]:
+        """把横轴范围限制在完整范围内，保持宽度不小于完整范围的百万分之一"""
+        full_low, full_high = self._series.x_range
+        full_span = full_high - full_low
+        span = min(max(high - low, full_span * 1e-6), full_span)
+        low = min(max(low, full_low), full_high - span)
+        return low, low + span
+
+    def _changeXRange(self, low: float, high: float) -> None:
+        """用户操作改变横轴范围，发送 xRangeChanged"""
+        x_range = self._clampXRange(low, high)
+        if x_range != self._x_range:
+            self._x_range = x_range
+            self._invalidate()
+            self.xRangeChanged.emit(*x_range)
+
+    def _drawTicks(self, painter: QPainter, rect: QRect, foreground: QColor, grid: QColor) -> None:
+        """绘制网格线与刻度标签"""
+        (x_low, x_high), (y_low, y_high) = self._x_range, self._y_range
+        metrics = painter.fontMetrics()
+        text_end = -math.inf
+        for value in niceTicks(x_low, x_high):
+            x = rect.left() + (value - x_low) / (x_high - x_low) * rect.width()
+            painter.setPen(grid)
+            painter.drawLine(round(x), rect.top(), round(x), rect.bottom())
+            # 与前一个标签重叠的刻度只画网格线
+            text = f"{value:.4g}"
+            text_start = round(x - metrics.horizontalAdvance(text) / 2)
+            if text_start < text_end:
+                continue
+            painter.setPen(foreground)
+            painter.drawText(text_start, rect.bottom() + metrics.ascent() + 4, text)
+            text_end = text_start + metrics.horizontalAdvance(text) + 4
+        for value in niceTicks(y_low, y_high):
+            y = rect.bottom() - (value - y_low) / (y_high - y_low) * rect.height()
+            painter.setPen(grid)
+            painter.drawLine(rect.left(), round(y), rect.right(), round(y))
+            painter.setPen(foreground)
+            text = f"{value:.4g}"
+            painter.drawText(
+                QRect(0, round(y) - metrics.height() // 2, rect.left() - 4, metrics.height()),
+                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                text,
+            )
+
+    def _invalidate(self) -> None:
+        """数据或坐标范围变化，下次绘制时重新栅格化"""
+        if self._pixmap is not None:
+            self._stale = (self._pixmap, self._pixmap_range)
+        self._pixmap = None
+        self._request = None
+        self.update()
@@ -0,0 +1,160 @@
+# coding:utf-8
+from typing import Callable, List, Optional
+
+from PyQt6.QtCore import QEvent, QObject, Qt, pyqtSignal
+from PyQt6.QtGui import QWheelEvent
+from PyQt6.QtWidgets import QScrollBar, QVBoxLayout, QWidget
+
+
+class VirtualGallery(QWidget):
+    """
+    虚拟化卡片画廊
+
+    横向排列任意数量的卡片，但只创建能同时显示的卡片控件（每屏卡片数加一）。
+    滚动时移出视口的卡片控件移到另一端，通过 bindCard 回调改为显示新的卡片，
+    控件数量与卡片总数无关。
+
+    第 i 张卡片总是由第 i % 控件数 个控件显示，滚动时仍然可见的卡片不会重新绑定。
+    """
+
+    # 可见卡片范围变化，参数为第一张与最后一张可见卡片的序号（不含）
+    visibleRangeChanged = pyqtSignal(int, int)
+
+    def __init__(
+        self,
+        createCard: Callable[[QWidget], QWidget],
+        bindCard: Callable[[QWidget, int], None],
+        visibleCards: int = 5,
+        spacing: int = 5,
+        parent: Optional[QWidget] = None,
+    ):
+        """
+        初始化卡片画廊
+
+        Args:
+            createCard (Callable[[QWidget], QWidget]): 创建卡片控件，参数为父控件
+            bindCard (Callable[[QWidget, int], None]): 让卡片控件显示第 index 张卡片
+            visibleCards (int): 每屏显示的卡片数
+            spacing (int): 卡片间距（像素）
+            parent (QWidget, optional): 父组件. Defaults to None.
+        """
+        super().__init__(parent)
+        self._bindCard = bindCard
+        self._visibleCards = max(int(visibleCards), 1)
+        self._spacing = spacing
+        self._count = 0
+
+        self.viewport = QWidget(self)
+        self.scrollBar = QScrollBar(Qt.Orientation.Horizontal, self)
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+        layout.addWidget(self.viewport, 1)
+        layout.addWidget(self.scrollBar)
+
+        self._cards: List[QWidget] = [createCard(self.viewport) for _ in range(self._visibleCards + 1)]
+        # 各控件当前显示的卡片序号，-1 表示未绑定
+        self._bound: List[int] = [-1] * len(self._cards)
+        for card in self._cards:
+            card.hide()
+        # 卡片不在布局中，视口高度至少容纳卡片
+        self.viewport.setMinimumHeight(max(card.minimumHeight() for card in self._cards))
+
+        self.scrollBar.valueChanged.connect(self._layoutCards)
+        self.viewport.installEventFilter(self)
+        self._updateScrollBar()
+
+    def cards(self) -> List[QWidget]:
+        """全部卡片控件（数量固定为每屏卡片数加一）"""
+        return list(self._cards)
+
+    def count(self) -> int:
+        """卡片总数"""
+        return self._count
+
+    def setCount(self, count: int) -> None:
+        """
+        设置卡片总数，滚动回开头并重新绑定全部可见卡片
+
+        卡片内容变化但总数不变时同样调用本方法刷新。
+
+        Args:
+            count (int): 卡片总数
+        """
+        self._count = max(int(count), 0)
+        self._bound = [-1] * len(self._cards)
+        self.scrollBar.blockSignals(True)
+        self.scrollBar.setValue(0)
+        self.scrollBar.blockSignals(False)
+        self._updateScrollBar()
+        self._layoutCards()
+
+    def visibleRange(self) -> range:
+        """可见卡片的序号范围"""
+        stride = self._stride()
+        first = self.scrollBar.value() // stride
+        last = -(-(self.scrollBar.value() + self.viewport.width()) // stride)
+        return range(min(first, self._count), min(last, self._count))
+
+    def scrollToCard(self, index: int) -> None:
+        """滚动使第 index 张卡片位于最左侧（受滚动范围限制）"""
+        self.scrollBar.setValue(index * self._stride())
+
+    def cardWidth(self) -> int:
+        """
+        卡片宽度（像素）
+
+        向上取整，余下的像素由卡片吸收：视口宽度不超过每屏卡片数个卡片间距，
+        任意滚动位置最多同时露出每屏卡片数加一张卡片，不会有两张可见卡片落在同一个控件上。
+        """
+        space = self.viewport.width() - self._spacing * (self._visibleCards - 1)
+        return max(-(-space // self._visibleCards), 1)
+
+    def _stride(self) -> int:
+        """相邻卡片左边缘的间距"""
+        return self.cardWidth() + self._spacing
+
+    def _updateScrollBar(self) -> None:
+        """按卡片总数与视口宽度更新滚动范围"""
+        stride = self._stride()
+        content = max(self._count * stride - self._spacing, 0)
+        self.scrollBar.setRange(0, max(content - self.viewport.width(), 0))
+        self.scrollBar.setSingleStep(stride)
+        self.scrollBar.setPageStep(max(self.viewport.width(), 1))
+        self.scrollBar.setVisible(self._count > self._visibleCards)
+
+    def _layoutCards(self) -> None:
+        """按滚动位置放置卡片控件，移入视口的卡片绑定到空出的控件"""
+        stride, width = self._stride(), self.cardWidth()
+        offset = self.scrollBar.value()
+        visible = self.visibleRange()
+        shown = [False] * len(self._cards)
+        for index in visible:
+            slot = index % len(self._cards)
+            card = self._cards[slot]
+            if self._bound[slot] != index:
+                self._bound[slot] = index
+                self._bindCard(card, index)
+            card.setGeometry(index * stride - offset, 0, width, self.viewport.height())
+            card.show()
+            shown[slot] = True
+        for slot, card in enumerate(self._cards):
+            if not shown[slot]:
+                card.hide()
+        self.visibleRangeChanged.emit(visible.start, visible.stop)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """视口尺寸变化（包括滚动条显示、隐藏）后更新滚动范围与卡片位置"""
+        if watched is self.viewport and event.type() == QEvent.Type.Resize:
+            self._updateScrollBar()
+            self._layoutCards()
+        return super().eventFilter(watched, event)
+
+    def wheelEvent(self, event: QWheelEvent) -> None:
+        """横向滚轮（触控板）滚动画廊，纵向滚轮交给父控件"""
+        delta = event.angleDelta().x()
+        if delta and self.scrollBar.isVisible():
+            self.scrollBar.setValue(self.scrollBar.value() - delta * self._stride() // 120)
+            event.accept()
+        else:
+            event.ignore()
@@ -0,0 +1,91 @@
+# coding:utf-8
+from typing import Dict, Optional, Union
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout
+
+from qfluentwidgets import BodyLabel, CaptionLabel, CompactSpinBox, ExpandGroupSettingCard, FluentIconBase
+
+
+class ModelThresholdSettingCard(ExpandGroupSettingCard):
+    """
+    级联识别阈值设置卡片组件
+
+    展开后每个模型一行，设置采用轻量分类器结果所需的最低置信度（百分比）。
+    没有轻量分类器的模型只显示提示，所有簇都交给 CNN。
+
+    Signals:
+        thresholdChanged (str, int): 阈值变化时发射，参数为模型名称与阈值（百分比）
+    """
+
+    thresholdChanged = pyqtSignal(str, int)
+
+    def __init__(
+        self,
+        icon: Union[str, QIcon, FluentIconBase],
+        title: str,
+        content=None,
+        parent=None
+    ):
+        """
+        初始化级联识别阈值设置卡片
+
+        Args:
+            icon (Union[str, QIcon, FluentIconBase]): 卡片图标
+            title (str): 卡片标题
+            content (str, optional): 卡片内容描述. Defaults to None.
+            parent (QWidget, optional): 父组件. Defaults to None.
+        """
+        super().__init__(icon, title, content, parent=parent)
+        self.summaryLabel = QLabel(self)
+        self.summaryLabel.setObjectName("titleLabel")
+        self.addWidget(self.summaryLabel)
+
+        self.rowsWidget = QWidget(self.view)
+        self.rowsLayout = QVBoxLayout(self.rowsWidget)
+        self.rowsLayout.setContentsMargins(48, 12, 16, 12)
+        self.rowsLayout.setSpacing(8)
+        self.rowsLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.rowsLayout.setSizeConstraint(QVBoxLayout.SizeConstraint.SetMinimumSize)
+        self.viewLayout.setSpacing(0)
+        self.viewLayout.setContentsMargins(0, 0, 0, 0)
+        self.addGroupWidget(self.rowsWidget)
+
+        self._spinBoxes: Dict[str, CompactSpinBox] = {}
+
+    def setModels(self, thresholds: Dict[str, Optional[int]]) -> None:
+        """
+        重建模型列表
+
+        Args:
+            thresholds: 模型名称到阈值（百分比）的映射，没有轻量分类器的模型为 None
+        """
+        while self.rowsLayout.count():
+            widget = self.rowsLayout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self._spinBoxes.clear()
+
+        for name, threshold in thresholds.items():
+            row = QWidget(self.rowsWidget)
+            layout = QHBoxLayout(row)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(BodyLabel(name, row))
+            layout.addStretch(1)
+
+            if threshold is None:
+                layout.addWidget(CaptionLabel("无轻量分类器，全部交给 CNN", row))
+            else:
+                spinBox = CompactSpinBox(row)
+                spinBox.setRange(50, 100)
+                spinBox.setSuffix(" %")
+                spinBox.setValue(threshold)
+                spinBox.valueChanged.connect(lambda value, name=name: self.thresholdChanged.emit(name, value))
+                layout.addWidget(spinBox)
+                self._spinBoxes[name] = spinBox
+
+            self.rowsLayout.addWidget(row)
+
+        self.summaryLabel.setText(f"{len(self._spinBoxes)} 个模型启用级联" if thresholds else "暂无模型")
+        self.summaryLabel.adjustSize()
+        self._adjustViewSize()
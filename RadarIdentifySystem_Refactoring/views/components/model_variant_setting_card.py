@@ -0,0 +1,112 @@
+# coding:utf-8
+from typing import Dict, List, Union
+from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import QWidget, QLabel, QHBoxLayout, QVBoxLayout
+
+from qfluentwidgets import BodyLabel, ComboBox, ExpandGroupSettingCard, FluentIconBase
+
+
+class ModelVariantSettingCard(ExpandGroupSettingCard):
+    """
+    模型精度设置卡片组件
+
+    展开后每个模型一行，通过下拉框选择推理时使用的精度变体（浮点 / float16 / int8）。
+    下拉框只列出当前推理后端已生成的变体。
+
+    Signals:
+        variantChanged (str, str): 模型精度变化时发射，参数为模型名称与精度变体
+    """
+
+    variantChanged = pyqtSignal(str, str)
+
+    VARIANT_TEXTS = {"float32": "浮点（float32）", "float16": "半精度（float16）", "int8": "整型量化（int8）"}
+
+    def __init__(
+        self,
+        icon: Union[str, QIcon, FluentIconBase],
+        title: str,
+        content=None,
+        parent=None
+    ):
+        """
+        初始化模型精度设置卡片
+
+        Args:
+            icon (Union[str, QIcon, FluentIconBase]): 卡片图标
+            title (str): 卡片标题
+            content (str, optional): 卡片内容描述. Defaults to None.
+            parent (QWidget, optional): 父组件. Defaults to None.
+        """
+        super().__init__(icon, title, content, parent=parent)
+        self.summaryLabel = QLabel(self)
+        self.summaryLabel.setObjectName("titleLabel")
+        self.addWidget(self.summaryLabel)
+
+        self.rowsWidget = QWidget(self.view)
+        self.rowsLayout = QVBoxLayout(self.rowsWidget)
+        self.rowsLayout.setContentsMargins(48, 12, 16, 12)
+        self.rowsLayout.setSpacing(8)
+        self.rowsLayout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.rowsLayout.setSizeConstraint(QVBoxLayout.SizeConstraint.SetMinimumSize)
+        self.viewLayout.setSpacing(0)
+        self.viewLayout.setContentsMargins(0, 0, 0, 0)
+        self.addGroupWidget(self.rowsWidget)
+
+        self._comboBoxes: Dict[str, ComboBox] = {}
+
+    def setModels(self, variants: Dict[str, List[str]], selected: Dict[str, str]) -> None:
+        """
+        重建模型列表
+
+        Args:
+            variants: 模型名称到可用精度变体的映射
+            selected: 模型名称到所选精度变体的映射，未列出的模型为浮点
+        """
+        while self.rowsLayout.count():
+            widget = self.rowsLayout.takeAt(0).widget()
+            if widget is not None:
+                widget.deleteLater()
+        self._comboBoxes.clear()
+
+        for name, available in variants.items():
+            row = QWidget(self.rowsWidget)
+            layout = QHBoxLayout(row)
+            layout.setContentsMargins(0, 0, 0, 0)
+            layout.addWidget(BodyLabel(name, row))
+            layout.addStretch(1)
+
+            comboBox = ComboBox(row)
+            for variant in available:
+                comboBox.addItem(self.VARIANT_TEXTS.get(variant, variant), userData=variant)
+            current = selected.get(name, "float32")
+            if current in available:
+                comboBox.setCurrentIndex(available.index(current))
+            comboBox.setEnabled(len(available) > 1)
+            comboBox.currentIndexChanged.connect(
+                lambda index, name=name, comboBox=comboBox: self._onCurrentIndexChanged(name, comboBox.itemData(index))
+            )
+            layout.addWidget(comboBox)
+
+            self.rowsLayout.addWidget(row)
+            self._comboBoxes[name] = comboBox
+
+        self._updateSummary()
+        self._adjustViewSize()
+
+    def _onCurrentIndexChanged(self, name: str, variant: str) -> None:
+        """
+        处理模型精度下拉框选择变化事件
+
+        Args:
+            name (str): 模型名称
+            variant (str): 选中的精度变体
+        """
+        self._updateSummary()
+        self.variantChanged.emit(name, variant)
+
+    def _updateSummary(self) -> None:
+        """更新标题栏右侧的量化模型计数"""
+        quantized = sum(comboBox.currentData() != "float32" for comboBox in self._comboBoxes.values())
+        self.summaryLabel.setText(f"{quantized} 个模型使用量化变体" if self._comboBoxes else "暂无模型")
+        self.summaryLabel.adjustSize()
@@ -1,54 +1,287 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
+from PyQt6.QtWidgets import QWidget, QLabel
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtGui import QResizeEvent
+from qfluentwidgets import (
+    ComboBoxSettingCard,
+    ExpandLayout,
+    InfoBar,
+    PrimaryPushSettingCard,
+    PushSettingCard,
+    RangeSettingCard,
+    ScrollArea,
+    SettingCardGroup,
+    SwitchSettingCard,
+)
+from qfluentwidgets import FluentIcon as FIF
 from typing import Optional
+from models.config.app_config import cfg
+from models.theme.style_sheet import StyleSheet
+from models.ui.dimensions import UIDimensions
+from models.utils.log_manager import LoggerMixin
+from views.components.model_threshold_setting_card import ModelThresholdSettingCard
+from views.components.model_variant_setting_card import ModelVariantSettingCard
 
 
-class ModelManagementInterface(QWidget):
+class ModelManagementInterface(ScrollArea, LoggerMixin):
     """模型管理界面
-    
-    用于雷达信号分析模型管理的界面，当前为占位实现。
+
+    用于浏览模型目录、选择识别模型的推理后端、将 Keras 模型转换为轻量后端所需的格式，
+    生成并按模型选择量化变体、设置级联识别阈值，以及设置模型常驻内存的上限和推理结果缓存。
     """
-    
+
     def __init__(self, text: str, parent: Optional[QWidget] = None) -> None:
         """初始化模型管理界面
-        
+
         Args:
+            text: 界面标识文本
             parent: 父控件
         """
-        super().__init__(parent)
+        super().__init__(parent=parent)
         self.setObjectName("ModelManagementInterface")
-        
+        self.scrollWidget = QWidget()
+        self.scrollWidget.setMaximumWidth(UIDimensions.SCROLL_AREA_MAX_WIDTH_SETTING)
+        self.expandLayout = ExpandLayout(self.scrollWidget)
+
+        # 设置标签
+        self.settingLabel = QLabel("模型管理", self)
+
+        # 模型库
+        self.libraryGroup = SettingCardGroup("模型库", self.scrollWidget)
+        self.modelDirCard = PushSettingCard(
+            "刷新",
+            FIF.FOLDER,
+            "模型目录",
+            "尚未扫描模型目录",
+            self.libraryGroup,
+        )
+
+        # 推理后端
+        self.backendGroup = SettingCardGroup("推理后端", self.scrollWidget)
+        self.backendCard = ComboBoxSettingCard(
+            cfg.inferenceBackend,
+            FIF.DEVELOPER_TOOLS,
+            "推理后端",
+            "ONNX Runtime 与 TFLite 的启动时间和内存占用远小于 TensorFlow，使用前需先转换模型",
+            texts=["TensorFlow", "ONNX Runtime", "TFLite"],
+            parent=self.backendGroup,
+        )
+        self.convertCard = PrimaryPushSettingCard(
+            "转换",
+            FIF.SYNC,
+            "模型转换",
+            "将模型目录下的 Keras 模型转换为当前推理后端的格式（需要 TensorFlow 环境）",
+            self.backendGroup,
+        )
+
+        # 模型量化
+        self.quantizationGroup = SettingCardGroup("模型量化", self.scrollWidget)
+        self.quantizeCard = PrimaryPushSettingCard(
+            "量化",
+            FIF.SPEED_HIGH,
+            "生成量化模型",
+            "为当前推理后端生成 int8 / float16 变体，并在留出集（<模型名>.holdout.npz）上与浮点模型比较准确率",
+            self.quantizationGroup,
+        )
+        self.maxAccuracyDropCard = RangeSettingCard(
+            cfg.quantizationMaxDrop,
+            FIF.CERTIFICATE,
+            "准确率损失上限",
+            "量化后准确率下降超过该值（单位：百分点）的变体将被丢弃",
+            parent=self.quantizationGroup,
+        )
+        self.variantCard = ModelVariantSettingCard(
+            FIF.IOT,
+            "模型精度",
+            "为每个模型选择推理时使用的精度，只列出当前后端已生成的变体",
+            parent=self.quantizationGroup,
+        )
+
+        # 级联识别
+        self.cascadeGroup = SettingCardGroup("级联识别", self.scrollWidget)
+        self.cascadeDefaultCard = RangeSettingCard(
+            cfg.cascadeDefaultThreshold,
+            FIF.FILTER,
+            "默认置信度阈值",
+            "轻量分类器（<模型名>.cascade.joblib）置信度达到该值（%）的簇不再送入 CNN，100 表示全部交给 CNN",
+            parent=self.cascadeGroup,
+        )
+        self.cascadeThresholdCard = ModelThresholdSettingCard(
+            FIF.TILES,
+            "模型阈值",
+            "为每个带轻量分类器的模型单独设置置信度阈值",
+            parent=self.cascadeGroup,
+        )
+
+        # 模型缓存
+        self.cacheGroup = SettingCardGroup("模型缓存", self.scrollWidget)
+        self.maxResidentCard = RangeSettingCard(
+            cfg.maxResidentModels,
+            FIF.LIBRARY,
+            "常驻模型数",
+            "模型在首次使用时加载，最多保留该数量的最近使用模型",
+            parent=self.cacheGroup,
+        )
+        self.memoryBudgetCard = RangeSettingCard(
+            cfg.modelMemoryBudget,
+            FIF.SPEED_HIGH,
+            "内存预算",
+            "常驻模型的估计内存上限，单位：MB，超出时淘汰最久未使用的模型",
+            parent=self.cacheGroup,
+        )
+
+        # 推理结果缓存
+        self.inferenceCacheGroup = SettingCardGroup("推理结果缓存", self.scrollWidget)
+        self.inferenceCacheCard = SwitchSettingCard(
+            FIF.SAVE,
+            "缓存推理结果",
+            "特征相同的簇直接复用上次的识别结果，只调整合并参数或重新打开同一数据时无需重新推理",
+            configItem=cfg.inferenceCacheEnabled,
+            parent=self.inferenceCacheGroup,
+        )
+        self.inferenceCacheSizeCard = RangeSettingCard(
+            cfg.inferenceCacheSize,
+            FIF.ZIP_FOLDER,
+            "磁盘缓存上限",
+            "推理结果缓存的磁盘占用上限，单位：MB，超出时删除最久未使用的缓存",
+            parent=self.inferenceCacheGroup,
+        )
+        self.clearCacheCard = PushSettingCard(
+            "清空",
+            FIF.DELETE,
+            "清空推理缓存",
+            "推理缓存为空",
+            self.inferenceCacheGroup,
+        )
+
         # 设置UI
         self._setup_ui()
-        
+
     def _setup_ui(self) -> None:
         """设置用户界面"""
-        # 创建主布局
-        main_layout = QVBoxLayout(self)
-        main_layout.setContentsMargins(10, 10, 10, 10)
-        main_layout.setSpacing(10)
-        
-        # 创建占位框架
-        placeholder_frame = QFrame()
-        placeholder_frame.setFrameStyle(QFrame.Shape.Box)
-        placeholder_frame.setStyleSheet("""
-            QFrame {
-                background-color: #e8f5e9;
-                border: 2px dashed #4caf50;
-                border-radius: 5px;
-            }
-        """)
-        
-        # 创建占位标签
-        placeholder_label = QLabel("模型管理界面\n(占位实现)")
-        placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder_label.setFont(QFont("Arial", 16, QFont.Weight.Bold))
-        placeholder_label.setStyleSheet("color: #388e3c;")
-        
-        frame_layout = QVBoxLayout(placeholder_frame)
-        frame_layout.addWidget(placeholder_label)
-        frame_layout.addStretch()
-        
-        main_layout.addWidget(placeholder_frame)
-        main_layout.addStretch()
\ No newline at end of file
+        # 设置滚动区域属性
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setViewportMargins(0, 80, 0, 20)
+        self.setWidget(self.scrollWidget)
+        self.setWidgetResizable(True)
+
+        # 设置滚动区域居中对齐
+        self.setAlignment(Qt.AlignmentFlag.AlignHCenter)
+
+        # 初始化样式
+        self.scrollWidget.setObjectName("scrollWidget")
+        self.settingLabel.setObjectName("modelManagementLabel")
+        StyleSheet.MODEL_MANAGEMENT_INTERFACE.apply(self)
+
+        # 初始化布局
+        self._initLayout()
+
+    def _initLayout(self) -> None:
+        """初始化布局
+
+        设置标签位置和卡片组布局。
+        """
+        # 初始化标签位置（相对定位）
+        self._updateLabelPosition()
+
+        # 添加设置卡片到组
+        self.libraryGroup.addSettingCard(self.modelDirCard)
+
+        self.backendGroup.addSettingCard(self.backendCard)
+        self.backendGroup.addSettingCard(self.convertCard)
+
+        self.quantizationGroup.addSettingCard(self.quantizeCard)
+        self.quantizationGroup.addSettingCard(self.maxAccuracyDropCard)
+        self.quantizationGroup.addSettingCard(self.variantCard)
+
+        self.cascadeGroup.addSettingCard(self.cascadeDefaultCard)
+        self.cascadeGroup.addSettingCard(self.cascadeThresholdCard)
+
+        self.cacheGroup.addSettingCard(self.maxResidentCard)
+        self.cacheGroup.addSettingCard(self.memoryBudgetCard)
+
+        self.inferenceCacheGroup.addSettingCard(self.inferenceCacheCard)
+        self.inferenceCacheGroup.addSettingCard(self.inferenceCacheSizeCard)
+        self.inferenceCacheGroup.addSettingCard(self.clearCacheCard)
+
+        # 添加卡片组到布局
+        self.expandLayout.setSpacing(28)
+        self.expandLayout.setContentsMargins(36, 10, 36, 0)
+        self.expandLayout.addWidget(self.libraryGroup)
+        self.expandLayout.addWidget(self.backendGroup)
+        self.expandLayout.addWidget(self.quantizationGroup)
+        self.expandLayout.addWidget(self.cascadeGroup)
+        self.expandLayout.addWidget(self.cacheGroup)
+        self.expandLayout.addWidget(self.inferenceCacheGroup)
+
+    def _updateLabelPosition(self) -> None:
+        """更新设置标签位置
+
+        根据滚动区域的宽度动态调整标签位置，使其始终与滚动区域保持一致的对齐方式。
+        """
+        window_width = self.width() if self.width() > 0 else UIDimensions.WINDOW_DEFAULT_WIDTH
+        scroll_area_width = min(window_width, UIDimensions.SCROLL_AREA_MAX_WIDTH_SETTING)
+        center_offset = (window_width - scroll_area_width) // 2
+        label_x = max(center_offset + 36, 36)  # 确保最小边距为36px
+        self.settingLabel.move(label_x, 30)
+
+    def setModelSummary(self, model_count: int, resident: list) -> None:
+        """更新模型目录卡片的说明文本
+
+        Args:
+            model_count: 已发现的模型数量
+            resident: 常驻内存的模型名称
+        """
+        text = f"已发现 {model_count} 个模型"
+        text += f"，常驻：{'、'.join(resident)}" if resident else "，暂无常驻模型"
+        self.modelDirCard.setContent(text)
+
+    def setCacheSummary(self, entries: int, disk_bytes: int) -> None:
+        """更新清空推理缓存卡片的说明文本
+
+        Args:
+            entries: 内存中的缓存条目数
+            disk_bytes: 磁盘缓存占用（字节）
+        """
+        self.clearCacheCard.setContent(f"内存中 {entries} 条，磁盘占用 {disk_bytes / 1024 / 1024:.1f} MB")
+
+    def setConverting(self, converting: bool) -> None:
+        """切换模型转换进行中的界面状态
+
+        Args:
+            converting: 是否正在转换
+        """
+        self.convertCard.button.setEnabled(not converting)
+        self.convertCard.button.setText("转换中..." if converting else "转换")
+
+    def setQuantizing(self, quantizing: bool) -> None:
+        """切换模型量化进行中的界面状态
+
+        Args:
+            quantizing: 是否正在量化
+        """
+        self.quantizeCard.button.setEnabled(not quantizing)
+        self.quantizeCard.button.setText("量化中..." if quantizing else "量化")
+
+    def showMessage(self, success: bool, title: str, content: str) -> None:
+        """在界面右上角显示操作结果
+
+        Args:
+            success: 是否成功
+            title: 标题
+            content: 内容
+        """
+        if success:
+            InfoBar.success(title, content, duration=2000, parent=self)
+        else:
+            InfoBar.warning(title, content, duration=4000, parent=self)
+
+    def resizeEvent(self, event: QResizeEvent) -> None:
+        """窗口大小变化事件处理
+
+        当窗口大小变化时，自动调整设置标签的位置。
+
+        Args:
+            event: 窗口大小变化事件
+        """
+        super().resizeEvent(event)
+        self._updateLabelPosition()
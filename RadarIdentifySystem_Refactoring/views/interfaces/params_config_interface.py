@@ -4,6 +4,7 @@ from PyQt6.QtGui import QResizeEvent
 from qfluentwidgets import (
     ComboBoxSettingCard,
     ExpandLayout,
+    RangeSettingCard,
     ScrollArea,
     SettingCardGroup,
     SwitchSettingCard,
@@ -103,6 +104,27 @@ class ParamsConfigInterface(ScrollArea, LoggerMixin):
 
         # 绘图设置
         self.plotGroup = SettingCardGroup("绘图设置", self.scrollWidget)
+        self.densityThresholdCard = RangeSettingCard(
+            cfg.densityPlotThreshold,
+            FIF.PALETTE,
+            "密度图阈值",
+            "切片视图中可见脉冲数达到该值（单位：千个）时，载频、脉宽、幅度、到达角面板改为绘制密度图",
+            parent=self.plotGroup,
+        )
+        self.plotCacheSizeCard = RangeSettingCard(
+            cfg.plotCacheSize,
+            FIF.SPEED_HIGH,
+            "切片缓存上限",
+            "预渲染的切片图像与抽稀数据的内存上限，单位：MB，超出时淘汰最久未查看的切片",
+            parent=self.plotGroup,
+        )
+        self.refreshRateCard = RangeSettingCard(
+            cfg.viewRefreshRate,
+            FIF.SYNC,
+            "视图刷新频率",
+            "全速处理时视图每秒最多刷新的次数，两次刷新之间只显示最新的切片",
+            parent=self.plotGroup,
+        )
         
 
 
@@ -148,6 +170,10 @@ class ParamsConfigInterface(ScrollArea, LoggerMixin):
         self.sliceGroup.addSettingCard(self.sliceLengthCard)
         self.sliceGroup.addSettingCard(self.timeFlipProcCard)
 
+        self.plotGroup.addSettingCard(self.densityThresholdCard)
+        self.plotGroup.addSettingCard(self.plotCacheSizeCard)
+        self.plotGroup.addSettingCard(self.refreshRateCard)
+
 
         # 添加卡片组到布局
         self.expandLayout.setSpacing(28)
@@ -11,6 +11,7 @@ from qfluentwidgets import (
     CustomColorSettingCard,
     HyperlinkCard,
     PrimaryPushSettingCard,
+    RangeSettingCard,
     MessageBox,
     InfoBar,
 )
@@ -55,6 +56,30 @@ class SettingsInterface(ScrollArea, LoggerMixin):
             parent=self.basicGroup,
         )
 
+        # 推理设置
+        self.inferenceGroup = SettingCardGroup("推理设置", self.scrollWidget)
+        self.intraOpThreadsCard = RangeSettingCard(
+            cfg.intraOpThreads,
+            FIF.SPEED_HIGH,
+            "算子内线程数",
+            "单个模型运算内部并行使用的线程数（TensorFlow intra-op / ONNX Runtime / TFLite），0 表示占用全部核心",
+            parent=self.inferenceGroup,
+        )
+        self.interOpThreadsCard = RangeSettingCard(
+            cfg.interOpThreads,
+            FIF.SPEED_MEDIUM,
+            "算子间线程数",
+            "相互独立的模型运算并行使用的线程数（TensorFlow inter-op / ONNX Runtime），0 表示由运行库决定",
+            parent=self.inferenceGroup,
+        )
+        self.batchSizeCard = RangeSettingCard(
+            cfg.inferenceBatchSize,
+            FIF.ALIGNMENT,
+            "推理批大小",
+            "每次调用模型推理的最大样本数，模型加载后按该批大小预热",
+            parent=self.inferenceGroup,
+        )
+
         # 个性化
         self.personalGroup = SettingCardGroup("个性化", self.scrollWidget)
         self.micaCard = SwitchSettingCard(
@@ -143,6 +168,10 @@ class SettingsInterface(ScrollArea, LoggerMixin):
 
         # 添加设置卡片到组
         self.basicGroup.addSettingCard(self.logLevelCard)
+
+        self.inferenceGroup.addSettingCard(self.intraOpThreadsCard)
+        self.inferenceGroup.addSettingCard(self.interOpThreadsCard)
+        self.inferenceGroup.addSettingCard(self.batchSizeCard)
         
         self.personalGroup.addSettingCard(self.micaCard)
         self.personalGroup.addSettingCard(self.themeCard)
@@ -156,6 +185,7 @@ class SettingsInterface(ScrollArea, LoggerMixin):
         self.expandLayout.setSpacing(28)
         self.expandLayout.setContentsMargins(36, 10, 36, 0)
         self.expandLayout.addWidget(self.basicGroup)
+        self.expandLayout.addWidget(self.inferenceGroup)
         self.expandLayout.addWidget(self.personalGroup)
         self.expandLayout.addWidget(self.aboutGroup)
 
@@ -190,6 +220,10 @@ class SettingsInterface(ScrollArea, LoggerMixin):
         # 更新标签位置以适应新的窗口大小
         self._updateLabelPosition()
 
-    def showRestartTooltip(self) -> None:
-        """唤起重启提示"""
-        InfoBar.success("修改成功", "配置将在重启后生效", duration=1500, parent=self)
+    def showRestartTooltip(self, content: str = "配置将在重启后生效") -> None:
+        """唤起重启提示
+
+        Args:
+            content: 提示内容
+        """
+        InfoBar.success("修改成功", content, duration=1500, parent=self)
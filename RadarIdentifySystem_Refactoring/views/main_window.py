@@ -1,4 +1,5 @@
-from PyQt6.QtCore import QSize
+from PyQt6.QtCore import QSize, QTimer
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import QApplication
 from typing import Optional
 
@@ -9,7 +10,11 @@ from views.interfaces.model_management_interface import ModelManagementInterface
 from views.interfaces.params_config_interface import ParamsConfigInterface
 from views.interfaces.settings_interface import SettingsInterface
 from controllers.ui.settings_controller import SettingsController
+from controllers.ui.model_management_controller import ModelManagementController
+from models.processors.inference_backends import BACKENDS
+from models.services.render_service import render_service
 from models.utils.log_manager import LoggerMixin
+from models.utils.module_preloader import ModulePreloader
 from models.utils.icons_manager import Icon
 from models.utils.signal_bus import mw_signalBus
 from models.config.app_config import cfg
@@ -46,6 +51,10 @@ class MainWindow(MSFluentWindow, LoggerMixin):
         
         # 创建控制器
         self.settings_controller = None
+        self.model_management_controller = None
+
+        # 重量级模块预加载线程
+        self.module_preloader: Optional[ModulePreloader] = None
 
         # 连接信号
         self._connectSignalToSlot()
@@ -54,6 +63,9 @@ class MainWindow(MSFluentWindow, LoggerMixin):
         self._init_navigation()
         self.splashScreen.finish()
 
+        # 窗口完成首次绘制后再在后台导入推理运行库
+        QTimer.singleShot(0, self._start_module_preload)
+
     def _init_window(self) -> None:
         """初始化窗口
 
@@ -97,6 +109,11 @@ class MainWindow(MSFluentWindow, LoggerMixin):
             parent=self
         )
         self.logger.info("主窗口实例化设置控制器")
+        self.model_management_controller: ModelManagementController = ModelManagementController(
+            model_management_interface=self.model_management_interface,
+            parent=self
+        )
+        self.logger.info("主窗口实例化模型管理控制器")
         
         # 添加导航项
         self.addSubInterface(
@@ -135,6 +152,38 @@ class MainWindow(MSFluentWindow, LoggerMixin):
         )
 
 
+    def _start_module_preload(self) -> None:
+        """在后台线程中预加载当前推理后端的运行库
+
+        启动路径上不导入 tensorflow / onnxruntime 等重量级库，首次推理前由此线程提前导入。
+
+        Returns:
+            None
+        """
+        module = BACKENDS[cfg.get(cfg.inferenceBackend)].runtime_module()
+        if module is None:
+            self.logger.warning(f"推理后端 {cfg.get(cfg.inferenceBackend)} 的运行库未安装，跳过预加载")
+            return
+        self.module_preloader = ModulePreloader([module], self)
+        self.module_preloader.preloadFinished.connect(
+            lambda results: self.logger.info(f"后台模块预加载完成: {results}")
+        )
+        self.module_preloader.start()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """关闭窗口前等待预加载线程与渲染线程池结束
+
+        正在进行的导入无法中断，只能等待其完成后退出线程；排队中的渲染请求直接取消。
+
+        Args:
+            event: 关闭事件
+        """
+        if self.module_preloader is not None and self.module_preloader.isRunning():
+            self.module_preloader.requestInterruption()
+            self.module_preloader.wait()
+        render_service.shutdown()
+        super().closeEvent(event)
+
     def _connectSignalToSlot(self) -> None:
         """连接窗口信号
 
@@ -1,74 +1,94 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QKeySequence
 from typing import Optional
 
+from qfluentwidgets import BodyLabel, PushButton, StrongBodyLabel
+from qfluentwidgets import FluentIcon as FIF
+
 
 class SlicePanel(QWidget):
     """切片面板
-    
-    用于显示和控制雷达信号切片的面板，当前为占位实现。
+
+    用于在切片之间切换的面板：上一片 / 下一片按钮（PageUp / PageDown）与当前位置显示。
     """
-    
-    # 切片变更信号
-    sliceChanged = pyqtSignal()
-    
+
+    # 切片变更信号，参数为新的切片序号
+    sliceChanged = pyqtSignal(int)
+
     def __init__(self, parent: Optional[QWidget] = None):
         """初始化切片面板
-        
+
         Args:
             parent: 父控件
         """
         super().__init__(parent)
-        
+        self._index = 0
+        self._count = 0
+
         # 设置UI
         self._setup_ui()
-        
+        self._connect_signals()
+        self._update_state()
+
     def _setup_ui(self) -> None:
         """设置用户界面"""
         # 创建主布局
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
-        
-        # 创建占位框架
-        placeholder_frame = QFrame()
-        placeholder_frame.setFrameStyle(QFrame.Shape.Box)
-        placeholder_frame.setStyleSheet("""
-            QFrame {
-                background-color: #e8f5e9;
-                border: 2px dashed #4caf50;
-                border-radius: 5px;
-            }
-        """)
-        
-        # 创建占位标签
-        placeholder_label = QLabel("切片控制面板\n(占位实现)")
-        placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        placeholder_label.setStyleSheet("color: #388e3c;")
-        
-        frame_layout = QVBoxLayout(placeholder_frame)
-        frame_layout.addWidget(placeholder_label)
-        frame_layout.addStretch()
-        
-        main_layout.addWidget(placeholder_frame)
+
+        main_layout.addWidget(StrongBodyLabel("切片控制", self))
+
+        # 切换按钮与位置
+        button_layout = QHBoxLayout()
+        self.previous_button = PushButton(FIF.LEFT_ARROW, "上一片", self)
+        self.next_button = PushButton(FIF.RIGHT_ARROW, "下一片", self)
+        self.previous_button.setShortcut(QKeySequence.StandardKey.MoveToPreviousPage)
+        self.next_button.setShortcut(QKeySequence.StandardKey.MoveToNextPage)
+        self.position_label = BodyLabel("", self)
+        button_layout.addWidget(self.previous_button)
+        button_layout.addWidget(self.next_button)
+        button_layout.addWidget(self.position_label)
+        button_layout.addStretch()
+        main_layout.addLayout(button_layout)
         main_layout.addStretch()
-        
+
+    def _connect_signals(self) -> None:
+        """连接内部控件信号"""
+        self.previous_button.clicked.connect(lambda: self._step(-1))
+        self.next_button.clicked.connect(lambda: self._step(1))
+
     def get_slice_info(self) -> dict:
         """获取切片信息
-        
+
         Returns:
-            切片信息字典
+            切片信息字典，包含 index（当前切片序号）与 count（切片总数）
         """
-        # TODO: 实现获取切片信息逻辑
-        return {}
-        
+        return {"index": self._index, "count": self._count}
+
     def set_slice_info(self, info: dict) -> None:
         """设置切片信息
-        
+
+        序号变化时发射 sliceChanged。
+
         Args:
-            info: 切片信息字典
+            info: 切片信息字典，可包含 index（当前切片序号）与 count（切片总数）
         """
-        # TODO: 实现设置切片信息逻辑
-        self.sliceChanged.emit()
\ No newline at end of file
+        self._count = max(int(info.get("count", self._count)), 0)
+        index = min(max(int(info.get("index", self._index)), 0), max(self._count - 1, 0))
+        changed = index != self._index
+        self._index = index
+        self._update_state()
+        if changed:
+            self.sliceChanged.emit(index)
+
+    def _step(self, offset: int) -> None:
+        """切换到相邻切片"""
+        self.set_slice_info({"index": self._index + offset})
+
+    def _update_state(self) -> None:
+        """更新按钮可用状态与位置显示"""
+        self.previous_button.setEnabled(self._index > 0)
+        self.next_button.setEnabled(self._index < self._count - 1)
+        self.position_label.setText(f"第 {self._index + 1} / {self._count} 片" if self._count else "无切片")
@@ -1,74 +1,154 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QFrame
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFormLayout, QHBoxLayout
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtGui import QKeySequence
 from typing import Optional
 
+from qfluentwidgets import BodyLabel, CheckBox, DoubleSpinBox, PrimaryPushButton, PushButton, StrongBodyLabel
+from qfluentwidgets import FluentIcon as FIF
+
 
 class MergeControlPanel(QWidget):
     """合并控制面板
-    
-    用于控制雷达信号合并操作的面板组件，当前为占位实现。
+
+    提供跨切片合并的容差设置与合并操作入口。
     """
-    
-    # 控制信号
+
+    # 控制信号：任一合并参数变化时发射
     controlChanged = pyqtSignal()
-    
+    # 请求按当前参数执行合并
+    mergeRequested = pyqtSignal()
+    # 请求人工合并所选的组、撤销与重做
+    mergeSelectedRequested = pyqtSignal()
+    undoRequested = pyqtSignal()
+    redoRequested = pyqtSignal()
+
     def __init__(self, parent: Optional[QWidget] = None):
         """初始化合并控制面板
-        
+
         Args:
             parent: 父控件
         """
         super().__init__(parent)
-        
+
         # 设置UI
         self._setup_ui()
-        
+        self._connect_signals()
+
     def _setup_ui(self) -> None:
         """设置用户界面"""
         # 创建主布局
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
-        
-        # 创建占位框架
-        placeholder_frame = QFrame()
-        placeholder_frame.setFrameStyle(QFrame.Shape.Box)
-        placeholder_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f5f5f5;
-                border: 2px dashed #ccc;
-                border-radius: 5px;
-            }
-        """)
-        
-        # 创建占位标签
-        placeholder_label = QLabel("合并控制面板\n(占位实现)")
-        placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        placeholder_label.setFont(QFont("Arial", 12, QFont.Weight.Bold))
-        placeholder_label.setStyleSheet("color: #666;")
-        
-        frame_layout = QVBoxLayout(placeholder_frame)
-        frame_layout.addWidget(placeholder_label)
-        frame_layout.addStretch()
-        
-        main_layout.addWidget(placeholder_frame)
+
+        main_layout.addWidget(StrongBodyLabel("合并控制", self))
+
+        # 容差设置
+        form_layout = QFormLayout()
+        form_layout.setSpacing(8)
+        self.cf_tolerance_spin = self._create_spin_box(0.0, 1000.0, 5.0, 1.0, " MHz")
+        self.pw_tolerance_spin = self._create_spin_box(0.0, 100.0, 0.5, 0.1, " us")
+        self.pri_tolerance_spin = self._create_spin_box(0.0, 50.0, 2.0, 0.5, " %")
+        form_layout.addRow(BodyLabel("载频容差", self), self.cf_tolerance_spin)
+        form_layout.addRow(BodyLabel("脉宽容差", self), self.pw_tolerance_spin)
+        form_layout.addRow(BodyLabel("PRI 相对容差", self), self.pri_tolerance_spin)
+        main_layout.addLayout(form_layout)
+
+        self.same_class_check = CheckBox("仅合并识别类别相同的簇", self)
+        self.same_class_check.setChecked(True)
+        self.cross_slice_check = CheckBox("仅合并不同切片中的簇", self)
+        self.cross_slice_check.setChecked(True)
+        main_layout.addWidget(self.same_class_check)
+        main_layout.addWidget(self.cross_slice_check)
+
+        # 操作按钮与状态
+        button_layout = QHBoxLayout()
+        self.merge_button = PrimaryPushButton("合并", self)
+        button_layout.addWidget(self.merge_button)
+        button_layout.addStretch()
+        main_layout.addLayout(button_layout)
+
+        # 人工合并与撤销 / 重做
+        edit_layout = QHBoxLayout()
+        self.merge_selected_button = PushButton("合并所选组", self)
+        self.undo_button = PushButton(FIF.LEFT_ARROW, "撤销", self)
+        self.redo_button = PushButton(FIF.RIGHT_ARROW, "重做", self)
+        self.undo_button.setShortcut(QKeySequence.StandardKey.Undo)
+        self.redo_button.setShortcut(QKeySequence.StandardKey.Redo)
+        edit_layout.addWidget(self.merge_selected_button)
+        edit_layout.addWidget(self.undo_button)
+        edit_layout.addWidget(self.redo_button)
+        edit_layout.addStretch()
+        main_layout.addLayout(edit_layout)
+        self.set_edit_state(False, False, False)
+
+        self.status_label = BodyLabel("", self)
+        main_layout.addWidget(self.status_label)
         main_layout.addStretch()
-        
+
+    def _create_spin_box(self, minimum: float, maximum: float, value: float, step: float, suffix: str) -> DoubleSpinBox:
+        """创建容差输入框"""
+        spin_box = DoubleSpinBox(self)
+        spin_box.setRange(minimum, maximum)
+        spin_box.setSingleStep(step)
+        spin_box.setDecimals(2)
+        spin_box.setSuffix(suffix)
+        spin_box.setValue(value)
+        return spin_box
+
+    def _connect_signals(self) -> None:
+        """连接内部控件信号"""
+        for spin_box in (self.cf_tolerance_spin, self.pw_tolerance_spin, self.pri_tolerance_spin):
+            spin_box.valueChanged.connect(self.controlChanged)
+        for check_box in (self.same_class_check, self.cross_slice_check):
+            check_box.stateChanged.connect(self.controlChanged)
+        self.merge_button.clicked.connect(self.mergeRequested)
+        self.merge_selected_button.clicked.connect(self.mergeSelectedRequested)
+        self.undo_button.clicked.connect(self.undoRequested)
+        self.redo_button.clicked.connect(self.redoRequested)
+
     def set_control_enabled(self, enabled: bool) -> None:
         """设置控制面板是否启用
-        
+
         Args:
             enabled: 是否启用
         """
-        # TODO: 实现启用/禁用逻辑
-        pass
-        
+        for widget in (
+            self.cf_tolerance_spin, self.pw_tolerance_spin, self.pri_tolerance_spin,
+            self.same_class_check, self.cross_slice_check, self.merge_button,
+        ):
+            widget.setEnabled(enabled)
+
+    def set_edit_state(self, can_merge_selected: bool, can_undo: bool, can_redo: bool) -> None:
+        """设置人工合并、撤销与重做按钮的可用状态
+
+        Args:
+            can_merge_selected: 是否已选择至少两个组
+            can_undo: 是否有可撤销的人工合并
+            can_redo: 是否有可重做的人工合并
+        """
+        self.merge_selected_button.setEnabled(can_merge_selected)
+        self.undo_button.setEnabled(can_undo)
+        self.redo_button.setEnabled(can_redo)
+
     def get_control_settings(self) -> dict:
         """获取控制设置
-        
+
         Returns:
-            控制设置字典
+            控制设置字典，键与 MergeParams 的字段一致
+        """
+        return {
+            "cf_tolerance": self.cf_tolerance_spin.value(),
+            "pw_tolerance": self.pw_tolerance_spin.value(),
+            "pri_tolerance": self.pri_tolerance_spin.value() / 100.0,
+            "require_same_class": self.same_class_check.isChecked(),
+            "cross_slice_only": self.cross_slice_check.isChecked(),
+        }
+
+    def set_status(self, text: str) -> None:
+        """显示合并状态
+
+        Args:
+            text: 状态文本
         """
-        # TODO: 实现获取设置逻辑
-        return {}
\ No newline at end of file
+        self.status_label.setText(text)
@@ -1,83 +1,121 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout, QFrame
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
-from typing import Optional
+from typing import Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from models.data.pulse_columns import PulseColumn
+from models.services.render_service import render_service
+from models.utils.plot_decimation import DecimatedSeries
+from views.base import PlotWidget, VirtualGallery
 
 
 class ClusterView(QWidget):
     """聚类视图组件
-    
-    用于显示雷达信号聚类结果的视图组件，支持5×1的图像展示布局。
+
+    用于显示雷达信号聚类结果的视图组件，按脉冲数从多到少横向排列各簇的幅度随 TOA 的散点图，
+    每屏显示 5 个簇，簇更多时可横向滚动。画廊是虚拟化的：只创建每屏可见数量加一个散点图，
+    滚动时复用移出视口的散点图显示新的簇，簇再多控件数量也不变。
+    各簇的筛选与散点序列在渲染服务的线程池中整理，完成后才更新显示并发射 dataUpdated。
     """
-    
+
+    # 每屏显示的簇数
+    VISIBLE_CLUSTERS = 5
+
     # 数据更新信号
     dataUpdated = pyqtSignal()
-    
+
     def __init__(self, parent: Optional[QWidget] = None):
         """初始化聚类视图
-        
+
         Args:
             parent: 父控件
         """
         super().__init__(parent)
-        
+        self._target = ("clusters", id(self))
+        # 全部簇的标题与散点序列，按脉冲数从多到少排列
+        self._clusters: List[Tuple[str, DecimatedSeries]] = []
+
         # 设置UI
         self._setup_ui()
-        
+        render_service.rendered.connect(self._on_rendered)
+
     def _setup_ui(self) -> None:
         """设置用户界面"""
         # 创建主布局
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
-        
+
         # 创建标题标签
-        title_label = QLabel("聚类视图")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        main_layout.addWidget(title_label)
-        
-        # 创建网格布局用于5×1的图像展示
-        grid_layout = QGridLayout()
-        grid_layout.setSpacing(5)
-        
-        # 创建5个占位图像区域
-        self.image_frames = []
-        for i in range(5):
-            frame = QFrame()
-            frame.setFrameStyle(QFrame.Shape.Box)
-            frame.setStyleSheet("""
-                QFrame {
-                    background-color: #e8f4f8;
-                    border: 1px solid #4fc3f7;
-                    border-radius: 5px;
-                }
-            """)
-            
-            # 添加标签
-            label = QLabel(f"聚类 {i+1}")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            frame_layout = QVBoxLayout(frame)
-            frame_layout.addWidget(label)
-            frame_layout.addStretch()
-            
-            self.image_frames.append(frame)
-            grid_layout.addWidget(frame, 0, i)
-        
-        main_layout.addLayout(grid_layout)
-        main_layout.addStretch()
-        
+        self.title_label = QLabel("聚类视图")
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        main_layout.addWidget(self.title_label)
+
+        # 创建虚拟化的簇画廊
+        self.gallery = VirtualGallery(
+            lambda parent: PlotWidget("", parent), self._bind_plot, self.VISIBLE_CLUSTERS, 5, self
+        )
+        self.plots = self.gallery.cards()
+        main_layout.addWidget(self.gallery, 1)
+
     def update_clusters(self, clusters: dict) -> None:
-        """更新聚类数据
-        
+        """更新聚类数据（异步，整理完成后更新显示）
+
         Args:
-            clusters: 聚类数据字典
+            clusters: 聚类数据字典，包含 pulses（(N, 5) 脉冲数组）与 labels（各脉冲的簇标签，负值为噪声）
         """
-        # TODO: 实现聚类数据更新逻辑
-        self.dataUpdated.emit()
-        
+        render_service.submit(self._target, self.build_clusters, clusters)
+
+    @staticmethod
+    def build_clusters(clusters: dict, count: Optional[int] = None) -> List[Tuple[str, DecimatedSeries]]:
+        """按脉冲数从多到少建立各簇的散点序列，可在工作线程中调用（不访问任何控件）
+
+        Args:
+            clusters: 聚类数据字典，同 update_clusters
+            count: 最多取的簇数，None 表示全部
+
+        Returns:
+            各簇的标题与幅度随 TOA 的散点序列
+        """
+        pulses = np.asarray(clusters["pulses"])
+        labels = np.asarray(clusters["labels"])
+        cluster_labels, counts = np.unique(labels[labels >= 0], return_counts=True)
+        largest = cluster_labels[np.argsort(-counts, kind="stable")][:count]
+
+        panels = []
+        for label in largest:
+            mask = labels == label
+            series = DecimatedSeries(pulses[mask, PulseColumn.TOA], pulses[mask, PulseColumn.PA], labels=labels[mask])
+            panels.append((f"簇 {label}（{int(mask.sum())} 个脉冲）", series))
+        return panels
+
     def clear_clusters(self) -> None:
         """清除聚类数据"""
-        # TODO: 实现聚类数据清除逻辑
-        pass
\ No newline at end of file
+        render_service.cancel(self._target)
+        self._show_clusters([])
+
+    def _on_rendered(self, target: Hashable, request_id: int, panels: List[Tuple[str, DecimatedSeries]]) -> None:
+        """显示整理完成的各簇"""
+        if target != self._target:
+            return
+        self._show_clusters(panels)
+        self.dataUpdated.emit()
+
+    def _show_clusters(self, panels: List[Tuple[str, DecimatedSeries]]) -> None:
+        """更新画廊的簇列表，不足一屏时以空白图补齐"""
+        self._clusters = panels
+        self.title_label.setText(f"聚类视图（{len(panels)} 个簇）" if panels else "聚类视图")
+        self.gallery.setCount(max(len(panels), self.VISIBLE_CLUSTERS))
+
+    def _bind_plot(self, plot: PlotWidget, index: int) -> None:
+        """让复用的散点图显示第 index 个簇"""
+        if index < len(self._clusters):
+            title, series = self._clusters[index]
+            plot.setTitle(title)
+            plot.setSeries(series)
+        else:
+            plot.setTitle(f"聚类 {index + 1}")
+            plot.clear()
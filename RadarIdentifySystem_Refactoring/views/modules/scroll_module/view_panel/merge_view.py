@@ -1,17 +1,25 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout, QFrame
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
-from typing import Optional
+from typing import List, Optional
+
+import numpy as np
+from qfluentwidgets import CheckBox
+
+from views.base import PlotWidget
 
 
 class MergeView(QWidget):
     """合并视图组件
     
     用于显示雷达信号合并结果的视图组件，支持5×1的图像展示布局。
+    每格上方为簇载频随时间的散点图（第一格为全部簇按合并组着色，其余格为各合并组），下方为文字概况。
     """
     
     # 数据更新信号
     dataUpdated = pyqtSignal()
+    # 合并组的选择变化信号
+    selectionChanged = pyqtSignal()
     
     def __init__(self, parent: Optional[QWidget] = None):
         """初始化合并视图
@@ -43,6 +51,10 @@ class MergeView(QWidget):
         
         # 创建5个占位图像区域
         self.image_frames = []
+        self.image_labels = []
+        self.plots = []
+        self.select_checks = []
+        self._group_ids: List[int] = []
         for i in range(5):
             frame = QFrame()
             frame.setFrameStyle(QFrame.Shape.Box)
@@ -57,12 +69,26 @@ class MergeView(QWidget):
             # 添加标签
             label = QLabel(f"合并 {i+1}")
             label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            label.setWordWrap(True)
+            
+            plot = PlotWidget("全部簇" if i == 0 else "", frame)
             
             frame_layout = QVBoxLayout(frame)
+            frame_layout.addWidget(plot)
             frame_layout.addWidget(label)
             frame_layout.addStretch()
             
+            # 合并组格子可勾选，用于人工合并
+            if i > 0:
+                check = CheckBox("选择", frame)
+                check.setVisible(False)
+                check.stateChanged.connect(self.selectionChanged)
+                frame_layout.addWidget(check)
+                self.select_checks.append(check)
+            
             self.image_frames.append(frame)
+            self.image_labels.append(label)
+            self.plots.append(plot)
             grid_layout.addWidget(frame, 0, i)
         
         main_layout.addLayout(grid_layout)
@@ -71,13 +97,79 @@ class MergeView(QWidget):
     def update_merge_data(self, merge_data: dict) -> None:
         """更新合并数据
         
+        第一格显示合并概况，其余格按簇数从多到少显示各合并组。
+        
         Args:
-            merge_data: 合并数据字典
+            merge_data: 合并数据字典，包含 n_clusters、n_groups、n_pairs 与 groups；
+                groups 中每项包含 id（组序号）、size、slices（切片序号范围）、cf_range（载频范围）
+                与可选的 similarity（组内兼容簇对的平均相似度）；
+                可选的 points 包含各簇的 toa（起始时间）、cf（载频均值）与 group_ids（所属合并组），用于绘图
         """
-        # TODO: 实现合并数据更新逻辑
+        self._group_ids = [group["id"] for group in merge_data.get("groups", [])]
+        self._update_plots(merge_data.get("points"))
+        self.image_labels[0].setText(
+            f"簇数: {merge_data.get('n_clusters', 0)}\n"
+            f"合并后组数: {merge_data.get('n_groups', 0)}\n"
+            f"兼容簇对: {merge_data.get('n_pairs', 0)}"
+        )
+        groups = merge_data.get("groups", [])
+        for i, label in enumerate(self.image_labels[1:]):
+            if i < len(groups):
+                group = groups[i]
+                first_slice, last_slice = group["slices"]
+                cf_low, cf_high = group["cf_range"]
+                text = (
+                    f"组 {i + 1}: {group['size']} 个簇\n"
+                    f"切片 {first_slice} ~ {last_slice}\n"
+                    f"载频 {cf_low:.1f} ~ {cf_high:.1f}"
+                )
+                if group.get("similarity") is not None:
+                    text += f"\n平均相似度 {group['similarity']:.2f}"
+                label.setText(text)
+            else:
+                label.setText(f"合并 {i + 2}")
+        self._reset_selection()
         self.dataUpdated.emit()
         
     def clear_merge_data(self) -> None:
         """清除合并数据"""
-        # TODO: 实现合并数据清除逻辑
-        pass
\ No newline at end of file
+        for i, label in enumerate(self.image_labels):
+            label.setText(f"合并 {i + 1}")
+        for plot in self.plots:
+            plot.clear()
+        self._group_ids = []
+        self._reset_selection()
+        
+    def selected_groups(self) -> List[int]:
+        """获取勾选的合并组序号
+        
+        Returns:
+            组序号列表
+        """
+        return [
+            group_id for group_id, check in zip(self._group_ids, self.select_checks) if check.isChecked()
+        ]
+        
+    def _update_plots(self, points: Optional[dict]) -> None:
+        """绘制全部簇与各合并组的载频-时间散点图"""
+        if points is None:
+            for plot in self.plots:
+                plot.clear()
+            return
+        toa, cf, group_ids = (np.asarray(points[key]) for key in ("toa", "cf", "group_ids"))
+        self.plots[0].setData(toa, cf, point_size=3, labels=group_ids)
+        for i, plot in enumerate(self.plots[1:]):
+            if i < len(self._group_ids):
+                mask = group_ids == self._group_ids[i]
+                plot.setData(toa[mask], cf[mask], point_size=3, labels=group_ids[mask])
+            else:
+                plot.clear()
+        
+    def _reset_selection(self) -> None:
+        """清除勾选，只为显示了合并组的格子显示勾选框"""
+        for i, check in enumerate(self.select_checks):
+            check.blockSignals(True)
+            check.setChecked(False)
+            check.blockSignals(False)
+            check.setVisible(i < len(self._group_ids))
+        self.selectionChanged.emit()
\ No newline at end of file
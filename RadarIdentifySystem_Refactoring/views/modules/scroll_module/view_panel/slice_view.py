@@ -1,83 +1,225 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout, QFrame
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QGridLayout
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
-from typing import Optional
+from PyQt6.QtGui import QFont, QImage, QPixmap
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from qfluentwidgets import Theme
+
+from models.config.app_config import cfg
+from models.data.pulse_columns import PulseColumn
+from models.utils.plot_decimation import DecimatedSeries
+from models.utils.plot_raster import data_range
+from models.utils.plot_style import PlotStyle, plot_style
+from views.base import PlotWidget
+
+
+@dataclass
+class SliceFrame:
+    """一个切片在切片视图中的显示内容
+
+    由 SliceView.build_frame 在任意线程中生成；images 为按 sizes 预先栅格化的各面板图像，
+    在界面线程中可转换为 pixmaps 以便直接绘制。
+
+    Attributes:
+        title: 视图标题
+        series: 各面板的散点序列
+        x_range: 各面板共用的 TOA 范围
+        sizes: 预先栅格化时各面板的图像尺寸（设备像素），未栅格化时为空
+        density_threshold: 预先栅格化时使用的密度图阈值（脉冲数）
+        theme: 预先栅格化时使用的配色的主题
+        images: 预先栅格化的各面板图像与是否为密度图
+        pixmaps: 在界面线程中由 images 转换的图像
+    """
+
+    title: str
+    series: List[DecimatedSeries]
+    x_range: Tuple[float, float]
+    sizes: List[Tuple[int, int]] = field(default_factory=list)
+    density_threshold: Optional[int] = None
+    theme: Optional[Theme] = None
+    images: List[Tuple[QImage, bool]] = field(default_factory=list)
+    pixmaps: List[Tuple[QPixmap, bool]] = field(default_factory=list)
+
+    @property
+    def nbytes(self) -> int:
+        """序列与图像占用的内存（字节，按各自的数组与像素估算）"""
+        images = sum(image.sizeInBytes() for image, _ in self.images)
+        pixmaps = sum(pixmap.width() * pixmap.height() * pixmap.depth() // 8 for pixmap, _ in self.pixmaps)
+        return sum(series.nbytes for series in self.series) + images + pixmaps
+
+    def to_pixmaps(self) -> None:
+        """在界面线程中把预先栅格化的图像转换为 QPixmap，并释放 QImage"""
+        self.pixmaps = [(QPixmap.fromImage(image), density) for image, density in self.images]
+        self.images = []
 
 
 class SliceView(QWidget):
     """切片视图组件
-    
-    用于显示雷达信号切片数据的视图组件，支持5×1的图像展示布局。
+
+    用于显示雷达信号切片数据的视图组件，5×1 布局依次为载频、脉宽、幅度、到达角与 DTOA 随 TOA 的散点图。
+    各面板按可见 TOA 范围抽稀绘制，缩放、平移任一面板时其余面板同步到相同的 TOA 范围。
+    可见脉冲数达到 cfg.densityPlotThreshold（千个）时，载频、脉宽、幅度与到达角面板改为绘制密度图。
     """
-    
+
     # 数据更新信号
     dataUpdated = pyqtSignal()
-    
+
+    # 各面板的标题与纵轴数据列（None 表示 DTOA）
+    PANELS = (
+        ("载频", PulseColumn.CF),
+        ("脉宽", PulseColumn.PW),
+        ("幅度", PulseColumn.PA),
+        ("到达角", PulseColumn.DOA),
+        ("DTOA", None),
+    )
+
     def __init__(self, parent: Optional[QWidget] = None):
         """初始化切片视图
-        
+
         Args:
             parent: 父控件
         """
         super().__init__(parent)
-        
+
         # 设置UI
         self._setup_ui()
-        
+        self._apply_density_threshold(cfg.get(cfg.densityPlotThreshold))
+        cfg.densityPlotThreshold.valueChanged.connect(self._apply_density_threshold)
+
     def _setup_ui(self) -> None:
         """设置用户界面"""
         # 创建主布局
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(10, 10, 10, 10)
         main_layout.setSpacing(10)
-        
+
         # 创建标题标签
-        title_label = QLabel("切片视图")
-        title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        main_layout.addWidget(title_label)
-        
+        self.title_label = QLabel("切片视图")
+        self.title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
+        main_layout.addWidget(self.title_label)
+
         # 创建网格布局用于5×1的图像展示
         grid_layout = QGridLayout()
         grid_layout.setSpacing(5)
-        
-        # 创建5个占位图像区域
-        self.image_frames = []
-        for i in range(5):
-            frame = QFrame()
-            frame.setFrameStyle(QFrame.Shape.Box)
-            frame.setStyleSheet("""
-                QFrame {
-                    background-color: #f0f0f0;
-                    border: 1px solid #ccc;
-                    border-radius: 5px;
-                }
-            """)
-            
-            # 添加标签
-            label = QLabel(f"切片 {i+1}")
-            label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            
-            frame_layout = QVBoxLayout(frame)
-            frame_layout.addWidget(label)
-            frame_layout.addStretch()
-            
-            self.image_frames.append(frame)
-            grid_layout.addWidget(frame, 0, i)
-        
+
+        # 创建5个散点图面板
+        self.plots = []
+        for i, (title, _) in enumerate(self.PANELS):
+            plot = PlotWidget(title, self)
+            plot.xRangeChanged.connect(self._sync_x_range)
+            self.plots.append(plot)
+            grid_layout.addWidget(plot, 0, i)
+
         main_layout.addLayout(grid_layout)
         main_layout.addStretch()
-        
+
     def update_data(self, data: dict) -> None:
         """更新视图数据
-        
+
+        Args:
+            data: 切片数据字典，包含 pulses（(N, 5) 脉冲数组，列见 PulseColumn），
+                可选的 labels（各脉冲的簇标签，用于着色）与 slice_index（切片序号）
+        """
+        self.show_frame(self.build_frame(data))
+
+    @classmethod
+    def build_frame(
+        cls,
+        data: dict,
+        sizes: Sequence[Tuple[int, int]] = (),
+        density_threshold: Optional[int] = None,
+        style: Optional[PlotStyle] = None,
+    ) -> SliceFrame:
+        """整理切片的显示内容，可在工作线程中调用（不访问任何控件）
+
+        Args:
+            data: 切片数据字典，同 update_data
+            sizes: 需要预先栅格化时各面板的图像尺寸（设备像素），见 render_sizes
+            density_threshold: 预先栅格化使用的密度图阈值（脉冲数），见 density_threshold
+            style: 预先栅格化使用的配色，缺省为当前主题的配色（在工作线程中调用时须传入）
+
+        Returns:
+            切片显示内容
+        """
+        pulses = np.asarray(data["pulses"])
+        labels = data.get("labels")
+        title = f"切片视图 - 第 {data['slice_index'] + 1} 片" if "slice_index" in data else "切片视图"
+
+        # 按 TOA 排序，DTOA 取相邻脉冲的到达时间差
+        order = np.argsort(pulses[:, PulseColumn.TOA], kind="stable")
+        pulses = pulses[order]
+        labels = np.asarray(labels)[order] if labels is not None else None
+        toa = pulses[:, PulseColumn.TOA]
+
+        series = []
+        for _, column in cls.PANELS:
+            if column is None:
+                series.append(DecimatedSeries(toa[1:], np.diff(toa), labels=None if labels is None else labels[1:]))
+            else:
+                series.append(DecimatedSeries(toa, pulses[:, column], labels=labels))
+        # 各面板共用同一 TOA 范围
+        frame = SliceFrame(title, series, data_range(toa))
+
+        if sizes:
+            style = style if style is not None else plot_style()
+            frame.sizes = [tuple(size) for size in sizes]
+            frame.density_threshold = density_threshold
+            frame.theme = style.theme
+            for item, (width, height), (_, column) in zip(series, frame.sizes, cls.PANELS):
+                threshold = density_threshold if column is not None else None
+                frame.images.append(item.render(frame.x_range, item.y_range, width, height, 2, threshold, style))
+        return frame
+
+    def show_frame(self, frame: SliceFrame) -> None:
+        """显示切片内容
+
+        预先栅格化的图像在尺寸、密度图阈值与主题都与当前一致时直接使用，否则各面板在绘制时重新栅格化。
+
         Args:
-            data: 切片数据字典
+            frame: 切片显示内容
         """
-        # TODO: 实现数据更新逻辑
+        self.title_label.setText(frame.title)
+        rendered = frame.pixmaps or [(QPixmap.fromImage(image), density) for image, density in frame.images]
+        reusable = (
+            frame.sizes == self.render_sizes()
+            and frame.density_threshold == self.density_threshold()
+            and frame.theme == plot_style().theme
+        )
+        for i, (plot, series) in enumerate(zip(self.plots, frame.series)):
+            plot.setSeries(series, x_range=frame.x_range)
+            if reusable and i < len(rendered):
+                plot.setRendered(*rendered[i])
         self.dataUpdated.emit()
-        
+
+    def render_sizes(self) -> List[Tuple[int, int]]:
+        """各面板当前的数据区域图像尺寸（设备像素）"""
+        return [(plot.renderSize().width(), plot.renderSize().height()) for plot in self.plots]
+
+    def density_threshold(self) -> int:
+        """当前的密度图阈值（脉冲数）"""
+        return cfg.get(cfg.densityPlotThreshold) * 1000
+
+    def _apply_density_threshold(self, threshold: int) -> None:
+        """设置除 DTOA 外各面板的密度图阈值
+
+        Args:
+            threshold: 可见脉冲数阈值，单位：千个
+        """
+        for plot, (_, column) in zip(self.plots, self.PANELS):
+            if column is not None:
+                plot.setDensityThreshold(threshold * 1000)
+
+    def _sync_x_range(self, low: float, high: float) -> None:
+        """把用户缩放、平移后的 TOA 范围同步到其余面板"""
+        for plot in self.plots:
+            if plot is not self.sender():
+                plot.setXRange(low, high)
+
     def clear_data(self) -> None:
         """清除视图数据"""
-        # TODO: 实现数据清除逻辑
-        pass
\ No newline at end of file
+        self.title_label.setText("切片视图")
+        for plot in self.plots:
+            plot.clear()